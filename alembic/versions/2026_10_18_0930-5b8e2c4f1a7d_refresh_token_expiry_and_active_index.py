@@ -0,0 +1,67 @@
+"""refresh token expiry and active index
+
+Revision ID: 5b8e2c4f1a7d
+Revises: 31e7a71b93c7
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e2c4f1a7d"
+down_revision: str | Sequence[str] | None = "31e7a71b93c7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from app.config import get_refresh_token_expire_delta
+
+    with op.batch_alter_table("refresh_tokens") as batch_op:
+        batch_op.add_column(sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True))
+
+    # Existing rows predate the column; no token issued before now can outlive now + the refresh lifetime
+    refresh_tokens = sa.table("refresh_tokens", sa.column("expires_at", sa.DateTime(timezone=True)))
+    op.execute(
+        refresh_tokens.update()
+        .where(refresh_tokens.c.expires_at.is_(None))
+        .values(expires_at=datetime.now(UTC) + get_refresh_token_expire_delta())
+    )
+
+    with op.batch_alter_table("refresh_tokens") as batch_op:
+        batch_op.alter_column("expires_at", existing_type=sa.DateTime(timezone=True), nullable=False)
+        batch_op.drop_index("ix_refresh_token_user_revoked")
+        batch_op.drop_index(batch_op.f("ix_refresh_tokens_is_revoked"))
+        batch_op.create_index(batch_op.f("ix_refresh_tokens_expires_at"), ["expires_at"], unique=False)
+
+    op.create_index(
+        "ix_refresh_token_user_active",
+        "refresh_tokens",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_revoked"),
+        sqlite_where=sa.text("is_revoked = 0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_refresh_token_user_active",
+        table_name="refresh_tokens",
+        postgresql_where=sa.text("NOT is_revoked"),
+        sqlite_where=sa.text("is_revoked = 0"),
+    )
+
+    with op.batch_alter_table("refresh_tokens") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_refresh_tokens_expires_at"))
+        batch_op.create_index(batch_op.f("ix_refresh_tokens_is_revoked"), ["is_revoked"], unique=False)
+        batch_op.create_index("ix_refresh_token_user_revoked", ["user_id", "is_revoked"], unique=False)
+        batch_op.drop_column("expires_at")
@@ -0,0 +1,101 @@
+"""hot query index pack
+
+Revision ID: 8d3f6a2b9c41
+Revises: 5b8e2c4f1a7d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f6a2b9c41"
+down_revision: str | Sequence[str] | None = "5b8e2c4f1a7d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Composite indexes for the hot predicates: (table, index, columns)
+COMPOSITE_INDEXES = [
+    ("periods", "ix_period_group_status", ["group_id", "status"]),
+    ("group_role_bindings", "ix_group_role_binding_group_role", ["group_id", "role"]),
+    ("account_link_requests", "ix_link_request_status_expires", ["status", "expires_at"]),
+    ("transactions", "ix_transaction_period_status", ["period_id", "status"]),
+]
+
+# Audit timestamps are written on every insert/update but never filtered on. The created_by/updated_by
+# indexes stay: they back foreign keys (MySQL refuses to drop them, PostgreSQL scans without them on user delete)
+TIMESTAMP_TABLES = [
+    "account_link_requests",
+    "categories",
+    "expense_shares",
+    "group_role_bindings",
+    "groups",
+    "periods",
+    "refresh_tokens",
+    "settlements",
+    "transactions",
+    "user_identities",
+    "users",
+]
+
+# Indexes no query uses, or duplicated by another index, a unique constraint or the leading columns of a composite
+REDUNDANT_INDEXES = [
+    # unused: expiry is only queried together with a status, served by the composite (status, expires_at)
+    ("account_link_requests", "ix_account_link_requests_expires_at", ["expires_at"]),
+    ("account_link_requests", "ix_link_request_expires", ["expires_at"]),
+    # leading column of the composite (status, expires_at)
+    ("account_link_requests", "ix_account_link_requests_status", ["status"]),
+    ("account_link_requests", "ix_link_request_status", ["status"]),
+    # ix_account_link_requests_request_token (unique) and ix_account_link_requests_user_id
+    ("account_link_requests", "ix_link_request_token", ["request_token"]),
+    ("account_link_requests", "ix_link_request_user", ["user_id"]),
+    # leading column of the primary key
+    ("expense_shares", "ix_expense_shares_transaction_id", ["transaction_id"]),
+    # uq_user_group_role (user_id, group_id) and ix_group_role_binding_group_role (group_id, role)
+    ("group_role_bindings", "ix_group_role_binding_group", ["group_id"]),
+    ("group_role_bindings", "ix_group_role_binding_user", ["user_id"]),
+    ("group_role_bindings", "ix_group_role_bindings_group_id", ["group_id"]),
+    ("group_role_bindings", "ix_group_role_bindings_role", ["role"]),
+    ("group_role_bindings", "ix_group_role_bindings_user_id", ["user_id"]),
+    # ix_period_group_dates and ix_period_group_status
+    ("periods", "ix_periods_group_id", ["group_id"]),
+    # ix_settlement_period_payer_payee
+    ("settlements", "ix_settlements_period_id", ["period_id"]),
+    # uq_user_system_role
+    ("system_role_bindings", "ix_system_role_binding_user", ["user_id"]),
+    ("system_role_bindings", "ix_system_role_bindings_user_id", ["user_id"]),
+    # ix_transaction_period_* composites
+    ("transactions", "ix_transactions_period_id", ["period_id"]),
+    ("transactions", "ix_transactions_status", ["status"]),
+    # uq_provider_external_id and ix_user_identities_user_id
+    ("user_identities", "ix_user_identity_provider", ["identity_provider"]),
+    ("user_identities", "ix_user_identity_user", ["user_id"]),
+]
+
+
+def _timestamp_indexes() -> list[tuple[str, str, list[str]]]:
+    return [
+        (table, f"ix_{table}_{column}", [column])
+        for table in TIMESTAMP_TABLES
+        for column in ("created_at", "updated_at")
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, name, columns in COMPOSITE_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+    for table, name, _ in REDUNDANT_INDEXES + _timestamp_indexes():
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, name, columns in REDUNDANT_INDEXES + _timestamp_indexes():
+        op.create_index(name, table, columns, unique=False)
+
+    for table, name, _ in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,31 @@
+"""period change version
+
+Revision ID: c4a9e1f7b2d3
+Revises: 8d3f6a2b9c41
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9e1f7b2d3"
+down_revision: str | Sequence[str] | None = "8d3f6a2b9c41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("periods") as batch_op:
+        batch_op.add_column(sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("periods") as batch_op:
+        batch_op.drop_column("version")
@@ -0,0 +1,42 @@
+"""change log
+
+Revision ID: e2b7d4a8f6c1
+Revises: c4a9e1f7b2d3
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7d4a8f6c1"
+down_revision: str | Sequence[str] | None = "c4a9e1f7b2d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "change_log",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=True),
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_change_log_group_id", "change_log", ["group_id", "id"], unique=False)
+    op.create_index("ix_change_log_entity", "change_log", ["entity", "entity_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_change_log_entity", table_name="change_log")
+    op.drop_index("ix_change_log_group_id", table_name="change_log")
+    op.drop_table("change_log")
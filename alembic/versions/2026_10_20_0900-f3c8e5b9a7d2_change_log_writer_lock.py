@@ -0,0 +1,34 @@
+"""change log writer lock
+
+Revision ID: f3c8e5b9a7d2
+Revises: e2b7d4a8f6c1
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c8e5b9a7d2"
+down_revision: str | Sequence[str] | None = "e2b7d4a8f6c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    lock = op.create_table(
+        "change_log_writer_lock",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(lock, [{"id": 1}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("change_log_writer_lock")
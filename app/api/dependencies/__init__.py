@@ -5,7 +5,9 @@ This module provides a unified interface for all dependencies.
 Individual dependencies are organized in sub-packages:
 - authn: Authentication dependencies (identity provision)
 - authz: Authorization dependencies (permission enforcement)
+- caching: Conditional request dependencies (ETag validation)
 - db: Database session dependencies
+- formats: Response format selection dependencies
 - services: Service dependencies
 
 Common dependencies are re-exported here for convenience.
@@ -19,7 +21,7 @@ from app.api.dependencies.authn import get_current_user
 from app.api.dependencies.db import get_db
 
 # Expose sub-packages for direct access
-from . import authn, authz, db, services
+from . import authn, authz, caching, db, formats, services
 
 __all__ = [
     # Common dependencies (re-exported for convenience)
@@ -28,6 +30,8 @@ __all__ = [
     # Sub-packages (for direct access to all dependencies)
     "authn",
     "authz",
+    "caching",
     "db",
+    "formats",
     "services",
 ]
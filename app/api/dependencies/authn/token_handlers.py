@@ -1,17 +1,18 @@
 """
 Authentication: Token Handlers (Phase 1: Token Verification) 🔐
 
-This module contains the factory for the synchronous FastAPI dependency that
-decodes and verifies the JWT access token. It is the first stage of the
-authentication process.
+This module contains the factory for the FastAPI dependency that decodes and
+verifies the JWT access token. It is the first stage of the authentication process.
 
 ---
 KEY ARCHITECTURE:
 - The module uses a **synchronous factory function** (`def get_claims_payload`)
-  which returns a **synchronous dependency function** (`def _get_claims_payload`).
-  This structure allows passing dynamic configuration (`options`) while keeping the
-  CPU-bound verification logic off the main event loop via a threadpool.
-- It relies on the `app.core.security.verify_access_token` function for the
+  which returns an **async dependency function** (`async def _get_claims_payload`).
+  This structure allows passing dynamic configuration (`options`).
+- Tokens already verified with the default options are served inline from the
+  in-process claims cache (a dictionary lookup, no threadpool hop). On a miss, the
+  CPU-bound verification runs off the main event loop via the threadpool.
+- It relies on the `app.core.security.validate_access_token` function for the
   cryptographic checks (signature, expiration, etc.).
 
 FAILURE:
@@ -22,15 +23,16 @@ PUBLIC API:
 - get_claims_payload: Factory for the core claims provider dependency.
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Annotated, Any
 
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
 from app.core.i18n import _
-from app.core.security import validate_access_token
+from app.core.security import get_cached_access_token_claims, validate_access_token
 from app.exceptions import UnauthorizedError
 
 # The OAuth2PasswordBearer instance
@@ -39,10 +41,10 @@ _oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 def get_claims_payload(
     options: dict[str, Any] | None = None,
-) -> Callable[[Annotated[str, Depends]], dict[str, Any]]:
+) -> Callable[[Annotated[str, Depends]], Awaitable[dict[str, Any]]]:
     """
-    🔑 AUTHENTICATION PROVIDER FACTORY: Creates a SYNCHRONOUS dependency that decodes
-    and verifies the JWT, allowing optional override of verification settings.
+    🔑 AUTHENTICATION PROVIDER FACTORY: Creates a dependency that decodes and
+    verifies the JWT, allowing optional override of verification settings.
 
     Args:
         options: Optional dictionary of verification options (e.g., {"verify_exp": False}).
@@ -54,12 +56,14 @@ def get_claims_payload(
         UnauthorizedError (401): If the token is invalid, expired, or malformed.
     """
 
-    def _get_claims_payload(token: Annotated[str, Depends(_oauth2_scheme)]):
+    async def _get_claims_payload(token: Annotated[str, Depends(_oauth2_scheme)]) -> dict[str, Any]:
         """
-        Synchronous dependency for token claims. Runs in FastAPI's internal threadpool.
+        Dependency for token claims. Cache hits are served inline; misses are verified in the threadpool.
         """
+        if options is None and (claims := get_cached_access_token_claims(token)) is not None:
+            return claims
         try:
-            return validate_access_token(token, options)
+            return await run_in_threadpool(validate_access_token, token, options)
         except (JWTError, ValueError) as e:
             raise UnauthorizedError(_("Invalid authentication token")) from e
 
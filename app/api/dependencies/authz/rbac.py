@@ -38,7 +38,7 @@ from typing import Annotated, Any
 from fastapi import Depends
 
 from app.api.dependencies.authn import get_current_user
-from app.api.dependencies.services import get_authorization_service
+from app.api.dependencies.services import get_authorization_service, get_read_authorization_service
 from app.core.i18n import _
 from app.exceptions import ForbiddenError, NotFoundError
 from app.models import GroupRole, SystemRole
@@ -130,7 +130,7 @@ def requires_system_role(*roles: RoleType) -> Callable[..., Awaitable[Any]]:
     return _verify_system_role
 
 
-def requires_group_role(*roles: RoleType) -> Callable[..., Awaitable[Any]]:
+def requires_group_role(*roles: RoleType, read_only: bool = False) -> Callable[..., Awaitable[Any]]:
     """
     Factory function to create a dependency that requires a specific group role
     for the resource identified by 'group_id' in the path.
@@ -139,6 +139,8 @@ def requires_group_role(*roles: RoleType) -> Callable[..., Awaitable[Any]]:
         *roles: A variable number of required GroupRole objects or string values.
                 Access is granted if the user possesses ANY of the provided roles
                 within the context of the requested group.
+        read_only: Check the role on the request's replica session (see `get_read_db`),
+                   for read-only endpoints whose other dependencies read there too.
 
     Returns:
         A callable FastAPI dependency that raises NotFoundError or ForbiddenError on failure.
@@ -150,10 +152,12 @@ def requires_group_role(*roles: RoleType) -> Callable[..., Awaitable[Any]]:
     display_names = [_get_display_role_name(r) for r in required_role_values]
     role_list_display = ", ".join(display_names)
 
+    authorization_service_dependency = get_read_authorization_service if read_only else get_authorization_service
+
     async def _verify_group_role(
         group_id: int,
         current_user: Annotated[UserResponse, Depends(get_current_user)],
-        authorization_service: AuthorizationService = Depends(get_authorization_service),
+        authorization_service: AuthorizationService = Depends(authorization_service_dependency),
     ) -> UserResponse:
         role = await authorization_service.get_group_role_by_group_id(current_user.id, group_id)
 
@@ -171,7 +175,7 @@ def requires_group_role(*roles: RoleType) -> Callable[..., Awaitable[Any]]:
     return _verify_group_role
 
 
-def requires_group_role_for_period(*roles: RoleType) -> Callable[..., Awaitable[UserResponse]]:
+def requires_group_role_for_period(*roles: RoleType, read_only: bool = False) -> Callable[..., Awaitable[UserResponse]]:
     """
     Factory function to create a dependency that requires a specific group role
     for the group associated with the period identified by 'period_id' in the path.
@@ -183,6 +187,8 @@ def requires_group_role_for_period(*roles: RoleType) -> Callable[..., Awaitable[
         *roles: A variable number of required GroupRole objects or string values.
                 Access is granted if the user possesses ANY of the provided roles
                 within the context of the period's group.
+        read_only: Check the role on the request's replica session (see `get_read_db`),
+                   for read-only endpoints whose other dependencies read there too.
 
     Returns:
         A callable FastAPI dependency that raises NotFoundError or ForbiddenError on failure.
@@ -192,10 +198,12 @@ def requires_group_role_for_period(*roles: RoleType) -> Callable[..., Awaitable[
     display_names = [_get_display_role_name(r) for r in required_role_values]
     role_list_display = ", ".join(display_names)
 
+    authorization_service_dependency = get_read_authorization_service if read_only else get_authorization_service
+
     async def _check_group_role_for_period(
         period_id: int,
         current_user: Annotated[UserResponse, Depends(get_current_user)],
-        authorization_service: AuthorizationService = Depends(get_authorization_service),
+        authorization_service: AuthorizationService = Depends(authorization_service_dependency),
     ) -> UserResponse:
         """
         Internal PEP check: Retrieves period details and verifies the user's role within that context.
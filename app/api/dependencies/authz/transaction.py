@@ -12,7 +12,7 @@ from app.api.dependencies.services import get_transaction_service
 from app.core.i18n import _
 from app.exceptions import ForbiddenError, NotFoundError
 from app.models import TransactionStatus
-from app.schemas import TransactionResponse, UserResponse
+from app.schemas import UserResponse
 from app.services import TransactionService
 
 
@@ -26,22 +26,23 @@ def requires_transaction_status(*statuses: TransactionStatus) -> Callable[..., A
     async def _requires_transaction_status(
         transaction_id: int,
         transaction_service: Annotated[TransactionService, Depends(get_transaction_service)],
-    ) -> TransactionResponse:
+    ) -> TransactionStatus:
         """
-        Internal PEP check: Retrieves transaction and verifies its status against the requirements.
+        Internal PEP check: Retrieves the transaction's status and verifies it against the requirements.
         """
-        transaction = await transaction_service.get_transaction_by_id(transaction_id)
+        status_and_creator = await transaction_service.get_transaction_status_and_creator(transaction_id)
 
-        if not transaction:
+        if not status_and_creator:
             raise NotFoundError(_("Transaction %s not found") % transaction_id)
 
-        if transaction.status not in statuses:
+        transaction_status, _created_by = status_and_creator
+        if transaction_status not in statuses:
             raise ForbiddenError(
                 _("Transaction %s must be in one of the following statuses: %(statuses)s")
                 % {"transaction_id": transaction_id, "statuses": display_statuses}
             )
 
-        return transaction
+        return transaction_status
 
     return _requires_transaction_status
 
@@ -57,26 +58,28 @@ def requires_transaction_status_and_creator(*statuses: TransactionStatus) -> Cal
         transaction_id: int,
         transaction_service: Annotated[TransactionService, Depends(get_transaction_service)],
         current_user: Annotated[UserResponse, Depends(get_current_user)],
-    ) -> TransactionResponse:
+    ) -> TransactionStatus:
         """
-        Internal PEP check: Retrieves transaction and verifies its status and the creator's ID.
+        Internal PEP check: Retrieves the transaction's status and creator ID and verifies them.
         """
-        transaction = await transaction_service.get_transaction_by_id(transaction_id)
+        status_and_creator = await transaction_service.get_transaction_status_and_creator(transaction_id)
 
-        if not transaction:
+        if not status_and_creator:
             raise NotFoundError(_("Transaction %s not found") % transaction_id)
 
+        transaction_status, created_by = status_and_creator
+
         # 1. Status Check
-        if transaction.status not in statuses:
+        if transaction_status not in statuses:
             raise ForbiddenError(
                 _("Transaction %s must be in one of the following statuses: %(statuses)s")
                 % {"transaction_id": transaction_id, "statuses": display_statuses}
             )
 
         # 2. Creator (Ownership) Check
-        if transaction.created_by != current_user.id:
+        if created_by != current_user.id:
             raise ForbiddenError(_("Transaction %s is not created by the current user") % transaction_id)
 
-        return transaction
+        return transaction_status
 
     return _requires_transaction_status_and_creator
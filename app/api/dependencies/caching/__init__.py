@@ -0,0 +1,88 @@
+"""
+Conditional request dependencies.
+
+Period-scoped GET endpoints are validated by the period's change version, which
+every change to the period, its transactions and settlements, and the user and
+category names they show increments (see `PeriodRepository`). The version and the
+`Accept` header make up the ETag, so each representation is tagged on its own.
+
+`get_period_cache_validators` answers an `If-None-Match` naming the current ETag
+with 304 Not Modified, after loading the period and before the endpoint runs any
+query of its own; otherwise the endpoint sends `validators.headers` with its response.
+`If-Modified-Since` is not honored: `Last-Modified` has one-second resolution and
+would hide a second change made within the same second.
+
+Declare the dependency after the endpoint's authorization dependency. Dependencies
+resolve in declaration order, and a 304 must only reach callers allowed to read the
+period. The period is read from a replica (see `get_read_db`), so the endpoint and its
+authorization dependency should read there too and see the same version.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from app.api.dependencies.services import get_read_loaders
+from app.core.i18n import _
+from app.exceptions import NotFoundError, NotModifiedError
+from app.services import RequestLoaders
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    """Validators of the representation an endpoint is about to send."""
+
+    etag: str
+    last_modified: datetime
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            # Clients may store the response but must revalidate it before every use
+            "Cache-Control": "private, no-cache",
+        }
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an `If-None-Match` header against an ETag (RFC 9110, 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+async def get_period_cache_validators(
+    period_id: int,
+    request: Request,
+    loaders: Annotated[RequestLoaders, Depends(get_read_loaders)],
+) -> CacheValidators:
+    """
+    Dependency that computes the cache validators of a period-scoped representation.
+
+    The period is loaded through the request's loaders, so an endpoint that goes on
+    to read it does not query it again.
+
+    Raises:
+        NotFoundError: If the period does not exist
+        NotModifiedError: If `If-None-Match` names the current ETag
+    """
+    period = await loaders.periods.load(period_id)
+    if period is None:
+        raise NotFoundError(_("Period %s not found") % period_id)
+    changed_at = period.updated_at or period.created_at
+
+    variant = hashlib.blake2s(request.headers.get("accept", "").encode(), digest_size=4).hexdigest()
+    if changed_at.tzinfo is None:  # SQLite drops the time zone
+        changed_at = changed_at.replace(tzinfo=UTC)
+    validators = CacheValidators(etag=f'W/"{period_id}.{period.version}.{variant}"', last_modified=changed_at)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _matches(if_none_match, validators.etag):
+        raise NotModifiedError(validators.headers)
+    return validators
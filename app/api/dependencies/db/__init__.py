@@ -1,38 +1,119 @@
 """
 Database session dependencies.
+
+Every session reads from and writes to the primary, except those of `get_read_db`:
+read-only dependencies opt into it to read from a replica when replicas are configured.
+A caller who wrote within the read-your-writes window reads from the primary there too;
+sessions that write pin their user for that window.
 """
 
 from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
 
+from fastapi import Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_serializable_session, get_session
+from app.core.security import get_cached_access_token_claims, validate_access_token
+from app.db import (
+    get_read_session,
+    get_read_your_writes_tracker,
+    get_serializable_session,
+    get_session,
+    has_replicas,
+    session_has_writes,
+)
+from app.exceptions import InvalidAccessTokenError
+
+
+async def _get_request_subject(request: Request) -> str | None:
+    """
+    Get the 'sub' claim of the request's verified bearer token, used only to key read-your-writes pinning.
+
+    Without replicas nothing is pinned and the token is not read. A missing or invalid
+    token yields None; rejecting it is left to the authentication dependencies.
+    """
+    if not has_replicas():
+        return None
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    claims = get_cached_access_token_claims(token)
+    if claims is None:
+        try:
+            claims = await run_in_threadpool(validate_access_token, token)
+        except InvalidAccessTokenError:
+            return None
+    subject = claims.get("sub")
+    return str(subject) if subject is not None else None
+
+
+async def _yield_session(
+    session_context: AbstractAsyncContextManager[AsyncSession], subject: str | None
+) -> AsyncIterator[AsyncSession]:
+    """Yield a session and, once it committed, pin its user to the primary if it wrote."""
+    async with session_context as session:
+        yield session
+    if subject is not None and session_has_writes(session):
+        get_read_your_writes_tracker().pin(subject)
 
 
-async def get_db() -> AsyncIterator[AsyncSession]:
+async def get_db(request: Request) -> AsyncIterator[AsyncSession]:
     """
     Dependency that provides a database session.
     Automatically closes the session after the request.
 
+    Always uses the primary; a session that wrote pins its user to it.
+
     Usage:
         @app.get("/items")
         async def get_items(db: AsyncSession = Depends(get_db)):
             ...
     """
-    async with get_session() as session:
+    async for session in _yield_session(get_session(), await _get_request_subject(request)):
         yield session
 
 
-async def get_serializable_db() -> AsyncIterator[AsyncSession]:
+async def get_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Dependency that provides a database session reading from a replica.
+    Automatically closes the session after the request.
+
+    Only for read-only dependencies that tolerate replication lag. Falls back to the
+    primary when no replicas are configured or the caller wrote within the
+    read-your-writes window (tracked per process). A write through this session goes
+    to the primary.
+
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    subject = await _get_request_subject(request)
+    pinned = subject is not None and get_read_your_writes_tracker().is_pinned(subject)
+    session_context = get_session() if pinned else get_read_session()
+    async for session in _yield_session(session_context, subject):
+        yield session
+
+
+async def get_serializable_db(request: Request, db: AsyncSession = Depends(get_db)) -> AsyncIterator[AsyncSession]:
     """
     Dependency that provides a database session with SERIALIZABLE isolation level.
     Automatically closes the session after the request.
 
+    Always uses the primary; like get_db, a session that wrote pins its user to it.
+
+    The request's get_db session, used by the dependencies resolved so far (authentication,
+    role checks), is committed first so its connection returns to the shared pool: a request
+    never holds one connection while waiting for a second. Dependencies resolved after this
+    one should not query through get_db.
+
     Usage:
         @app.get("/items")
         async def get_items(db: AsyncSession = Depends(get_serializable_db)):
             # This session will use SERIALIZABLE isolation level
             ...
     """
-    async with get_serializable_session() as session:
+    await db.commit()
+    async for session in _yield_session(get_serializable_session(), await _get_request_subject(request)):
         yield session
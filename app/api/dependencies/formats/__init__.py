@@ -0,0 +1,91 @@
+"""
+Response format dependencies.
+
+Endpoints offering several representations of a resource select one from the
+`format` query parameter or, when it is absent, from the vendor media types listed
+in the `Accept` header. Plain `application/json` (or no preference) selects the
+full representation.
+
+List endpoints accepting sparse fieldsets read the comma-separated `fields` query
+parameter (e.g. `?fields=id,amount,status`) with `sparse_fields`.
+"""
+
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Annotated
+
+from fastapi import Header, Query
+from pydantic import BaseModel
+
+from app.core.i18n import _
+from app.exceptions import ValidationError
+from app.schemas import TransactionListFormat
+
+TRANSACTION_LIST_MEDIA_TYPES: Mapping[TransactionListFormat, str] = MappingProxyType(
+    {
+        TransactionListFormat.FULL: "application/json",
+        TransactionListFormat.COMPACT: "application/vnd.divvy.transactions.compact+json",
+        TransactionListFormat.COLUMNS: "application/vnd.divvy.transactions.columns+json",
+    }
+)
+
+
+def _accepted_media_types(accept: str) -> list[str]:
+    """Media types of an `Accept` header, most preferred first, without those refused with `q=0`."""
+    weighted: list[tuple[float, str]] = []
+    for entry in accept.split(","):
+        media_type, *params = (part.strip() for part in entry.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type and quality > 0:
+            weighted.append((quality, media_type.lower()))
+    # Stable sort: equally weighted types keep the client's order
+    return [media_type for _, media_type in sorted(weighted, key=lambda item: -item[0])]
+
+
+def get_transaction_list_format(
+    list_format: Annotated[
+        TransactionListFormat | None,
+        Query(alias="format", description="Representation of the transaction list; overrides the Accept header"),
+    ] = None,
+    accept: Annotated[str | None, Header()] = None,
+) -> TransactionListFormat:
+    """Dependency that selects the representation of a transaction list."""
+    if list_format is not None:
+        return list_format
+    formats_by_media_type = {media_type: f for f, media_type in TRANSACTION_LIST_MEDIA_TYPES.items()}
+    for media_type in _accepted_media_types(accept or ""):
+        if (selected := formats_by_media_type.get(media_type)) is not None:
+            return selected
+    return TransactionListFormat.FULL
+
+
+def sparse_fields(model: type[BaseModel]) -> Callable[..., frozenset[str] | None]:
+    """
+    Dependency factory reading the `fields` query parameter as a set of `model` fields.
+
+    The dependency returns None when the parameter is absent, meaning every field.
+
+    Raises:
+        ValidationError: If the parameter is empty or names a field `model` does not have
+    """
+
+    description = f"Comma-separated fields to return, out of: {', '.join(model.model_fields)}"
+
+    def dependency(fields: str | None = Query(None, description=description)) -> frozenset[str] | None:
+        if fields is None:
+            return None
+        requested = frozenset(name for name in (part.strip() for part in fields.split(",")) if name)
+        if not requested:
+            raise ValidationError(_("At least one field must be requested"))
+        if unknown := requested - model.model_fields.keys():
+            raise ValidationError(_("Unknown fields: %s") % ", ".join(sorted(unknown)))
+        return requested
+
+    return dependency
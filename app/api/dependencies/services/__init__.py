@@ -1,12 +1,14 @@
 """
 Service dependencies.
+
+Every service dependency resolves through the request's `ServiceContainer`, which
+builds a service on first use and shares it for the rest of the request.
 """
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies.db import get_db, get_serializable_db
-from app.repositories import SettlementRepository
+from app.api.dependencies.db import get_db, get_read_db, get_serializable_db
 from app.services import (
     AccountLinkRequestService,
     AuthenticationService,
@@ -15,121 +17,141 @@ from app.services import (
     GroupService,
     IdentityProviderService,
     PeriodService,
+    RequestLoaders,
+    ServiceContainer,
     SettlementService,
+    SyncService,
     TransactionService,
     UserIdentityService,
     UserService,
 )
 
 
+def get_services(db: AsyncSession = Depends(get_db)) -> ServiceContainer:
+    """Dependency that provides the request's service container."""
+    return ServiceContainer(db)
+
+
+def get_read_services(db: AsyncSession = Depends(get_read_db)) -> ServiceContainer:
+    """Dependency that provides a service container reading from a replica, for read-only dependencies."""
+    return ServiceContainer(db)
+
+
+def get_serializable_services(db: AsyncSession = Depends(get_serializable_db)) -> ServiceContainer:
+    """Dependency that provides a service container with SERIALIZABLE isolation level."""
+    return ServiceContainer(db)
+
+
+def get_loaders(services: ServiceContainer = Depends(get_services)) -> RequestLoaders:
+    """Dependency that provides the request's batching entity loaders, shared by its services."""
+    return services.loaders
+
+
 # Base services (no dependencies on other services)
-def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+def get_user_service(services: ServiceContainer = Depends(get_services)) -> UserService:
     """Dependency that provides UserService instance."""
-    return UserService(db)
+    return services.user_service
 
 
-def get_authentication_service(
-    db: AsyncSession = Depends(get_db),
-    user_service: UserService = Depends(get_user_service),
-) -> AuthenticationService:
+def get_authentication_service(services: ServiceContainer = Depends(get_services)) -> AuthenticationService:
     """Dependency that provides AuthenticationService instance."""
-    return AuthenticationService(
-        session=db,
-        user_service=user_service,
-    )
+    return services.authentication_service
 
 
-def get_authorization_service(db: AsyncSession = Depends(get_db)) -> AuthorizationService:
+def get_authorization_service(services: ServiceContainer = Depends(get_services)) -> AuthorizationService:
     """Dependency that provides AuthorizationService instance."""
-    return AuthorizationService(db)
+    return services.authorization_service
 
 
-def get_user_identity_service(
-    db: AsyncSession = Depends(get_db), user_service: UserService = Depends(get_user_service)
-) -> UserIdentityService:
+def get_user_identity_service(services: ServiceContainer = Depends(get_services)) -> UserIdentityService:
     """Dependency that provides UserIdentityService instance."""
-    return UserIdentityService(db, user_service)
+    return services.user_identity_service
 
 
-def get_category_service(db: AsyncSession = Depends(get_db)) -> CategoryService:
+def get_category_service(services: ServiceContainer = Depends(get_services)) -> CategoryService:
     """Dependency that provides CategoryService instance."""
-    return CategoryService(db)
+    return services.category_service
 
 
-def get_period_service(db: AsyncSession = Depends(get_db)) -> PeriodService:
+def get_period_service(services: ServiceContainer = Depends(get_services)) -> PeriodService:
     """Dependency that provides PeriodService instance."""
-    return PeriodService(db)
+    return services.period_service
 
 
-def get_transaction_service(db: AsyncSession = Depends(get_db)) -> TransactionService:
+def get_transaction_service(services: ServiceContainer = Depends(get_services)) -> TransactionService:
     """Dependency that provides TransactionService instance."""
-    return TransactionService(db)
+    return services.transaction_service
 
 
 def get_account_link_request_service(
-    db: AsyncSession = Depends(get_db), user_service: UserService = Depends(get_user_service)
+    services: ServiceContainer = Depends(get_services),
 ) -> AccountLinkRequestService:
     """Dependency that provides AccountLinkRequestService instance."""
-    return AccountLinkRequestService(db, user_service)
+    return services.account_link_request_service
 
 
 # Services with dependencies on other services
-def get_group_service(
-    db: AsyncSession = Depends(get_db),
-    authorization_service: AuthorizationService = Depends(get_authorization_service),
-    period_service: PeriodService = Depends(get_period_service),
-) -> GroupService:
+def get_group_service(services: ServiceContainer = Depends(get_services)) -> GroupService:
     """Dependency that provides GroupService instance."""
-    return GroupService(db, authorization_service, period_service)
+    return services.group_service
 
 
-def get_settlement_service(
-    db: AsyncSession = Depends(get_db),
-    transaction_service: TransactionService = Depends(get_transaction_service),
-    period_service: PeriodService = Depends(get_period_service),
-    category_service: CategoryService = Depends(get_category_service),
-    user_service: UserService = Depends(get_user_service),
-) -> SettlementService:
+def get_settlement_service(services: ServiceContainer = Depends(get_services)) -> SettlementService:
     """Dependency that provides SettlementService instance."""
-    settlement_repository = SettlementRepository(db)
-    return SettlementService(
-        period_service=period_service,
-        transaction_service=transaction_service,
-        user_service=user_service,
-        settlement_repository=settlement_repository,
-    )
-
-
-def get_identity_provider_service(
-    db: AsyncSession = Depends(get_db),
-    user_service: UserService = Depends(get_user_service),
-    authentication_service: AuthenticationService = Depends(get_authentication_service),
-    user_identity_service: UserIdentityService = Depends(get_user_identity_service),
-    account_link_request_service: AccountLinkRequestService = Depends(get_account_link_request_service),
-) -> IdentityProviderService:
+    return services.settlement_service
+
+
+def get_sync_service(services: ServiceContainer = Depends(get_services)) -> SyncService:
+    """Dependency that provides SyncService instance."""
+    return services.sync_service
+
+
+def get_identity_provider_service(services: ServiceContainer = Depends(get_services)) -> IdentityProviderService:
     """Dependency that provides IdentityProviderService instance."""
-    return IdentityProviderService(
-        session=db,
-        user_service=user_service,
-        user_identity_service=user_identity_service,
-        account_link_request_service=account_link_request_service,
-        authentication_service=authentication_service,
-    )
+    return services.identity_provider_service
+
+
+# Read-only services served from a replica (see get_read_db)
+def get_read_loaders(services: ServiceContainer = Depends(get_read_services)) -> RequestLoaders:
+    """Dependency that provides the request's batching entity loaders reading from a replica."""
+    return services.loaders
+
+
+def get_read_authorization_service(
+    services: ServiceContainer = Depends(get_read_services),
+) -> AuthorizationService:
+    """Dependency that provides AuthorizationService instance reading from a replica."""
+    return services.authorization_service
+
+
+def get_read_category_service(services: ServiceContainer = Depends(get_read_services)) -> CategoryService:
+    """Dependency that provides CategoryService instance reading from a replica."""
+    return services.category_service
+
+
+def get_read_group_service(services: ServiceContainer = Depends(get_read_services)) -> GroupService:
+    """Dependency that provides GroupService instance reading from a replica."""
+    return services.group_service
+
+
+def get_read_period_service(services: ServiceContainer = Depends(get_read_services)) -> PeriodService:
+    """Dependency that provides PeriodService instance reading from a replica."""
+    return services.period_service
+
+
+def get_read_transaction_service(services: ServiceContainer = Depends(get_read_services)) -> TransactionService:
+    """Dependency that provides TransactionService instance reading from a replica."""
+    return services.transaction_service
+
+
+def get_read_settlement_service(services: ServiceContainer = Depends(get_read_services)) -> SettlementService:
+    """Dependency that provides SettlementService instance reading from a replica."""
+    return services.settlement_service
 
 
 # Services with SERIALIZABLE isolation level
 def get_serializable_settlement_service(
-    db: AsyncSession = Depends(get_serializable_db),
+    services: ServiceContainer = Depends(get_serializable_services),
 ) -> SettlementService:
     """Dependency that provides SettlementService instance with SERIALIZABLE isolation level."""
-    user_service = UserService(db)
-    period_service = PeriodService(db)
-    transaction_service = TransactionService(db)
-    settlement_repository = SettlementRepository(db)
-
-    return SettlementService(
-        period_service=period_service,
-        transaction_service=transaction_service,
-        user_service=user_service,
-        settlement_repository=settlement_repository,
-    )
+    return services.settlement_service
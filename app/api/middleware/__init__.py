@@ -0,0 +1,7 @@
+"""
+ASGI middleware for the Divvy API.
+"""
+
+from .sql import SQLInstrumentationMiddleware
+
+__all__ = ["SQLInstrumentationMiddleware"]
@@ -0,0 +1,73 @@
+"""
+Per-request SQL instrumentation middleware.
+
+Counts and times the SQL statements each request executes, adds them to the
+per-route metrics served by /health/sql, optionally reports them to the client in a
+Server-Timing header, and flags requests that repeat one statement past the
+configured threshold (a likely N+1 query).
+"""
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_sql_server_timing_enabled
+from app.db import QueryStats, route_query_metrics, track_queries
+
+logger = logging.getLogger(__name__)
+
+# Metrics key for requests that did not match a route
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_key(scope: Scope) -> str:
+    """Method and path template of the matched route, so metrics don't split by path parameters."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return f"{scope['method']} {path}" if path else UNMATCHED_ROUTE
+
+
+def _server_timing(stats: QueryStats) -> str:
+    return f'db;dur={stats.total_time * 1000:.3f};desc="{stats.count} queries"'
+
+
+class SQLInstrumentationMiddleware:
+    """
+    ASGI middleware tracking the SQL executed by each HTTP request.
+
+    Statements run after the response has started (e.g. the commit of a session
+    dependency) are counted in the route metrics but miss the Server-Timing header.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool | None = None):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            server_timing: Add a Server-Timing header to responses (default: from app.config)
+        """
+        self.app = app
+        self.server_timing = get_sql_server_timing_enabled() if server_timing is None else server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_server_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", _server_timing(stats))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_server_timing if self.server_timing else send)
+            finally:
+                route = _route_key(scope)
+                route_query_metrics.record(route, stats)
+                if stats.repeat_action == "warn":
+                    for statement, count in stats.repeated_statements():
+                        logger.warning(f"{route} executed a statement {count} times (likely N+1): {statement}")
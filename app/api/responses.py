@@ -0,0 +1,88 @@
+"""
+Fast JSON responses.
+
+By default FastAPI validates a handler's return value against its `response_model`
+and then serializes it. Handlers whose services already build the exact response
+DTOs can opt out of that second validation by returning a `ModelResponse`: the DTOs
+are serialized straight to bytes by pydantic-core, while the route's declared
+`response_model` still documents the endpoint.
+
+`ORJSONResponse` renders plain Python content (dicts, lists, scalars) with orjson
+when it is installed (`pip install orjson`), falling back to the standard encoder.
+Pydantic models are not routed through orjson: dumping them to dicts first costs
+more than pydantic-core's own JSON serializer.
+"""
+
+import functools
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+@functools.cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    # `model` is only known at runtime, which a static type expression cannot express
+    return TypeAdapter[list[Any]](list[model])  # pyright: ignore[reportInvalidTypeForm]
+
+
+def dump_models(content: BaseModel | Sequence[BaseModel], include: Collection[str] | None = None) -> bytes:
+    """
+    Serialize a model, or a sequence of models of one type, to JSON bytes without re-validation.
+
+    Args:
+        content: Response DTO or DTOs
+        include: Fields to serialize (of each DTO), or None for all of them
+
+    Returns:
+        JSON document as bytes
+    """
+    fields = None if include is None else set(include)
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content, include=fields)
+    if not content:
+        return b"[]"
+    return _list_adapter(type(content[0])).dump_json(
+        list(content), include=None if fields is None else {"__all__": fields}
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ModelResponse(JSONResponse):
+    """
+    JSON response for Pydantic DTOs, serialized directly to bytes and never re-validated.
+
+    `include` restricts every DTO to the given fields, as for sparse fieldsets.
+    """
+
+    def __init__(
+        self,
+        content: BaseModel | Sequence[BaseModel],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        include: Collection[str] | None = None,
+    ):
+        self.include = include
+        super().__init__(
+            content, status_code=status_code, headers=headers, media_type=media_type, background=background
+        )
+
+    def render(self, content: BaseModel | Sequence[BaseModel]) -> bytes:
+        return dump_models(content, self.include)
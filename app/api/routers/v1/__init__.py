@@ -8,6 +8,7 @@ from .auth import router as auth
 from .categories import router as categories
 from .groups import router as groups
 from .periods import router as periods
+from .sync import router as sync
 from .transactions import router as transactions
 from .user import router as user
 
@@ -20,6 +21,7 @@ api_router.include_router(categories)
 api_router.include_router(groups)
 api_router.include_router(transactions)
 api_router.include_router(periods)
+api_router.include_router(sync)
 api_router.include_router(user)
 
 __all__ = ["api_router"]
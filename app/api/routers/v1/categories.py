@@ -7,7 +7,7 @@ from collections.abc import Sequence
 from fastapi import APIRouter, Depends
 
 from app.api.dependencies import get_current_user
-from app.api.dependencies.services import get_category_service
+from app.api.dependencies.services import get_read_category_service
 from app.schemas.category import CategoryResponse
 from app.services import CategoryService
 
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/categories", tags=["categories"], dependencies=[Depe
 
 @router.get("/", response_model=list[CategoryResponse])
 async def get_all_categories(
-    category_service: CategoryService = Depends(get_category_service),
+    category_service: CategoryService = Depends(get_read_category_service),
 ) -> Sequence[CategoryResponse]:
     """
     List all categories.
@@ -2,7 +2,6 @@
 API v1 router for Group endpoints.
 """
 
-from collections.abc import Sequence
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
@@ -14,7 +13,14 @@ from app.api.dependencies.authz.group import (
     requires_settled_active_period,
     verifies_target_user_membership,
 )
-from app.api.dependencies.services import get_group_service, get_period_service
+from app.api.dependencies.formats import sparse_fields
+from app.api.dependencies.services import (
+    get_group_service,
+    get_period_service,
+    get_read_group_service,
+    get_read_period_service,
+)
+from app.api.responses import ModelResponse
 from app.core.i18n import _
 from app.exceptions import NotFoundError
 from app.models import GroupRole
@@ -24,6 +30,7 @@ from app.schemas import (
     PeriodRequest,
     PeriodResponse,
     UserResponse,
+    validate_partial,
 )
 from app.services import GroupService, PeriodService
 
@@ -37,12 +44,14 @@ router = APIRouter(
 @router.get("/", response_model=list[GroupResponse])
 async def get_groups_by_user_id(
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    group_service: GroupService = Depends(get_group_service),
-) -> Sequence[GroupResponse]:
+    fields: Annotated[frozenset[str] | None, Depends(sparse_fields(GroupResponse))],
+    group_service: GroupService = Depends(get_read_group_service),
+) -> ModelResponse:
     """
     List all groups that the current user is a member of.
+    `fields` restricts each group to the given fields.
     """
-    return await group_service.get_groups_by_user_id(current_user.id)
+    return ModelResponse(await group_service.get_groups_by_user_id(current_user.id, fields), include=fields)
 
 
 @router.get("/{group_id}", response_model=GroupResponse)
@@ -145,17 +154,19 @@ async def delete_group(
 @router.get("/{group_id}/periods", response_model=list[PeriodResponse])
 async def get_periods(
     group_id: int,
-    period_service: Annotated[PeriodService, Depends(get_period_service)],
+    period_service: Annotated[PeriodService, Depends(get_read_period_service)],
+    fields: Annotated[frozenset[str] | None, Depends(sparse_fields(PeriodResponse))],
     _group_role_check: Annotated[
-        UserResponse, Depends(requires_group_role(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
+        UserResponse, Depends(requires_group_role(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER, read_only=True))
     ],
-) -> list[PeriodResponse]:
+) -> ModelResponse:
     """
     Get all periods for a specific group.
     Requires group membership (owner, admin, or member).
+    `fields` restricts each period to the given fields.
     """
-    periods = await period_service.get_periods_by_group_id(group_id)
-    return [PeriodResponse.model_validate(period) for period in periods]
+    periods = await period_service.get_periods_by_group_id(group_id, fields)
+    return ModelResponse([validate_partial(PeriodResponse, period, fields) for period in periods], include=fields)
 
 
 @router.get("/{group_id}/periods/current", response_model=PeriodResponse)
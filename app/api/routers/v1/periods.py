@@ -2,29 +2,40 @@
 API v1 router for Period endpoints.
 """
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user
 from app.api.dependencies.authz import requires_group_role_for_period
-from app.api.dependencies.db import get_serializable_db
+from app.api.dependencies.caching import CacheValidators, get_period_cache_validators
+from app.api.dependencies.db import get_db, get_serializable_db
+from app.api.dependencies.formats import TRANSACTION_LIST_MEDIA_TYPES, get_transaction_list_format, sparse_fields
 from app.api.dependencies.services import (
     get_period_service,
+    get_read_period_service,
+    get_read_settlement_service,
+    get_read_transaction_service,
     get_serializable_settlement_service,
-    get_settlement_service,
     get_transaction_service,
 )
+from app.api.responses import ModelResponse
+from app.core.events import event_hub, period_channel
 from app.core.i18n import _
-from app.exceptions import NotFoundError
+from app.exceptions import NotFoundError, ValidationError
 from app.models import GroupRole
 from app.schemas import (
     BalanceResponse,
+    ColumnarTransactionListResponse,
+    CompactTransactionListResponse,
+    PeriodEventKind,
     PeriodRequest,
     PeriodResponse,
     SettlementResponse,
+    TransactionListFormat,
     TransactionRequest,
     TransactionResponse,
     UserResponse,
@@ -37,9 +48,10 @@ router = APIRouter(prefix="/periods", tags=["periods"], dependencies=[Depends(ge
 @router.get("/{period_id}", response_model=PeriodResponse)
 async def get_period(
     period_id: int,
-    period_service: Annotated[PeriodService, Depends(get_period_service)],
+    period_service: Annotated[PeriodService, Depends(get_read_period_service)],
     _group_role_check: Annotated[
-        UserResponse, Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
+        UserResponse,
+        Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER, read_only=True)),
     ],
 ) -> PeriodResponse:
     """
@@ -83,19 +95,49 @@ async def close_period(
     return await period_service.close_period(period_id)
 
 
-@router.get("/{period_id}/transactions", response_model=list[TransactionResponse])
+@router.get(
+    "/{period_id}/transactions",
+    response_model=list[TransactionResponse] | CompactTransactionListResponse | ColumnarTransactionListResponse,
+)
 async def get_transactions(
     period_id: int,
-    transaction_service: Annotated[TransactionService, Depends(get_transaction_service)],
+    transaction_service: Annotated[TransactionService, Depends(get_read_transaction_service)],
+    list_format: Annotated[TransactionListFormat, Depends(get_transaction_list_format)],
+    fields: Annotated[frozenset[str] | None, Depends(sparse_fields(TransactionResponse))],
     _group_role_check: Annotated[
-        UserResponse, Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
+        UserResponse,
+        Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER, read_only=True)),
     ],
-) -> Sequence[TransactionResponse]:
+    validators: Annotated[CacheValidators, Depends(get_period_cache_validators)],
+) -> ModelResponse:
     """
     Get the transactions for a specific period.
     Requires group membership for the period's group.
-    """
-    return await transaction_service.get_transactions_by_period_id(period_id)
+    Answers a matching `If-None-Match` with 304 Not Modified.
+
+    The `format` query parameter, or else the `Accept` header, selects the representation:
+    - `full` (`application/json`): a list of transactions with payer, category and period names
+    - `compact` (`application/vnd.divvy.transactions.compact+json`): transactions referencing
+      users and categories by ID, plus one dictionary of their names
+    - `columns` (`application/vnd.divvy.transactions.columns+json`): the compact representation
+      with one array per field instead of one object per transaction
+
+    `fields` restricts each transaction of the full representation to the given fields.
+    """
+    if fields is not None and list_format != TransactionListFormat.FULL:
+        raise ValidationError(_("Fields can only be selected in the full format"))
+    if list_format == TransactionListFormat.COMPACT:
+        content = await transaction_service.get_compact_transactions_by_period_id(period_id)
+    elif list_format == TransactionListFormat.COLUMNS:
+        content = await transaction_service.get_transaction_columns_by_period_id(period_id)
+    else:
+        content = await transaction_service.get_transactions_by_period_id(period_id, fields)
+    return ModelResponse(
+        content,
+        headers={"Vary": "Accept", **validators.headers},
+        media_type=TRANSACTION_LIST_MEDIA_TYPES[list_format],
+        include=fields,
+    )
 
 
 @router.post("/{period_id}/transactions", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
@@ -116,45 +158,91 @@ async def create_transaction(
 @router.get("/{period_id}/balances", response_model=list[BalanceResponse])
 async def get_balances(
     period_id: int,
-    transaction_service: Annotated[TransactionService, Depends(get_transaction_service)],
+    transaction_service: Annotated[TransactionService, Depends(get_read_transaction_service)],
     _group_role_check: Annotated[
-        UserResponse, Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
+        UserResponse,
+        Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER, read_only=True)),
     ],
-) -> Sequence[BalanceResponse]:
+    validators: Annotated[CacheValidators, Depends(get_period_cache_validators)],
+) -> ModelResponse:
     """
     Get the balances for a specific period.
     Requires group membership for the period's group.
+    Answers a matching `If-None-Match` with 304 Not Modified.
 
     Returns a list of user balances where:
     - Positive balance = user is owed money
     - Negative balance = user owes money
     """
-    return await transaction_service.get_all_balances(period_id)
+    return ModelResponse(await transaction_service.get_all_balances(period_id), headers=validators.headers)
+
+
+@router.get("/{period_id}/events", response_class=EventSourceResponse)
+async def stream_period_events(
+    period_id: int,
+    transaction_service: Annotated[TransactionService, Depends(get_transaction_service)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _group_role_check: Annotated[
+        UserResponse, Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
+    ],
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Stream live updates of a period as Server-Sent Events.
+    Requires group membership for the period's group, checked once when the stream opens.
+
+    The stream starts with a `balances` event holding the current balances, then sends
+    one `transaction.created`, `transaction.updated` or `transaction.deleted` event per
+    committed change, with the balance deltas it causes. The event ID is the period
+    version the event brings the client to.
+
+    A client that falls too far behind gets a `resync` event and the stream ends;
+    reconnect to start over from fresh balances.
+    """
+    with event_hub.subscribe(period_channel(period_id)) as subscription:
+        # Read the balances in a transaction begun after subscribing: a change committed
+        # since is either in them or delivered as an event, and events are ordered by version
+        await db.commit()
+        snapshot = await transaction_service.get_balances_event(period_id)
+        # The stream holds no connection while it waits for events
+        await db.close()
+        yield ServerSentEvent(data=snapshot, event=PeriodEventKind.BALANCES.value, id=str(snapshot.version))
+
+        async for event in subscription:
+            if event.version > snapshot.version:
+                yield ServerSentEvent(data=event, event=event.kind.value, id=str(event.version))
+
+    yield ServerSentEvent(data={"period_id": period_id}, event=PeriodEventKind.RESYNC.value)
 
 
 @router.get("/{period_id}/get-settlement-plan", response_model=list[SettlementResponse])
 async def get_settlement_plan(
     period_id: int,
-    settlement_service: Annotated[SettlementService, Depends(get_settlement_service)],
+    settlement_service: Annotated[SettlementService, Depends(get_read_settlement_service)],
+    fields: Annotated[frozenset[str] | None, Depends(sparse_fields(SettlementResponse))],
     _group_role_check: Annotated[
-        UserResponse, Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
+        UserResponse,
+        Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER, read_only=True)),
     ],
-) -> Sequence[SettlementResponse]:
+    validators: Annotated[CacheValidators, Depends(get_period_cache_validators)],
+) -> ModelResponse:
     """
     Get the settlement plan for a specific period.
     Requires group membership for the period's group.
+    `fields` restricts each settlement to the given fields.
+    Answers a matching `If-None-Match` with 304 Not Modified.
     """
-    return await settlement_service.get_settlement_plan(period_id)
+    plan = await settlement_service.get_settlement_plan(period_id)
+    return ModelResponse(plan, headers=validators.headers, include=fields)
 
 
 @router.post("/{period_id}/apply-settlement-plan", status_code=status.HTTP_204_NO_CONTENT)
 async def apply_settlement_plan(
     period_id: int,
-    settlement_service: Annotated[SettlementService, Depends(get_serializable_settlement_service)],
-    db: Annotated[AsyncSession, Depends(get_serializable_db)],
     _group_role_check: Annotated[
         UserResponse, Depends(requires_group_role_for_period(GroupRole.OWNER, GroupRole.ADMIN))
     ],
+    settlement_service: Annotated[SettlementService, Depends(get_serializable_settlement_service)],
+    db: Annotated[AsyncSession, Depends(get_serializable_db)],
 ) -> None:
     """
     Apply the settlement plan and settle the period.
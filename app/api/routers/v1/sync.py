@@ -0,0 +1,34 @@
+"""
+API v1 router for incremental sync.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies import get_current_user
+from app.api.dependencies.services import get_sync_service
+from app.api.responses import ModelResponse
+from app.schemas import SyncResponse, UserResponse
+from app.services import SyncService
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.get("/", response_model=SyncResponse)
+async def sync(
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    sync_service: Annotated[SyncService, Depends(get_sync_service)],
+    cursor: Annotated[int | None, Query(ge=0, description="Cursor returned by the previous sync")] = None,
+    limit: Annotated[int, Query(ge=1, le=5000, description="Maximum number of changes to consume")] = 1000,
+) -> ModelResponse:
+    """
+    Get what changed in the current user's groups since a cursor.
+
+    Without a cursor, returns a snapshot of all the user's groups and the cursor to
+    continue from. Each changed group, period, transaction (with its expense shares),
+    settlement and category is returned once in its current state; deletions and
+    groups the user left are listed in `deleted`. While `has_more` is set, sync again
+    with the returned cursor.
+    """
+    return ModelResponse(await sync_service.get_changes(current_user.id, cursor, limit))
@@ -46,7 +46,7 @@ async def update_transaction(
         UserResponse, Depends(requires_group_role_for_transaction(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
     ],
     _status_and_creator_check: Annotated[
-        TransactionResponse, Depends(requires_transaction_status_and_creator(TransactionStatus.DRAFT))
+        TransactionStatus, Depends(requires_transaction_status_and_creator(TransactionStatus.DRAFT))
     ],
 ) -> TransactionResponse:
     """Update an existing transaction."""
@@ -60,7 +60,7 @@ async def approve_transaction(
     _group_role_check: Annotated[
         UserResponse, Depends(requires_group_role_for_transaction(GroupRole.OWNER, GroupRole.ADMIN))
     ],
-    _status_check: Annotated[TransactionResponse, Depends(requires_transaction_status(TransactionStatus.PENDING))],
+    _status_check: Annotated[TransactionStatus, Depends(requires_transaction_status(TransactionStatus.PENDING))],
 ) -> TransactionResponse:
     """
     Approve a pending transaction.
@@ -75,7 +75,7 @@ async def reject_transaction(
     _group_role_check: Annotated[
         UserResponse, Depends(requires_group_role_for_transaction(GroupRole.OWNER, GroupRole.ADMIN))
     ],
-    _status_check: Annotated[TransactionResponse, Depends(requires_transaction_status(TransactionStatus.PENDING))],
+    _status_check: Annotated[TransactionStatus, Depends(requires_transaction_status(TransactionStatus.PENDING))],
 ) -> TransactionResponse:
     """
     Reject a pending transaction.
@@ -94,7 +94,7 @@ async def submit_transaction(
         ),
     ],
     _status_and_creator_check: Annotated[
-        TransactionResponse, Depends(requires_transaction_status_and_creator(TransactionStatus.DRAFT))
+        TransactionStatus, Depends(requires_transaction_status_and_creator(TransactionStatus.DRAFT))
     ],
 ) -> TransactionResponse:
     """
@@ -111,7 +111,7 @@ async def draft_transaction(
         UserResponse, Depends(requires_group_role_for_transaction(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
     ],
     _status_and_creator_check: Annotated[
-        TransactionResponse,
+        TransactionStatus,
         Depends(requires_transaction_status_and_creator(TransactionStatus.PENDING, TransactionStatus.REJECTED)),
     ],
 ) -> TransactionResponse:
@@ -129,7 +129,7 @@ async def delete_transaction(
         UserResponse, Depends(requires_group_role_for_transaction(GroupRole.OWNER, GroupRole.ADMIN, GroupRole.MEMBER))
     ],
     _status_and_creator_check: Annotated[
-        TransactionResponse,
+        TransactionStatus,
         Depends(requires_transaction_status_and_creator(TransactionStatus.DRAFT, TransactionStatus.REJECTED)),
     ],
 ) -> None:
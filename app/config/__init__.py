@@ -13,14 +13,17 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 # Import settings helpers from sub-modules
-from .app import get_frontend_url, get_google_redirect_uri, get_microsoft_redirect_uri
+from .app import get_category_catalog_ttl, get_frontend_url, get_google_redirect_uri, get_microsoft_redirect_uri
 from .auth import (
+    get_access_token_cache_size,
     get_access_token_expire_delta,
     get_access_token_secret_key,
     get_account_link_request_expiration_delta,
     get_core_jwt_secret_key,
     get_google_client_id,
     get_google_client_secret,
+    get_identity_provider_metadata_ttl,
+    get_identity_provider_timeout,
     get_jwt_algorithm,
     get_microsoft_client_id,
     get_microsoft_client_secret,
@@ -31,6 +34,23 @@ from .auth import (
     get_state_token_expire_delta,
     get_state_token_secret_key,
 )
+from .database import (
+    get_database_replica_selection,
+    get_database_replica_urls,
+    get_db_max_overflow,
+    get_db_pool_liveness,
+    get_db_pool_recycle,
+    get_db_pool_size,
+    get_db_pool_timeout,
+    get_read_your_writes_window,
+    get_repeated_statement_action,
+    get_repeated_statement_threshold,
+    get_sql_server_timing_enabled,
+    get_sqlite_busy_timeout,
+    get_sqlite_cache_size,
+    get_sqlite_mmap_size,
+    get_sqlite_profile_enabled,
+)
 from .log import setup_logging
 
 # Module-level logger (used before or during main app logging setup)
@@ -115,6 +135,7 @@ __all__ = [
     "get_refresh_token_secret_key",
     "get_access_token_expire_delta",
     "get_refresh_token_expire_delta",
+    "get_access_token_cache_size",
     # State Token (OAuth Flow Security)
     "get_state_token_algorithm",
     "get_state_token_secret_key",
@@ -125,10 +146,34 @@ __all__ = [
     "get_frontend_url",
     "get_google_redirect_uri",
     "get_microsoft_redirect_uri",
+    # Application Configuration (Caching)
+    "get_category_catalog_ttl",
     # Identity Providers (Credentials)
     "get_google_client_id",
     "get_google_client_secret",
     "get_microsoft_client_id",
     "get_microsoft_client_secret",
     "get_microsoft_tenant_id",
+    # Identity Providers (HTTP client and metadata caching)
+    "get_identity_provider_timeout",
+    "get_identity_provider_metadata_ttl",
+    # Database (Connection Pool)
+    "get_db_pool_size",
+    "get_db_max_overflow",
+    "get_db_pool_timeout",
+    "get_db_pool_recycle",
+    "get_db_pool_liveness",
+    # Database (SQLite Performance Profile)
+    "get_sqlite_profile_enabled",
+    "get_sqlite_busy_timeout",
+    "get_sqlite_cache_size",
+    "get_sqlite_mmap_size",
+    # Database (Read Replicas)
+    "get_database_replica_urls",
+    "get_database_replica_selection",
+    "get_read_your_writes_window",
+    # Database (SQL Instrumentation)
+    "get_sql_server_timing_enabled",
+    "get_repeated_statement_threshold",
+    "get_repeated_statement_action",
 ]
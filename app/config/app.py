@@ -6,6 +6,7 @@ on routing and external URLs.
 """
 
 import os
+from datetime import timedelta
 
 # --- APPLICATION URLS ---
 
@@ -42,3 +43,19 @@ def get_google_redirect_uri() -> str:
     """
     frontend_url = get_frontend_url()
     return f"{frontend_url}/auth/callback/google"
+
+
+# --- CACHING ---
+
+
+def get_category_catalog_ttl() -> timedelta:
+    """
+    Get how long the in-memory category catalog is trusted before it is revalidated.
+
+    Revalidating compares the latest category change log entry with the one the catalog
+    was loaded at, so other workers' category writes show up within this time.
+    Read from the environment in seconds (DIVVY_CATEGORY_CATALOG_TTL_SECONDS).
+    Returns:
+        Revalidation interval (default: 30 seconds).
+    """
+    return timedelta(seconds=float(os.getenv("DIVVY_CATEGORY_CATALOG_TTL_SECONDS", "30")))
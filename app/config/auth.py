@@ -80,6 +80,19 @@ def get_refresh_token_expire_delta() -> timedelta:
     return timedelta(days=days)
 
 
+def get_access_token_cache_size() -> int:
+    """
+    Get the maximum number of verified access token claims kept in the in-process cache.
+
+    Cached claims are reused until the token's 'exp', skipping repeated signature checks
+    for clients that send the same bearer token on every request. Set to 0 to disable.
+
+    Returns:
+        Maximum number of cached tokens (default: 4096).
+    """
+    return int(os.getenv("DIVVY_ACCESS_TOKEN_CACHE_SIZE", "4096"))
+
+
 # --- OAUTH STATE TOKEN CONFIGURATION (CRITICAL SEPARATION) ---
 
 
@@ -141,6 +154,30 @@ def get_account_link_request_expiration_delta() -> timedelta:
 # --- IDENTITY PROVIDER (OAuth) CONFIGURATION (UNCHANGED) ---
 
 
+def get_identity_provider_timeout() -> float:
+    """
+    Get the timeout for HTTP calls to identity providers, in seconds.
+
+    Read from the environment (DIVVY_IDENTITY_PROVIDER_TIMEOUT_SECONDS).
+    Returns:
+        Timeout in seconds (default: 10).
+    """
+    return float(os.getenv("DIVVY_IDENTITY_PROVIDER_TIMEOUT_SECONDS", "10"))
+
+
+def get_identity_provider_metadata_ttl() -> timedelta:
+    """
+    Get how long OIDC discovery metadata and signing keys (JWKS) are cached.
+
+    The duration is read in minutes from the environment (DIVVY_IDENTITY_PROVIDER_METADATA_TTL_MINUTES).
+    An unknown signing key ID always triggers a refresh, so key rotation does not wait for the TTL.
+    Returns:
+        Cache lifetime (default: 60 minutes).
+    """
+    minutes = int(os.getenv("DIVVY_IDENTITY_PROVIDER_METADATA_TTL_MINUTES", "60"))
+    return timedelta(minutes=minutes)
+
+
 def get_microsoft_client_id() -> str:
     """Get Microsoft Entra ID Client ID."""
     client_id = os.getenv("MICROSOFT_CLIENT_ID")
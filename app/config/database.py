@@ -0,0 +1,224 @@
+"""
+Database Configuration 🗄️
+
+This module defines connection pool settings for the async SQLAlchemy engines and
+the performance profile applied to file-based SQLite databases.
+
+---
+DESIGN:
+- Pool sizing (size, overflow, checkout timeout) applies to pooled backends only;
+  in-memory SQLite uses a single shared connection and ignores it.
+- Connection liveness is either checked on every checkout ("pre_ping", one extra
+  round trip per checkout) or bounded by recycling connections older than the
+  recycle interval ("recycle", no extra round trip).
+- The opt-in SQLite profile (WAL journal plus connection pragmas) splits the database
+  into one writer connection, which serializes sessions, and a pool of read connections
+  for read-only sessions.
+- Optional read replicas serve the read-only dependencies that opt into them; users
+  who wrote recently are pinned to the primary for the read-your-writes window.
+- SQL instrumentation counts and times statements per request; in development a
+  statement repeated too often in one request (an N+1 pattern) is reported.
+"""
+
+import os
+from datetime import timedelta
+from typing import Final, Literal
+
+PoolLiveness = Literal["pre_ping", "recycle"]
+ReplicaSelection = Literal["round_robin", "least_connections"]
+RepeatedStatementAction = Literal["off", "warn", "raise"]
+
+POOL_LIVENESS_MODES: Final[tuple[PoolLiveness, ...]] = ("pre_ping", "recycle")
+REPLICA_SELECTION_MODES: Final[tuple[ReplicaSelection, ...]] = ("round_robin", "least_connections")
+REPEATED_STATEMENT_ACTIONS: Final[tuple[RepeatedStatementAction, ...]] = ("off", "warn", "raise")
+
+
+def get_db_pool_size() -> int:
+    """
+    Get the number of connections kept open in the pool.
+
+    Returns:
+        Pool size (default: 5).
+    """
+    return int(os.getenv("DIVVY_DB_POOL_SIZE", "5"))
+
+
+def get_db_max_overflow() -> int:
+    """
+    Get how many connections may be opened beyond the pool size under load.
+
+    Overflow connections are closed when returned to the pool.
+    Returns:
+        Maximum overflow (default: 10).
+    """
+    return int(os.getenv("DIVVY_DB_MAX_OVERFLOW", "10"))
+
+
+def get_db_pool_timeout() -> float:
+    """
+    Get how long a request waits for a free connection before failing, in seconds.
+
+    Returns:
+        Checkout timeout in seconds (default: 30).
+    """
+    return float(os.getenv("DIVVY_DB_POOL_TIMEOUT_SECONDS", "30"))
+
+
+def get_db_pool_recycle() -> int:
+    """
+    Get the maximum age of a pooled connection, in seconds.
+
+    Connections older than this are replaced on checkout. Keep it below the server's
+    idle timeout (e.g. MySQL wait_timeout) when using "recycle" liveness.
+    Returns:
+        Recycle interval in seconds, -1 to disable (default: 1800).
+    """
+    return int(os.getenv("DIVVY_DB_POOL_RECYCLE_SECONDS", "1800"))
+
+
+def get_db_pool_liveness() -> PoolLiveness:
+    """
+    Get the strategy used to avoid handing out dead connections.
+
+    Returns:
+        "pre_ping" or "recycle" (default: "pre_ping").
+
+    Raises:
+        ValueError: If DIVVY_DB_POOL_LIVENESS is set to an unknown strategy.
+    """
+    liveness = os.getenv("DIVVY_DB_POOL_LIVENESS", "pre_ping").strip().lower()
+    if liveness not in POOL_LIVENESS_MODES:
+        raise ValueError(f"DIVVY_DB_POOL_LIVENESS must be one of {', '.join(POOL_LIVENESS_MODES)}")
+    return liveness
+
+
+# --- SQLITE PERFORMANCE PROFILE ---
+
+
+def get_sqlite_profile_enabled() -> bool:
+    """
+    Get whether the SQLite performance profile is applied to file-based SQLite databases.
+
+    The profile enables the WAL journal with synchronous=NORMAL, tunes cache, mmap,
+    busy timeout and temp storage, and runs every session but the read-only ones
+    (get_read_session) on a single writer connection, so those sessions queue for it.
+    Returns:
+        True if DIVVY_SQLITE_PROFILE is "true", "1" or "on" (default: disabled).
+    """
+    return os.getenv("DIVVY_SQLITE_PROFILE", "false").strip().lower() in ("true", "1", "on")
+
+
+def get_sqlite_busy_timeout() -> int:
+    """
+    Get how long a SQLite connection waits for a lock held by another connection, in milliseconds.
+
+    Returns:
+        Busy timeout in milliseconds (default: 5000).
+    """
+    return int(os.getenv("DIVVY_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+
+def get_sqlite_cache_size() -> int:
+    """
+    Get the page cache size of each SQLite connection, in KiB.
+
+    Returns:
+        Cache size in KiB (default: 65536, i.e. 64 MiB).
+    """
+    return int(os.getenv("DIVVY_SQLITE_CACHE_SIZE_KIB", "65536"))
+
+
+def get_sqlite_mmap_size() -> int:
+    """
+    Get how much of the SQLite database file is memory-mapped, in bytes.
+
+    Returns:
+        Memory map size in bytes, 0 to disable (default: 268435456, i.e. 256 MiB).
+    """
+    return int(os.getenv("DIVVY_SQLITE_MMAP_SIZE_BYTES", "268435456"))
+
+
+# --- READ REPLICAS ---
+
+
+def get_database_replica_urls() -> list[str]:
+    """
+    Get the async connection URLs of read replicas of the primary database.
+
+    Read from the environment as a comma-separated list (DIVVY_DATABASE_REPLICA_URLS).
+    Returns:
+        Replica URLs (default: none, all reads go to the primary).
+    """
+    urls = os.getenv("DIVVY_DATABASE_REPLICA_URLS", "")
+    return [url.strip() for url in urls.split(",") if url.strip()]
+
+
+def get_database_replica_selection() -> ReplicaSelection:
+    """
+    Get how a replica is chosen for each read session.
+
+    Returns:
+        "round_robin" or "least_connections" (default: "round_robin").
+
+    Raises:
+        ValueError: If DIVVY_DATABASE_REPLICA_SELECTION is set to an unknown strategy.
+    """
+    selection = os.getenv("DIVVY_DATABASE_REPLICA_SELECTION", "round_robin").strip().lower()
+    if selection not in REPLICA_SELECTION_MODES:
+        raise ValueError(f"DIVVY_DATABASE_REPLICA_SELECTION must be one of {', '.join(REPLICA_SELECTION_MODES)}")
+    return selection
+
+
+def get_read_your_writes_window() -> timedelta:
+    """
+    Get how long a user who wrote to the primary keeps reading from it instead of a replica.
+
+    Should exceed the usual replication lag. Read from the environment in seconds
+    (DIVVY_READ_YOUR_WRITES_SECONDS).
+    Returns:
+        Pinning window (default: 5 seconds).
+    """
+    return timedelta(seconds=float(os.getenv("DIVVY_READ_YOUR_WRITES_SECONDS", "5")))
+
+
+# --- SQL INSTRUMENTATION ---
+
+
+def get_sql_server_timing_enabled() -> bool:
+    """
+    Get whether responses carry a Server-Timing header with the request's SQL count and time.
+
+    Returns:
+        True if DIVVY_SQL_SERVER_TIMING is "true", "1" or "on" (default: disabled).
+    """
+    return os.getenv("DIVVY_SQL_SERVER_TIMING", "false").strip().lower() in ("true", "1", "on")
+
+
+def get_repeated_statement_threshold() -> int:
+    """
+    Get how many times one request may run the same SQL statement before it is reported.
+
+    Returns:
+        Maximum executions of one statement per request (default: 10).
+    """
+    return int(os.getenv("DIVVY_SQL_REPEATED_STATEMENT_THRESHOLD", "10"))
+
+
+def get_repeated_statement_action() -> RepeatedStatementAction:
+    """
+    Get what happens when a request exceeds the repeated statement threshold.
+
+    "warn" logs the statement once per request; "raise" fails the request with a
+    RepeatedStatementError before the statement exceeding the threshold runs, which is
+    meant for development and tests.
+    Returns:
+        "off", "warn" or "raise" (default: "warn" when DIVVY_ENV is "dev", otherwise "off").
+
+    Raises:
+        ValueError: If DIVVY_SQL_REPEATED_STATEMENT_ACTION is set to an unknown action.
+    """
+    default = "warn" if os.getenv("DIVVY_ENV") == "dev" else "off"
+    action = (os.getenv("DIVVY_SQL_REPEATED_STATEMENT_ACTION") or default).strip().lower()
+    if action not in REPEATED_STATEMENT_ACTIONS:
+        raise ValueError(f"DIVVY_SQL_REPEATED_STATEMENT_ACTION must be one of {', '.join(REPEATED_STATEMENT_ACTIONS)}")
+    return action
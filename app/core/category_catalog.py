@@ -0,0 +1,154 @@
+"""
+Process-wide catalog of categories.
+
+Categories are seeded by migration and rarely change, so they are kept in memory:
+loaded once (at startup, or on first use), then kept current by `CategoryService`
+writes once they commit. Transaction responses and validation resolve category
+names from here instead of joining the categories table.
+
+Writes made by other processes are picked up when the catalog is revalidated:
+once its TTL has passed, the next read compares the latest category change log
+entry with the one the catalog was loaded at and reloads it if they differ (see
+`CategoryService.load_catalog`). A category missing from the catalog also reloads it.
+"""
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Protocol, Self
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.i18n import SUPPORTED_LANGUAGES, translate_category
+from app.db.hooks import has_pending_callbacks, run_on_commit
+
+_CATALOG_TOPIC = "category_catalog"
+
+# Normalized language codes, each catalog entry carries its name in all of them
+CATALOG_LANGUAGES = tuple(sorted(set(SUPPORTED_LANGUAGES.values())))
+
+
+class CategoryLike(Protocol):
+    """Fields the catalog reads from a category; read-only, so frozen models match too."""
+
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def is_default(self) -> bool: ...
+
+
+@dataclass(frozen=True)
+class CatalogCategory:
+    """A category as held by the catalog."""
+
+    id: int
+    name: str
+    is_default: bool
+    translated_names: Mapping[str, str]
+
+    @classmethod
+    def from_category(cls, category: CategoryLike) -> Self:
+        return cls(
+            id=category.id,
+            name=category.name,
+            is_default=category.is_default,
+            translated_names=MappingProxyType(
+                {lang: translate_category(category.name, lang) for lang in CATALOG_LANGUAGES}
+            ),
+        )
+
+    def translated_name(self, lang: str) -> str:
+        """Name in the given normalized language, falling back to the stored name."""
+        return self.translated_names.get(lang, self.name)
+
+
+class CategoryCatalog:
+    """In-memory categories by id; every update swaps in a new mapping."""
+
+    def __init__(self) -> None:
+        self._by_id: Mapping[int, CatalogCategory] = MappingProxyType({})
+        self._loaded = False
+        # Latest category change log entry when loaded, and when that was last confirmed
+        self._version = 0
+        self._validated_at = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def load(self, categories: Iterable[CategoryLike], version: int = 0) -> None:
+        """Replace the catalog contents with `categories`, read at change log entry `version`."""
+        self._by_id = MappingProxyType({c.id: CatalogCategory.from_category(c) for c in categories})
+        self._loaded = True
+        self._version = version
+        self._validated_at = time.monotonic()
+
+    def is_expired(self, ttl: timedelta) -> bool:
+        """Check whether the contents were last loaded or validated more than `ttl` ago."""
+        return time.monotonic() - self._validated_at >= ttl.total_seconds()
+
+    def mark_validated(self) -> None:
+        """Record that the contents were just found current."""
+        self._validated_at = time.monotonic()
+
+    def put(self, category: CategoryLike) -> None:
+        """Add or replace one category."""
+        self._by_id = MappingProxyType({**self._by_id, category.id: CatalogCategory.from_category(category)})
+
+    def remove(self, category_id: int) -> None:
+        """Remove one category, if present."""
+        self._by_id = MappingProxyType({k: v for k, v in self._by_id.items() if k != category_id})
+
+    def clear(self) -> None:
+        """Empty the catalog and mark it as not loaded."""
+        self._by_id = MappingProxyType({})
+        self._loaded = False
+        self._version = 0
+        self._validated_at = 0.0
+
+    def get(self, category_id: int) -> CatalogCategory | None:
+        return self._by_id.get(category_id)
+
+    def get_by_name(self, name: str) -> CatalogCategory | None:
+        return next((c for c in self._by_id.values() if c.name == name), None)
+
+    def get_name(self, category_id: int) -> str | None:
+        category = self._by_id.get(category_id)
+        return category.name if category else None
+
+    def all(self) -> list[CatalogCategory]:
+        """All categories ordered by id."""
+        return sorted(self._by_id.values(), key=lambda c: c.id)
+
+
+category_catalog = CategoryCatalog()
+
+
+def update_on_commit(session: AsyncSession | Session, update: Callable[[CategoryCatalog], None]) -> None:
+    """
+    Apply `update` to the catalog once `session` commits.
+
+    Updates are dropped if the session rolls back, so the catalog never holds
+    categories that were not persisted.
+
+    Args:
+        session: Async or sync session the category write was made in
+        update: Callable receiving the process-wide catalog
+    """
+    run_on_commit(session, _CATALOG_TOPIC, lambda: update(category_catalog))
+
+
+def has_pending_updates(session: AsyncSession | Session) -> bool:
+    """Check whether `session` made category writes the catalog has not seen yet."""
+    return has_pending_callbacks(session, _CATALOG_TOPIC)
@@ -0,0 +1,96 @@
+"""
+Batching, memoizing loader for related entities.
+
+Keys requested with `load()` during one event-loop tick are collected and resolved by
+a single call to the batch function (typically one `IN` query). Results are memoized
+for the lifetime of the loader, which is meant to be one request.
+
+Loaders that share an `AsyncSession` must share a lock: a session cannot run two
+statements at once, and batches of different loaders dispatch in the same tick.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection, Iterable, Mapping
+
+
+class DataLoader[K, V]:
+    """Collects keys loaded within one event-loop tick and resolves them in one batch."""
+
+    def __init__(
+        self,
+        batch_load: Callable[[Collection[K]], Awaitable[Mapping[K, V]]],
+        lock: asyncio.Lock | None = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            batch_load: Resolves a batch of distinct keys to a mapping of the keys found;
+                keys missing from the mapping resolve to None
+            lock: Serializes batches, shared by loaders that use the same session
+        """
+        self._batch_load = batch_load
+        self._lock = lock or asyncio.Lock()
+        self._results: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def load(self, key: K) -> Awaitable[V | None]:
+        """Load one key, batched with every other key requested in this tick."""
+        result = self._results.get(key)
+        if result is None:
+            loop = asyncio.get_running_loop()
+            result = self._results[key] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return result
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """Load several keys in one batch, in the order given."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Memoize an already known value, unless the key is loaded or loading."""
+        if key not in self._results:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._results[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget a memoized key, e.g. after the entity changed."""
+        result = self._results.get(key)
+        if result is not None and result.done():
+            del self._results[key]
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._run(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: list[K]) -> None:
+        futures = [self._results[key] for key in keys]
+        try:
+            async with self._lock:
+                values = await self._batch_load(keys)
+        except Exception as exc:
+            self._forget(keys, futures)
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            self._forget(keys, futures)
+            for future in futures:
+                future.cancel()
+            raise
+        for key, future in zip(keys, futures, strict=True):
+            if not future.done():
+                future.set_result(values.get(key))
+
+    def _forget(self, keys: list[K], futures: list[asyncio.Future[V | None]]) -> None:
+        # Failed keys are not memoized, a later load retries them
+        for key, future in zip(keys, futures, strict=True):
+            if self._results.get(key) is future:
+                del self._results[key]
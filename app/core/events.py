@@ -0,0 +1,120 @@
+"""
+Process-wide publish/subscribe hub for live updates.
+
+Writers publish an event to a channel once their transaction commits (see
+`publish_on_commit`), and each subscriber of the channel receives it on its own
+bounded queue. Publishing never waits: a subscriber that falls further behind than
+its queue holds is dropped, and its stream ends so the client can start over from a
+fresh snapshot.
+
+The hub only sees writes made by this process; with several workers, a subscriber
+only receives the events of writes served by its own worker.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Generator, Hashable
+from contextlib import contextmanager
+from typing import Any, Self
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.hooks import run_on_commit
+
+_EVENT_HUB_TOPIC = "event_hub"
+
+# Events queued per subscriber before it is dropped as lagging
+DEFAULT_MAX_PENDING_EVENTS = 256
+
+
+def period_channel(period_id: int) -> str:
+    """Channel of the events of a period."""
+    return f"period:{period_id}"
+
+
+class Subscription[EventT]:
+    """Events published to a channel since subscribing; iterate to receive them."""
+
+    def __init__(self, max_pending: int) -> None:
+        self._queue: asyncio.Queue[EventT] = asyncio.Queue(max_pending)
+        self._lagged = False
+
+    @property
+    def lagged(self) -> bool:
+        """Whether events were dropped because the subscriber fell behind."""
+        return self._lagged
+
+    def deliver(self, event: EventT) -> bool:
+        """Queue an event; return False, marking the subscription lagged, if the queue is full."""
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._lagged = True
+            return False
+        return True
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> EventT:
+        # The events still queued miss the dropped ones: stop rather than deliver a gap
+        if not self._lagged:
+            event = await self._queue.get()
+            if not self._lagged:
+                return event
+        raise StopAsyncIteration
+
+
+class EventHub[EventT]:
+    """Subscribers by channel; publishing hands each of them the event."""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING_EVENTS) -> None:
+        self._max_pending = max_pending
+        self._subscriptions: defaultdict[Hashable, set[Subscription[EventT]]] = defaultdict(set)
+
+    @contextmanager
+    def subscribe(self, channel: Hashable) -> Generator[Subscription[EventT]]:
+        """Receive the events published to `channel` until the block exits."""
+        subscription = Subscription[EventT](self._max_pending)
+        self._subscriptions[channel].add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._unsubscribe(channel, subscription)
+
+    def subscriber_count(self, channel: Hashable) -> int:
+        """Number of subscribers listening on `channel`."""
+        return len(self._subscriptions.get(channel, ()))
+
+    def publish(self, channel: Hashable, event: EventT) -> None:
+        """Hand `event` to every subscriber of `channel`, dropping those that fell behind."""
+        for subscription in list(self._subscriptions.get(channel, ())):
+            if not subscription.deliver(event):
+                self._unsubscribe(channel, subscription)
+
+    def _unsubscribe(self, channel: Hashable, subscription: Subscription[EventT]) -> None:
+        subscriptions = self._subscriptions.get(channel)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[channel]
+
+
+event_hub: EventHub[Any] = EventHub()
+
+
+def publish_on_commit(session: AsyncSession | Session, channel: Hashable, event: Any) -> None:
+    """
+    Publish `event` to `channel` of the process-wide hub once `session` commits.
+
+    Events are dropped if the session rolls back, so subscribers never see changes
+    that were not persisted, nor see them before they can be read.
+
+    Args:
+        session: Async or sync session the change was made in
+        channel: Channel to publish to
+        event: Event handed to the subscribers
+    """
+    run_on_commit(session, _EVENT_HUB_TOPIC, lambda: event_hub.publish(channel, event))
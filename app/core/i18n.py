@@ -3,6 +3,7 @@ Internationalization (i18n) support for Divvy CLI.
 Provides translation functions and language management.
 """
 
+import functools
 import gettext
 import locale
 import os
@@ -125,6 +126,10 @@ def get_language() -> str:
     return DEFAULT_LANGUAGE
 
 
+# Language of the global translation object, used to pick per-language caches
+_language = get_language()
+
+
 def set_language(lang: str | None = None) -> str:
     """
     Sets the language for translations.
@@ -136,7 +141,7 @@ def set_language(lang: str | None = None) -> str:
     Returns:
         The language code that was set
     """
-    global _translation
+    global _translation, _language
 
     if lang:
         normalized = SUPPORTED_LANGUAGES.get(lang)
@@ -157,6 +162,7 @@ def set_language(lang: str | None = None) -> str:
         # If translation files don't exist, use fallback (English)
         _translation = gettext.NullTranslations()
 
+    _language = normalized
     return normalized
 
 
@@ -188,30 +194,48 @@ def ngettext(singular: str, plural: str, n: int) -> str:
     return _translation.ngettext(singular, plural, n)
 
 
-def _get_category_translations() -> dict[str, str]:
-    """Get category translations dictionary (called after language is set)."""
-    return {
-        "Utilities (Water & Electricity & Gas)": _(
-            "Utilities (Water & Electricity & Gas)"
-        ),
-        "Groceries": _("Groceries"),
-        "Daily Necessities": _("Daily Necessities"),
-        "Rent": _("Rent"),
-        "Other": _("Other"),
-    }
+def N_(message: str) -> str:  # noqa: N802
+    """Mark a message for translation without translating it."""
+    return message
+
+
+# Names of the default categories seeded by migration
+DEFAULT_CATEGORY_NAMES = (
+    N_("Utilities (Water & Electricity & Gas)"),
+    N_("Groceries"),
+    N_("Daily Necessities"),
+    N_("Rent"),
+    N_("Other"),
+)
+
+
+@functools.cache
+def get_category_translations(lang: str) -> dict[str, str]:
+    """
+    Get the default category name translations for a language, built once per language.
+
+    Args:
+        lang: Normalized language code (e.g., "en_US", "zh_CN")
+
+    Returns:
+        Mapping of category name to translated name
+    """
+    translation = gettext.translation("divvy", localedir=str(_LOCALE_DIR), languages=[lang], fallback=True)
+    return {name: translation.gettext(name) for name in DEFAULT_CATEGORY_NAMES}
 
 
-def translate_category(category_name: str) -> str:
+def translate_category(category_name: str, lang: str | None = None) -> str:
     """
     Translates a category name.
 
     Args:
         category_name: The category name from database
+        lang: Normalized language code; defaults to the current language
 
     Returns:
         Translated category name
     """
-    translations = _get_category_translations()
+    translations = get_category_translations(lang or _language)
     return translations.get(category_name, category_name)
 
 
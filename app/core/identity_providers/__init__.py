@@ -2,16 +2,26 @@
 Identity provider implementations for OAuth2/OIDC authentication.
 """
 
+from .fake import FakeIdentityProvider
 from .google import GoogleProvider
 from .microsoft import MicrosoftProvider
-from .protocol import IdentityProvider, IdentityProviderTokenResponse, IdentityProviderUserInfo
+from .oidc import OIDCProvider
+from .protocol import (
+    IdentityProvider,
+    IdentityProviderTokenResponse,
+    IdentityProviderUserInfo,
+    IdTokenIdentityProvider,
+)
 from .registry import IdentityProviderRegistry
 
 __all__ = [
     "IdentityProvider",
     "IdentityProviderTokenResponse",
     "IdentityProviderUserInfo",
+    "IdTokenIdentityProvider",
+    "OIDCProvider",
     "GoogleProvider",
     "MicrosoftProvider",
+    "FakeIdentityProvider",
     "IdentityProviderRegistry",
 ]
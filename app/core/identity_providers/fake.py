@@ -0,0 +1,141 @@
+"""
+Fake identity provider for load testing the OAuth callback path.
+
+`FakeIdentityProvider` talks OAuth2 to an in-process ASGI token/userinfo server over a
+pooled `httpx` client, exactly like the real providers talk to theirs, but with a
+configurable artificial latency instead of the public internet. Register it under the
+name of a real provider in a load-test environment to exercise the full
+`IdentityProviderService.handle_oauth_callback` flow (user creation, identity linking,
+token issuance) without contacting Google or Microsoft.
+
+Authorization codes are free-form: each distinct code maps deterministically to one
+external user, so repeating a code simulates a returning user and a new code a sign-up.
+
+Never register this provider in production.
+"""
+
+import asyncio
+import random
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+from fastapi import FastAPI, Form, Header, HTTPException
+
+from app.exceptions import UnauthorizedError
+from app.models import IdentityProviderName
+
+from .oidc import OIDCProvider
+from .protocol import IdentityProviderUserInfo
+
+FAKE_BASE_URL = "http://fake-idp.local"
+
+
+def create_fake_identity_provider_app(latency: float = 0.0, jitter: float = 0.0) -> FastAPI:
+    """Build the in-process token and userinfo server.
+
+    Args:
+        latency: Seconds each endpoint waits before answering, simulating the provider round trip
+        jitter: Maximum extra random delay in seconds added to each response
+
+    Returns:
+        ASGI application serving /token and /userinfo
+    """
+    app = FastAPI(title="Fake identity provider")
+
+    async def _simulate_latency() -> None:
+        delay = latency + (random.uniform(0, jitter) if jitter > 0 else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @app.post("/token")
+    async def token(code: str = Form(...)) -> dict[str, Any]:
+        await _simulate_latency()
+        if not code:
+            raise HTTPException(status_code=400, detail="invalid_grant")
+        return {"access_token": f"fake-access-{code}", "token_type": "Bearer", "expires_in": 3600}
+
+    @app.get("/userinfo")
+    async def userinfo(authorization: str = Header(...)) -> dict[str, Any]:
+        await _simulate_latency()
+        access_token = authorization.removeprefix("Bearer ")
+        code = access_token.removeprefix("fake-access-")
+        if not code or code == access_token:
+            raise HTTPException(status_code=401, detail="invalid_token")
+        return {"id": f"fake-{code}", "email": f"{code}@example.com", "name": f"Fake User {code}"}
+
+    return app
+
+
+class FakeIdentityProvider(OIDCProvider):
+    """Identity provider backed by the in-process fake token/userinfo server."""
+
+    DISPLAY_NAME = "fake identity provider"
+    AUTHORIZATION_ENDPOINT = f"{FAKE_BASE_URL}/authorize"
+    TOKEN_ENDPOINT = f"{FAKE_BASE_URL}/token"
+    USERINFO_ENDPOINT = f"{FAKE_BASE_URL}/userinfo"
+
+    def __init__(
+        self,
+        name: IdentityProviderName = IdentityProviderName.GOOGLE,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the fake provider.
+
+        Args:
+            name: Provider name to register under (impersonates a real provider)
+            latency: Seconds each fake endpoint waits before answering
+            jitter: Maximum extra random delay in seconds per response
+            transport: Transport to the fake server (default: the in-process ASGI app)
+        """
+        self._name = name
+        super().__init__(
+            client_id="fake-client-id",
+            client_secret="fake-client-secret",
+            redirect_uri=f"{FAKE_BASE_URL}/callback",
+            transport=transport or httpx.ASGITransport(app=create_fake_identity_provider_app(latency, jitter)),
+        )
+
+    @property
+    def name(self) -> str:
+        """Provider name."""
+        return self._name.value
+
+    def get_authorization_url(self, state: str | None = None) -> str:
+        """Generate the fake authorization URL.
+
+        Args:
+            state: Optional state parameter for CSRF protection
+
+        Returns:
+            Authorization URL (not served; codes are supplied directly by the load generator)
+        """
+        params: dict[str, str] = {"client_id": self._client_id, "response_type": "code"}
+        if state:
+            params["state"] = state
+        return f"{self.AUTHORIZATION_ENDPOINT}?{urlencode(params)}"
+
+    async def get_user_info(self, access_token: str) -> IdentityProviderUserInfo:
+        """Get standardized user information from the fake userinfo endpoint.
+
+        Args:
+            access_token: Fake access token
+
+        Returns:
+            UserInfo containing standardized user data (external_id, email, name)
+
+        Raises:
+            UnauthorizedError: If the call fails or required fields are missing
+        """
+        raw_response = await self._get_userinfo_json(access_token)
+        if not raw_response.get("id") or not raw_response.get("email"):
+            raise UnauthorizedError("Could not extract user from fake identity provider response")
+
+        return IdentityProviderUserInfo(
+            external_id=raw_response["id"],
+            email=raw_response["email"],
+            name=raw_response.get("name"),
+            raw_data=raw_response,
+        )
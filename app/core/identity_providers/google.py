@@ -3,6 +3,7 @@ Google OAuth2 provider implementation.
 """
 
 import logging
+from typing import Any
 from urllib.parse import urlencode
 
 import httpx
@@ -15,23 +16,38 @@ from app.config import (
 from app.exceptions import UnauthorizedError
 from app.models import IdentityProviderName
 
-from .protocol import IdentityProviderTokenResponse, IdentityProviderUserInfo
+from .oidc import OIDCProvider
+from .protocol import IdentityProviderUserInfo
 
 logger = logging.getLogger(__name__)
 
 
-class GoogleProvider:
+class GoogleProvider(OIDCProvider):
     """Google OAuth2 provider."""
 
+    DISPLAY_NAME = "Google"
     AUTHORIZATION_ENDPOINT = "https://accounts.google.com/o/oauth2/v2/auth"
+    DISCOVERY_ENDPOINT = "https://accounts.google.com/.well-known/openid-configuration"
     TOKEN_ENDPOINT = "https://oauth2.googleapis.com/token"
     USERINFO_ENDPOINT = "https://www.googleapis.com/oauth2/v2/userinfo"
 
-    def __init__(self):
-        """Initialize Google provider with configuration."""
-        self._client_id = get_google_client_id()
-        self._client_secret = get_google_client_secret()
-        self._redirect_uri = get_google_redirect_uri()
+    # Google documents both forms of its issuer
+    ISSUERS = frozenset({"https://accounts.google.com", "accounts.google.com"})
+
+    def __init__(self, *, transport: httpx.AsyncBaseTransport | None = None, **endpoints: str):
+        """Initialize Google provider with configuration.
+
+        Args:
+            transport: Optional httpx transport for the shared client (e.g., a stand-in IdP in tests)
+            **endpoints: Optional endpoint overrides (discovery_endpoint, token_endpoint, userinfo_endpoint)
+        """
+        super().__init__(
+            get_google_client_id(),
+            get_google_client_secret(),
+            get_google_redirect_uri(),
+            transport=transport,
+            **endpoints,
+        )
 
     @property
     def name(self) -> str:
@@ -60,48 +76,8 @@ class GoogleProvider:
 
         return f"{self.AUTHORIZATION_ENDPOINT}?{urlencode(params)}"
 
-    async def exchange_code_for_tokens(self, code: str) -> IdentityProviderTokenResponse:
-        """Exchange authorization code for access token and ID token.
-
-        Args:
-            code: Authorization code from Google callback
-
-        Returns:
-            TokenResponse containing standardized OAuth2 token data
-
-        Raises:
-            UnauthorizedError: If token exchange fails
-        """
-        data: dict[str, str] = {
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "code": code,
-            "grant_type": "authorization_code",
-            "redirect_uri": self._redirect_uri,
-        }
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(self.TOKEN_ENDPOINT, data=data)
-                response.raise_for_status()
-                raw_response = response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"Failed to exchange Google authorization code: {error_detail}")
-            raise UnauthorizedError("Failed to exchange authorization code with Google") from e
-        except httpx.RequestError as e:
-            logger.error(f"Network error exchanging Google code: {e}")
-            raise UnauthorizedError("Network error during token exchange") from e
-
-        return IdentityProviderTokenResponse(
-            access_token=raw_response.get("access_token", ""),
-            token_type=raw_response.get("token_type", "Bearer"),
-            expires_in=raw_response.get("expires_in"),
-            refresh_token=raw_response.get("refresh_token"),
-            scope=raw_response.get("scope"),
-            id_token=raw_response.get("id_token"),
-            raw_data=raw_response,
-        )
+    def _is_expected_issuer(self, issuer: str | None, metadata: dict[str, Any], claims: dict[str, Any]) -> bool:
+        return issuer == metadata.get("issuer") or issuer in self.ISSUERS
 
     async def get_user_info(self, access_token: str) -> IdentityProviderUserInfo:
         """Get and extract standardized user information from Google UserInfo API.
@@ -115,20 +91,7 @@ class GoogleProvider:
         Raises:
             UnauthorizedError: If API call fails or required fields cannot be extracted
         """
-        headers: dict[str, str] = {"Authorization": f"Bearer {access_token}"}
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.USERINFO_ENDPOINT, headers=headers)
-                response.raise_for_status()
-                raw_response = response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"Failed to get Google user info: {error_detail}")
-            raise UnauthorizedError("Failed to retrieve user information from Google") from e
-        except httpx.RequestError as e:
-            logger.error(f"Network error getting Google user info: {e}")
-            raise UnauthorizedError("Network error retrieving user information") from e
+        raw_response = await self._get_userinfo_json(access_token)
 
         external_id = raw_response.get("id", "")
         email = raw_response.get("email", "")
@@ -145,3 +108,28 @@ class GoogleProvider:
             name=name,
             raw_data=raw_response,
         )
+
+    async def get_user_info_from_id_token(self, id_token: str, access_token: str) -> IdentityProviderUserInfo:
+        """Extract standardized user information from a locally verified Google ID token.
+
+        The 'sub' claim is the same identifier the UserInfo API returns as 'id'. Falls back to
+        the UserInfo API if the token carries no email (the 'email' scope was not granted).
+
+        Raises:
+            UnauthorizedError: If the ID token is invalid or has no subject
+        """
+        claims = await self.verify_id_token(id_token, access_token)
+
+        external_id = claims.get("sub", "")
+        email = claims.get("email", "")
+        if not external_id:
+            raise UnauthorizedError("Could not extract user ID from Google ID token")
+        if not email:
+            return await self.get_user_info(access_token)
+
+        return IdentityProviderUserInfo(
+            external_id=external_id,
+            email=email,
+            name=claims.get("name"),
+            raw_data=claims,
+        )
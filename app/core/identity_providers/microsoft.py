@@ -3,6 +3,7 @@ Microsoft Entra ID (formerly Azure AD) OAuth2/OIDC provider implementation.
 """
 
 import logging
+from typing import Any
 from urllib.parse import urlencode
 
 import httpx
@@ -16,24 +17,40 @@ from app.config import (
 from app.exceptions import UnauthorizedError
 from app.models import IdentityProviderName
 
-from .protocol import IdentityProviderTokenResponse, IdentityProviderUserInfo
+from .oidc import OIDCProvider
+from .protocol import IdentityProviderUserInfo
 
 logger = logging.getLogger(__name__)
 
 
-class MicrosoftProvider:
+class MicrosoftProvider(OIDCProvider):
     """Microsoft Entra ID (Microsoft Identity Platform) OAuth2/OIDC provider."""
 
+    DISPLAY_NAME = "Microsoft"
     AUTHORIZATION_ENDPOINT = "https://login.microsoftonline.com/{tenant}/oauth2/v2.0/authorize"
+    DISCOVERY_ENDPOINT = "https://login.microsoftonline.com/{tenant}/v2.0/.well-known/openid-configuration"
     TOKEN_ENDPOINT = "https://login.microsoftonline.com/{tenant}/oauth2/v2.0/token"
     USERINFO_ENDPOINT = "https://graph.microsoft.com/v1.0/me"
+    # Tenant of personal Microsoft accounts ('tid' claim); their Graph user ID is not the 'oid' claim
+    CONSUMER_TENANT_ID = "9188040d-6c67-4c5b-b112-36a304b66dad"
 
-    def __init__(self):
-        """Initialize Microsoft provider with configuration."""
-        self._client_id = get_microsoft_client_id()
-        self._client_secret = get_microsoft_client_secret()
+    def __init__(self, *, transport: httpx.AsyncBaseTransport | None = None, **endpoints: str):
+        """Initialize Microsoft provider with configuration.
+
+        Args:
+            transport: Optional httpx transport for the shared client (e.g., a stand-in IdP in tests)
+            **endpoints: Optional endpoint overrides (discovery_endpoint, token_endpoint, userinfo_endpoint)
+        """
         self._tenant_id = get_microsoft_tenant_id()
-        self._redirect_uri = get_microsoft_redirect_uri()
+        endpoints.setdefault("discovery_endpoint", self.DISCOVERY_ENDPOINT.format(tenant=self._tenant_id))
+        endpoints.setdefault("token_endpoint", self.TOKEN_ENDPOINT.format(tenant=self._tenant_id))
+        super().__init__(
+            get_microsoft_client_id(),
+            get_microsoft_client_secret(),
+            get_microsoft_redirect_uri(),
+            transport=transport,
+            **endpoints,
+        )
 
     @property
     def name(self) -> str:
@@ -62,50 +79,12 @@ class MicrosoftProvider:
         endpoint = self.AUTHORIZATION_ENDPOINT.format(tenant=self._tenant_id)
         return f"{endpoint}?{urlencode(params)}"
 
-    async def exchange_code_for_tokens(self, code: str) -> IdentityProviderTokenResponse:
-        """Exchange authorization code for access token and ID token.
-
-        Args:
-            code: Authorization code from Microsoft callback
-
-        Returns:
-            TokenResponse containing standardized OAuth2 token data
-
-        Raises:
-            UnauthorizedError: If token exchange fails
-        """
-        endpoint = self.TOKEN_ENDPOINT.format(tenant=self._tenant_id)
-
-        data: dict[str, str] = {
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "code": code,
-            "redirect_uri": self._redirect_uri,
-            "grant_type": "authorization_code",
-        }
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(endpoint, data=data)
-                response.raise_for_status()
-                raw_response = response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"Failed to exchange Microsoft authorization code: {error_detail}")
-            raise UnauthorizedError("Failed to exchange authorization code with Microsoft") from e
-        except httpx.RequestError as e:
-            logger.error(f"Network error exchanging Microsoft code: {e}")
-            raise UnauthorizedError("Network error during token exchange") from e
-
-        return IdentityProviderTokenResponse(
-            access_token=raw_response.get("access_token", ""),
-            token_type=raw_response.get("token_type", "Bearer"),
-            expires_in=raw_response.get("expires_in"),
-            refresh_token=raw_response.get("refresh_token"),
-            scope=raw_response.get("scope"),
-            id_token=raw_response.get("id_token"),
-            raw_data=raw_response,
-        )
+    def _is_expected_issuer(self, issuer: str | None, metadata: dict[str, Any], claims: dict[str, Any]) -> bool:
+        # Multi-tenant ("common"/"organizations") metadata uses a {tenantid} placeholder in the issuer
+        expected = metadata.get("issuer", "")
+        if "{tenantid}" in expected:
+            expected = expected.replace("{tenantid}", str(claims.get("tid", "")))
+        return issuer == expected
 
     async def get_user_info(self, access_token: str) -> IdentityProviderUserInfo:
         """Get and extract standardized user information from Microsoft Graph API.
@@ -119,20 +98,7 @@ class MicrosoftProvider:
         Raises:
             UnauthorizedError: If API call fails or required fields cannot be extracted
         """
-        headers: dict[str, str] = {"Authorization": f"Bearer {access_token}"}
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.USERINFO_ENDPOINT, headers=headers)
-                response.raise_for_status()
-                raw_response = response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if e.response else str(e)
-            logger.error(f"Failed to get Microsoft user info: {error_detail}")
-            raise UnauthorizedError("Failed to retrieve user information from Microsoft") from e
-        except httpx.RequestError as e:
-            logger.error(f"Network error getting Microsoft user info: {e}")
-            raise UnauthorizedError("Network error retrieving user information") from e
+        raw_response = await self._get_userinfo_json(access_token)
 
         external_id = raw_response.get("id") or raw_response.get("objectId", "")
         email = raw_response.get("mail") or raw_response.get("userPrincipalName", "")
@@ -149,3 +115,32 @@ class MicrosoftProvider:
             name=name,
             raw_data=raw_response,
         )
+
+    async def get_user_info_from_id_token(self, id_token: str, access_token: str) -> IdentityProviderUserInfo:
+        """Extract standardized user information from a locally verified Microsoft ID token.
+
+        External IDs are Microsoft Graph user IDs. For work and school accounts that is the
+        'oid' claim; personal Microsoft accounts have a different Graph ID, so their user
+        info comes from Microsoft Graph. The email comes from the optional 'email' claim or
+        'preferred_username'; if neither is present this also falls back to Microsoft Graph.
+
+        Raises:
+            UnauthorizedError: If the ID token is invalid or has no object ID
+        """
+        claims = await self.verify_id_token(id_token, access_token)
+        if claims.get("tid") == self.CONSUMER_TENANT_ID:
+            return await self.get_user_info(access_token)
+
+        external_id = claims.get("oid", "")
+        email = claims.get("email") or claims.get("preferred_username", "")
+        if not external_id:
+            raise UnauthorizedError("Could not extract user ID from Microsoft ID token")
+        if not email:
+            return await self.get_user_info(access_token)
+
+        return IdentityProviderUserInfo(
+            external_id=external_id,
+            email=email,
+            name=claims.get("name"),
+            raw_data=claims,
+        )
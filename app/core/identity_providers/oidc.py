@@ -0,0 +1,251 @@
+"""
+Shared OAuth2/OIDC plumbing for identity providers.
+
+Every provider instance owns one long-lived `httpx.AsyncClient`, so token exchanges
+reuse pooled keep-alive connections instead of paying a TCP and TLS handshake per call.
+OIDC discovery metadata and the provider's JWKS are cached, which lets the `id_token`
+returned by the token endpoint be verified locally instead of calling the userinfo API.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import httpx
+from jose import jwt
+from jose.exceptions import JWTError
+
+from app.config import get_identity_provider_metadata_ttl, get_identity_provider_timeout
+from app.exceptions import UnauthorizedError
+
+from .protocol import IdentityProviderTokenResponse
+
+logger = logging.getLogger(__name__)
+
+
+class OIDCProvider:
+    """Base class for OAuth2/OIDC providers with a pooled HTTP client and cached discovery/JWKS."""
+
+    DISPLAY_NAME = "identity provider"
+    DISCOVERY_ENDPOINT = ""
+    TOKEN_ENDPOINT = ""
+    USERINFO_ENDPOINT = ""
+
+    # Connection pool sizing; identity provider traffic is bursty but low volume
+    MAX_CONNECTIONS = 20
+    MAX_KEEPALIVE_CONNECTIONS = 10
+    KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        *,
+        discovery_endpoint: str | None = None,
+        token_endpoint: str | None = None,
+        userinfo_endpoint: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            client_id: OAuth client ID (also the expected 'aud' of ID tokens)
+            client_secret: OAuth client secret
+            redirect_uri: Redirect URI registered with the provider
+            discovery_endpoint: Override for the OIDC discovery document URL
+            token_endpoint: Override for the token endpoint URL
+            userinfo_endpoint: Override for the userinfo endpoint URL
+            transport: Optional httpx transport (e.g., an ASGI transport to a stand-in IdP in tests)
+        """
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._redirect_uri = redirect_uri
+        self._discovery_endpoint = discovery_endpoint or self.DISCOVERY_ENDPOINT
+        self._token_endpoint = token_endpoint or self.TOKEN_ENDPOINT
+        self._userinfo_endpoint = userinfo_endpoint or self.USERINFO_ENDPOINT
+        self._transport = transport
+        self._http_client: httpx.AsyncClient | None = None
+
+        self._metadata_ttl = get_identity_provider_metadata_ttl().total_seconds()
+        self._metadata: dict[str, Any] | None = None
+        self._metadata_expires_at = 0.0
+        self._jwks: dict[str | None, dict[str, Any]] = {}
+        self._jwks_expires_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+
+    # --- HTTP CLIENT LIFECYCLE ---
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use and reused for every request."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=httpx.Timeout(get_identity_provider_timeout()),
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def _request_json(
+        self, method: str, url: str, *, failure_message: str, network_message: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Send a request with the shared client and decode a JSON object response.
+
+        Raises:
+            UnauthorizedError: If the provider answers with an error status or cannot be reached
+        """
+        try:
+            response = await self.http_client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"{failure_message}: {e.response.text}")
+            raise UnauthorizedError(failure_message) from e
+        except httpx.RequestError as e:
+            logger.error(f"{network_message}: {e}")
+            raise UnauthorizedError(network_message) from e
+
+    # --- TOKEN EXCHANGE ---
+
+    async def exchange_code_for_tokens(self, code: str) -> IdentityProviderTokenResponse:
+        """Exchange authorization code for access token and ID token.
+
+        Args:
+            code: Authorization code from the provider callback
+
+        Returns:
+            TokenResponse containing standardized OAuth2 token data
+
+        Raises:
+            UnauthorizedError: If token exchange fails
+        """
+        data: dict[str, str] = {
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "code": code,
+            "grant_type": "authorization_code",
+            "redirect_uri": self._redirect_uri,
+        }
+        raw_response = await self._request_json(
+            "POST",
+            self._token_endpoint,
+            data=data,
+            failure_message=f"Failed to exchange authorization code with {self.DISPLAY_NAME}",
+            network_message="Network error during token exchange",
+        )
+
+        return IdentityProviderTokenResponse(
+            access_token=raw_response.get("access_token", ""),
+            token_type=raw_response.get("token_type", "Bearer"),
+            expires_in=raw_response.get("expires_in"),
+            refresh_token=raw_response.get("refresh_token"),
+            scope=raw_response.get("scope"),
+            id_token=raw_response.get("id_token"),
+            raw_data=raw_response,
+        )
+
+    async def _get_userinfo_json(self, access_token: str) -> dict[str, Any]:
+        """Call the provider's userinfo API with the shared client."""
+        return await self._request_json(
+            "GET",
+            self._userinfo_endpoint,
+            headers={"Authorization": f"Bearer {access_token}"},
+            failure_message=f"Failed to retrieve user information from {self.DISPLAY_NAME}",
+            network_message="Network error retrieving user information",
+        )
+
+    # --- DISCOVERY AND JWKS CACHING ---
+
+    async def get_metadata(self) -> dict[str, Any]:
+        """Get the OIDC discovery document, cached for the configured metadata TTL."""
+        if self._metadata is not None and time.monotonic() < self._metadata_expires_at:
+            return self._metadata
+        async with self._refresh_lock:
+            return await self._load_metadata()
+
+    async def _get_signing_key(self, kid: str | None) -> dict[str, Any]:
+        """Get the JWK for a key ID, refreshing the cached JWKS once if the key is unknown (key rotation)."""
+        if kid in self._jwks and time.monotonic() < self._jwks_expires_at:
+            return self._jwks[kid]
+        async with self._refresh_lock:
+            if kid not in self._jwks or time.monotonic() >= self._jwks_expires_at:
+                metadata = await self._load_metadata()
+                jwks = await self._request_json(
+                    "GET",
+                    metadata["jwks_uri"],
+                    failure_message=f"Failed to load {self.DISPLAY_NAME} signing keys",
+                    network_message="Network error loading signing keys",
+                )
+                self._jwks = {key.get("kid"): key for key in jwks.get("keys", [])}
+                self._jwks_expires_at = time.monotonic() + self._metadata_ttl
+        if kid not in self._jwks:
+            raise UnauthorizedError(f"Unknown {self.DISPLAY_NAME} ID token signing key")
+        return self._jwks[kid]
+
+    async def _load_metadata(self) -> dict[str, Any]:
+        # Must be called while holding the refresh lock, which is not re-entrant
+        if self._metadata is None or time.monotonic() >= self._metadata_expires_at:
+            self._metadata = await self._request_json(
+                "GET",
+                self._discovery_endpoint,
+                failure_message=f"Failed to load {self.DISPLAY_NAME} OpenID configuration",
+                network_message="Network error loading OpenID configuration",
+            )
+            self._metadata_expires_at = time.monotonic() + self._metadata_ttl
+        return self._metadata
+
+    # --- ID TOKEN VERIFICATION ---
+
+    def _is_expected_issuer(self, issuer: str | None, metadata: dict[str, Any], claims: dict[str, Any]) -> bool:
+        """Check the 'iss' claim against the discovery document; providers override for special cases."""
+        return issuer == metadata.get("issuer")
+
+    async def verify_id_token(self, id_token: str, access_token: str | None = None) -> dict[str, Any]:
+        """Verify an ID token locally against the cached JWKS and return its claims.
+
+        Checks the signature, expiry, audience (our client ID), issuer and, when an access
+        token is given and the ID token carries 'at_hash', that both were issued together.
+
+        Raises:
+            UnauthorizedError: If the token cannot be verified
+        """
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except JWTError as e:
+            raise UnauthorizedError(f"Malformed {self.DISPLAY_NAME} ID token") from e
+
+        metadata = await self.get_metadata()
+        key = await self._get_signing_key(header.get("kid"))
+        algorithm = header.get("alg") or key.get("alg") or "RS256"
+        if algorithm not in metadata.get("id_token_signing_alg_values_supported", ["RS256"]):
+            raise UnauthorizedError(f"Unsupported {self.DISPLAY_NAME} ID token algorithm")
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=[algorithm],
+                audience=self._client_id,
+                access_token=access_token,
+                options={"verify_iss": False, "leeway": 5},
+            )
+        except JWTError as e:
+            logger.warning(f"{self.DISPLAY_NAME} ID token verification failed: {e}")
+            raise UnauthorizedError(f"Invalid {self.DISPLAY_NAME} ID token") from e
+
+        if not self._is_expected_issuer(claims.get("iss"), metadata, claims):
+            raise UnauthorizedError(f"Invalid {self.DISPLAY_NAME} ID token issuer")
+        return claims
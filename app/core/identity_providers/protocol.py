@@ -2,7 +2,7 @@
 Base abstraction for identity providers.
 """
 
-from typing import Any, NamedTuple, Protocol
+from typing import Any, NamedTuple, Protocol, runtime_checkable
 
 
 class IdentityProvider(Protocol):
@@ -72,3 +72,25 @@ class IdentityProviderUserInfo(NamedTuple):
     email: str
     name: str | None = None
     raw_data: dict[str, Any] | None = None
+
+
+@runtime_checkable
+class IdTokenIdentityProvider(IdentityProvider, Protocol):
+    """Identity provider that can read user information from a locally verified OIDC ID token."""
+
+    async def get_user_info_from_id_token(self, id_token: str, access_token: str) -> IdentityProviderUserInfo:
+        """Verify the ID token locally and extract standardized user information from its claims.
+
+        This skips the userinfo round trip after the token exchange.
+
+        Args:
+            id_token: ID token returned by the token endpoint
+            access_token: Access token issued alongside it (checked against 'at_hash')
+
+        Returns:
+            UserInfo containing standardized user data (external_id, email, name)
+
+        Raises:
+            UnauthorizedError: If the ID token is invalid or required claims cannot be extracted
+        """
+        ...
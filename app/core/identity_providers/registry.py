@@ -2,6 +2,8 @@
 Registry for identity provider implementations.
 """
 
+import inspect
+
 from .protocol import IdentityProvider
 
 
@@ -70,6 +72,19 @@ class IdentityProviderRegistry:
         """
         cls._providers.pop(name, None)
 
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the pooled HTTP clients of all registered providers that hold one.
+
+        Note:
+            Called on application shutdown. Providers stay registered and reopen
+            their client lazily if used again.
+        """
+        for provider in cls._providers.values():
+            close = getattr(provider, "aclose", None)
+            if inspect.iscoroutinefunction(close):
+                await close()
+
     @classmethod
     def clear(cls) -> None:
         """Clear all registered providers.
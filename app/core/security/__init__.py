@@ -17,8 +17,10 @@ from .password import check_password, hash_password
 from .tokens import (
     AccessTokenResult,
     RefreshTokenResult,
+    clear_token_caches,
     create_access_token,
     create_refresh_token,
+    get_cached_access_token_claims,
     validate_access_token,
     validate_refresh_token,
 )
@@ -31,6 +33,8 @@ __all__ = [
     "AccessTokenResult",
     "create_access_token",
     "validate_access_token",
+    "get_cached_access_token_claims",
+    "clear_token_caches",
     # Refresh tokens
     "RefreshTokenResult",
     "create_refresh_token",
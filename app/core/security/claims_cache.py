@@ -0,0 +1,76 @@
+"""
+Verified Token Claims Cache ⚡
+
+Bounded, thread-safe LRU cache of already-verified JWT claims. A client typically
+sends the same access token on every request until it expires, so re-running the
+signature check and claim parsing each time is wasted work.
+
+---
+DESIGN:
+- Entries are keyed by a SHA-256 digest of the raw token, so raw credentials are not
+  retained as dictionary keys.
+- Each entry carries the token's 'exp'; an entry is never served after it.
+- Only tokens that passed full verification are inserted. Callers are responsible for
+  caching only results of the default verification (default key, algorithm and options).
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class ClaimsCache:
+    """LRU cache mapping a token digest to its verified claims until the token's expiry."""
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached tokens; 0 disables caching
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Return a copy of the cached claims for a token, or None if missing or expired."""
+        if self.max_size <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return dict(claims)
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        """Store verified claims; tokens without a numeric 'exp' claim are not cached."""
+        exp = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(exp, int | float):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(exp), dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -13,6 +13,9 @@ DESIGN PRINCIPLES:
 3.  Testability: All JWT functions accept security parameters (secret_key, algorithm)
     as explicit arguments, allowing easy overriding in unit tests.
 4.  Security: JWT verification uses a 5-second `leeway` to mitigate clock drift issues.
+5.  Performance: The default secret and algorithm are resolved once per process, and
+    verified access token claims are kept in a bounded LRU cache until the token's 'exp'.
+    Call `clear_token_caches` after changing the JWT configuration at runtime.
 
 Key functionalities include:
 - Generation and verification of JWT access tokens.
@@ -21,12 +24,14 @@ Key functionalities include:
 
 import secrets
 from datetime import UTC, datetime, timedelta
+from functools import cache
 from typing import Any, NamedTuple
 
 from jose import jwt
 from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
 
 from app.config import (
+    get_access_token_cache_size,
     get_access_token_expire_delta,
     get_core_jwt_secret_key,
     get_jwt_algorithm,
@@ -34,6 +39,8 @@ from app.config import (
 )
 from app.exceptions import InvalidAccessTokenError, InvalidRefreshTokenError
 
+from .claims_cache import ClaimsCache
+
 
 class AccessTokenResult(NamedTuple):
     """
@@ -53,10 +60,43 @@ class RefreshTokenResult(NamedTuple):
     Attributes:
         token: The fully encoded JWT string to be sent to the user.
         jti: The unique JWT ID claim, required for database storage and revocation checks.
+        expires_at: The 'exp' claim as an aware datetime, stored alongside the JTI so expired rows can be purged.
     """
 
     token: str
     jti: str
+    expires_at: datetime
+
+
+# --- RESOLVED CONFIGURATION AND CACHES ---
+
+
+@cache
+def _get_default_signing_config() -> tuple[str, str]:
+    """Resolve the default (secret_key, algorithm) pair once instead of reading the environment per call."""
+    return get_core_jwt_secret_key(), get_jwt_algorithm()
+
+
+@cache
+def _get_access_token_claims_cache() -> ClaimsCache:
+    """Get the process-wide cache of verified access token claims."""
+    return ClaimsCache(get_access_token_cache_size())
+
+
+def clear_token_caches() -> None:
+    """Forget the resolved signing configuration and all cached access token claims."""
+    _get_access_token_claims_cache.cache_clear()
+    _get_default_signing_config.cache_clear()
+
+
+def get_cached_access_token_claims(token: str) -> dict[str, Any] | None:
+    """
+    Return the claims of an access token that already passed default validation, if still cached.
+
+    This is a cheap, non-blocking lookup suitable for running directly on the event loop;
+    on a miss, callers fall back to `validate_access_token`.
+    """
+    return _get_access_token_claims_cache().get(token)
 
 
 # --- ACCESS TOKEN (JWT) UTILITIES ---
@@ -81,8 +121,9 @@ def create_access_token(
         AccessTokenResult: Contains the encoded token string and the
         expires_in (lifetime in seconds) for the OAuth 2.0 response.
     """
-    secret_key = secret_key or get_core_jwt_secret_key()
-    algorithm = algorithm or get_jwt_algorithm()
+    default_secret_key, default_algorithm = _get_default_signing_config()
+    secret_key = secret_key or default_secret_key
+    algorithm = algorithm or default_algorithm
     expires_delta = expires_delta or get_access_token_expire_delta()
 
     to_encode = data.copy()
@@ -118,18 +159,28 @@ def validate_access_token(
     Raises:
         InvalidAccessTokenError: If the token is invalid (expired, bad signature, malformed claim, etc.).
     """
-    secret_key = secret_key or get_core_jwt_secret_key()
-    algorithm = algorithm or get_jwt_algorithm()
+    # Only results of the default verification are cached, so custom options or keys never leak into it
+    use_cache = options is None and secret_key is None and algorithm is None
+    if use_cache and (claims := get_cached_access_token_claims(token)) is not None:
+        return claims
+
+    default_secret_key, default_algorithm = _get_default_signing_config()
+    secret_key = secret_key or default_secret_key
+    algorithm = algorithm or default_algorithm
 
     default_options = {"leeway": 5}
     if options:
         default_options.update(options)
 
     try:
-        return jwt.decode(token, secret_key, algorithms=[algorithm], options=default_options)
+        claims = jwt.decode(token, secret_key, algorithms=[algorithm], options=default_options)
     except (JWTError, ExpiredSignatureError, JWTClaimsError) as e:
         raise InvalidAccessTokenError(f"Access token verification failed: {e.__class__.__name__}") from e
 
+    if use_cache:
+        _get_access_token_claims_cache().put(token, claims)
+    return claims
+
 
 # --- REFRESH TOKEN (JWT) UTILITIES ---
 
@@ -151,11 +202,12 @@ def create_refresh_token(
         expires_delta: Token expiration time (timedelta). If None, uses the configured default.
 
     Returns:
-        RefreshTokenResult: Contains the JTI (jti) which MUST be saved in the
-        database and the encoded token (token) for the user.
+        RefreshTokenResult: Contains the JTI (jti) and expiry (expires_at) which MUST be saved
+        in the database and the encoded token (token) for the user.
     """
-    secret_key = secret_key or get_core_jwt_secret_key()
-    algorithm = algorithm or get_jwt_algorithm()
+    default_secret_key, default_algorithm = _get_default_signing_config()
+    secret_key = secret_key or default_secret_key
+    algorithm = algorithm or default_algorithm
     expires_delta = expires_delta or get_refresh_token_expire_delta()
 
     to_encode = data.copy()
@@ -177,7 +229,7 @@ def create_refresh_token(
     token = jwt.encode(to_encode, secret_key, algorithm=algorithm)
 
     # 4. Return both the token and the JTI using the NamedTuple
-    return RefreshTokenResult(token=token, jti=jti)
+    return RefreshTokenResult(token=token, jti=jti, expires_at=expire)
 
 
 def validate_refresh_token(
@@ -207,8 +259,9 @@ def validate_refresh_token(
                                   (expired, wrong signature, missing/bad claim, etc.).
     """
 
-    secret_key = secret_key or get_core_jwt_secret_key()
-    algorithm = algorithm or get_jwt_algorithm()
+    default_secret_key, default_algorithm = _get_default_signing_config()
+    secret_key = secret_key or default_secret_key
+    algorithm = algorithm or default_algorithm
 
     default_options: dict[str, Any] = {"leeway": 5}
     # Ensure JTI is present, as it is mandatory for refresh token revocation
@@ -3,17 +3,44 @@ Database module for Divvy application.
 Provides async SQLAlchemy session management.
 """
 
-from .connection import get_database_url, get_engine, get_serializable_engine, reset_engine, reset_serializable_engine
-from .session import create_serializable_session, create_session, get_serializable_session, get_session
+from .connection import (
+    create_engine_from_url,
+    get_database_url,
+    get_engine,
+    get_pool_status,
+    get_read_your_writes_tracker,
+    get_serializable_engine,
+    has_replicas,
+    reset_engine,
+    reset_serializable_engine,
+)
+from .instrumentation import QueryStats, route_query_metrics, track_queries
+from .routing import session_has_writes
+from .session import (
+    create_serializable_session,
+    create_session,
+    get_read_session,
+    get_serializable_session,
+    get_session,
+)
 
 __all__ = [
+    "create_engine_from_url",
     "get_database_url",
     "get_engine",
+    "get_pool_status",
+    "get_read_your_writes_tracker",
     "get_serializable_engine",
+    "has_replicas",
     "reset_engine",
     "reset_serializable_engine",
     "create_serializable_session",
     "create_session",
     "get_serializable_session",
+    "get_read_session",
     "get_session",
+    "session_has_writes",
+    "QueryStats",
+    "route_query_metrics",
+    "track_queries",
 ]
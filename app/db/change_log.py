@@ -0,0 +1,72 @@
+"""
+Change log writer lock.
+
+Change log entry IDs are the sync cursor, but autoincrement IDs are assigned at
+insert time, not at commit: an entry committed after one with a higher ID was synced
+would never be synced. Writers therefore hold the `ChangeLogWriterLock` row until
+they commit, so IDs become visible in commit order.
+
+The lock is taken before a transaction's first write to a table the change log
+describes (or to the change log itself), never after: a writer holding the lock
+then only waits for rows of transactions that do not hold it, so writers cannot
+deadlock on it. SQLite already admits one writer at a time and takes no lock.
+"""
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.models.change_log import ChangeLogWriterLock
+
+# ID of the only ChangeLogWriterLock row, created by migration
+_WRITER_LOCK_ID = 1
+# Session info key of the transaction that holds the writer lock
+_WRITER_LOCK_TRANSACTION = "change_log_writer_lock_transaction"
+
+# Tables whose changes are recorded in the change log, and the log itself
+_LOGGED_TABLES = frozenset(
+    {
+        "categories",
+        "change_log",
+        "expense_shares",
+        "group_role_bindings",
+        "groups",
+        "periods",
+        "settlements",
+        "transactions",
+        "users",
+    }
+)
+
+
+def _lock_writers(session: Session) -> None:
+    """Lock the writer row until the transaction ends, unless this transaction already holds it."""
+    if session.get_bind().dialect.name == "sqlite":
+        return
+    # Locks taken in a savepoint are released if it rolls back: only trust an enclosing transaction's
+    innermost = session.get_nested_transaction() or session.get_transaction()
+    locked_in = session.info.get(_WRITER_LOCK_TRANSACTION)
+    transaction = innermost
+    while transaction is not None:
+        if transaction is locked_in:
+            return
+        transaction = transaction.parent
+    session.execute(
+        select(ChangeLogWriterLock.id).where(ChangeLogWriterLock.id == _WRITER_LOCK_ID).with_for_update(),
+        execution_options={"autoflush": False},
+    )
+    session.info[_WRITER_LOCK_TRANSACTION] = session.get_nested_transaction() or session.get_transaction()
+
+
+@event.listens_for(Session, "before_flush")
+def _lock_before_flush(session: Session, flush_context: UOWTransaction, instances: object) -> None:
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(getattr(instance, "__tablename__", None) in _LOGGED_TABLES for instance in changed):
+        _lock_writers(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _lock_before_dml(orm_execute_state: ORMExecuteState) -> None:
+    statement = orm_execute_state.statement
+    if isinstance(statement, UpdateBase) and getattr(statement.table, "name", None) in _LOGGED_TABLES:
+        _lock_writers(orm_execute_state.session)
@@ -4,9 +4,27 @@ Supports SQLite, PostgreSQL, MySQL, and MSSQL with async SQLAlchemy.
 """
 
 import os
+from typing import Any
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from app.config import (
+    get_database_replica_selection,
+    get_database_replica_urls,
+    get_db_max_overflow,
+    get_db_pool_liveness,
+    get_db_pool_recycle,
+    get_db_pool_size,
+    get_db_pool_timeout,
+    get_read_your_writes_window,
+    get_sqlite_profile_enabled,
+)
+
+from .pool import InstrumentedAsyncQueuePool, get_pool_metrics
+from .replicas import ReadYourWritesTracker, ReplicaSelector
+from .sqlite import apply_sqlite_profile, use_immediate_transactions
+
 # Determine the absolute path to the project root and the database file
 # From app/db/connection.py: go up 2 levels to reach project root
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -36,12 +54,59 @@ def get_database_url() -> str:
     return f"sqlite+aiosqlite:///{DB_FILE}"
 
 
-def _create_engine_from_url(url: str | None = None) -> AsyncEngine:
+def _is_in_memory_sqlite(url: str) -> bool:
+    """Check whether the URL points at an in-memory SQLite database (which cannot be pooled)."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and (
+        parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+    )
+
+
+def _uses_sqlite_profile(url: str) -> bool:
+    """Check whether the SQLite performance profile (WAL, pragmas, single writer) applies to the URL."""
+    return (
+        make_url(url).get_backend_name() == "sqlite" and not _is_in_memory_sqlite(url) and get_sqlite_profile_enabled()
+    )
+
+
+def _get_pool_options(url: str, *, single_connection: bool = False) -> dict[str, Any]:
+    """
+    Build connection pool keyword arguments for create_async_engine from app.config.
+
+    Args:
+        url: Database URL the engine is created for
+        single_connection: Limit the pool to one connection (the SQLite writer)
+
+    Returns:
+        Pool keyword arguments
+    """
+    liveness = get_db_pool_liveness()
+    options: dict[str, Any] = {
+        "pool_pre_ping": liveness == "pre_ping",
+        "pool_recycle": get_db_pool_recycle(),
+    }
+    # In-memory SQLite keeps one shared connection; sizing does not apply
+    if not _is_in_memory_sqlite(url):
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=1 if single_connection else get_db_pool_size(),
+            max_overflow=0 if single_connection else get_db_max_overflow(),
+            pool_timeout=get_db_pool_timeout(),
+        )
+    return options
+
+
+def create_engine_from_url(url: str | None = None, *, read_only: bool = False) -> AsyncEngine:
     """
     Create async SQLAlchemy engine from database URL.
 
+    Pool size, overflow, timeout, recycle interval and liveness strategy come from app.config.
+    When the SQLite profile applies, the engine is either the single-connection writer
+    (default) or a query-only reader pool (read_only=True).
+
     Args:
         url: Database URL. If None, uses get_database_url() to determine URL.
+        read_only: Create the SQLite profile's reader engine instead of the writer
 
     Returns:
         Async SQLAlchemy Engine instance
@@ -52,22 +117,24 @@ def _create_engine_from_url(url: str | None = None) -> AsyncEngine:
     if url is None:
         url = get_database_url()
 
-    print(url)
-
-    # Create async engine with appropriate settings
     # For SQLite, use check_same_thread=False to allow connection sharing
-    # For other databases, connection pooling is handled automatically
     connect_args = {}
     if url.startswith("sqlite+aiosqlite"):
         connect_args = {"check_same_thread": False}
 
+    sqlite_profile = _uses_sqlite_profile(url)
+
     try:
         engine = create_async_engine(
             url,
             connect_args=connect_args,
             echo=False,  # Set to True for SQL debugging
-            pool_pre_ping=True,  # Verify connections before using
+            **_get_pool_options(url, single_connection=sqlite_profile and not read_only),
         )
+        if sqlite_profile:
+            apply_sqlite_profile(engine, read_only=read_only)
+            if not read_only:
+                use_immediate_transactions(engine)
         return engine
     except ImportError as e:
         # Provide helpful error messages for missing drivers
@@ -106,7 +173,7 @@ def get_engine() -> AsyncEngine:
     """
     global _engine
     if _engine is None:
-        _engine = _create_engine_from_url()
+        _engine = create_engine_from_url()
     return _engine
 
 
@@ -114,12 +181,101 @@ async def reset_engine() -> None:
     """
     Reset the global async engine (useful for testing or switching databases).
 
+    The SQLite profile's reader engine and the replica engines are disposed too; the
+    SERIALIZABLE view of the engine is dropped, since it shares the pool.
+
     Note: This is now async because AsyncEngine.dispose() is async.
     """
-    global _engine
+    global _engine, _serializable_engine, _read_engine, _replica_selector
+    if _replica_selector is not None:
+        for replica_engine in _replica_selector.engines:
+            await replica_engine.dispose()
+    if _read_engine is not None:
+        await _read_engine.dispose()
     if _engine is not None:
         await _engine.dispose()
     _engine = None
+    _serializable_engine = None
+    _read_engine = None
+    _replica_selector = None
+
+
+_read_engine: AsyncEngine | None = None
+
+
+def has_read_engine() -> bool:
+    """
+    Check whether reads are served by a separate engine.
+
+    Returns:
+        True when the SQLite profile applies to the configured database
+    """
+    return _uses_sqlite_profile(get_database_url())
+
+
+def get_read_engine() -> AsyncEngine:
+    """
+    Get the engine serving reads.
+
+    With the SQLite profile this is a pool of query-only connections next to the
+    single writer connection of get_engine(); otherwise it is get_engine() itself.
+
+    Returns:
+        Async SQLAlchemy Engine instance
+    """
+    global _read_engine
+    if not has_read_engine():
+        return get_engine()
+    if _read_engine is None:
+        _read_engine = create_engine_from_url(read_only=True)
+    return _read_engine
+
+
+_replica_selector: ReplicaSelector | None = None
+_read_your_writes: ReadYourWritesTracker | None = None
+
+
+def has_replicas() -> bool:
+    """
+    Check whether read replicas are configured.
+
+    Returns:
+        True when DIVVY_DATABASE_REPLICA_URLS lists at least one replica
+    """
+    return bool(get_database_replica_urls())
+
+
+def get_replica_engine() -> AsyncEngine:
+    """
+    Get a read replica engine for the next read session.
+
+    Replica engines are created on first use and chosen per call according to
+    the configured selection strategy (round-robin or least connections).
+
+    Returns:
+        Async SQLAlchemy Engine instance connected to a replica
+
+    Raises:
+        ValueError: If no replicas are configured
+    """
+    global _replica_selector
+    if _replica_selector is None:
+        engines = [create_engine_from_url(url, read_only=True) for url in get_database_replica_urls()]
+        _replica_selector = ReplicaSelector(engines, get_database_replica_selection())
+    return _replica_selector.choose()
+
+
+def get_read_your_writes_tracker() -> ReadYourWritesTracker:
+    """
+    Get the process-wide tracker of users pinned to the primary after writing.
+
+    Returns:
+        ReadYourWritesTracker instance
+    """
+    global _read_your_writes
+    if _read_your_writes is None:
+        _read_your_writes = ReadYourWritesTracker(get_read_your_writes_window())
+    return _read_your_writes
 
 
 _serializable_engine: AsyncEngine | None = None
@@ -127,21 +283,42 @@ _serializable_engine: AsyncEngine | None = None
 
 def get_serializable_engine() -> AsyncEngine:
     """
-    Get or create engine with SERIALIZABLE isolation level.
+    Get the global engine with SERIALIZABLE isolation level.
 
     Used for critical financial operations that require highest isolation.
+
+    This is a view of get_engine() created with execution options, not a second engine:
+    connections are borrowed from the shared pool, the isolation level is applied on
+    checkout and the connection's default level is restored when it is returned.
     """
     global _serializable_engine
     if _serializable_engine is None:
-        _serializable_engine = _create_engine_from_url().execution_options(isolation_level="SERIALIZABLE")
+        _serializable_engine = get_engine().execution_options(isolation_level="SERIALIZABLE")
     return _serializable_engine
 
 
 async def reset_serializable_engine() -> None:
     """
-    Reset the global async engine with SERIALIZABLE isolation level.
+    Reset the SERIALIZABLE view of the global engine.
+
+    The shared pool is left open; use reset_engine() to dispose it.
     """
     global _serializable_engine
-    if _serializable_engine is not None:
-        await _serializable_engine.dispose()
     _serializable_engine = None
+
+
+def get_pool_status() -> dict[str, dict[str, Any]]:
+    """
+    Get connection pool metrics for every engine created so far.
+
+    Engines are not created by this call, so an idle process reports no pools.
+    The SERIALIZABLE engine shares the default pool and is not reported separately.
+
+    Returns:
+        Pool metrics keyed by engine name ("default", "read" with the SQLite profile,
+        "replica-<n>" for each replica)
+    """
+    engines = {"default": _engine, "read": _read_engine}
+    if _replica_selector is not None:
+        engines.update({f"replica-{i}": engine for i, engine in enumerate(_replica_selector.engines)})
+    return {name: get_pool_metrics(engine) for name, engine in engines.items() if engine is not None}
@@ -0,0 +1,75 @@
+"""
+Callbacks run once a session commits.
+
+Process-wide state mirroring the database (the category catalog, the live event hub)
+must only change once the write it mirrors is persisted. Writers register a callback
+on their session instead of acting right away: it runs after the session commits, and
+is dropped if the transaction, or the savepoint it was registered in, rolls back.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+_PENDING_CALLBACKS = "post_commit_callbacks"
+
+
+@dataclass(frozen=True)
+class _PendingCallback:
+    topic: str
+    callback: Callable[[], None]
+    # Innermost transaction when registered, None if the session had not begun one yet
+    transaction: SessionTransaction | None
+
+
+def run_on_commit(session: AsyncSession | Session, topic: str, callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once `session` commits; drop it if it rolls back first.
+
+    Args:
+        session: Async or sync session the write was made in
+        topic: Name grouping related callbacks, see `has_pending_callbacks`
+        callback: Callable run after the commit, in registration order
+    """
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    transaction = sync_session.get_nested_transaction() or sync_session.get_transaction()
+    sync_session.info.setdefault(_PENDING_CALLBACKS, []).append(_PendingCallback(topic, callback, transaction))
+
+
+def has_pending_callbacks(session: AsyncSession | Session, topic: str) -> bool:
+    """Check whether `session` registered callbacks of `topic` that have not run yet."""
+    return any(pending.topic == topic for pending in session.info.get(_PENDING_CALLBACKS, ()))
+
+
+def _within(transaction: SessionTransaction | None, rolled_back: SessionTransaction) -> bool:
+    """Whether `transaction` is `rolled_back` or nested in it; None stands for the outermost transaction."""
+    if transaction is None:
+        return rolled_back.parent is None
+    current: SessionTransaction | None = transaction
+    while current is not None:
+        if current is rolled_back:
+            return True
+        current = current.parent
+    return False
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending_callbacks(session: Session) -> None:
+    # Also fires when a savepoint is released: its callbacks wait for the outermost commit
+    if session.in_nested_transaction():
+        return
+    for pending in session.info.pop(_PENDING_CALLBACKS, ()):
+        pending.callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_callbacks(session: Session, previous_transaction: SessionTransaction) -> None:
+    pending_callbacks: list[_PendingCallback] = session.info.get(_PENDING_CALLBACKS, [])
+    kept = [pending for pending in pending_callbacks if not _within(pending.transaction, previous_transaction)]
+    if kept:
+        session.info[_PENDING_CALLBACKS] = kept
+    else:
+        session.info.pop(_PENDING_CALLBACKS, None)
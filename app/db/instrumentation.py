@@ -0,0 +1,174 @@
+"""
+Per-request SQL instrumentation.
+
+Cursor execution hooks on every engine record each statement's duration into the
+`QueryStats` of the request being served (a context variable set by
+`track_queries`); statements outside a tracked scope are not recorded. Statements
+are counted by their SQL text, which with bound parameters is the statement shape,
+so the same query repeated for each row of a result (an N+1 pattern) shows up as one
+shape with a high count.
+
+Finished requests are folded into per-route totals by `RouteQueryMetrics`.
+"""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from app.config import get_repeated_statement_action, get_repeated_statement_threshold
+from app.config.database import RepeatedStatementAction
+from app.exceptions import RepeatedStatementError
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one tracked scope (usually one request)."""
+
+    repeat_threshold: int = 0
+    repeat_action: RepeatedStatementAction = "off"
+    count: int = 0
+    total_time: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter[str])
+
+    def check(self, statement: str) -> None:
+        """
+        Check a statement about to execute against the repeat threshold.
+
+        Raises:
+            RepeatedStatementError: If the action is "raise" and executing the statement would
+                exceed the threshold; the statement is then not executed
+        """
+        if self.repeat_action == "raise" and self.shapes[statement] >= self.repeat_threshold:
+            raise RepeatedStatementError(statement, self.shapes[statement] + 1)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """Record one executed statement."""
+        self.count += 1
+        self.total_time += elapsed
+        self.shapes[statement] += 1
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        """The most frequently executed statement and its count, if any statement ran."""
+        most_common = self.shapes.most_common(1)
+        return most_common[0] if most_common else None
+
+    def repeated_statements(self) -> list[tuple[str, int]]:
+        """Statements executed more often than the threshold, most frequent first."""
+        if self.repeat_action == "off":
+            return []
+        return [(statement, n) for statement, n in self.shapes.most_common() if n > self.repeat_threshold]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def track_queries(
+    repeat_threshold: int | None = None, repeat_action: RepeatedStatementAction | None = None
+) -> Generator[QueryStats]:
+    """
+    Record every SQL statement executed within the block.
+
+    Args:
+        repeat_threshold: Executions of one statement allowed before it counts as repeated
+            (default: from app.config)
+        repeat_action: "off", "warn" or "raise" for repeated statements (default: from app.config)
+
+    Yields:
+        QueryStats filled in as statements run
+    """
+    stats = QueryStats(
+        repeat_threshold=get_repeated_statement_threshold() if repeat_threshold is None else repeat_threshold,
+        repeat_action=get_repeated_statement_action() if repeat_action is None else repeat_action,
+    )
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.check(statement)
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = _current_stats.get()
+    start_times = conn.info.get("query_start_time")
+    if stats is not None and start_times:
+        stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+@dataclass
+class RouteStats:
+    """Cumulative SQL statistics of one route."""
+
+    requests: int = 0
+    statements: int = 0
+    sql_time: float = 0.0
+    max_statements: int = 0
+    repeated_statement_requests: int = 0
+
+
+class RouteQueryMetrics:
+    """Thread-safe per-route totals of the SQL executed by finished requests."""
+
+    def __init__(self) -> None:
+        self._routes: dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, stats: QueryStats) -> None:
+        """Fold one finished request into its route's totals."""
+        repeated = bool(stats.repeated_statements())
+        with self._lock:
+            route_stats = self._routes.setdefault(route, RouteStats())
+            route_stats.requests += 1
+            route_stats.statements += stats.count
+            route_stats.sql_time += stats.total_time
+            route_stats.max_statements = max(route_stats.max_statements, stats.count)
+            route_stats.repeated_statement_requests += repeated
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Per-route totals, with averages per request.
+
+        Returns:
+            Metrics keyed by route (method and path template)
+        """
+        with self._lock:
+            return {
+                route: {
+                    "requests": s.requests,
+                    "statements": s.statements,
+                    "avg_statements": round(s.statements / s.requests, 2),
+                    "max_statements": s.max_statements,
+                    "sql_time_ms": round(s.sql_time * 1000, 3),
+                    "avg_sql_time_ms": round(s.sql_time / s.requests * 1000, 3),
+                    "repeated_statement_requests": s.repeated_statement_requests,
+                }
+                for route, s in sorted(self._routes.items())
+            }
+
+    def clear(self) -> None:
+        """Forget all recorded requests."""
+        with self._lock:
+            self._routes.clear()
+
+
+route_query_metrics = RouteQueryMetrics()
@@ -0,0 +1,105 @@
+"""
+Instrumented connection pool and pool metrics.
+
+`InstrumentedAsyncQueuePool` behaves like SQLAlchemy's default async queue pool but
+records how long each checkout took (waiting for a free connection, opening a new
+one and the optional pre-ping) and how many checkouts timed out. Together with the
+pool's live counters this is exposed by `get_pool_metrics` for the health endpoint.
+"""
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass
+class CheckoutStats:
+    """Cumulative checkout statistics of one pool."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def record(self, wait: float) -> None:
+        """Record a successful checkout that took `wait` seconds."""
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool recording checkout wait times and timeouts."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    @property
+    def max_overflow(self) -> int:
+        """Connections that may be opened beyond the pool size."""
+        return self._max_overflow
+
+    @property
+    def recycle(self) -> int:
+        """Maximum connection age in seconds, -1 when connections are never recycled."""
+        return self._recycle
+
+    @property
+    def pre_ping(self) -> bool:
+        """Whether connections are pinged on checkout."""
+        return self._pre_ping
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording how long it took."""
+        start = perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.checkout_stats.timeouts += 1
+            raise
+        self.checkout_stats.record(perf_counter() - start)
+        return connection
+
+
+def get_pool_metrics(engine: AsyncEngine) -> dict[str, Any]:
+    """
+    Describe the current state of an engine's connection pool.
+
+    Args:
+        engine: Engine whose pool to describe
+
+    Returns:
+        Pool class and, for queue pools, size, checked-in/out and overflow counts;
+        for instrumented pools also their overflow, timeout and liveness settings, and
+        checkout count, timeouts and wait times in milliseconds
+    """
+    pool = engine.pool
+    metrics: dict[str, Any] = {"pool": type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats = pool.checkout_stats
+        metrics.update(
+            max_overflow=pool.max_overflow,
+            timeout_seconds=pool.timeout(),
+            recycle_seconds=pool.recycle,
+            pre_ping=pool.pre_ping,
+            checkouts=stats.checkouts,
+            timeouts=stats.timeouts,
+            avg_wait_ms=round(stats.total_wait / stats.checkouts * 1000, 3) if stats.checkouts else 0.0,
+            max_wait_ms=round(stats.max_wait * 1000, 3),
+        )
+
+    return metrics
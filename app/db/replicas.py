@@ -0,0 +1,79 @@
+"""
+Read replica selection and read-your-writes pinning.
+
+Replicas lag the primary, so a user who has just written is pinned to the primary
+for a short window; everyone else reads from a replica chosen round-robin or by
+fewest checked-out connections.
+"""
+
+import itertools
+import threading
+import time
+from collections.abc import Sequence
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.config.database import ReplicaSelection
+
+
+def _checked_out(engine: AsyncEngine) -> int:
+    """Number of connections currently checked out of the engine's pool (0 for unsized pools)."""
+    pool = engine.pool
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class ReplicaSelector:
+    """Chooses the replica engine for each read session."""
+
+    def __init__(self, engines: Sequence[AsyncEngine], selection: ReplicaSelection = "round_robin"):
+        """
+        Initialize the selector.
+
+        Args:
+            engines: Replica engines (at least one)
+            selection: "round_robin" or "least_connections"
+        """
+        if not engines:
+            raise ValueError("At least one replica engine is required")
+        self.engines = list(engines)
+        self.selection = selection
+        self._cycle = itertools.cycle(self.engines)
+
+    def choose(self) -> AsyncEngine:
+        """Pick the replica engine for the next read session."""
+        if self.selection == "least_connections":
+            return min(self.engines, key=_checked_out)
+        return next(self._cycle)
+
+
+class ReadYourWritesTracker:
+    """Remembers which users wrote recently, so their reads can be pinned to the primary."""
+
+    # Expired entries are swept once the map grows past this size
+    SWEEP_THRESHOLD = 10_000
+
+    def __init__(self, window: timedelta):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: How long a user stays pinned after a write
+        """
+        self._window = window.total_seconds()
+        self._pinned_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def pin(self, user_key: str) -> None:
+        """Pin a user to the primary for the read-your-writes window, starting now."""
+        now = time.monotonic()
+        with self._lock:
+            self._pinned_until[user_key] = now + self._window
+            if len(self._pinned_until) > self.SWEEP_THRESHOLD:
+                self._pinned_until = {key: until for key, until in self._pinned_until.items() if until > now}
+
+    def is_pinned(self, user_key: str) -> bool:
+        """Check whether a user wrote within the read-your-writes window."""
+        until = self._pinned_until.get(user_key)
+        return until is not None and until > time.monotonic()
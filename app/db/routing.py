@@ -0,0 +1,68 @@
+"""
+Read/write routing for ORM sessions.
+
+`ReadWriteSession` sends a session's reads to a read engine until the session first
+writes (flushes or executes INSERT/UPDATE/DELETE); from then on every statement goes
+to the write engine, so the session reads its own writes. What it read before the
+first write may be stale, so it only serves read-only sessions (replica reads).
+
+Every session also records whether it wrote (`session_has_writes`), which lets the
+request layer pin recent writers to the primary when reads are served by replicas.
+"""
+
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+from sqlalchemy.sql.dml import UpdateBase
+
+_HAS_WRITES = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_HAS_WRITES] = True
+
+
+def session_has_writes(session: AsyncSession | Session) -> bool:
+    """
+    Check whether a session has flushed changes or executed INSERT/UPDATE/DELETE.
+
+    Args:
+        session: Async or sync session
+
+    Returns:
+        True if the session wrote at least once
+    """
+    return bool(session.info.get(_HAS_WRITES))
+
+
+class ReadWriteSession(Session):
+    """Session routing reads to a read engine until its first write."""
+
+    def __init__(self, *, reader: Engine, **kwargs: Any):
+        """
+        Initialize the session.
+
+        Args:
+            reader: Engine serving reads until the session writes
+            **kwargs: Session arguments; `bind` is the write engine
+        """
+        super().__init__(**kwargs)
+        self._reader = reader
+        self._writing = False
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kwargs: Any) -> Engine | Connection:
+        """Pick the engine for a statement: the reader until the session writes, then the writer."""
+        if not self._writing and (self._flushing or isinstance(clause, UpdateBase)):
+            self._writing = True
+        if self._writing:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        return self._reader
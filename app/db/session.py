@@ -3,15 +3,24 @@ Session management for SQLAlchemy.
 Provides async session context managers and session factory.
 """
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from . import (
     audit,  # noqa: F401  # pyright: ignore[reportUnusedImport]  # Import side effect registers SQLAlchemy event listeners
+    change_log,  # noqa: F401  # pyright: ignore[reportUnusedImport]  # Import side effect registers SQLAlchemy event listeners
 )
-from .connection import get_engine, get_serializable_engine
+from .connection import (
+    get_engine,
+    get_read_engine,
+    get_replica_engine,
+    get_serializable_engine,
+    has_read_engine,
+    has_replicas,
+)
+from .routing import ReadWriteSession
 
 # Lazy async session factory - only creates engine when first used
 # This allows .env files to be loaded before engine creation
@@ -68,6 +77,41 @@ async def create_session() -> AsyncSession:
     return _get_session_factory()()
 
 
+@asynccontextmanager
+async def get_read_session() -> AsyncGenerator[AsyncSession]:
+    """
+    Async context manager for sessions serving read-only dependencies.
+
+    With read replicas configured, the session reads from a replica until its first
+    write, which (like everything after it) goes to the primary. With the SQLite
+    profile it uses the query-only reader pool instead of queueing for the writer;
+    a write through it fails. Otherwise this is get_session().
+    """
+    if has_replicas():
+        async_session = AsyncSession(
+            bind=get_engine(),
+            sync_session_class=ReadWriteSession,
+            reader=get_replica_engine().sync_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    elif has_read_engine():
+        async_session = AsyncSession(bind=get_read_engine(), autoflush=False, expire_on_commit=False)
+    else:
+        async with get_session() as session:
+            yield session
+        return
+
+    try:
+        yield async_session
+        await async_session.commit()
+    except Exception:
+        await async_session.rollback()
+        raise
+    finally:
+        await async_session.close()
+
+
 _serializable_session_local: async_sessionmaker[AsyncSession] | None = None
 
 
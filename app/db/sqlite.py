@@ -0,0 +1,91 @@
+"""
+SQLite performance profile.
+
+File-based SQLite deployments run in WAL mode, where readers never block the writer
+and the writer never blocks readers, but there is still only one writer at a time.
+The profile therefore uses two engines against the same file:
+
+- a writer engine with exactly one connection; its pool queue is the write queue and
+  transactions start with BEGIN IMMEDIATE so the file lock is taken up front instead
+  of failing with "database is locked" when a read transaction is upgraded
+- a reader engine with a regular pool of query-only connections
+
+Regular sessions run on the writer from their first statement, so whatever they read
+before writing comes from the snapshot they write to. Only read-only sessions use the
+reader. A request must therefore never hold two writer sessions at once (see
+get_serializable_db), or it waits for itself until the pool times out.
+
+Both engines apply the profile pragmas through connect events.
+"""
+
+from typing import Any
+
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import (
+    get_sqlite_busy_timeout,
+    get_sqlite_cache_size,
+    get_sqlite_mmap_size,
+)
+
+
+def _profile_pragmas(read_only: bool) -> list[str]:
+    """Build the PRAGMA statements run on every new connection."""
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={get_sqlite_busy_timeout()}",
+        # Negative values are in KiB rather than pages
+        f"PRAGMA cache_size=-{get_sqlite_cache_size()}",
+        f"PRAGMA mmap_size={get_sqlite_mmap_size()}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        # Fail loudly if a write is ever routed to a reader instead of contending for the lock
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def apply_sqlite_profile(engine: AsyncEngine, *, read_only: bool = False) -> None:
+    """
+    Apply the SQLite performance profile to every connection the engine opens.
+
+    Args:
+        engine: Engine connected to a file-based SQLite database
+        read_only: Make connections query-only (reader engine)
+    """
+    pragmas = _profile_pragmas(read_only)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def use_immediate_transactions(engine: AsyncEngine) -> None:
+    """
+    Start every transaction of the engine with BEGIN IMMEDIATE.
+
+    The driver's own implicit BEGIN is disabled so SQLAlchemy can emit the statement itself.
+
+    Args:
+        engine: Writer engine connected to a file-based SQLite database
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_immediate(connection: Connection) -> None:
+        # Run on the DBAPI cursor, like the driver's own BEGIN, so statement counts are unchanged
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+        finally:
+            cursor.close()
@@ -16,12 +16,14 @@ from .auth import (
     InvalidRefreshTokenError,
     InvalidStateTokenError,
 )
+from .db import RepeatedStatementError
 from .http import (
     BusinessRuleError,  # Alias for UnprocessableContentError
     ConflictError,
     ForbiddenError,
     InternalServerError,
     NotFoundError,
+    NotModifiedError,
     UnauthorizedError,
     UnprocessableContentError,
     ValidationError,
@@ -29,6 +31,7 @@ from .http import (
 
 __all__ = [
     # Core HTTP Errors (Alphabetical by HTTP Status)
+    "NotModifiedError",  # 304
     "ValidationError",  # 400
     "UnauthorizedError",  # 401 (Base)
     "ForbiddenError",  # 403
@@ -41,4 +44,6 @@ __all__ = [
     "InvalidStateTokenError",
     "InvalidAccessTokenError",
     "InvalidRefreshTokenError",
+    # Database Usage Errors (Inherit from InternalServerError)
+    "RepeatedStatementError",
 ]
@@ -0,0 +1,19 @@
+"""
+Database Usage Exceptions 🗄️
+
+This module defines exceptions raised by development-time database checks.
+
+Contents:
+- RepeatedStatementError: A request ran the same SQL statement more often than allowed (N+1 pattern).
+"""
+
+from .http import InternalServerError
+
+
+class RepeatedStatementError(InternalServerError):
+    """Raised in development when one request runs the same statement more than the configured threshold."""
+
+    def __init__(self, statement: str, count: int):
+        super().__init__(detail=f"Statement executed {count} times in one request (likely N+1): {statement}")
+        self.statement = statement
+        self.count = count
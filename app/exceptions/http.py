@@ -10,6 +10,7 @@ The exceptions are named to be semantically clearer than the raw status codes
 in application logic (e.g., ValidationError instead of HTTPException(400)).
 
 Contents:
+- 304 Conditional Requests: NotModifiedError (not a failure; answers a conditional GET)
 - 400 Client Errors: ValidationError
 - 401 Authorization Errors: UnauthorizedError (base for auth-specific exceptions)
 - 403 Permission Errors: ForbiddenError
@@ -19,9 +20,18 @@ Contents:
 - 500 Server Errors: InternalServerError
 """
 
+from collections.abc import Mapping
+
 from fastapi import HTTPException, status
 
 
+class NotModifiedError(HTTPException):
+    """Raised when a conditional GET's validators still match; answered without a body. (HTTP 304)"""
+
+    def __init__(self, headers: Mapping[str, str]):
+        super().__init__(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(headers))
+
+
 class ValidationError(HTTPException):
     """Raised when general input or payload validation fails (e.g., missing field). (HTTP 400)"""
 
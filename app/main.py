@@ -2,15 +2,42 @@
 FastAPI application main entry point.
 """
 
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 
+from app.api.middleware import SQLInstrumentationMiddleware
+from app.api.responses import ORJSONResponse
 from app.api.routers.v1 import api_router
 from app.config import load_env_files
+from app.core.identity_providers import IdentityProviderRegistry
+from app.db import get_pool_status, get_session, route_query_metrics
+from app.services import CategoryService
 
 # Load environment variables
 load_env_files()
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    """Application lifespan: warm up the category catalog, release shared resources on shutdown."""
+    try:
+        async with get_session() as session:
+            await CategoryService(session).load_catalog()
+    except SQLAlchemyError:
+        # Not fatal: the catalog loads on first use instead
+        logger.warning("Could not load the category catalog at startup", exc_info=True)
+    yield
+    # Close pooled identity provider HTTP connections
+    await IdentityProviderRegistry.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Divvy API",
@@ -19,6 +46,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -30,11 +58,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Count and time the SQL each request executes
+app.add_middleware(SQLInstrumentationMiddleware)
+
 # Include API routers
 app.include_router(api_router, prefix="/api")
 
 
-@app.get("/")
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     """Root endpoint."""
     return {
@@ -45,7 +76,19 @@ async def root():
     }
 
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/health/db", response_class=ORJSONResponse)
+async def database_health_check():
+    """Connection pool metrics: checked-out and overflow connections, checkout waits and timeouts."""
+    return {"status": "healthy", "pools": get_pool_status()}
+
+
+@app.get("/health/sql", response_class=ORJSONResponse)
+async def sql_health_check():
+    """Per-route SQL metrics: statements and SQL time per request, and requests that repeated a statement."""
+    return {"status": "healthy", "routes": route_query_metrics.snapshot()}
@@ -16,6 +16,7 @@ from app.models.authorization import (
     SystemRoleBinding,
 )
 from app.models.base import AuditMixin, Base, TimestampMixin
+from app.models.change_log import ChangeEntity, ChangeLogEntry, ChangeLogWriterLock
 from app.models.group import Group
 from app.models.period import Period, PeriodStatus
 from app.models.transaction import (
@@ -60,4 +61,8 @@ __all__ = [
     "ExpenseShare",
     "Category",
     "Settlement",
+    # Sync
+    "ChangeEntity",
+    "ChangeLogEntry",
+    "ChangeLogWriterLock",
 ]
@@ -11,7 +11,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base, TimestampMixin
@@ -44,18 +44,30 @@ class RefreshToken(TimestampMixin, Base):
     """RefreshToken model for managing refresh tokens."""
 
     __tablename__ = "refresh_tokens"
-    __table_args__ = (Index("ix_refresh_token_user_revoked", "user_id", "is_revoked"),)
+    __table_args__ = (
+        # Partial index: only active tokens are looked up by user, revoked rows wait for the purge job
+        Index(
+            "ix_refresh_token_user_active",
+            "user_id",
+            postgresql_where=text("NOT is_revoked"),
+            sqlite_where=text("is_revoked = 0"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True, nullable=False)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     device_info: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    is_revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    is_revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
 
     # Relationships
     user: Mapped[User] = relationship("User", back_populates="refresh_tokens")
 
     def __repr__(self) -> str:
-        return f"<RefreshToken(id='{self.id}', user_id={self.user_id}, is_revoked={self.is_revoked})>"
+        return (
+            f"<RefreshToken(id='{self.id}', user_id={self.user_id}, is_revoked={self.is_revoked}, "
+            f"expires_at={self.expires_at})>"
+        )
 
 
 class UserIdentity(TimestampMixin, Base):
@@ -64,8 +76,6 @@ class UserIdentity(TimestampMixin, Base):
     __tablename__ = "user_identities"
     __table_args__ = (
         UniqueConstraint("identity_provider", "external_id", name="uq_provider_external_id"),
-        Index("ix_user_identity_user", "user_id"),
-        Index("ix_user_identity_provider", "identity_provider"),
         Index("ix_user_identity_external_id", "external_id"),
     )
 
@@ -101,10 +111,8 @@ class AccountLinkRequest(TimestampMixin, Base):
 
     __tablename__ = "account_link_requests"
     __table_args__ = (
-        Index("ix_link_request_token", "request_token"),
-        Index("ix_link_request_user", "user_id"),
-        Index("ix_link_request_status", "status"),
-        Index("ix_link_request_expires", "expires_at"),
+        # Expiry sweeps filter on pending requests past their expiry
+        Index("ix_link_request_status_expires", "status", "expires_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -119,9 +127,8 @@ class AccountLinkRequest(TimestampMixin, Base):
         CheckConstraint("status IN ('pending', 'approved')"),
         default=AccountLinkRequestStatus.PENDING.value,
         nullable=False,
-        index=True,
     )
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     # Relationships
     user: Mapped[User] = relationship("User")
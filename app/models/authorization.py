@@ -34,13 +34,10 @@ class SystemRoleBinding(Base):
     """System-wide role binding (user → role at system level)."""
 
     __tablename__ = "system_role_bindings"
-    __table_args__ = (
-        UniqueConstraint("user_id", name="uq_user_system_role"),
-        Index("ix_system_role_binding_user", "user_id"),
-    )
+    __table_args__ = (UniqueConstraint("user_id", name="uq_user_system_role"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     role: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
 
     # Relationships
@@ -72,15 +69,15 @@ class GroupRoleBinding(AuditMixin, Base):
 
     __tablename__ = "group_role_bindings"
     __table_args__ = (
+        # The unique constraint also serves lookups by user; group lookups filter on role as well
         UniqueConstraint("user_id", "group_id", name="uq_user_group_role"),
-        Index("ix_group_role_binding_user", "user_id"),
-        Index("ix_group_role_binding_group", "group_id"),
+        Index("ix_group_role_binding_group_role", "group_id", "role"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    group_id: Mapped[int] = mapped_column(Integer, ForeignKey("groups.id"), nullable=False, index=True)
-    role: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    group_id: Mapped[int] = mapped_column(Integer, ForeignKey("groups.id"), nullable=False)
+    role: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Relationships
     user: Mapped[User] = relationship("User", foreign_keys=[user_id], back_populates="group_role_bindings")
@@ -18,19 +18,19 @@ class TimestampMixin:
     """Mixin to add automatic timestamp tracking to models."""
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC), index=True
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
     )
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
         default=None,
         onupdate=lambda: datetime.now(UTC),
-        index=True,
     )
 
 
 class AuditMixin(TimestampMixin):
     """Mixin to add full audit trail (timestamps + user tracking) to models."""
 
+    # Foreign key indexes: deleting a user looks up the rows referencing it
     created_by: Mapped[int | None] = mapped_column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     updated_by: Mapped[int | None] = mapped_column(Integer, ForeignKey("users.id"), nullable=True, index=True)
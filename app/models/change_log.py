@@ -0,0 +1,82 @@
+"""
+Change log model backing incremental sync.
+"""
+
+from datetime import UTC, datetime
+from enum import Enum
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ChangeEntity(str, Enum):
+    """
+    Enumeration of the entities recorded in the change log.
+
+    Attributes:
+        GROUP: A group was created, renamed or deleted.
+        MEMBERSHIP: A user joined or left a group, or their role changed. The
+                    entity ID is the user's ID.
+        PERIOD: A period was created, renamed, closed or settled.
+        TRANSACTION: A transaction or its expense shares changed.
+        CATEGORY: A category changed. Categories are global, so these entries
+                  have no group.
+        USER: A member's name or email changed.
+    """
+
+    GROUP = "group"
+    MEMBERSHIP = "membership"
+    PERIOD = "period"
+    TRANSACTION = "transaction"
+    CATEGORY = "category"
+    USER = "user"
+
+
+class ChangeLogEntry(Base):
+    """
+    Append-only record of one change, in commit order of the writers.
+
+    Writers hold the `ChangeLogWriterLock` row from their first write to a logged
+    table until they commit, so entry IDs increase in commit order (see
+    `app.db.change_log`).
+
+    The entry ID is the sync cursor: a client that has applied every entry up to an
+    ID asks for the entries after it. Entries name what changed, not its new state.
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_group_id", "group_id", "id"),
+        Index("ix_change_log_entity", "entity", "entity_id", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # No foreign key: entries outlive the group, as tombstones
+    group_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    entity: Mapped[ChangeEntity] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ChangeLogEntry(id={self.id}, group_id={self.group_id}, entity='{self.entity}', "
+            f"entity_id={self.entity_id}, deleted={self.deleted})>"
+        )
+
+
+class ChangeLogWriterLock(Base):
+    """
+    Single row that transactions writing logged tables lock until they commit.
+
+    Autoincrement IDs are assigned at insert time, not at commit: without the lock,
+    an entry committed after one with a higher ID was synced would never be synced.
+    """
+
+    __tablename__ = "change_log_writer_lock"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
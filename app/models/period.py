@@ -42,10 +42,13 @@ class Period(AuditMixin, Base):
     """
 
     __tablename__ = "periods"
-    __table_args__ = (Index("ix_period_group_dates", "group_id", "start_date", "end_date"),)
+    __table_args__ = (
+        Index("ix_period_group_dates", "group_id", "start_date", "end_date"),
+        Index("ix_period_group_status", "group_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    group_id: Mapped[int] = mapped_column(Integer, ForeignKey("groups.id"), nullable=False, index=True)
+    group_id: Mapped[int] = mapped_column(Integer, ForeignKey("groups.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[PeriodStatus] = mapped_column(String(20), nullable=False, default=PeriodStatus.OPEN)
     start_date: Mapped[datetime] = mapped_column(
@@ -53,6 +56,8 @@ class Period(AuditMixin, Base):
     )
     end_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     closed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Change counter, bumped by every change to the period or what its endpoints show (see PeriodRepository)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
     group: Mapped[Group] = relationship("Group", back_populates="periods")
@@ -17,6 +17,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.category_catalog import category_catalog
+
 from .base import AuditMixin, Base, TimestampMixin
 
 if TYPE_CHECKING:
@@ -100,6 +102,7 @@ class Transaction(AuditMixin, Base):
     __table_args__ = (
         Index("ix_transaction_period_payer", "period_id", "payer_id"),
         Index("ix_transaction_period_created", "period_id", "created_at"),
+        Index("ix_transaction_period_status", "period_id", "status"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -115,7 +118,6 @@ class Transaction(AuditMixin, Base):
     status: Mapped[TransactionStatus] = mapped_column(
         default=TransactionStatus.DRAFT,
         nullable=False,
-        index=True,
     )
     description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     amount: Mapped[int] = mapped_column(Integer, nullable=False)  # Stored in cents
@@ -124,7 +126,7 @@ class Transaction(AuditMixin, Base):
     )
     payer_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     category_id: Mapped[int] = mapped_column(Integer, ForeignKey("categories.id"), nullable=False, index=True)
-    period_id: Mapped[int] = mapped_column(Integer, ForeignKey("periods.id"), nullable=False, index=True)
+    period_id: Mapped[int] = mapped_column(Integer, ForeignKey("periods.id"), nullable=False)
 
     # Relationships
     payer: Mapped[User] = relationship(
@@ -147,8 +149,8 @@ class Transaction(AuditMixin, Base):
 
     @property
     def category_name(self) -> str | None:
-        """Get category name from relationship."""
-        return self.category.name if self.category else None
+        """Get category name from the category catalog."""
+        return category_catalog.get_name(self.category_id)
 
     @property
     def period_name(self) -> str | None:
@@ -173,7 +175,7 @@ class ExpenseShare(AuditMixin, Base):
     __tablename__ = "expense_shares"
 
     # Composite primary key
-    transaction_id: Mapped[int] = mapped_column(Integer, ForeignKey("transactions.id"), primary_key=True, index=True)
+    transaction_id: Mapped[int] = mapped_column(Integer, ForeignKey("transactions.id"), primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True, index=True)
 
     # Share calculation - if null, split equally
@@ -197,7 +199,7 @@ class Settlement(AuditMixin, Base):
     __table_args__ = (Index("ix_settlement_period_payer_payee", "period_id", "payer_id", "payee_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    period_id: Mapped[int] = mapped_column(Integer, ForeignKey("periods.id"), nullable=False, index=True)
+    period_id: Mapped[int] = mapped_column(Integer, ForeignKey("periods.id"), nullable=False)
     payer_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     payee_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     amount: Mapped[int] = mapped_column(Integer, nullable=False)  # Stored in cents
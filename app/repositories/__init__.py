@@ -1,6 +1,7 @@
 from .account_link_request import AccountLinkRequestRepository
 from .authorization import AuthorizationRepository
 from .category import CategoryRepository
+from .change_log import ChangeLogRepository
 from .group import GroupRepository
 from .period import PeriodRepository
 from .refresh_token import RefreshTokenRepository
@@ -13,6 +14,7 @@ __all__ = [
     "AccountLinkRequestRepository",
     "AuthorizationRepository",
     "CategoryRepository",
+    "ChangeLogRepository",
     "GroupRepository",
     "PeriodRepository",
     "RefreshTokenRepository",
@@ -0,0 +1,87 @@
+from collections.abc import Collection, Sequence
+
+from sqlalchemy import Select, and_, false, func, insert, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChangeEntity, ChangeLogEntry, GroupRoleBinding, Period
+
+
+class ChangeLogRepository:
+    """Repository for the change log read by incremental sync."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def record(self, entity: ChangeEntity, entity_id: int, group_id: int | None, deleted: bool = False) -> None:
+        """Record a change to an entity of a group, or to a global entity when `group_id` is None."""
+        stmt = insert(ChangeLogEntry).values(group_id=group_id, entity=entity, entity_id=entity_id, deleted=deleted)
+        await self.session.execute(stmt)
+
+    async def record_in_period(
+        self, entity: ChangeEntity, entity_id: int, period_id: int, deleted: bool = False
+    ) -> None:
+        """Record a change to an entity of a period, under the period's group."""
+        await self._record_from(
+            select(Period.group_id, literal(entity.value), literal(entity_id), literal(deleted)).where(
+                Period.id == period_id
+            )
+        )
+
+    async def record_in_user_groups(self, entity: ChangeEntity, entity_id: int, user_id: int) -> None:
+        """Record a change once under every group the user belongs to."""
+        await self._record_from(
+            select(GroupRoleBinding.group_id, literal(entity.value), literal(entity_id), false()).where(
+                GroupRoleBinding.user_id == user_id
+            )
+        )
+
+    async def record_group_deleted(self, group_id: int) -> None:
+        """Record that every member of a group left it; must run before the group's bindings are deleted."""
+        await self._record_from(
+            select(
+                GroupRoleBinding.group_id,
+                literal(ChangeEntity.MEMBERSHIP.value),
+                GroupRoleBinding.user_id,
+                literal(True),
+            ).where(GroupRoleBinding.group_id == group_id)
+        )
+
+    async def _record_from(self, rows: Select[int, str, int, bool]) -> None:
+        # One INSERT ... SELECT: the group is resolved by the database, not fetched first
+        stmt = insert(ChangeLogEntry).from_select(["group_id", "entity", "entity_id", "deleted"], rows)
+        await self.session.execute(stmt)
+
+    async def get_head(self) -> int:
+        """Retrieve the ID of the latest entry, or 0 when the log is empty."""
+        return await self.session.scalar(select(func.coalesce(func.max(ChangeLogEntry.id), 0))) or 0
+
+    async def get_entity_head(self, entity: ChangeEntity) -> int:
+        """Retrieve the ID of the latest entry about an entity type, or 0 when there is none."""
+        stmt = select(func.coalesce(func.max(ChangeLogEntry.id), 0)).where(ChangeLogEntry.entity == entity.value)
+        return await self.session.scalar(stmt) or 0
+
+    async def get_entries(
+        self, after: int, group_ids: Collection[int], user_id: int, limit: int
+    ) -> Sequence[ChangeLogEntry]:
+        """Retrieve up to `limit` entries after an ID visible to a user, oldest first.
+
+        Visible are the entries of the user's groups, global entries, and the user's own
+        membership changes, which remain visible after the user left the group.
+        """
+        stmt = (
+            select(ChangeLogEntry)
+            .where(
+                ChangeLogEntry.id > after,
+                or_(
+                    ChangeLogEntry.group_id.in_(group_ids),
+                    ChangeLogEntry.group_id.is_(None),
+                    and_(
+                        ChangeLogEntry.entity == ChangeEntity.MEMBERSHIP.value,
+                        ChangeLogEntry.entity_id == user_id,
+                    ),
+                ),
+            )
+            .order_by(ChangeLogEntry.id)
+            .limit(limit)
+        )
+        return (await self.session.scalars(stmt)).all()
@@ -1,9 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Group, GroupRole, GroupRoleBinding
+from app.repositories.projection import load_only_fields
 
 
 class GroupRepository:
@@ -21,31 +22,54 @@ class GroupRepository:
         """Retrieve a specific group by its ID."""
         return await self.session.get(Group, id)
 
-    async def get_groups_by_user_id(self, user_id: int) -> Sequence[Group]:
-        """Retrieve all groups that a specific user is a member of (via GroupRoleBinding)."""
+    async def group_exists(self, id: int) -> bool:
+        """Check if a group exists without loading it."""
+        return bool(await self.session.scalar(select(exists().where(Group.id == id))))
+
+    async def get_groups_by_user_id(self, user_id: int, fields: Collection[str] | None = None) -> Sequence[Group]:
+        """Retrieve all groups that a specific user is a member of (via GroupRoleBinding).
+
+        Only the group columns in `fields` are loaded when given.
+        """
         stmt = (
             select(Group)
             .join(GroupRoleBinding, Group.id == GroupRoleBinding.group_id)
             .where(GroupRoleBinding.user_id == user_id)
         )
+        if fields is not None:
+            stmt = stmt.options(load_only_fields(Group, fields))
+        return (await self.session.scalars(stmt)).all()
+
+    async def get_groups_by_ids(self, ids: Collection[int]) -> Sequence[Group]:
+        """Retrieve the groups with the given IDs in one query; unknown IDs are skipped."""
+        stmt = select(Group).where(Group.id.in_(ids))
+        return (await self.session.scalars(stmt)).all()
+
+    async def get_group_ids_by_user_id(self, user_id: int) -> Sequence[int]:
+        """Retrieve the IDs of the groups a specific user is a member of, without loading the groups."""
+        stmt = select(GroupRoleBinding.group_id).where(GroupRoleBinding.user_id == user_id)
         return (await self.session.scalars(stmt)).all()
 
     async def is_member(self, group_id: int, user_id: int) -> bool:
         """Check if a user is a member of a specific group (has any GroupRoleBinding)."""
-        stmt = select(GroupRoleBinding).where(
-            GroupRoleBinding.group_id == group_id,
-            GroupRoleBinding.user_id == user_id,
+        stmt = select(
+            exists().where(
+                GroupRoleBinding.group_id == group_id,
+                GroupRoleBinding.user_id == user_id,
+            )
         )
-        return (await self.session.scalars(stmt)).one_or_none() is not None
+        return bool(await self.session.scalar(stmt))
 
     async def is_owner(self, group_id: int, user_id: int) -> bool:
-        """Get the owner user_id for a group."""
-        stmt = select(GroupRoleBinding).where(
-            GroupRoleBinding.group_id == group_id,
-            GroupRoleBinding.user_id == user_id,
-            GroupRoleBinding.role == GroupRole.OWNER.value,
+        """Check if a user is the owner of a specific group."""
+        stmt = select(
+            exists().where(
+                GroupRoleBinding.group_id == group_id,
+                GroupRoleBinding.user_id == user_id,
+                GroupRoleBinding.role == GroupRole.OWNER.value,
+            )
         )
-        return (await self.session.scalars(stmt)).one_or_none() is not None
+        return bool(await self.session.scalar(stmt))
 
     async def create_group(self, group: Group) -> Group:
         """Create a new group and persist it to the database."""
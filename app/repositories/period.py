@@ -1,10 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, Update, delete, exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models import Period, PeriodStatus
+from app.models import GroupRoleBinding, Period, PeriodStatus, Transaction
+from app.repositories.projection import load_only_fields
 
 
 class PeriodRepository:
@@ -13,29 +13,83 @@ class PeriodRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_periods_by_group_id(self, group_id: int) -> Sequence[Period]:
-        """Retrieve all periods associated with a specific group."""
+    async def get_periods_by_group_id(self, group_id: int, fields: Collection[str] | None = None) -> Sequence[Period]:
+        """Retrieve all periods associated with a specific group, loading only `fields` when given."""
         stmt = select(Period).where(Period.group_id == group_id)
+        if fields is not None:
+            stmt = stmt.options(load_only_fields(Period, fields))
         return (await self.session.scalars(stmt)).all()
 
     async def get_period_by_id(self, id: int) -> Period | None:
         """Retrieve a specific period by its ID."""
         return await self.session.get(Period, id)
 
+    async def get_periods_by_ids(self, ids: Collection[int]) -> Sequence[Period]:
+        """Retrieve the periods with the given IDs in one query; unknown IDs are skipped."""
+        stmt = select(Period).where(Period.id.in_(ids))
+        return (await self.session.scalars(stmt)).all()
+
+    async def get_periods_by_group_ids(self, group_ids: Collection[int]) -> Sequence[Period]:
+        """Retrieve all periods of the given groups in one query."""
+        stmt = select(Period).where(Period.group_id.in_(group_ids))
+        return (await self.session.scalars(stmt)).all()
+
     async def get_active_period_by_group_id(self, group_id: int) -> Period | None:
         """Retrieve the active period for a specific group."""
-        stmt = (
-            select(Period)
+        stmt = select(Period).where(Period.group_id == group_id, Period.status == PeriodStatus.OPEN)
+        return (await self.session.scalars(stmt)).one_or_none()
+
+    async def active_period_has_transactions(self, group_id: int) -> bool:
+        """Check if the active period of a specific group has any transactions, without loading them."""
+        stmt = select(
+            exists()
+            .where(Transaction.period_id == Period.id)
             .where(Period.group_id == group_id, Period.status == PeriodStatus.OPEN)
-            .options(selectinload(Period.transactions))
         )
-        return (await self.session.scalars(stmt)).one_or_none()
+        return bool(await self.session.scalar(stmt))
 
     async def get_period_status_by_id(self, period_id: int) -> PeriodStatus | None:
         """Retrieve the status of a specific period."""
         stmt = select(Period.status).where(Period.id == period_id)
         return (await self.session.scalars(stmt)).one_or_none()
 
+    async def bump_version(self, period_id: int) -> int | None:
+        """Record a change to a period, its transactions or its settlements; return the new version.
+
+        Returns None if the period does not exist.
+        """
+        stmt = self._bump_versions_statement(Period.id == period_id)
+        if self.session.get_bind().dialect.update_returning:
+            return (await self.session.execute(stmt.returning(Period.version))).scalar_one_or_none()
+        # MySQL has no UPDATE ... RETURNING: the update locks the row until commit, so read it back
+        await self.session.execute(stmt)
+        return await self.session.scalar(select(Period.version).where(Period.id == period_id))
+
+    async def bump_versions_for_category(self, category_id: int) -> None:
+        """Record a change to a category in every period with transactions of that category."""
+        await self._bump_versions(
+            Period.id.in_(select(Transaction.period_id).where(Transaction.category_id == category_id))
+        )
+
+    async def bump_versions_for_user(self, user_id: int) -> None:
+        """Record a change to a user in every period of the groups the user belongs to."""
+        await self._bump_versions(
+            Period.group_id.in_(select(GroupRoleBinding.group_id).where(GroupRoleBinding.user_id == user_id))
+        )
+
+    async def _bump_versions(self, criterion: ColumnElement[bool]) -> None:
+        await self.session.execute(self._bump_versions_statement(criterion))
+
+    @staticmethod
+    def _bump_versions_statement(criterion: ColumnElement[bool]) -> Update:
+        # Incremented in SQL, so concurrent writers never lose a bump; updated_at follows
+        return (
+            update(Period)
+            .where(criterion)
+            .values(version=Period.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
     async def create_period(self, period: Period) -> Period:
         """Create a new period and persist it to the database."""
         self.session.add(period)
@@ -0,0 +1,25 @@
+"""
+Column projections for repository queries that load only part of an entity.
+"""
+
+from collections.abc import Collection
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.models import Base
+
+
+def load_only_fields(entity: type[Base], fields: Collection[str]) -> ORMOption:
+    """
+    Loader option restricting `entity` to the columns named in `fields`, plus its primary key.
+
+    Names that are not column attributes (relationships, properties) are ignored; eager
+    loads are decided by the caller. Reading a column that was not loaded raises
+    instead of emitting a lazy load.
+    """
+    mapper = inspect(entity)
+    primary_key = {mapper.get_property_by_column(column).key for column in mapper.primary_key}
+    names = primary_key | {name for name in fields if name in mapper.column_attrs}
+    return load_only(*(mapper.column_attrs[name].class_attribute for name in names), raiseload=True)
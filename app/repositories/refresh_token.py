@@ -1,9 +1,12 @@
 """Repository for managing refresh token entities."""
 
-from sqlalchemy import select
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Result, delete, exists, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import RefreshToken
+from app.models import RefreshToken, User
 
 
 class RefreshTokenRepository:
@@ -16,6 +19,7 @@ class RefreshTokenRepository:
         self,
         id: str,
         user_id: int,
+        expires_at: datetime,
         device_info: str | None = None,
     ) -> RefreshToken:
         """Create a new refresh token and persist it to the database."""
@@ -24,6 +28,7 @@ class RefreshTokenRepository:
             user_id=user_id,
             device_info=device_info,
             is_revoked=False,
+            expires_at=expires_at,
         )
         self.session.add(refresh_token)
         await self.session.flush()
@@ -36,16 +41,70 @@ class RefreshTokenRepository:
 
     async def revoke_by_id(self, id: str) -> RefreshToken | None:
         """Revoke a refresh token by its ID and return the revoked token."""
-        refresh_token = await self.get_by_id(id)
-        if refresh_token:
-            refresh_token.is_revoked = True
-            await self.session.flush()
-        return refresh_token
+        stmt = update(RefreshToken).where(RefreshToken.id == id).values(is_revoked=True)
+        if self.session.get_bind().dialect.update_returning:
+            return (await self.session.scalars(stmt.returning(RefreshToken))).one_or_none()
+        # MySQL has no UPDATE ... RETURNING: read the token back within the same transaction
+        await self.session.execute(stmt)
+        return await self.get_by_id(id)
 
-    async def revoke_all(self, user_id: int) -> None:
-        """Revoke all refresh tokens for a specific user."""
-        stmt = select(RefreshToken).where(RefreshToken.user_id == user_id).where(~RefreshToken.is_revoked)
-        tokens = (await self.session.scalars(stmt)).all()
-        for token in tokens:
-            token.is_revoked = True
-        await self.session.flush()
+    async def revoke_for_rotation(self, id: str, user_id: int) -> tuple[str | None, str] | None:
+        """
+        Atomically revoke an active refresh token owned by an active user.
+
+        The revocation is a compare-and-swap on ``is_revoked`` in a single ``UPDATE ... RETURNING``,
+        so two concurrent rotations of the same token cannot both succeed. Without RETURNING (MySQL),
+        the updated row count decides and the device info and email are read back afterwards.
+
+        Returns:
+            Tuple of (device_info, user email) if the token was revoked by this call, None if it was
+            missing, already revoked, not owned by ``user_id`` or its user is inactive
+        """
+        user_is_active = exists().where(User.id == RefreshToken.user_id, User.is_active)
+        user_email = select(User.email).where(User.id == RefreshToken.user_id).scalar_subquery()
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.id == id, RefreshToken.user_id == user_id, ~RefreshToken.is_revoked, user_is_active)
+            .values(is_revoked=True)
+        )
+        if self.session.get_bind().dialect.update_returning:
+            row = (await self.session.execute(stmt.returning(RefreshToken.device_info, user_email))).one_or_none()
+        elif self._rowcount(await self.session.execute(stmt)):
+            row = (
+                await self.session.execute(select(RefreshToken.device_info, user_email).where(RefreshToken.id == id))
+            ).one()
+        else:
+            row = None
+        return (row[0], row[1]) if row else None
+
+    async def revoke_all(self, user_id: int) -> int:
+        """Revoke all active refresh tokens for a specific user and return how many were revoked."""
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, ~RefreshToken.is_revoked)
+            .values(is_revoked=True)
+        )
+        return self._rowcount(await self.session.execute(stmt))
+
+    async def delete_expired_or_revoked(self, now: datetime, limit: int) -> int:
+        """
+        Delete up to ``limit`` refresh tokens that are revoked or expired at ``now``.
+
+        Deleting in bounded batches keeps each transaction (and its locks) short; callers loop
+        until fewer than ``limit`` rows are deleted.
+
+        Returns:
+            Number of deleted tokens
+        """
+        # The batch is selected first: MySQL rejects LIMIT in an IN subquery
+        batch = select(RefreshToken.id).where(or_(RefreshToken.is_revoked, RefreshToken.expires_at <= now)).limit(limit)
+        ids = (await self.session.scalars(batch)).all()
+        if not ids:
+            return 0
+        stmt = delete(RefreshToken).where(RefreshToken.id.in_(ids)).execution_options(synchronize_session=False)
+        return self._rowcount(await self.session.execute(stmt))
+
+    @staticmethod
+    def _rowcount(result: Result[Any]) -> int:
+        # Bulk UPDATE/DELETE without RETURNING yields a CursorResult, typed as a plain Result
+        return cast(CursorResult[Any], result).rowcount
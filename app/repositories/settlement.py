@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -39,6 +39,11 @@ class SettlementRepository:
         )
         return (await self.session.scalars(stmt)).all()
 
+    async def get_settlements_by_period_ids(self, period_ids: Collection[int]) -> Sequence[Settlement]:
+        """Retrieve all settlements of the given periods in one query, without their related entities."""
+        stmt = select(Settlement).where(Settlement.period_id.in_(period_ids))
+        return (await self.session.scalars(stmt)).all()
+
     async def create_settlement(self, settlement: Settlement) -> Settlement:
         """Create a new settlement and persist it to the database."""
         self.session.add(settlement)
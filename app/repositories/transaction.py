@@ -1,10 +1,11 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
-from app.models import Transaction
+from app.models import Period, Transaction, TransactionStatus
+from app.repositories.projection import load_only_fields
 
 
 class TransactionRepository:
@@ -20,24 +21,87 @@ class TransactionRepository:
             .where(Transaction.id == transaction_id)
             .options(
                 joinedload(Transaction.payer),
-                joinedload(Transaction.category),
                 joinedload(Transaction.period),
                 selectinload(Transaction.expense_shares),
             )
         )
         return (await self.session.scalars(stmt)).one_or_none()
 
-    async def get_transactions_by_period_id(self, period_id: int) -> Sequence[Transaction]:
-        """Retrieve all transactions associated with a specific period."""
+    async def get_transaction_status_and_creator(
+        self, transaction_id: int
+    ) -> tuple[TransactionStatus, int | None] | None:
+        """Retrieve the status and creator ID of a specific transaction."""
+        stmt = select(Transaction.status, Transaction.created_by).where(Transaction.id == transaction_id)
+        row = (await self.session.execute(stmt)).one_or_none()
+        return (row.status, row.created_by) if row else None
+
+    async def get_transactions_by_period_id(
+        self, period_id: int, fields: Collection[str] | None = None
+    ) -> Sequence[Transaction]:
+        """Retrieve all transactions associated with a specific period.
+
+        Payer and period are not joined: they repeat across rows, callers resolve them
+        once per distinct ID (see `RequestLoaders`).
+
+        Args:
+            period_id: ID of the period
+            fields: Transaction attributes to load, or None for all of them. Expense
+                shares are only loaded when listed.
+        """
+        stmt = select(Transaction).where(Transaction.period_id == period_id)
+        if fields is None or "expense_shares" in fields:
+            stmt = stmt.options(selectinload(Transaction.expense_shares))
+        if fields is not None:
+            stmt = stmt.options(load_only_fields(Transaction, fields))
+        return (await self.session.scalars(stmt)).all()
+
+    async def get_period_version_and_transactions(
+        self, period_id: int, fields: Collection[str] | None = None
+    ) -> tuple[int, Sequence[Transaction]] | None:
+        """Retrieve a period's change version with its transactions, in one statement.
+
+        A single statement reads a single snapshot, even under READ COMMITTED: the
+        transactions are exactly those of the returned version. Expense shares are
+        joined in rather than loaded separately.
+
+        Args:
+            period_id: ID of the period
+            fields: Transaction attributes to load, or None for all of them. Expense
+                shares are only loaded when listed.
+
+        Returns:
+            The version and the transactions, or None if the period does not exist
+        """
+        stmt = (
+            select(Period.version, Transaction)
+            .select_from(Period)
+            .outerjoin(Transaction, Transaction.period_id == Period.id)
+            .where(Period.id == period_id)
+            # Transactions already in the session must not keep the state of an older snapshot
+            .execution_options(populate_existing=True)
+        )
+        if fields is None or "expense_shares" in fields:
+            stmt = stmt.options(joinedload(Transaction.expense_shares))
+        if fields is not None:
+            stmt = stmt.options(load_only_fields(Transaction, fields))
+        rows = (await self.session.execute(stmt)).unique().all()
+        if not rows:
+            return None
+        # The outer join yields a single row without a transaction for an empty period
+        transactions: list[Transaction | None] = [transaction for _, transaction in rows]
+        return rows[0][0], [transaction for transaction in transactions if transaction is not None]
+
+    async def get_transactions_by_ids(
+        self, ids: Collection[int], period_ids: Collection[int] = ()
+    ) -> Sequence[Transaction]:
+        """Retrieve the transactions with the given IDs, plus every transaction of `period_ids`, with their shares.
+
+        Unknown IDs are skipped. Payer and period are not joined (see `get_transactions_by_period_id`).
+        """
         stmt = (
             select(Transaction)
-            .where(Transaction.period_id == period_id)
-            .options(
-                joinedload(Transaction.payer),
-                joinedload(Transaction.category),
-                joinedload(Transaction.period),
-                selectinload(Transaction.expense_shares),
-            )
+            .where(or_(Transaction.id.in_(ids), Transaction.period_id.in_(period_ids)))
+            .options(selectinload(Transaction.expense_shares))
         )
         return (await self.session.scalars(stmt)).all()
 
@@ -51,7 +115,6 @@ class TransactionRepository:
             .where(Transaction.id == transaction.id)
             .options(
                 joinedload(Transaction.payer),
-                joinedload(Transaction.category),
                 joinedload(Transaction.period),
                 selectinload(Transaction.expense_shares),
             )
@@ -67,15 +130,20 @@ class TransactionRepository:
             .where(Transaction.id == transaction.id)
             .options(
                 joinedload(Transaction.payer),
-                joinedload(Transaction.category),
                 joinedload(Transaction.period),
                 selectinload(Transaction.expense_shares),
             )
         )
         return (await self.session.scalars(stmt)).one()
 
-    async def delete_transaction(self, id: int) -> None:
-        """Delete a transaction by its ID if it exists."""
+    async def delete_transaction(self, id: int) -> int | None:
+        """Delete a transaction by its ID if it exists; return the ID of its period, or None if it did not exist."""
         stmt = delete(Transaction).where(Transaction.id == id)
-        await self.session.execute(stmt)
+        if self.session.get_bind().dialect.delete_returning:
+            period_id = (await self.session.execute(stmt.returning(Transaction.period_id))).scalar_one_or_none()
+        else:
+            # MySQL has no DELETE ... RETURNING: read the period first
+            period_id = await self.session.scalar(select(Transaction.period_id).where(Transaction.id == id))
+            await self.session.execute(stmt)
         await self.session.flush()
+        return period_id
@@ -1,6 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
 from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import User
@@ -21,15 +22,28 @@ class UserRepository:
         """Retrieve a specific user by their ID."""
         return await self.session.get(User, id)
 
+    async def get_users_by_ids(self, ids: Collection[int]) -> Sequence[User]:
+        """Retrieve the users with the given IDs in one query; unknown IDs are skipped."""
+        stmt = select(User).where(User.id.in_(ids))
+        return (await self.session.scalars(stmt)).all()
+
     async def get_user_by_email(self, email: str) -> User | None:
         """Retrieve a specific user by their email address."""
         stmt = select(User).where(User.email == email)
         return (await self.session.scalars(stmt)).one_or_none()
 
     async def create_user(self, user: User) -> User:
-        """Create a new user and persist them to the database."""
+        """Create a new user and persist them to the database.
+
+        Raises:
+            IntegrityError: If the email is already taken; the session is rolled back before re-raising
+        """
         self.session.add(user)
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         return user
 
     async def update_user(self, user: User) -> User:
@@ -15,13 +15,22 @@ from .authentication import (
     TokenResponse,
 )
 from .category import CategoryRequest, CategoryResponse
+from .event import PeriodBalancesEvent, PeriodEventKind, TransactionEvent
 from .group import GroupRequest, GroupResponse, GroupRoleAssignmentRequest
 from .period import PeriodRequest, PeriodResponse
+from .sparse import validate_partial
+from .sync import SyncResponse, SyncSettlementResponse, SyncTombstone, SyncTransactionResponse
 from .transaction import (
     BalanceResponse,
+    ColumnarTransactionListResponse,
+    CompactTransactionListResponse,
+    CompactTransactionResponse,
     ExpenseShareRequest,
     ExpenseShareResponse,
     SettlementResponse,
+    TransactionColumns,
+    TransactionListFormat,
+    TransactionListReferences,
     TransactionRequest,
     TransactionResponse,
 )
@@ -44,9 +53,22 @@ __all__ = [
     "PeriodResponse",
     "TransactionRequest",
     "TransactionResponse",
+    "TransactionListFormat",
+    "TransactionListReferences",
+    "CompactTransactionResponse",
+    "CompactTransactionListResponse",
+    "TransactionColumns",
+    "ColumnarTransactionListResponse",
     "SettlementResponse",
     "ExpenseShareRequest",
     "ExpenseShareResponse",
+    "PeriodBalancesEvent",
+    "PeriodEventKind",
+    "TransactionEvent",
+    "SyncResponse",
+    "SyncSettlementResponse",
+    "SyncTombstone",
+    "SyncTransactionResponse",
     "RegisterRequest",
     "RefreshTokenRequest",
     "TokenResponse",
@@ -58,4 +80,5 @@ __all__ = [
     "UserIdentityRequest",
     "UserIdentityResponse",
     "UserIdentityUpdateRequest",
+    "validate_partial",
 ]
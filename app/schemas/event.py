@@ -0,0 +1,58 @@
+"""
+Pydantic schemas for the live events of a period.
+"""
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from .transaction import BalanceResponse, TransactionResponse
+
+
+class PeriodEventKind(str, Enum):
+    """
+    Kinds of events on a period's live stream, sent as the SSE event name.
+
+    Attributes:
+        BALANCES: The balances of the period, sent first on every stream.
+        TRANSACTION_CREATED: A transaction was added to the period.
+        TRANSACTION_UPDATED: A transaction, or only its status, changed.
+        TRANSACTION_DELETED: A transaction was deleted.
+        RESYNC: The client fell behind and missed events; the stream ends and the
+                client reconnects for fresh balances.
+    """
+
+    BALANCES = "balances"
+    TRANSACTION_CREATED = "transaction.created"
+    TRANSACTION_UPDATED = "transaction.updated"
+    TRANSACTION_DELETED = "transaction.deleted"
+    RESYNC = "resync"
+
+
+class PeriodBalancesEvent(BaseModel):
+    """Schema for the balances a period's live stream starts from."""
+
+    period_id: int = Field(..., description="ID of the period")
+    version: int = Field(..., description="Change version of the period the balances were computed at")
+    balances: list[BalanceResponse] = Field(..., description="Balance of every user with transactions")
+
+
+class TransactionEvent(BaseModel):
+    """
+    Schema for a committed transaction change, with its effect on the balances.
+
+    Adding `balance_deltas` to the balances of an earlier version yields the balances
+    of `version`. Events with a version the client already has must be skipped.
+    """
+
+    kind: PeriodEventKind = Field(..., description="Kind of the change")
+    period_id: int = Field(..., description="ID of the period of the transaction")
+    version: int = Field(..., description="Change version of the period after the change")
+    transaction_id: int = Field(..., description="ID of the changed transaction")
+    transaction: TransactionResponse | None = Field(
+        default=None, description="Transaction after the change; absent once deleted"
+    )
+    balance_deltas: dict[int, int] = Field(
+        default_factory=dict[int, int],
+        description="Change of balance in cents by user ID; users left unchanged are omitted",
+    )
@@ -0,0 +1,31 @@
+"""
+Sparse fieldsets: response DTOs holding only the fields a client asked for.
+"""
+
+from collections.abc import Collection
+
+from pydantic import BaseModel
+
+
+def validate_partial[ModelT: BaseModel](model: type[ModelT], source: object, fields: Collection[str] | None) -> ModelT:
+    """
+    Validate the given fields of a response DTO from the attributes of `source`.
+
+    Other fields are neither read nor validated, so `source` may be an ORM object
+    loaded with only those columns. Required fields left out stay unset: serialize
+    the result with `include=fields` (see `ModelResponse`).
+
+    Args:
+        model: Response DTO class
+        source: Object to read the field values from, typically an ORM entity
+        fields: Names of the fields to validate, or None for all of them
+
+    Returns:
+        DTO with the given fields set
+    """
+    if fields is None:
+        return model.model_validate(source, from_attributes=True)
+    partial = model.model_construct()
+    for field in fields:
+        model.__pydantic_validator__.validate_assignment(partial, field, getattr(source, field), from_attributes=True)
+    return partial
@@ -0,0 +1,72 @@
+"""
+Pydantic schemas for the incremental sync endpoint.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.models import ChangeEntity
+
+from .category import CategoryResponse
+from .group import GroupResponse
+from .period import PeriodResponse
+from .transaction import CompactTransactionResponse
+
+
+class SyncTransactionResponse(CompactTransactionResponse):
+    """Schema for a changed transaction, in compact form with its period."""
+
+    period_id: int = Field(..., description="ID of the period of the transaction")
+
+
+class SyncSettlementResponse(BaseModel):
+    """Schema for a recorded settlement transfer."""
+
+    model_config = {"from_attributes": True}
+
+    id: int = Field(..., description="ID of the settlement")
+    period_id: int = Field(..., description="ID of the settled period")
+    payer_id: int = Field(..., description="ID of the user who paid (debtor)")
+    payee_id: int = Field(..., description="ID of the user who was paid (creditor)")
+    amount: int = Field(..., description="Amount transferred in cents")
+    date_paid: datetime = Field(..., description="Date of the transfer")
+
+
+class SyncTombstone(BaseModel):
+    """Schema for an entity the client must drop."""
+
+    entity: ChangeEntity = Field(..., description="Kind of the deleted entity")
+    id: int = Field(..., description="ID of the deleted entity")
+
+
+class SyncResponse(BaseModel):
+    """
+    Schema for the changes after a sync cursor.
+
+    Each changed entity appears once, in its current state. A group tombstone also
+    drops the group's periods, transactions and settlements.
+    """
+
+    cursor: int = Field(..., description="Cursor to send with the next sync request")
+    has_more: bool = Field(..., description="Whether more changes follow; if so, sync again right away")
+    groups: list[GroupResponse] = Field(default_factory=list[GroupResponse], description="Created or changed groups")
+    periods: list[PeriodResponse] = Field(
+        default_factory=list[PeriodResponse], description="Created or changed periods"
+    )
+    transactions: list[SyncTransactionResponse] = Field(
+        default_factory=list[SyncTransactionResponse],
+        description="Created or changed transactions, with their expense shares",
+    )
+    settlements: list[SyncSettlementResponse] = Field(
+        default_factory=list[SyncSettlementResponse], description="Settlements of the settled periods among `periods`"
+    )
+    categories: list[CategoryResponse] = Field(
+        default_factory=list[CategoryResponse], description="Created or changed categories"
+    )
+    users: dict[int, str] = Field(
+        default_factory=dict[int, str], description="Names of the users referenced by the changes and of renamed users"
+    )
+    deleted: list[SyncTombstone] = Field(
+        default_factory=list[SyncTombstone], description="Entities deleted or no longer visible"
+    )
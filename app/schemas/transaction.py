@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 
 from pydantic import BaseModel, Field
 
@@ -67,6 +68,94 @@ class ExpenseShareResponse(BaseModel):
     share_percentage: float | None = Field(default=None, description="Percentage of the share")
 
 
+class TransactionListFormat(str, Enum):
+    """
+    Representations of a period's transaction list.
+
+    Attributes:
+        FULL: One `TransactionResponse` per transaction, names included.
+        COMPACT: One `CompactTransactionResponse` per transaction, names in sidecar dictionaries.
+        COLUMNS: One array per field (`TransactionColumns`), names in sidecar dictionaries.
+    """
+
+    FULL = "full"
+    COMPACT = "compact"
+    COLUMNS = "columns"
+
+
+# Expense share as [user_id, share_amount, share_percentage]
+type CompactExpenseShare = tuple[int, int | None, float | None]
+
+
+class CompactTransactionResponse(BaseModel):
+    """Schema for a transaction in a compact transaction list; related entities are referenced by ID only."""
+
+    id: int = Field(..., description="ID of the transaction")
+    description: str | None = Field(default=None, description="Transaction description")
+    amount: int = Field(..., description="Transaction amount in cents")
+    payer_id: int = Field(..., description="ID of the user who paid the transaction")
+    category_id: int = Field(..., description="ID of the category of the transaction")
+    transaction_kind: TransactionKind = Field(..., description="Kind of transaction")
+    split_kind: SplitKind = Field(..., description="Kind of split")
+    status: TransactionStatus = Field(..., description="Status of the transaction")
+    expense_shares: list[CompactExpenseShare] | None = Field(
+        default=None, description="Expense shares as [user_id, share_amount, share_percentage]"
+    )
+
+    created_at: datetime | None = Field(default=None, description="Transaction created at")
+    updated_at: datetime | None = Field(default=None, description="Transaction updated at")
+
+    created_by: int | None = Field(default=None, description="Transaction created by")
+    updated_by: int | None = Field(default=None, description="Transaction updated by")
+
+
+class TransactionColumns(BaseModel):
+    """Schema for a transaction list as one array per field; index i of every array describes transaction i."""
+
+    id: list[int] = Field(..., description="IDs of the transactions")
+    description: list[str | None] = Field(..., description="Transaction descriptions")
+    amount: list[int] = Field(..., description="Transaction amounts in cents")
+    payer_id: list[int] = Field(..., description="IDs of the users who paid the transactions")
+    category_id: list[int] = Field(..., description="IDs of the categories of the transactions")
+    transaction_kind: list[TransactionKind] = Field(..., description="Kinds of the transactions")
+    split_kind: list[SplitKind] = Field(..., description="Kinds of split")
+    status: list[TransactionStatus] = Field(..., description="Statuses of the transactions")
+    expense_shares: list[list[CompactExpenseShare] | None] = Field(
+        ..., description="Expense shares of each transaction as [user_id, share_amount, share_percentage]"
+    )
+
+    created_at: list[datetime | None] = Field(..., description="Transactions created at")
+    updated_at: list[datetime | None] = Field(..., description="Transactions updated at")
+
+    created_by: list[int | None] = Field(..., description="Transactions created by")
+    updated_by: list[int | None] = Field(..., description="Transactions updated by")
+
+
+class TransactionListReferences(BaseModel):
+    """Schema for the entities referenced by a normalized transaction list, each listed once."""
+
+    period_id: int = Field(..., description="ID of the period of the transactions")
+    period_name: str | None = Field(default=None, description="Name of the period of the transactions")
+    users: dict[int, str] = Field(
+        default_factory=dict[int, str], description="Names of the payers and sharing users, by user ID"
+    )
+    categories: dict[int, str] = Field(
+        default_factory=dict[int, str], description="Names of the categories, by category ID"
+    )
+
+
+class CompactTransactionListResponse(TransactionListReferences):
+    """Schema for a period's transactions as ID-only rows plus referenced entities."""
+
+    transactions: list[CompactTransactionResponse] = Field(..., description="Transactions of the period")
+
+
+class ColumnarTransactionListResponse(TransactionListReferences):
+    """Schema for a period's transactions as column arrays plus referenced entities."""
+
+    columns: TransactionColumns = Field(..., description="Transactions of the period, one array per field")
+
+
 class BalanceResponse(BaseModel):
     """Schema for user balance in a period."""
 
@@ -6,10 +6,13 @@ from .account_link_request import AccountLinkRequestService
 from .authentication import AuthenticationService
 from .authorization import AuthorizationService
 from .category import CategoryService
+from .container import ServiceContainer
 from .group import GroupService
 from .identity_provider import IdentityProviderService
+from .loaders import RequestLoaders
 from .period import PeriodService
 from .settlement import SettlementService
+from .sync import SyncService
 from .transaction import TransactionService
 from .user import UserService
 from .user_identity import UserIdentityService
@@ -22,7 +25,10 @@ __all__ = [
     "GroupService",
     "IdentityProviderService",
     "PeriodService",
+    "RequestLoaders",
+    "ServiceContainer",
     "SettlementService",
+    "SyncService",
     "TransactionService",
     "UserService",
     "UserIdentityService",
@@ -55,14 +55,7 @@ class AuthenticationService:
         Raises:
             ConflictError: If email already exists
         """
-        from app.exceptions import ConflictError
-
-        # Check if user exists
-        existing_user = await self._user_service.get_user_by_email(email)
-        if existing_user:
-            raise ConflictError("Email already registered")
-
-        # Create user using schema
+        # Create user using schema; duplicate emails are rejected by the unique constraint on insert
         user_request = UserRequest(
             email=email,
             name=name,
@@ -88,10 +81,13 @@ class AuthenticationService:
         Raises:
             UnauthorizedError: If email or password is incorrect or user is inactive
         """
-        if not await self._user_service.check_password(email, password):
+        user = await self._user_service.verify_credentials(email, password)
+        if not user:
             raise UnauthorizedError("Invalid email or password")
+        if not user.is_active:
+            raise UnauthorizedError("User not found or inactive or email is incorrect")
 
-        return await self.issues_tokens(email, device_info)
+        return await self._issues_tokens(user, device_info)
 
     async def change_password(
         self,
@@ -182,7 +178,8 @@ class AuthenticationService:
         Rotate a refresh token: invalidate the old one and create a new one.
 
         This implements token rotation for security. When a refresh token is used,
-        it's invalidated and a new one is issued.
+        it's invalidated and a new one is issued. The old token is revoked with a single
+        conditional update, so a token replayed concurrently can only be rotated once.
 
         Args:
             token: The refresh token to rotate
@@ -196,17 +193,12 @@ class AuthenticationService:
         old_refresh_token_claims = validate_refresh_token(token)
         jti, user_id = self._get_refresh_token_jti_and_user_id(old_refresh_token_claims)
 
-        user = await self._user_service.get_user_by_id(user_id)
-        if not user or not user.is_active:
-            raise UnauthorizedError("User not found or inactive")
-        old_refresh_token = await self._refresh_token_repository.get_by_id(jti)
-        if not old_refresh_token:
-            raise UnauthorizedError("Refresh token not found")
-        if old_refresh_token.is_revoked:
-            raise UnauthorizedError("Refresh token is revoked")
+        revoked = await self._refresh_token_repository.revoke_for_rotation(jti, user_id)
+        if revoked is None:
+            raise UnauthorizedError("Refresh token is invalid, revoked, or user is inactive")
 
-        await self._refresh_token_repository.revoke_by_id(jti)
-        return await self._issues_tokens(user, old_refresh_token.device_info)
+        device_info, email = revoked
+        return await self._issue_tokens_for(user_id, email, device_info)
 
     def _get_refresh_token_jti_and_user_id(self, claims: dict[str, Any]) -> tuple[str, int]:
         """
@@ -242,10 +234,26 @@ class AuthenticationService:
         Raises:
             NotFoundError: If user not found or inactive
         """
-        access_token, expires_in = create_access_token(data={"sub": str(user.id), "email": user.email})
-        refresh_token, jti = create_refresh_token(data={"sub": str(user.id)})
+        return await self._issue_tokens_for(user.id, user.email, device_info)
+
+    async def _issue_tokens_for(self, user_id: int, email: str, device_info: str | None = None) -> TokenResponse:
+        """
+        Issue access and refresh tokens from the user's id and email, without loading the user.
 
-        await self._refresh_token_repository.create(id=jti, user_id=user.id, device_info=device_info)
+        Args:
+            user_id: ID of the user to generate tokens for
+            email: Email embedded in the access token claims
+            device_info: Optional device information (e.g., User-Agent string)
+
+        Returns:
+            TokenResponse containing access token and refresh token
+        """
+        access_token, expires_in = create_access_token(data={"sub": str(user_id), "email": email})
+        refresh_token, jti, refresh_expires_at = create_refresh_token(data={"sub": str(user_id)})
+
+        await self._refresh_token_repository.create(
+            id=jti, user_id=user_id, expires_at=refresh_expires_at, device_info=device_info
+        )
 
         return TokenResponse(
             access_token=access_token,
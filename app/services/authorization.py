@@ -6,8 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.i18n import _
 from app.exceptions import ValidationError
-from app.models import GroupRole, SystemRole
-from app.repositories import AuthorizationRepository
+from app.models import ChangeEntity, GroupRole, SystemRole
+from app.repositories import AuthorizationRepository, ChangeLogRepository
 
 
 class AuthorizationService:
@@ -15,6 +15,7 @@ class AuthorizationService:
 
     def __init__(self, session: AsyncSession):
         self._auth_repository = AuthorizationRepository(session)
+        self._change_log_repository = ChangeLogRepository(session)
 
     # ========== System Role Management ==========
 
@@ -78,3 +79,4 @@ class AuthorizationService:
         # Upsert or delete
         role_str = role.value if role else None
         await self._auth_repository.assign_group_role(user_id, group_id, role_str)
+        await self._change_log_repository.record(ChangeEntity.MEMBERSHIP, user_id, group_id, deleted=role is None)
@@ -1,33 +1,79 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_category_catalog_ttl
+from app.core.category_catalog import CategoryCatalog, category_catalog, has_pending_updates, update_on_commit
 from app.core.i18n import _
 from app.exceptions import NotFoundError
-from app.models import Category
-from app.repositories import CategoryRepository
+from app.models import Category, ChangeEntity
+from app.repositories import CategoryRepository, ChangeLogRepository, PeriodRepository
 from app.schemas import CategoryRequest, CategoryResponse
 
 
 class CategoryService:
-    """Service layer for category-related business logic and operations."""
+    """Service layer for category-related business logic and operations.
+
+    Reads are served from the process-wide category catalog; writes update it once
+    the session commits. Until then the session reads its own writes from the database.
+    """
 
     def __init__(self, session: AsyncSession):
+        self._session = session
         self._category_repository = CategoryRepository(session)
+        self._period_repository = PeriodRepository(session)
+        self._change_log_repository = ChangeLogRepository(session)
+
+    async def load_catalog(self, category_ids: Collection[int] = ()) -> CategoryCatalog:
+        """
+        Load the category catalog if it is empty or misses any of `category_ids`.
+
+        Once its TTL has passed, the catalog is also reloaded if the change log holds
+        category changes it was not loaded with, such as other processes' writes.
+        """
+        if not category_catalog.loaded or any(category_catalog.get(id) is None for id in category_ids):
+            await self._reload_catalog()
+        elif category_catalog.is_expired(get_category_catalog_ttl()):
+            head = await self._change_log_repository.get_entity_head(ChangeEntity.CATEGORY)
+            if head != category_catalog.version:
+                await self._reload_catalog(head)
+            else:
+                category_catalog.mark_validated()
+        return category_catalog
+
+    async def _reload_catalog(self, version: int | None = None) -> None:
+        # Read the change log head first: a change committed in between is seen at the next validation
+        if version is None:
+            version = await self._change_log_repository.get_entity_head(ChangeEntity.CATEGORY)
+        categories = await self._category_repository.get_all_categories()
+        category_catalog.load((CategoryResponse.model_validate(category) for category in categories), version)
 
     async def get_all_categories(self) -> Sequence[CategoryResponse]:
         """Retrieve all categories ordered by ID."""
-        categories = await self._category_repository.get_all_categories()
-        return [CategoryResponse.model_validate(category) for category in categories]
+        if has_pending_updates(self._session):
+            categories = await self._category_repository.get_all_categories()
+            return [CategoryResponse.model_validate(category) for category in categories]
+        catalog = await self.load_catalog()
+        return [CategoryResponse.model_validate(category) for category in catalog.all()]
 
     async def get_category_by_id(self, category_id: int) -> CategoryResponse | None:
         """Retrieve a specific category by its ID."""
-        category = await self._category_repository.get_category_by_id(category_id)
+        if has_pending_updates(self._session):
+            category = await self._category_repository.get_category_by_id(category_id)
+        else:
+            category = (await self.load_catalog([category_id])).get(category_id)
         return CategoryResponse.model_validate(category) if category else None
 
     async def get_category_by_name(self, name: str) -> CategoryResponse | None:
         """Retrieve a specific category by its name."""
-        category = await self._category_repository.get_category_by_name(name)
+        if has_pending_updates(self._session):
+            category = await self._category_repository.get_category_by_name(name)
+        else:
+            category = (await self.load_catalog()).get_by_name(name)
+            if category is None:
+                # Possibly created by another process since the catalog was loaded
+                await self._reload_catalog()
+                category = category_catalog.get_by_name(name)
         return CategoryResponse.model_validate(category) if category else None
 
     async def create_category(self, request: CategoryRequest) -> CategoryResponse:
@@ -37,7 +83,10 @@ class CategoryService:
             is_default=False,
         )
         category = await self._category_repository.create_category(category)
-        return CategoryResponse.model_validate(category)
+        await self._change_log_repository.record(ChangeEntity.CATEGORY, category.id, None)
+        response = CategoryResponse.model_validate(category)
+        update_on_commit(self._session, lambda catalog: catalog.put(response))
+        return response
 
     async def update_category(self, id: int, request: CategoryRequest) -> CategoryResponse:
         """Update an existing category."""
@@ -46,8 +95,15 @@ class CategoryService:
             raise NotFoundError(_("Category %s not found") % id)
         category.name = request.name
         category = await self._category_repository.update_category(category)
-        return CategoryResponse.model_validate(category)
+        # Transaction lists show category names
+        await self._period_repository.bump_versions_for_category(id)
+        await self._change_log_repository.record(ChangeEntity.CATEGORY, id, None)
+        response = CategoryResponse.model_validate(category)
+        update_on_commit(self._session, lambda catalog: catalog.put(response))
+        return response
 
     async def delete_category(self, id: int) -> None:
         """Delete a category by its ID."""
-        return await self._category_repository.delete_category(id)
+        await self._category_repository.delete_category(id)
+        await self._change_log_repository.record(ChangeEntity.CATEGORY, id, None, deleted=True)
+        update_on_commit(self._session, lambda catalog: catalog.remove(id))
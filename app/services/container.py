@@ -0,0 +1,99 @@
+"""
+Request-scoped service container.
+
+One container is created per request and session (see `get_services`). Each service,
+with the services it depends on, is built the first time it is accessed and then
+shared by every dependency and PEP of the request; services a request never touches
+are never built.
+"""
+
+from functools import cached_property
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import SettlementRepository
+from app.services.account_link_request import AccountLinkRequestService
+from app.services.authentication import AuthenticationService
+from app.services.authorization import AuthorizationService
+from app.services.category import CategoryService
+from app.services.group import GroupService
+from app.services.identity_provider import IdentityProviderService
+from app.services.loaders import RequestLoaders
+from app.services.period import PeriodService
+from app.services.settlement import SettlementService
+from app.services.sync import SyncService
+from app.services.transaction import TransactionService
+from app.services.user import UserService
+from app.services.user_identity import UserIdentityService
+
+
+class ServiceContainer:
+    """Lazily built services sharing one session."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @cached_property
+    def loaders(self) -> RequestLoaders:
+        return RequestLoaders(self.session)
+
+    # Base services (no dependencies on other services)
+    @cached_property
+    def user_service(self) -> UserService:
+        return UserService(self.session)
+
+    @cached_property
+    def authorization_service(self) -> AuthorizationService:
+        return AuthorizationService(self.session)
+
+    @cached_property
+    def category_service(self) -> CategoryService:
+        return CategoryService(self.session)
+
+    @cached_property
+    def period_service(self) -> PeriodService:
+        return PeriodService(self.session)
+
+    @cached_property
+    def transaction_service(self) -> TransactionService:
+        return TransactionService(self.session, self.loaders)
+
+    # Services with dependencies on other services
+    @cached_property
+    def authentication_service(self) -> AuthenticationService:
+        return AuthenticationService(session=self.session, user_service=self.user_service)
+
+    @cached_property
+    def user_identity_service(self) -> UserIdentityService:
+        return UserIdentityService(self.session, self.user_service)
+
+    @cached_property
+    def account_link_request_service(self) -> AccountLinkRequestService:
+        return AccountLinkRequestService(self.session, self.user_service)
+
+    @cached_property
+    def group_service(self) -> GroupService:
+        return GroupService(self.session, self.authorization_service, self.period_service)
+
+    @cached_property
+    def settlement_service(self) -> SettlementService:
+        return SettlementService(
+            period_service=self.period_service,
+            transaction_service=self.transaction_service,
+            settlement_repository=SettlementRepository(self.session),
+            loaders=self.loaders,
+        )
+
+    @cached_property
+    def sync_service(self) -> SyncService:
+        return SyncService(self.session, self.transaction_service, self.loaders)
+
+    @cached_property
+    def identity_provider_service(self) -> IdentityProviderService:
+        return IdentityProviderService(
+            session=self.session,
+            user_service=self.user_service,
+            user_identity_service=self.user_identity_service,
+            account_link_request_service=self.account_link_request_service,
+            authentication_service=self.authentication_service,
+        )
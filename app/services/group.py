@@ -1,12 +1,12 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.i18n import _
 from app.exceptions import NotFoundError
-from app.models import Group, GroupRole, PeriodStatus
-from app.repositories import GroupRepository, UserRepository
-from app.schemas import GroupRequest, GroupResponse
+from app.models import ChangeEntity, Group, GroupRole
+from app.repositories import ChangeLogRepository, GroupRepository, UserRepository
+from app.schemas import GroupRequest, GroupResponse, validate_partial
 from app.services.authorization import AuthorizationService
 from app.services.period import PeriodService
 
@@ -22,6 +22,7 @@ class GroupService:
     ):
         self._group_repository = GroupRepository(session)
         self._user_repository = UserRepository(session)
+        self._change_log_repository = ChangeLogRepository(session)
         self._authorization_service = authorization_service
         self._period_service = period_service
 
@@ -35,10 +36,12 @@ class GroupService:
         group = await self._group_repository.get_group_by_id(group_id)
         return GroupResponse.model_validate(group) if group else None
 
-    async def get_groups_by_user_id(self, user_id: int) -> Sequence[GroupResponse]:
-        """Retrieve all groups that a specific user is a member of."""
-        groups = await self._group_repository.get_groups_by_user_id(user_id)
-        return [GroupResponse.model_validate(group) for group in groups]
+    async def get_groups_by_user_id(
+        self, user_id: int, fields: Collection[str] | None = None
+    ) -> Sequence[GroupResponse]:
+        """Retrieve all groups that a specific user is a member of, with only `fields` set when given."""
+        groups = await self._group_repository.get_groups_by_user_id(user_id, fields)
+        return [validate_partial(GroupResponse, group, fields) for group in groups]
 
     async def is_member(self, group_id: int, user_id: int) -> bool:
         """Check if a user is a member of a specific group."""
@@ -66,6 +69,7 @@ class GroupService:
         # Create group without owner_id (will be removed from model)
         group = Group(name=group_request.name)
         group = await self._group_repository.create_group(group)
+        await self._change_log_repository.record(ChangeEntity.GROUP, group.id, group.id)
 
         # Assign owner role via GroupRoleBinding
         await self._authorization_service.assign_group_role(
@@ -98,6 +102,7 @@ class GroupService:
         group.name = group_request.name
 
         updated_group = await self._group_repository.update_group(group)
+        await self._change_log_repository.record(ChangeEntity.GROUP, group_id, group_id)
         return GroupResponse.model_validate(updated_group)
 
     async def transfer_group_owner(self, group_id: int, new_owner_id: int) -> GroupResponse:
@@ -173,15 +178,13 @@ class GroupService:
         Raises:
             NotFoundError: If group not found
         """
-        group = await self.get_group_by_id(id)
-        if not group:
+        if not await self._group_repository.group_exists(id):
             raise NotFoundError(_("Group %s not found") % id)
 
+        # Members see the deletion as leaving the group
+        await self._change_log_repository.record_group_deleted(id)
         await self._group_repository.delete_group(id)
 
     async def has_active_period_with_transactions(self, group_id: int) -> bool:
         """Check if a group has an active period with transactions."""
-        active_period = await self._period_service.get_active_period_by_group_id(group_id)
-        if not active_period or active_period.status != PeriodStatus.OPEN:
-            return False
-        return len(active_period.transactions) > 0
+        return await self._period_service.active_period_has_transactions(group_id)
@@ -7,7 +7,13 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.i18n import _
-from app.core.identity_providers import IdentityProviderRegistry
+from app.core.identity_providers import (
+    IdentityProvider,
+    IdentityProviderRegistry,
+    IdentityProviderTokenResponse,
+    IdentityProviderUserInfo,
+    IdTokenIdentityProvider,
+)
 from app.core.security import StateTokenPayload, create_state_token, is_signed_state_token, validate_state_token
 from app.exceptions import UnauthorizedError
 from app.models import IdentityProviderName
@@ -105,7 +111,7 @@ class IdentityProviderService:
         Flow:
         1. Validate state parameter (if provided) - see State Parameter Handling below
         2. Exchange authorization code for access token
-        3. Get user info from provider
+        3. Get user info from the verified ID token, or from the provider's userinfo API
         4. Check if identity already exists (by provider + external_id)
            - If exists: return tokens for existing user
         5. If identity doesn't exist:
@@ -169,7 +175,7 @@ class IdentityProviderService:
             raise UnauthorizedError(_("No access token received from provider"))
 
         # Get user info from provider
-        user_info = await provider.get_user_info(tokens.access_token)
+        user_info = await self._get_user_info(provider, tokens)
         external_id = user_info.external_id
         email = user_info.email
         name = user_info.name or email.split("@")[0]  # Use email prefix as fallback name
@@ -257,3 +263,11 @@ class IdentityProviderService:
         await self._user_identity_service.create_identity(user_identity_request)
 
         return await self._authentication_service.issues_tokens(user.email, device_info)
+
+    async def _get_user_info(
+        self, provider: IdentityProvider, tokens: IdentityProviderTokenResponse
+    ) -> IdentityProviderUserInfo:
+        """Resolve user info, preferring local ID token verification over a userinfo round trip."""
+        if tokens.id_token and isinstance(provider, IdTokenIdentityProvider):
+            return await provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+        return await provider.get_user_info(tokens.access_token)
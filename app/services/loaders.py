@@ -0,0 +1,43 @@
+"""
+Request-scoped loaders for the entities services resolve by ID.
+
+One `RequestLoaders` is created per request (see `get_loaders`) and shared by the
+request's services, so an entity is fetched at most once per request and IDs
+requested together are fetched with one `IN` query per entity type.
+"""
+
+import asyncio
+from collections.abc import Collection
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.category_catalog import CatalogCategory
+from app.core.dataloader import DataLoader
+from app.models import Period, User
+from app.repositories import PeriodRepository, UserRepository
+from app.services.category import CategoryService
+
+
+class RequestLoaders:
+    """Batching loaders for users, periods and categories sharing one session."""
+
+    def __init__(self, session: AsyncSession):
+        self._user_repository = UserRepository(session)
+        self._period_repository = PeriodRepository(session)
+        self._category_service = CategoryService(session)
+
+        # One lock per session: batches dispatched in the same tick must not overlap
+        lock = asyncio.Lock()
+        self.users: DataLoader[int, User] = DataLoader(self._load_users, lock)
+        self.periods: DataLoader[int, Period] = DataLoader(self._load_periods, lock)
+        self.categories: DataLoader[int, CatalogCategory] = DataLoader(self._load_categories, lock)
+
+    async def _load_users(self, ids: Collection[int]) -> dict[int, User]:
+        return {user.id: user for user in await self._user_repository.get_users_by_ids(ids)}
+
+    async def _load_periods(self, ids: Collection[int]) -> dict[int, Period]:
+        return {period.id: period for period in await self._period_repository.get_periods_by_ids(ids)}
+
+    async def _load_categories(self, ids: Collection[int]) -> dict[int, CatalogCategory]:
+        catalog = await self._category_service.load_catalog(ids)
+        return {id: category for id in ids if (category := catalog.get(id)) is not None}
@@ -1,12 +1,12 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.i18n import _
 from app.exceptions import BusinessRuleError, NotFoundError
-from app.models import Period, PeriodStatus
-from app.repositories import PeriodRepository
+from app.models import ChangeEntity, Period, PeriodStatus
+from app.repositories import ChangeLogRepository, PeriodRepository
 from app.schemas import PeriodRequest, PeriodResponse
 
 
@@ -15,10 +15,11 @@ class PeriodService:
 
     def __init__(self, session: AsyncSession):
         self._period_repository = PeriodRepository(session)
+        self._change_log_repository = ChangeLogRepository(session)
 
-    async def get_periods_by_group_id(self, group_id: int) -> Sequence[Period]:
-        """Retrieve all periods associated with a specific group."""
-        return await self._period_repository.get_periods_by_group_id(group_id)
+    async def get_periods_by_group_id(self, group_id: int, fields: Collection[str] | None = None) -> Sequence[Period]:
+        """Retrieve all periods associated with a specific group, loading only `fields` when given."""
+        return await self._period_repository.get_periods_by_group_id(group_id, fields)
 
     async def get_period_by_id(self, period_id: int) -> PeriodResponse | None:
         """Retrieve a specific period by its ID."""
@@ -29,6 +30,10 @@ class PeriodService:
         """Retrieve the active period for a specific group."""
         return await self._period_repository.get_active_period_by_group_id(group_id)
 
+    async def active_period_has_transactions(self, group_id: int) -> bool:
+        """Check if the active period of a specific group has any transactions."""
+        return await self._period_repository.active_period_has_transactions(group_id)
+
     async def get_period_status_by_id(self, period_id: int) -> PeriodStatus | None:
         """Retrieve the status of a specific period."""
         return await self._period_repository.get_period_status_by_id(period_id)
@@ -37,6 +42,7 @@ class PeriodService:
         """Create a new period."""
         period = Period(name=request.name, group_id=group_id)
         period = await self._period_repository.create_period(period)
+        await self._change_log_repository.record(ChangeEntity.PERIOD, period.id, group_id)
 
         return PeriodResponse.model_validate(period)
 
@@ -49,6 +55,8 @@ class PeriodService:
 
         period.name = name
         updated_period = await self._period_repository.update_period(period)
+        await self._period_repository.bump_version(period_id)
+        await self._change_log_repository.record(ChangeEntity.PERIOD, period_id, updated_period.group_id)
 
         return PeriodResponse.model_validate(updated_period)
 
@@ -64,6 +72,8 @@ class PeriodService:
         period.status = PeriodStatus.CLOSED
         period.closed_at = datetime.now(UTC)
         updated_period = await self._period_repository.update_period(period)
+        await self._period_repository.bump_version(period_id)
+        await self._change_log_repository.record(ChangeEntity.PERIOD, period_id, updated_period.group_id)
 
         return PeriodResponse.model_validate(updated_period)
 
@@ -76,5 +86,7 @@ class PeriodService:
             raise BusinessRuleError(_("Period %s is not closed") % period_id)
         period.status = PeriodStatus.SETTLED
         updated_period = await self._period_repository.update_period(period)
+        await self._period_repository.bump_version(period_id)
+        await self._change_log_repository.record(ChangeEntity.PERIOD, period_id, updated_period.group_id)
 
         return PeriodResponse.model_validate(updated_period)
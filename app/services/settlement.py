@@ -7,9 +7,9 @@ from app.exceptions import BusinessRuleError, NotFoundError
 from app.models import PeriodStatus, Settlement
 from app.repositories import SettlementRepository
 from app.schemas import SettlementResponse
+from app.services.loaders import RequestLoaders
 from app.services.period import PeriodService
 from app.services.transaction import TransactionService
-from app.services.user import UserService
 
 
 class SettlementService:
@@ -17,13 +17,13 @@ class SettlementService:
         self,
         period_service: PeriodService,
         transaction_service: TransactionService,
-        user_service: UserService,
         settlement_repository: SettlementRepository,
+        loaders: RequestLoaders | None = None,
     ):
         self._period_service = period_service
         self._transaction_service = transaction_service
-        self._user_service = user_service
         self._settlement_repository = settlement_repository
+        self._loaders = loaders or RequestLoaders(settlement_repository.session)
 
     async def get_settlements_by_period_id(self, period_id: int) -> Sequence[SettlementResponse]:
         """Get settlements for a specific period."""
@@ -68,11 +68,10 @@ class SettlementService:
         creditors.sort(key=lambda x: x[1], reverse=True)
         debtors.sort(key=lambda x: x[1], reverse=True)
 
-        # Get user names for all involved users
-        user_ids = {user_id for user_id, _ in creditors + debtors}
+        # Get user names for all involved users in one batch
+        user_ids = sorted({user_id for user_id, _ in creditors + debtors})
         users: dict[int, str] = {}  # Store user names for lookup
-        for user_id in user_ids:
-            user = await self._user_service.get_user_by_id(user_id)
+        for user_id, user in zip(user_ids, await self._loaders.users.load_many(user_ids), strict=True):
             if not user:
                 raise NotFoundError(_("User %s not found") % user_id)
             users[user_id] = user.name
@@ -0,0 +1,175 @@
+"""
+Incremental sync for offline-first clients.
+
+Writers record what they change in the change log, in the same transaction (see
+`ChangeLogRepository`). A client sends the cursor of its last sync and gets each
+entity changed since, once and in its current state, plus tombstones; the cost
+grows with the number of changes, not with the size of its groups.
+
+A client without a cursor, and a client that joined a group since its cursor, gets
+a snapshot of the group instead.
+
+Cursors are change log IDs. They are assigned when a writer inserts its entries,
+so writers are serialized from their first write to their commit (see
+`app.db.change_log`): IDs then follow commit order, and no entry can become visible
+below a cursor already handed out.
+"""
+
+from collections import defaultdict
+from collections.abc import Collection, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChangeEntity, ChangeLogEntry, Group, Period, PeriodStatus, Settlement
+from app.repositories import ChangeLogRepository, GroupRepository, PeriodRepository, SettlementRepository
+from app.schemas import (
+    CategoryResponse,
+    GroupResponse,
+    PeriodResponse,
+    SyncResponse,
+    SyncSettlementResponse,
+    SyncTombstone,
+    SyncTransactionResponse,
+)
+from app.services.category import CategoryService
+from app.services.loaders import RequestLoaders
+from app.services.transaction import TransactionService
+
+
+class SyncService:
+    """Service layer assembling the changes a user has not synced yet."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        transaction_service: TransactionService,
+        loaders: RequestLoaders,
+    ):
+        self._change_log_repository = ChangeLogRepository(session)
+        self._group_repository = GroupRepository(session)
+        self._period_repository = PeriodRepository(session)
+        self._settlement_repository = SettlementRepository(session)
+        self._category_service = CategoryService(session)
+        self._transaction_service = transaction_service
+        self._loaders = loaders
+
+    async def get_changes(self, user_id: int, cursor: int | None, limit: int) -> SyncResponse:
+        """Retrieve the changes visible to a user after a cursor, or a full snapshot without one.
+
+        Args:
+            user_id: ID of the syncing user
+            cursor: Cursor returned by the previous sync, or None for a first sync
+            limit: Maximum number of change log entries to consume; `has_more` is set
+                when entries remain
+
+        Returns:
+            Changed entities, tombstones and the cursor to sync from next
+        """
+        group_ids = set(await self._group_repository.get_group_ids_by_user_id(user_id))
+        if cursor is None:
+            # Read the head first: changes committed while the snapshot is built are replayed next time
+            head = await self._change_log_repository.get_head()
+            response = await self._build_response(head, False, snapshot_group_ids=group_ids)
+            response.categories = list(await self._category_service.get_all_categories())
+            return response
+
+        entries = await self._change_log_repository.get_entries(cursor, group_ids, user_id, limit + 1)
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        next_cursor = entries[-1].id if entries else cursor
+
+        changed: defaultdict[ChangeEntity, set[int]] = defaultdict(set)
+        snapshot_group_ids: set[int] = set()
+        user_ids: set[int] = set()
+        deleted: list[SyncTombstone] = []
+        for entry in self._latest_entries(entries):
+            if entry.entity == ChangeEntity.MEMBERSHIP:
+                assert entry.group_id is not None, "memberships are recorded under their group"
+                if entry.entity_id != user_id:
+                    user_ids.add(entry.entity_id)
+                elif entry.deleted or entry.group_id not in group_ids:
+                    deleted.append(SyncTombstone(entity=ChangeEntity.GROUP, id=entry.group_id))
+                else:
+                    snapshot_group_ids.add(entry.group_id)
+            elif entry.deleted:
+                deleted.append(SyncTombstone(entity=entry.entity, id=entry.entity_id))
+            else:
+                changed[entry.entity].add(entry.entity_id)
+
+        response = await self._build_response(
+            next_cursor,
+            has_more,
+            snapshot_group_ids=snapshot_group_ids,
+            group_ids=changed[ChangeEntity.GROUP],
+            period_ids=changed[ChangeEntity.PERIOD],
+            transaction_ids=changed[ChangeEntity.TRANSACTION],
+            user_ids=user_ids | changed[ChangeEntity.USER],
+        )
+        categories = await self._loaders.categories.load_many(sorted(changed[ChangeEntity.CATEGORY]))
+        response.categories = [CategoryResponse.model_validate(c) for c in categories if c is not None]
+        response.deleted = deleted
+        return response
+
+    @staticmethod
+    def _latest_entries(entries: Sequence[ChangeLogEntry]) -> list[ChangeLogEntry]:
+        """Keep the last entry per entity; memberships are per group, the other entities have global IDs."""
+        latest: dict[tuple[str, int, int | None], ChangeLogEntry] = {}
+        for entry in entries:
+            group_id = entry.group_id if entry.entity == ChangeEntity.MEMBERSHIP else None
+            latest[(entry.entity, entry.entity_id, group_id)] = entry
+        return list(latest.values())
+
+    async def _build_response(
+        self,
+        cursor: int,
+        has_more: bool,
+        snapshot_group_ids: Collection[int] = (),
+        group_ids: Collection[int] = (),
+        period_ids: Collection[int] = (),
+        transaction_ids: Collection[int] = (),
+        user_ids: Collection[int] = (),
+    ) -> SyncResponse:
+        """Load the current state of the changed entities and of every entity of the snapshot groups."""
+        group_ids = {*group_ids, *snapshot_group_ids}
+        groups: Sequence[Group] = await self._group_repository.get_groups_by_ids(group_ids) if group_ids else []
+
+        periods: list[Period] = []
+        if period_ids:
+            periods.extend(await self._period_repository.get_periods_by_ids(period_ids))
+        if snapshot_group_ids:
+            periods.extend(await self._period_repository.get_periods_by_group_ids(snapshot_group_ids))
+        periods = list({period.id: period for period in periods}.values())
+
+        snapshot_period_ids = [period.id for period in periods if period.group_id in snapshot_group_ids]
+        transactions: Sequence[SyncTransactionResponse] = (
+            await self._transaction_service.get_sync_transactions(transaction_ids, snapshot_period_ids)
+            if transaction_ids or snapshot_period_ids
+            else []
+        )
+
+        # Settlements are recorded once, when their period is settled
+        settled_period_ids = [period.id for period in periods if period.status == PeriodStatus.SETTLED]
+        settlements: Sequence[Settlement] = (
+            await self._settlement_repository.get_settlements_by_period_ids(settled_period_ids)
+            if settled_period_ids
+            else []
+        )
+
+        referenced_user_ids = {
+            *user_ids,
+            *(t.payer_id for t in transactions),
+            *(share[0] for t in transactions for share in t.expense_shares or ()),
+            *(s.payer_id for s in settlements),
+            *(s.payee_id for s in settlements),
+        }
+        users = await self._loaders.users.load_many(sorted(referenced_user_ids))
+
+        return SyncResponse(
+            cursor=cursor,
+            has_more=has_more,
+            groups=[GroupResponse.model_validate(group) for group in groups],
+            periods=[PeriodResponse.model_validate(period) for period in periods],
+            transactions=list(transactions),
+            settlements=[SyncSettlementResponse.model_validate(settlement) for settlement in settlements],
+            users={user.id: user.name for user in users if user is not None},
+        )
@@ -1,32 +1,111 @@
+import asyncio
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from decimal import ROUND_HALF_EVEN, Decimal
 
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.events import period_channel, publish_on_commit
 from app.core.i18n import _
 from app.exceptions import InternalServerError, NotFoundError, ValidationError
-from app.models import ExpenseShare, SplitKind, Transaction, TransactionKind, TransactionStatus
-from app.repositories import TransactionRepository, UserRepository
-from app.schemas import BalanceResponse, TransactionRequest, TransactionResponse
+from app.models import ChangeEntity, ExpenseShare, SplitKind, Transaction, TransactionKind, TransactionStatus
+from app.repositories import ChangeLogRepository, PeriodRepository, TransactionRepository
+from app.schemas import (
+    BalanceResponse,
+    ColumnarTransactionListResponse,
+    CompactTransactionListResponse,
+    CompactTransactionResponse,
+    PeriodBalancesEvent,
+    PeriodEventKind,
+    SyncTransactionResponse,
+    TransactionColumns,
+    TransactionEvent,
+    TransactionListReferences,
+    TransactionRequest,
+    TransactionResponse,
+    validate_partial,
+)
+from app.services.category import CategoryService
+from app.services.loaders import RequestLoaders
+
+# Response fields read from a related entity, by the Transaction attribute referencing it
+_RELATED_FIELD_ATTRIBUTES = {"payer_name": "payer_id", "category_name": "category_id", "period_name": "period_id"}
+
+# Transaction attributes balances are computed from
+_BALANCE_ATTRIBUTES = ("payer_id", "amount", "transaction_kind", "split_kind", "expense_shares")
 
 
 class TransactionService:
     """Service layer for transaction-related business logic and operations."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, loaders: RequestLoaders | None = None):
+        self._session = session
         self._transaction_repository = TransactionRepository(session)
-        self._user_repository = UserRepository(session)
+        self._period_repository = PeriodRepository(session)
+        self._change_log_repository = ChangeLogRepository(session)
+        self._category_service = CategoryService(session)
+        self._loaders = loaders or RequestLoaders(session)
 
     async def get_transaction_by_id(self, transaction_id: int) -> TransactionResponse | None:
         """Retrieve a specific transaction by its ID."""
         transaction = await self._transaction_repository.get_transaction_by_id(transaction_id)
-        return TransactionResponse.model_validate(transaction) if transaction else None
+        return await self._to_response(transaction) if transaction else None
 
-    async def get_transactions_by_period_id(self, period_id: int) -> Sequence[TransactionResponse]:
-        """Retrieve all transactions associated with a specific period."""
+    async def get_transaction_status_and_creator(
+        self, transaction_id: int
+    ) -> tuple[TransactionStatus, int | None] | None:
+        """Retrieve the status and creator ID of a specific transaction."""
+        return await self._transaction_repository.get_transaction_status_and_creator(transaction_id)
+
+    async def get_transactions_by_period_id(
+        self, period_id: int, fields: Collection[str] | None = None
+    ) -> Sequence[TransactionResponse]:
+        """Retrieve all transactions associated with a specific period.
+
+        Args:
+            period_id: ID of the period
+            fields: `TransactionResponse` fields to return, or None for all of them. Only
+                the columns, expense shares and related entities they need are loaded.
+
+        Returns:
+            Transaction response DTOs with the requested fields set
+        """
+        attributes = None if fields is None else {_RELATED_FIELD_ATTRIBUTES.get(f, f) for f in fields}
+        transactions = await self._transaction_repository.get_transactions_by_period_id(period_id, attributes)
+        return await self._to_responses(transactions, fields)
+
+    async def get_compact_transactions_by_period_id(self, period_id: int) -> CompactTransactionListResponse:
+        """Retrieve all transactions of a period as ID-only rows, naming each referenced entity once."""
+        transactions = await self._transaction_repository.get_transactions_by_period_id(period_id)
+        references = await self._get_list_references(period_id, transactions)
+        return CompactTransactionListResponse(
+            **dict(references), transactions=[self._to_compact_response(t) for t in transactions]
+        )
+
+    async def get_transaction_columns_by_period_id(self, period_id: int) -> ColumnarTransactionListResponse:
+        """Retrieve all transactions of a period as column arrays, naming each referenced entity once."""
         transactions = await self._transaction_repository.get_transactions_by_period_id(period_id)
-        return [TransactionResponse.model_validate(transaction) for transaction in transactions]
+        references = await self._get_list_references(period_id, transactions)
+        rows = [self._to_compact_response(t) for t in transactions]
+        # Rows are validated already; transposing them needs no second validation.
+        # Passing the fields set positionally keeps the column lists off that parameter
+        columns = TransactionColumns.model_construct(
+            None, **{name: [getattr(row, name) for row in rows] for name in TransactionColumns.model_fields}
+        )
+        return ColumnarTransactionListResponse(**dict(references), columns=columns)
+
+    async def get_sync_transactions(
+        self, ids: Collection[int], period_ids: Collection[int] = ()
+    ) -> Sequence[SyncTransactionResponse]:
+        """Retrieve the transactions with the given IDs, plus every transaction of `period_ids`, in compact form."""
+        transactions = await self._transaction_repository.get_transactions_by_ids(ids, period_ids)
+        # The compact fields are validated already; only the period is added
+        return [
+            SyncTransactionResponse.model_construct(**dict(self._to_compact_response(t)), period_id=t.period_id)
+            for t in transactions
+        ]
 
     async def create_transaction(self, period_id: int, request: TransactionRequest) -> TransactionResponse:
         """Create a new transaction.
@@ -57,6 +136,7 @@ class TransactionService:
             amount=request.amount,
             payer_id=request.payer_id,
         )
+        await self._validate_category(request.category_id)
 
         transaction = Transaction(
             description=request.description,
@@ -69,7 +149,17 @@ class TransactionService:
             expense_shares=expense_shares,
         )
         transaction = await self._transaction_repository.create_transaction(transaction)
-        return TransactionResponse.model_validate(transaction)
+        version = await self._period_repository.bump_version(period_id)
+        await self._change_log_repository.record_in_period(ChangeEntity.TRANSACTION, transaction.id, period_id)
+        response = await self._to_response(transaction)
+        self._publish_event(
+            PeriodEventKind.TRANSACTION_CREATED,
+            transaction,
+            version,
+            response,
+            self._balance_deltas({}, self._balance_contribution(transaction)),
+        )
+        return response
 
     async def update_transaction(self, transaction_id: int, request: TransactionRequest) -> TransactionResponse:
         """Update an existing transaction.
@@ -108,6 +198,8 @@ class TransactionService:
             payer_id=request.payer_id,
             transaction_id=transaction_id,
         )
+        await self._validate_category(request.category_id)
+        previous_contribution = self._balance_contribution(transaction)
 
         transaction.description = request.description
         transaction.amount = request.amount
@@ -119,7 +211,19 @@ class TransactionService:
         transaction.expense_shares = expense_shares
 
         updated_transaction = await self._transaction_repository.update_transaction(transaction)
-        return TransactionResponse.model_validate(updated_transaction)
+        version = await self._period_repository.bump_version(updated_transaction.period_id)
+        await self._change_log_repository.record_in_period(
+            ChangeEntity.TRANSACTION, transaction_id, updated_transaction.period_id
+        )
+        response = await self._to_response(updated_transaction)
+        self._publish_event(
+            PeriodEventKind.TRANSACTION_UPDATED,
+            updated_transaction,
+            version,
+            response,
+            self._balance_deltas(previous_contribution, self._balance_contribution(updated_transaction)),
+        )
+        return response
 
     async def update_transaction_status(self, transaction_id: int, status: TransactionStatus) -> TransactionResponse:
         """Update the status of a transaction."""
@@ -129,31 +233,73 @@ class TransactionService:
 
         transaction.status = status
         updated_transaction = await self._transaction_repository.update_transaction(transaction)
+        version = await self._period_repository.bump_version(updated_transaction.period_id)
+        await self._change_log_repository.record_in_period(
+            ChangeEntity.TRANSACTION, transaction_id, updated_transaction.period_id
+        )
 
-        return TransactionResponse.model_validate(updated_transaction)
+        # Balances count transactions of every status, so a status change leaves them as they are
+        response = await self._to_response(updated_transaction)
+        self._publish_event(PeriodEventKind.TRANSACTION_UPDATED, updated_transaction, version, response, {})
+        return response
 
     async def delete_transaction(self, transaction_id: int) -> None:
         """Delete a transaction by its ID."""
-        return await self._transaction_repository.delete_transaction(transaction_id)
+        # Loaded first: the balance deltas of the deletion event undo the transaction's contribution
+        transactions = await self._transaction_repository.get_transactions_by_ids([transaction_id])
+        if not transactions:
+            return
+        contribution = self._balance_contribution(transactions[0])
 
-    async def _calculate_shares_for_transaction(self, transaction_id: int) -> dict[int, int]:
-        """Calculate how much each user owes for a transaction.
+        period_id = await self._transaction_repository.delete_transaction(transaction_id)
+        if period_id is not None:
+            version = await self._period_repository.bump_version(period_id)
+            await self._change_log_repository.record_in_period(
+                ChangeEntity.TRANSACTION, transaction_id, period_id, deleted=True
+            )
+            self._publish_event(
+                PeriodEventKind.TRANSACTION_DELETED,
+                transactions[0],
+                version,
+                None,
+                self._balance_deltas(contribution, {}),
+            )
+
+    def _publish_event(
+        self,
+        kind: PeriodEventKind,
+        transaction: Transaction,
+        version: int | None,
+        response: TransactionResponse | None,
+        balance_deltas: dict[int, int],
+    ) -> None:
+        """Publish a transaction change to the period's live subscribers once the session commits."""
+        if version is None:
+            return
+        event = TransactionEvent(
+            kind=kind,
+            period_id=transaction.period_id,
+            version=version,
+            transaction_id=transaction.id,
+            transaction=response,
+            balance_deltas=balance_deltas,
+        )
+        publish_on_commit(self._session, period_channel(transaction.period_id), event)
+
+    def _calculate_shares(self, transaction: Transaction) -> dict[int, int]:
+        """Calculate how much each user owes for a transaction with its expense shares loaded.
 
         Args:
-            transaction_id: ID of the transaction to calculate shares for
+            transaction: Transaction to calculate shares for
 
         Returns:
             dict[int, int]: {user_id: amount_owed_in_cents}
 
         Raises:
-            NotFoundError: If transaction not found
             ValidationError: If transaction has invalid split configuration
             InternalServerError: If share calculation fails
         """
-        # Fetch from repository (need ORM for relationship access)
-        transaction = await self._transaction_repository.get_transaction_by_id(transaction_id)
-        if not transaction:
-            raise NotFoundError(_("Transaction %s not found") % transaction_id)
+        transaction_id = transaction.id
 
         # Edge case: no expense shares
         if transaction.transaction_kind != TransactionKind.EXPENSE or not transaction.expense_shares:
@@ -260,6 +406,26 @@ class TransactionService:
 
         return shares
 
+    async def calculate_shares_for_transaction(self, transaction_id: int) -> dict[int, int]:
+        """Calculate how much each user owes for a transaction.
+
+        Args:
+            transaction_id: ID of the transaction to calculate shares for
+
+        Returns:
+            dict[int, int]: {user_id: amount_owed_in_cents}
+
+        Raises:
+            NotFoundError: If transaction not found
+            ValidationError: If transaction has invalid split configuration
+            InternalServerError: If share calculation fails
+        """
+        # Fetch from repository (need ORM for relationship access)
+        transaction = await self._transaction_repository.get_transaction_by_id(transaction_id)
+        if not transaction:
+            raise NotFoundError(_("Transaction %s not found") % transaction_id)
+        return self._calculate_shares(transaction)
+
     async def get_all_balances(self, period_id: int) -> Sequence[BalanceResponse]:
         """Calculate balances for all users in a specific period.
 
@@ -271,37 +437,149 @@ class TransactionService:
         Raises:
             ValidationError: If transaction kind is invalid
         """
+        transactions = await self._transaction_repository.get_transactions_by_period_id(period_id, _BALANCE_ATTRIBUTES)
+        return await self._calculate_balances(transactions)
+
+    async def get_balances_event(self, period_id: int) -> PeriodBalancesEvent:
+        """Calculate the balances of a period along with the change version they reflect.
+
+        The version and the transactions come from one statement: read separately, a
+        change committed in between could be counted in the balances while its event
+        carries a newer version, and a client would apply it twice.
+
+        Raises:
+            NotFoundError: If period not found
+            ValidationError: If transaction kind is invalid
+        """
+        snapshot = await self._transaction_repository.get_period_version_and_transactions(
+            period_id, _BALANCE_ATTRIBUTES
+        )
+        if snapshot is None:
+            raise NotFoundError(_("Period %s not found") % period_id)
+        version, transactions = snapshot
+        balances = await self._calculate_balances(transactions)
+        return PeriodBalancesEvent(period_id=period_id, version=version, balances=list(balances))
+
+    async def _calculate_balances(self, transactions: Sequence[Transaction]) -> list[BalanceResponse]:
+        """Sum the balance contributions of transactions, with the email of each user."""
         balances: dict[int, int] = defaultdict(int)
-        transactions = await self.get_transactions_by_period_id(period_id)
         for transaction in transactions:
-            if transaction.transaction_kind == TransactionKind.EXPENSE:
-                # Credit the payer for paying the full amount
-                balances[transaction.payer_id] += transaction.amount
-
-                # Debit each participant for their share
-                shares = await self._calculate_shares_for_transaction(transaction.id)
-                for user_id, amount in shares.items():
-                    balances[user_id] -= amount
-            elif transaction.transaction_kind == TransactionKind.DEPOSIT:
-                balances[transaction.payer_id] += transaction.amount
-            elif transaction.transaction_kind == TransactionKind.REFUND:
-                balances[transaction.payer_id] -= transaction.amount
-            else:
-                raise ValidationError(
-                    _("Invalid transaction kind: %(transaction_kind)s")
-                    % {"transaction_kind": transaction.transaction_kind}
-                )
-        # Fetch user emails for all user IDs
-        user_emails: dict[int, str | None] = {}
-        for user_id in balances.keys():
-            user = await self._user_repository.get_user_by_id(user_id)
-            user_emails[user_id] = user.email if user else None
+            for user_id, amount in self._balance_contribution(transaction).items():
+                balances[user_id] += amount
+        # Fetch user emails for all user IDs in one batch
+        users = await self._loaders.users.load_many(balances)
 
         return [
-            BalanceResponse(user_id=user_id, user_email=user_emails.get(user_id), balance=balance)
-            for user_id, balance in balances.items()
+            BalanceResponse(user_id=user_id, user_email=user.email if user else None, balance=balance)
+            for (user_id, balance), user in zip(balances.items(), users, strict=True)
         ]
 
+    def _balance_contribution(self, transaction: Transaction) -> dict[int, int]:
+        """Calculate how a transaction with its expense shares loaded moves each user's balance.
+
+        Returns:
+            dict[int, int]: {user_id: amount_in_cents}, the payer first
+
+        Raises:
+            ValidationError: If transaction kind or split configuration is invalid
+        """
+        if transaction.transaction_kind == TransactionKind.EXPENSE:
+            # Credit the payer for paying the full amount, then debit each participant for their share
+            contribution = {transaction.payer_id: transaction.amount}
+            for user_id, amount in self._calculate_shares(transaction).items():
+                contribution[user_id] = contribution.get(user_id, 0) - amount
+            return contribution
+        if transaction.transaction_kind == TransactionKind.DEPOSIT:
+            return {transaction.payer_id: transaction.amount}
+        if transaction.transaction_kind == TransactionKind.REFUND:
+            return {transaction.payer_id: -transaction.amount}
+        raise ValidationError(
+            _("Invalid transaction kind: %(transaction_kind)s") % {"transaction_kind": transaction.transaction_kind}
+        )
+
+    @staticmethod
+    def _balance_deltas(before: dict[int, int], after: dict[int, int]) -> dict[int, int]:
+        """Difference between two balance contributions, without the users it leaves unchanged."""
+        deltas = {user_id: after.get(user_id, 0) - before.get(user_id, 0) for user_id in {**after, **before}}
+        return {user_id: delta for user_id, delta in deltas.items() if delta}
+
+    async def _to_response(self, transaction: Transaction) -> TransactionResponse:
+        return (await self._to_responses([transaction]))[0]
+
+    async def _to_responses(
+        self, transactions: Sequence[Transaction], fields: Collection[str] | None = None
+    ) -> list[TransactionResponse]:
+        """Build response DTOs, resolving payers, periods and categories in one batch each.
+
+        With `fields`, only those fields are set and only the related entities they name are resolved.
+        """
+        # Relationships loaded with the transaction need no query, and are memoized for the request
+        for transaction in transactions:
+            unloaded = inspect(transaction).unloaded
+            if "payer" not in unloaded:
+                self._loaders.users.prime(transaction.payer_id, transaction.payer)
+            if "period" not in unloaded:
+                self._loaders.periods.prime(transaction.period_id, transaction.period)
+
+        def related_ids(field: str) -> list[int]:
+            if fields is not None and field not in fields:
+                return []
+            return [getattr(transaction, _RELATED_FIELD_ATTRIBUTES[field]) for transaction in transactions]
+
+        payers, periods, _categories = await asyncio.gather(
+            self._loaders.users.load_many(related_ids("payer_name")),
+            self._loaders.periods.load_many(related_ids("period_name")),
+            self._loaders.categories.load_many(related_ids("category_name")),
+        )
+        # Unresolved relationships stay unset: their zip is empty
+        for transaction, payer in zip(transactions, payers, strict=False):
+            set_committed_value(transaction, "payer", payer)
+        for transaction, period in zip(transactions, periods, strict=False):
+            set_committed_value(transaction, "period", period)
+        return [validate_partial(TransactionResponse, transaction, fields) for transaction in transactions]
+
+    async def _get_list_references(
+        self, period_id: int, transactions: Sequence[Transaction]
+    ) -> TransactionListReferences:
+        """Resolve the period, users and categories referenced by a period's transactions, one batch each."""
+        share_user_ids: set[int] = {s.user_id for t in transactions for s in t.expense_shares}
+        user_ids = {t.payer_id for t in transactions} | share_user_ids
+        category_ids = {t.category_id for t in transactions}
+        period, users, categories = await asyncio.gather(
+            self._loaders.periods.load(period_id),
+            self._loaders.users.load_many(sorted(user_ids)),
+            self._loaders.categories.load_many(sorted(category_ids)),
+        )
+        return TransactionListReferences(
+            period_id=period_id,
+            period_name=period.name if period else None,
+            users={user.id: user.name for user in users if user is not None},
+            categories={category.id: category.name for category in categories if category is not None},
+        )
+
+    @staticmethod
+    def _to_compact_response(transaction: Transaction) -> CompactTransactionResponse:
+        return CompactTransactionResponse(
+            id=transaction.id,
+            description=transaction.description,
+            amount=transaction.amount,
+            payer_id=transaction.payer_id,
+            category_id=transaction.category_id,
+            transaction_kind=transaction.transaction_kind,
+            split_kind=transaction.split_kind,
+            status=transaction.status,
+            expense_shares=[(s.user_id, s.share_amount, s.share_percentage) for s in transaction.expense_shares],
+            created_at=transaction.created_at,
+            updated_at=transaction.updated_at,
+            created_by=transaction.created_by,
+            updated_by=transaction.updated_by,
+        )
+
+    async def _validate_category(self, category_id: int) -> None:
+        """Raise ValidationError if the category does not exist."""
+        if await self._category_service.get_category_by_id(category_id) is None:
+            raise ValidationError(_("Category %s not found") % category_id)
+
     def _validate_transaction(
         self,
         transaction_kind: TransactionKind,
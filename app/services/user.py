@@ -1,12 +1,13 @@
 from collections.abc import Sequence
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.i18n import _
 from app.core.security import check_password, hash_password
-from app.exceptions import BusinessRuleError, NotFoundError, UnauthorizedError
-from app.models import User
-from app.repositories import GroupRepository, UserRepository
+from app.exceptions import BusinessRuleError, ConflictError, NotFoundError, UnauthorizedError
+from app.models import ChangeEntity, User
+from app.repositories import ChangeLogRepository, GroupRepository, PeriodRepository, UserRepository
 from app.schemas import ProfileRequest, UserRequest, UserResponse
 
 
@@ -16,6 +17,8 @@ class UserService:
     def __init__(self, session: AsyncSession):
         self._user_repository = UserRepository(session)
         self._group_repository = GroupRepository(session)
+        self._period_repository = PeriodRepository(session)
+        self._change_log_repository = ChangeLogRepository(session)
 
     async def get_all_users(self) -> Sequence[UserResponse]:
         """Retrieve all users."""
@@ -41,6 +44,9 @@ class UserService:
 
         Returns:
             Created User response DTO
+
+        Raises:
+            ConflictError: If email already exists
         """
         user = User(
             email=request.email,
@@ -48,15 +54,32 @@ class UserService:
             password=request.password,  # Note: password should be hashed before calling this
             is_active=request.is_active,
         )
-        user = await self._user_repository.create_user(user)
+        try:
+            user = await self._user_repository.create_user(user)
+        except IntegrityError as e:
+            # The unique constraint on email is the source of truth; relying on it saves a lookup per insert
+            raise ConflictError("Email already registered") from e
         return UserResponse.model_validate(user)
 
     async def check_password(self, email: str, password: str) -> bool:
         """Check if a user's password is correct."""
+        return await self.verify_credentials(email, password) is not None
+
+    async def verify_credentials(self, email: str, password: str) -> UserResponse | None:
+        """
+        Verify a user's email and password with a single lookup.
+
+        Args:
+            email: User's email address
+            password: Plain text password
+
+        Returns:
+            User response DTO if the credentials are correct, None otherwise
+        """
         user = await self._user_repository.get_user_by_email(email)
-        if not user or user.password is None:
-            return False
-        return check_password(password, user.password)
+        if not user or user.password is None or not check_password(password, user.password):
+            return None
+        return UserResponse.model_validate(user)
 
     async def change_password(self, email: str, old_password: str, new_password: str) -> UserResponse:
         """
@@ -135,6 +158,12 @@ class UserService:
             user.avatar = request.avatar
 
         updated_user = await self._user_repository.update_user(user)
+        # Transaction lists, balances and settlement plans show user names and emails
+        if request.name is not None or request.email is not None:
+            await self._period_repository.bump_versions_for_user(user_id)
+        # Synced clients only hold the names of their fellow members
+        if request.name is not None:
+            await self._change_log_repository.record_in_user_groups(ChangeEntity.USER, user_id, user_id)
         return UserResponse.model_validate(updated_user)
 
     async def delete_user(self, user_id: int) -> None:
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON response serialization on a large period transaction list.
+
+A temporary SQLite database is filled by `scripts/synthetic_data.py` with one period
+of `--rows` transactions (5,000 by default). The DTOs of that period are then
+serialized with each strategy:
+- stdlib: `jsonable_encoder` + the standard `JSONResponse` (FastAPI without a response_model)
+- response-model: re-validation against `list[TransactionResponse]` + pydantic-core JSON
+  (FastAPI's default for routes declaring a response_model)
+- fast-path: `ModelResponse`, pydantic-core JSON without re-validation
+- orjson-dicts: `model_dump()` per DTO + `ORJSONResponse`
+
+and end to end through the ASGI app, with the same handler returning either the DTOs
+(response-model) or a `ModelResponse` (fast-path), plus the real
+`GET /api/v1/periods/{id}/transactions` endpoint with authentication and authorization,
+in each of its formats (full, compact and columns).
+
+Usage:
+    python benchmarks/bench_json_responses.py
+    python benchmarks/bench_json_responses.py --rows 20000 --repeats 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated, Any
+
+# Add project root to path BEFORE importing app modules
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+_DB_DIR = tempfile.TemporaryDirectory(prefix="divvy-bench-")
+os.environ.setdefault("DIVVY_JWT_SECRET_KEY", "benchmark-secret-key-that-is-long-enough")
+os.environ["DIVVY_DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(_DB_DIR.name) / 'bench.db'}"
+
+import httpx  # noqa: E402
+from fastapi import Depends  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.api.dependencies.services import get_transaction_service  # noqa: E402
+from app.api.responses import ModelResponse, ORJSONResponse, orjson  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.db import get_engine, get_session  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Base, GroupRoleBinding, User  # noqa: E402
+from app.schemas import TransactionResponse  # noqa: E402
+from app.services import TransactionService  # noqa: E402
+from scripts.synthetic_data import SyntheticDataSpec, generate_synthetic_data  # noqa: E402
+
+
+def _median_ms(durations: list[float]) -> float:
+    return statistics.median(durations) * 1000
+
+
+def _time(call: Callable[[], Any], repeats: int) -> list[float]:
+    durations: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+@app.get("/bench/response-model/{period_id}", response_model=list[TransactionResponse], include_in_schema=False)
+async def _bench_response_model(
+    period_id: int, service: Annotated[TransactionService, Depends(get_transaction_service)]
+) -> Any:
+    return await service.get_transactions_by_period_id(period_id)
+
+
+@app.get("/bench/fast-path/{period_id}", response_model=list[TransactionResponse], include_in_schema=False)
+async def _bench_fast_path(
+    period_id: int, service: Annotated[TransactionService, Depends(get_transaction_service)]
+) -> ModelResponse:
+    return ModelResponse(await service.get_transactions_by_period_id(period_id))
+
+
+async def _seed(rows: int, members: int) -> tuple[int, str]:
+    """Create the schema and one period of `rows` transactions; return its ID and a member's token."""
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    spec = SyntheticDataSpec(
+        users=members, groups=1, members_per_group=members, periods_per_group=1, transactions_per_period=rows
+    )
+    async with get_engine().connect() as conn:
+        summary = await generate_synthetic_data(conn, spec)
+    async with get_session() as session:
+        user = (
+            await session.scalars(select(User).join(GroupRoleBinding, GroupRoleBinding.user_id == User.id).limit(1))
+        ).one()
+    token, _ = create_access_token(data={"sub": str(user.id), "email": user.email})
+    return summary.period_ids.start, token
+
+
+async def main_async(rows: int, members: int, repeats: int) -> None:
+    """Seed the database, then time every serialization strategy and endpoint."""
+    start = time.perf_counter()
+    period_id, token = await _seed(rows, members)
+    print(f"Seeded {rows} transactions in {time.perf_counter() - start:.1f} s")
+
+    async with get_session() as session:
+        dtos = await TransactionService(session).get_transactions_by_period_id(period_id)
+    adapter = TypeAdapter(list[TransactionResponse])
+
+    strategies: dict[str, Callable[[], Any]] = {
+        "stdlib": lambda: JSONResponse(jsonable_encoder(dtos)),
+        "response-model": lambda: adapter.dump_json(adapter.validate_python(dtos)),
+        "fast-path": lambda: ModelResponse(dtos),
+    }
+    if orjson is not None:
+        strategies["orjson-dicts"] = lambda: ORJSONResponse([dto.model_dump() for dto in dtos])
+
+    size_kib = len(ModelResponse(dtos).body) / 1024
+    print(f"\nSerializing {len(dtos)} transactions ({size_kib:,.0f} KiB), median of {repeats}:")
+    for name, call in strategies.items():
+        print(f"  {name:<16} {_median_ms(_time(call, repeats)):10.2f} ms")
+
+    headers = {"Authorization": f"Bearer {token}"}
+    endpoints = {
+        "response-model": f"/bench/response-model/{period_id}",
+        "fast-path": f"/bench/fast-path/{period_id}",
+        "api-full": f"/api/v1/periods/{period_id}/transactions",
+        "api-compact": f"/api/v1/periods/{period_id}/transactions?format=compact",
+        "api-columns": f"/api/v1/periods/{period_id}/transactions?format=columns",
+    }
+    # Endpoints take turns so drift (caches, GC) affects them alike
+    durations: dict[str, list[float]] = {name: [] for name in endpoints}
+    sizes: dict[str, int] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        for _ in range(repeats):
+            for name, path in endpoints.items():
+                request_start = time.perf_counter()
+                response = await client.get(path)
+                durations[name].append(time.perf_counter() - request_start)
+                response.raise_for_status()
+                sizes[name] = len(response.content)
+    print(f"\nGET through the ASGI app, median of {repeats}:")
+    for name, endpoint_durations in durations.items():
+        print(f"  {name:<16} {_median_ms(endpoint_durations):10.2f} ms {sizes[name] / 1024:10,.0f} KiB")
+
+    await get_engine().dispose()
+
+
+def main() -> None:
+    """Main entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON response serialization")
+    parser.add_argument("--rows", type=int, default=5000, help="Transactions in the period (default: 5000)")
+    parser.add_argument("--members", type=int, default=20, help="Group members (default: 20)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per strategy (default: 5)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main_async(args.rows, args.members, args.repeats))
+    finally:
+        _DB_DIR.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark the split, balance and settlement engines on synthetic periods.
+
+For each scenario (transactions x members) a fresh in-memory SQLite database is
+filled by `scripts/synthetic_data.py` with one group and one closed period, then the services are
+timed end to end, each run in its own session:
+- shares: `TransactionService.calculate_shares_for_transaction` on a sample of transactions
+- balances: `TransactionService.get_all_balances`
+- settlement-plan: `SettlementService.get_settlement_plan`
+- apply-settlement-plan: `SettlementService.apply_settlement_plan` (the period is
+  reset to closed between runs)
+
+Results are written as JSON so runs can be compared with `--compare`.
+
+Usage:
+    python benchmarks/bench_settlement_engine.py
+    python benchmarks/bench_settlement_engine.py --scenarios 1000x20,10000x100 --repeats 5
+    python benchmarks/bench_settlement_engine.py --scenarios 100000x500 --repeats 1
+    python benchmarks/bench_settlement_engine.py --compare benchmarks/results/settlement_engine-<before>.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+# Add project root to path BEFORE importing app modules
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.models import Base, Period, PeriodStatus, Settlement, Transaction  # noqa: E402
+from app.services import ServiceContainer, SettlementService, TransactionService  # noqa: E402
+from scripts.synthetic_data import SyntheticDataSpec, generate_synthetic_data  # noqa: E402
+
+DEFAULT_SCENARIOS = "10x2,1000x20,10000x100"
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+
+
+def _parse_scenarios(value: str) -> list[tuple[int, int]]:
+    """Parse "1000x20,10000x100" into (transactions, members) pairs."""
+    scenarios: list[tuple[int, int]] = []
+    for item in value.split(","):
+        transactions, _, members = item.strip().partition("x")
+        scenarios.append((int(transactions), int(members)))
+    return scenarios
+
+
+def _summarize(durations: list[float]) -> dict[str, float | int]:
+    """Summary statistics of durations in seconds, reported in milliseconds."""
+    ms = sorted(d * 1000 for d in durations)
+    return {
+        "runs": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "min_ms": round(ms[0], 3),
+        "max_ms": round(ms[-1], 3),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+    }
+
+
+def _settlement_service(session: AsyncSession) -> SettlementService:
+    return ServiceContainer(session).settlement_service
+
+
+async def _time_runs(
+    session_factory: async_sessionmaker[AsyncSession],
+    runs: int,
+    call: Callable[[AsyncSession], Awaitable[Any]],
+    reset: Callable[[AsyncSession], Awaitable[None]] | None = None,
+) -> list[float]:
+    """Time `call` `runs` times, each in a fresh session."""
+    durations: list[float] = []
+    for _ in range(runs):
+        async with session_factory() as session:
+            start = time.perf_counter()
+            await call(session)
+            durations.append(time.perf_counter() - start)
+        if reset is not None:
+            async with session_factory() as session:
+                await reset(session)
+    return durations
+
+
+async def _reset_period(session: AsyncSession, period_id: int) -> None:
+    """Undo apply_settlement_plan so the period can be settled again."""
+    await session.execute(delete(Settlement).where(Settlement.period_id == period_id))
+    await session.execute(update(Period).where(Period.id == period_id).values(status=PeriodStatus.CLOSED))
+    await session.commit()
+
+
+async def _run_scenario(transactions: int, members: int, repeats: int, share_samples: int, seed: int) -> dict[str, Any]:
+    engine: AsyncEngine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    try:
+        start = time.perf_counter()
+        spec = SyntheticDataSpec(
+            users=members,
+            groups=1,
+            members_per_group=members,
+            periods_per_group=1,
+            transactions_per_period=transactions,
+            leave_last_period_open=False,
+            seed=seed,
+        )
+        async with engine.connect() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            summary = await generate_synthetic_data(conn, spec)
+            period_id = summary.period_ids.start
+            transaction_ids = list(
+                (await conn.execute(select(Transaction.id).where(Transaction.period_id == period_id))).scalars()
+            )
+        seed_seconds = time.perf_counter() - start
+
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        sample = random.Random(seed).sample(transaction_ids, min(share_samples, transactions))
+
+        share_durations: list[float] = []
+        async with session_factory() as session:
+            service = TransactionService(session)
+            for transaction_id in sample:
+                call_start = time.perf_counter()
+                await service.calculate_shares_for_transaction(transaction_id)
+                share_durations.append(time.perf_counter() - call_start)
+
+        results = {
+            "shares": _summarize(share_durations),
+            "balances": _summarize(
+                await _time_runs(session_factory, repeats, lambda s: TransactionService(s).get_all_balances(period_id))
+            ),
+            "settlement-plan": _summarize(
+                await _time_runs(
+                    session_factory, repeats, lambda s: _settlement_service(s).get_settlement_plan(period_id)
+                )
+            ),
+            "apply-settlement-plan": _summarize(
+                await _time_runs(
+                    session_factory,
+                    repeats,
+                    lambda s: _settlement_service(s).apply_settlement_plan(period_id, s),
+                    reset=lambda s: _reset_period(s, period_id),
+                )
+            ),
+        }
+    finally:
+        await engine.dispose()
+
+    return {
+        "transactions": transactions,
+        "members": members,
+        "seed_seconds": round(seed_seconds, 3),
+        "results": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _print_scenario(scenario: dict[str, Any], baseline: dict[tuple[int, int], dict[str, Any]]) -> None:
+    key = (scenario["transactions"], scenario["members"])
+    print(f"\n{key[0]} transactions x {key[1]} members (seeded in {scenario['seed_seconds']:.2f} s)")
+    for operation, stats in scenario["results"].items():
+        line = f"  {operation:<22} median {stats['median_ms']:10.3f} ms  p95 {stats['p95_ms']:10.3f} ms"
+        before = baseline.get(key, {}).get(operation)
+        if before:
+            line += f"  ({stats['median_ms'] / before['median_ms']:.2f}x baseline)"
+        print(line)
+
+
+async def main_async(
+    scenarios: list[tuple[int, int]],
+    repeats: int,
+    share_samples: int,
+    seed: int,
+    output: Path,
+    compare: Path | None,
+) -> None:
+    """Run every scenario, print a summary and write the JSON results."""
+    baseline: dict[tuple[int, int], dict[str, Any]] = {}
+    if compare is not None:
+        for scenario in json.loads(compare.read_text())["scenarios"]:
+            baseline[(scenario["transactions"], scenario["members"])] = scenario["results"]
+
+    report: dict[str, Any] = {
+        "benchmark": "settlement_engine",
+        "created_at": datetime.now(UTC).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "options": {"repeats": repeats, "share_samples": share_samples, "seed": seed},
+        "scenarios": [],
+    }
+    for transactions, members in scenarios:
+        scenario = await _run_scenario(transactions, members, repeats, share_samples, seed)
+        report["scenarios"].append(scenario)
+        _print_scenario(scenario, baseline)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\n✓ Results written to {output}")
+
+
+def main() -> None:
+    """Main entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the split, balance and settlement engines")
+    parser.add_argument(
+        "--scenarios",
+        type=_parse_scenarios,
+        default=_parse_scenarios(DEFAULT_SCENARIOS),
+        help=f"Comma-separated TRANSACTIONSxMEMBERS pairs (default: {DEFAULT_SCENARIOS})",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per operation (default: 3)")
+    parser.add_argument(
+        "--share-samples", type=int, default=200, help="Transactions timed for share calculation (default: 200)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic data (default: 0)")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=RESULTS_DIR / f"settlement_engine-{datetime.now(UTC):%Y%m%dT%H%M%S}.json",
+        help="Where to write the JSON results (default: benchmarks/results/settlement_engine-<timestamp>.json)",
+    )
+    parser.add_argument("--compare", type=Path, help="Earlier JSON results to compare medians against")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args.scenarios, args.repeats, args.share_samples, args.seed, args.output, args.compare))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark access token validation strategies.
+
+Compares, for the same bearer token presented repeatedly:
+- threadpool: full `jose.jwt.decode` on every request, dispatched to the threadpool
+  (the previous behaviour of the `get_claims_payload` dependency)
+- inline-cached: the current dependency, serving verified claims from the in-process
+  cache on the event loop and only falling back to the threadpool on a miss
+
+Usage:
+    python benchmarks/bench_token_validation.py
+    python benchmarks/bench_token_validation.py --requests 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+# Add project root to path BEFORE importing app modules
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("DIVVY_JWT_SECRET_KEY", "benchmark-secret-key-that-is-long-enough")
+
+from fastapi.concurrency import run_in_threadpool  # noqa: E402
+
+from app.api.dependencies.authn import get_claims_payload  # noqa: E402
+from app.core.security import clear_token_caches, create_access_token, validate_access_token  # noqa: E402
+
+
+async def _threadpool_decode(token: str) -> dict[str, Any]:
+    # Non-default options bypass the cache, reproducing an uncached decode per request
+    return await run_in_threadpool(validate_access_token, token, {"leeway": 5})
+
+
+async def _run(
+    name: str, call: Callable[[str], Awaitable[dict[str, Any]]], token: str, requests: int, concurrency: int
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one() -> None:
+        async with semaphore:
+            await call(token)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"  {name:<15} {elapsed * 1000:10.1f} ms total  {elapsed / requests * 1e6:8.1f} µs/req  "
+        f"{requests / elapsed:12.0f} req/s"
+    )
+
+
+async def main_async(requests: int, concurrency: int) -> None:
+    """Run both strategies against the same token."""
+    clear_token_caches()
+    token, _ = create_access_token(data={"sub": "1", "email": "bench@example.com"})
+    inline_cached = get_claims_payload()
+
+    print(f"Validating one token {requests} times with concurrency {concurrency}:")
+    await _run("threadpool", _threadpool_decode, token, requests, concurrency)
+    await _run("inline-cached", inline_cached, token, requests, concurrency)
+
+
+def main() -> None:
+    """Main entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark access token validation strategies")
+    parser.add_argument("--requests", type=int, default=10000, help="Number of validations (default: 10000)")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent validations (default: 50)")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Load test the HTTP API end to end with simulated users.
+
+Each virtual user registers an account and a group, invites members and opens a
+period, then loops over weighted scenarios until the run ends:
+- login: password grant followed by a refresh token grant
+- browse: list groups, fetch the current period, its transactions and balances
+- add_expense: create an equal-split expense, submit it and approve it
+- settle: close the period, fetch and apply its settlement plan, open a new period
+
+Requests go through the full ASGI stack (middleware, dependencies, database), either
+in-process (`target: asgi`), against a uvicorn server started for the run
+(`target: uvicorn`) or against any running instance (an http(s) URL). Latency
+percentiles, throughput and error rates are reported per route template. Profiles
+are YAML files, see `benchmarks/profiles/`; command-line options override them.
+
+Usage:
+    python benchmarks/load_http.py
+    python benchmarks/load_http.py --profile benchmarks/profiles/smoke.yaml
+    python benchmarks/load_http.py --target uvicorn --virtual-users 50 --duration 120
+    DIVVY_DATABASE_URL=sqlite+aiosqlite:///./load.db python benchmarks/load_http.py --create-schema
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import secrets
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Self, cast
+
+import httpx
+import yaml
+
+# Add project root to path BEFORE importing app modules
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.config import load_env_files  # noqa: E402
+
+DEFAULT_PROFILE = PROJECT_ROOT / "benchmarks" / "profiles" / "default.yaml"
+PASSWORD = "load-test-password"
+
+
+@dataclass
+class LoadProfile:
+    """Load test settings, read from a YAML profile."""
+
+    target: str = "asgi"
+    duration: float = 60.0
+    virtual_users: int = 20
+    members_per_group: int = 3
+    think_time: float = 0.1
+    seed: int = 0
+    scenarios: dict[str, float] = field(
+        default_factory=lambda: {"browse": 6, "add_expense": 3, "login": 1, "settle": 0.5}
+    )
+
+    @classmethod
+    def from_yaml(cls, path: Path) -> Self:
+        data: object = yaml.safe_load(path.read_text()) or {}
+        if not isinstance(data, dict):
+            raise ValueError(f"Profile {path} must be a mapping of settings")
+        settings = cast(dict[str, Any], data)
+        unknown = set(settings) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown profile keys in {path}: {', '.join(sorted(unknown))}")
+        profile = cls(**settings)
+        unknown = set(profile.scenarios) - set(SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unknown scenarios in {path}: {', '.join(sorted(unknown))}")
+        return profile
+
+
+class ScenarioError(Exception):
+    """A request failed, so the rest of the scenario cannot run."""
+
+
+class LoadStats:
+    """Latencies and outcomes per route template."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, Counter[str]] = defaultdict(Counter)
+        self.scenarios: Counter[str] = Counter()
+        self.aborted: Counter[str] = Counter()
+
+    def record(self, route: str, duration: float, error: str | None) -> None:
+        self.durations[route].append(duration)
+        if error is not None:
+            self.errors[route][error] += 1
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        routes: dict[str, dict[str, Any]] = {}
+        for route, durations in sorted(self.durations.items()):
+            ms = [d * 1000 for d in durations]
+            quantiles = statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else ms * 99
+            errors = sum(self.errors[route].values())
+            routes[route] = {
+                "requests": len(ms),
+                "errors": errors,
+                "error_rate": round(errors / len(ms), 4),
+                "throughput_rps": round(len(ms) / elapsed, 2),
+                "p50_ms": round(quantiles[49], 2),
+                "p95_ms": round(quantiles[94], 2),
+                "p99_ms": round(quantiles[98], 2),
+                "max_ms": round(max(ms), 2),
+                "error_kinds": dict(self.errors[route]),
+            }
+        requests = sum(r["requests"] for r in routes.values())
+        errors = sum(r["errors"] for r in routes.values())
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+            "scenarios": dict(self.scenarios),
+            "aborted_scenarios": dict(self.aborted),
+            "routes": routes,
+        }
+
+
+class VirtualUser:
+    """One simulated user owning a group, driving the API over HTTP."""
+
+    def __init__(self, client: httpx.AsyncClient, stats: LoadStats, name: str, rng: random.Random) -> None:
+        self.client = client
+        self.stats = stats
+        self.name = name
+        self.rng = rng
+        self.email = f"{name}@load.example.com"
+        self.access_token = ""
+        self.refresh_token = ""
+        self.user_id = 0
+        self.member_ids: list[int] = []
+        self.category_id = 0
+        self.group_id = 0
+        self.period_id = 0
+
+    async def request(self, route: str, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send one request, record it under `route` and abort the scenario if it fails."""
+        if self.access_token:
+            kwargs.setdefault("headers", {})["Authorization"] = f"Bearer {self.access_token}"
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            self.stats.record(route, time.perf_counter() - start, type(e).__name__)
+            raise ScenarioError(route) from e
+        error = None if response.is_success else str(response.status_code)
+        self.stats.record(route, time.perf_counter() - start, error)
+        if error is not None:
+            raise ScenarioError(route)
+        return response
+
+    def _store_tokens(self, response: httpx.Response) -> None:
+        tokens = response.json()
+        self.access_token = tokens["access_token"]
+        self.refresh_token = tokens["refresh_token"]
+
+    async def _register(self, email: str, name: str) -> int:
+        """Register an account, keep its tokens and return its user id."""
+        self.access_token = ""
+        response = await self.request(
+            "POST /auth/register",
+            "POST",
+            "/api/v1/auth/register",
+            json={"email": email, "name": name, "password": PASSWORD},
+        )
+        self._store_tokens(response)
+        response = await self.request("GET /user/me", "GET", "/api/v1/user/me")
+        return response.json()["id"]
+
+    async def setup(self, members_per_group: int) -> None:
+        """Register the members and the owner, then create the owner's group and first period."""
+        for i in range(1, members_per_group):
+            self.member_ids.append(await self._register(f"{self.name}-member{i}@load.example.com", f"Member {i}"))
+        self.user_id = await self._register(self.email, self.name)
+
+        response = await self.request("GET /categories", "GET", "/api/v1/categories/")
+        categories = response.json()
+        if not categories:
+            raise RuntimeError("No categories found, run with --create-schema or seed the database")
+        self.category_id = categories[0]["id"]
+
+        response = await self.request("POST /groups", "POST", "/api/v1/groups/", json={"name": f"{self.name} group"})
+        self.group_id = response.json()["id"]
+        for member_id in self.member_ids:
+            await self.request(
+                "PUT /groups/{group_id}/users/{user_id}/{role}",
+                "PUT",
+                f"/api/v1/groups/{self.group_id}/users/{member_id}/group:member",
+            )
+        await self._open_period()
+
+    async def _open_period(self) -> None:
+        response = await self.request(
+            "POST /groups/{group_id}/periods",
+            "POST",
+            f"/api/v1/groups/{self.group_id}/periods",
+            json={"name": f"Period {secrets.token_hex(3)}"},
+        )
+        self.period_id = response.json()["id"]
+
+    async def login(self) -> None:
+        response = await self.request(
+            "POST /auth/token (password)",
+            "POST",
+            "/api/v1/auth/token",
+            data={"grant_type": "password", "username": self.email, "password": PASSWORD},
+        )
+        self._store_tokens(response)
+        response = await self.request(
+            "POST /auth/token (refresh)",
+            "POST",
+            "/api/v1/auth/token",
+            data={"grant_type": "refresh_token", "refresh_token": self.refresh_token},
+        )
+        self._store_tokens(response)
+
+    async def browse(self) -> None:
+        await self.request("GET /groups", "GET", "/api/v1/groups/")
+        await self.request(
+            "GET /groups/{group_id}/periods/current", "GET", f"/api/v1/groups/{self.group_id}/periods/current"
+        )
+        await self.request(
+            "GET /periods/{period_id}/transactions", "GET", f"/api/v1/periods/{self.period_id}/transactions"
+        )
+        await self.request("GET /periods/{period_id}/balances", "GET", f"/api/v1/periods/{self.period_id}/balances")
+
+    async def add_expense(self) -> None:
+        participants = [self.user_id, *self.member_ids]
+        response = await self.request(
+            "POST /periods/{period_id}/transactions",
+            "POST",
+            f"/api/v1/periods/{self.period_id}/transactions",
+            json={
+                "description": "Load test expense",
+                "amount": self.rng.randint(1, 500) * 100,
+                "payer_id": self.rng.choice(participants),
+                "category_id": self.category_id,
+                "transaction_kind": "expense",
+                "split_kind": "equal",
+                "expense_shares": [{"user_id": user_id, "transaction_id": 0} for user_id in participants],
+            },
+        )
+        transaction_id = response.json()["id"]
+        await self.request(
+            "PUT /transactions/{transaction_id}/submit", "PUT", f"/api/v1/transactions/{transaction_id}/submit"
+        )
+        await self.request(
+            "PUT /transactions/{transaction_id}/approve", "PUT", f"/api/v1/transactions/{transaction_id}/approve"
+        )
+
+    async def settle(self) -> None:
+        await self.request("PUT /periods/{period_id}/close", "PUT", f"/api/v1/periods/{self.period_id}/close")
+        await self.request(
+            "GET /periods/{period_id}/get-settlement-plan",
+            "GET",
+            f"/api/v1/periods/{self.period_id}/get-settlement-plan",
+        )
+        await self.request(
+            "POST /periods/{period_id}/apply-settlement-plan",
+            "POST",
+            f"/api/v1/periods/{self.period_id}/apply-settlement-plan",
+        )
+        await self._open_period()
+
+
+SCENARIOS = {
+    "login": VirtualUser.login,
+    "browse": VirtualUser.browse,
+    "add_expense": VirtualUser.add_expense,
+    "settle": VirtualUser.settle,
+}
+
+
+async def _run_virtual_user(user: VirtualUser, profile: LoadProfile, deadline: float) -> None:
+    names = list(profile.scenarios)
+    weights = [profile.scenarios[name] for name in names]
+    while time.perf_counter() < deadline:
+        name = user.rng.choices(names, weights)[0]
+        try:
+            await SCENARIOS[name](user)
+        except ScenarioError:
+            user.stats.aborted[name] += 1
+        else:
+            user.stats.scenarios[name] += 1
+        if profile.think_time:
+            await asyncio.sleep(profile.think_time)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def _client(target: str):
+    """Yield an HTTP client for the target, starting a local uvicorn server if asked to."""
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(60.0)
+    if target == "asgi":
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load", timeout=timeout) as client:
+            yield client
+        return
+
+    server: subprocess.Popen[bytes] | None = None
+    base_url = target
+    if target == "uvicorn":
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=PROJECT_ROOT,
+            env=os.environ.copy(),
+        )
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+            if server is not None:
+                await _wait_until_healthy(client, server)
+            yield client
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+async def _wait_until_healthy(
+    client: httpx.AsyncClient, server: subprocess.Popen[bytes], timeout: float = 30.0
+) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+        try:
+            if (await client.get("/health")).is_success:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"uvicorn did not become healthy within {timeout:.0f} s")
+
+
+async def _create_schema() -> None:
+    """Create missing tables and the default categories (scratch databases)."""
+    from app.db import get_engine, get_session
+    from app.models import Base
+    from scripts.seed_sample_data import get_or_create_categories
+
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with get_session() as session:
+        await get_or_create_categories(session)
+        await session.commit()
+    print("✓ Schema created")
+
+
+def _print_summary(summary: dict[str, Any]) -> None:
+    print(
+        f"✓ {summary['requests']} requests in {summary['elapsed_seconds']:.2f} s: "
+        f"{summary['throughput_rps']:.1f} req/s, error rate {summary['error_rate']:.2%}"
+    )
+    print(f"  {'route':<50} {'reqs':>6} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  (ms)")
+    for route, stats in summary["routes"].items():
+        print(
+            f"  {route:<50} {stats['requests']:>6} {stats['error_rate']:>6.1%} {stats['p50_ms']:>8.1f} "
+            f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>8.1f}"
+        )
+    for name in sorted(summary["scenarios"].keys() | summary["aborted_scenarios"].keys()):
+        completed = summary["scenarios"].get(name, 0)
+        aborted = summary["aborted_scenarios"].get(name, 0)
+        print(f"  scenario {name:<15} {completed} completed, {aborted} aborted")
+
+
+async def run_load(profile: LoadProfile, create_schema: bool, output: Path | None) -> dict[str, Any]:
+    """
+    Set up the virtual users, run the profile's scenarios until its duration ends and report.
+
+    Args:
+        profile: Load profile to run
+        create_schema: Create missing tables and default categories before the run
+        output: Optional path to write the JSON summary to
+
+    Returns:
+        The summary, per route and overall
+    """
+    if create_schema:
+        await _create_schema()
+
+    run_id = secrets.token_hex(4)
+    setup_stats = LoadStats()
+    stats = LoadStats()
+    async with _client(profile.target) as client:
+        users = [
+            VirtualUser(client, setup_stats, f"load-{run_id}-{i}", random.Random(f"{profile.seed}-{i}"))
+            for i in range(profile.virtual_users)
+        ]
+        print(f"Setting up {len(users)} virtual users against {profile.target}...")
+        await asyncio.gather(*(user.setup(profile.members_per_group) for user in users))
+        print(f"✓ Setup done ({sum(len(d) for d in setup_stats.durations.values())} requests)")
+
+        for user in users:
+            user.stats = stats
+        print(f"Running {profile.duration:.0f} s of load...")
+        start = time.perf_counter()
+        deadline = start + profile.duration
+        await asyncio.gather(*(_run_virtual_user(user, profile, deadline) for user in users))
+        elapsed = time.perf_counter() - start
+
+    summary = stats.summary(elapsed)
+    _print_summary(summary)
+    if output is not None:
+        report = {"benchmark": "load_http", "created_at": datetime.now(UTC).isoformat(), "profile": asdict(profile)}
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report | summary, indent=2) + "\n")
+        print(f"✓ Results written to {output}")
+    return summary
+
+
+def main() -> None:
+    """Main entry point for the load test."""
+    parser = argparse.ArgumentParser(description="Load test the HTTP API with simulated users")
+    parser.add_argument(
+        "--profile", type=Path, default=DEFAULT_PROFILE, help="YAML load profile (default: profiles/default.yaml)"
+    )
+    parser.add_argument("--target", help="asgi, uvicorn or a base URL (overrides the profile)")
+    parser.add_argument("--duration", type=float, help="Seconds of load (overrides the profile)")
+    parser.add_argument("--virtual-users", type=int, help="Concurrent simulated users (overrides the profile)")
+    parser.add_argument("--create-schema", action="store_true", help="Create missing tables and default categories")
+    parser.add_argument("--output", type=Path, help="Write the JSON summary to this file")
+    args = parser.parse_args()
+
+    profile = LoadProfile.from_yaml(args.profile)
+    for option in ("target", "duration", "virtual_users"):
+        if getattr(args, option) is not None:
+            setattr(profile, option, getattr(args, option))
+
+    load_env_files()
+    asyncio.run(run_load(profile, args.create_schema, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Load test the OAuth callback flow against the fake identity provider.
+
+Each simulated callback runs `IdentityProviderService.handle_oauth_callback` in its own
+database session, exactly as the API route does: token exchange and userinfo calls go to
+the in-process fake provider (with the configured latency), then the user and identity
+are created or looked up and our own token pair is issued.
+
+A share of callbacks reuses codes seen earlier in the run (`--returning-ratio`) to mix
+returning-user logins with sign-ups. Codes are prefixed with a per-run token so
+repeated runs against the same database still sign up new users.
+
+Usage:
+    python benchmarks/load_oauth_callback.py
+    python benchmarks/load_oauth_callback.py --requests 2000 --concurrency 50 --latency 0.05
+    DIVVY_DATABASE_URL=sqlite+aiosqlite:///./load.db python benchmarks/load_oauth_callback.py --create-schema
+"""
+
+import argparse
+import asyncio
+import random
+import secrets
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path BEFORE importing app modules
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.config import load_env_files  # noqa: E402
+from app.core.identity_providers import FakeIdentityProvider, IdentityProviderRegistry  # noqa: E402
+from app.db import get_engine, get_session  # noqa: E402
+from app.models import Base, IdentityProviderName  # noqa: E402
+from app.services import (  # noqa: E402
+    AccountLinkRequestService,
+    AuthenticationService,
+    IdentityProviderService,
+    UserIdentityService,
+    UserService,
+)
+
+
+async def _oauth_callback(provider_name: IdentityProviderName, code: str) -> str:
+    """Run one OAuth callback in its own session and return the response type name."""
+    async with get_session() as session:
+        user_service = UserService(session)
+        service = IdentityProviderService(
+            session=session,
+            user_service=user_service,
+            user_identity_service=UserIdentityService(session, user_service),
+            account_link_request_service=AccountLinkRequestService(session, user_service),
+            authentication_service=AuthenticationService(session=session, user_service=user_service),
+        )
+        result = await service.handle_oauth_callback(provider_name=provider_name, code=code)
+    return type(result).__name__
+
+
+async def run_load(
+    requests: int,
+    concurrency: int,
+    latency: float,
+    jitter: float,
+    returning_ratio: float,
+    create_schema: bool,
+) -> None:
+    """
+    Fire OAuth callbacks concurrently and report latency percentiles and throughput.
+
+    Args:
+        requests: Total number of callbacks
+        concurrency: Maximum callbacks in flight
+        latency: Fake provider latency per HTTP call, in seconds
+        jitter: Maximum extra random latency per HTTP call, in seconds
+        returning_ratio: Share of callbacks reusing an already signed-up code
+        create_schema: Create missing tables before the run (scratch databases)
+    """
+    if create_schema:
+        async with get_engine().begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        print("✓ Schema created")
+
+    provider_name = IdentityProviderName.GOOGLE
+    provider = FakeIdentityProvider(name=provider_name, latency=latency, jitter=jitter)
+    IdentityProviderRegistry.clear()
+    IdentityProviderRegistry.register(provider)
+
+    run_id = secrets.token_hex(4)
+    signed_up: list[str] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    durations: list[float] = []
+    outcomes: Counter[str] = Counter()
+
+    async def _one(i: int) -> None:
+        returning = signed_up and random.random() < returning_ratio
+        code = random.choice(signed_up) if returning else f"{run_id}-{i}"
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                outcome = await _oauth_callback(provider_name, code)
+            except Exception as e:
+                outcome = type(e).__name__
+            durations.append(time.perf_counter() - start)
+        outcomes[outcome] += 1
+        if outcome == "TokenResponse" and code not in signed_up:
+            signed_up.append(code)
+
+    print(
+        f"Running {requests} OAuth callbacks with concurrency {concurrency} (provider latency {latency * 1000:.0f} ms):"
+    )
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(_one(i) for i in range(requests)))
+    finally:
+        elapsed = time.perf_counter() - start
+        await IdentityProviderRegistry.aclose()
+        IdentityProviderRegistry.clear()
+
+    quantiles = statistics.quantiles(durations, n=100) if len(durations) > 1 else durations * 99
+    print(f"✓ {requests / elapsed:.1f} callbacks/s over {elapsed:.2f} s")
+    print(
+        f"  latency p50 {quantiles[49] * 1000:.1f} ms  p95 {quantiles[94] * 1000:.1f} ms  "
+        f"p99 {quantiles[98] * 1000:.1f} ms  max {max(durations) * 1000:.1f} ms"
+    )
+    for outcome, count in outcomes.most_common():
+        print(f"  {outcome:<25} {count}")
+
+
+def main() -> None:
+    """Main entry point for the load test."""
+    parser = argparse.ArgumentParser(description="Load test the OAuth callback flow with a fake identity provider")
+    parser.add_argument("--requests", type=int, default=500, help="Number of callbacks (default: 500)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent callbacks (default: 20)")
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Fake provider latency per call in seconds (default: 0.02)"
+    )
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in seconds (default: 0)")
+    parser.add_argument(
+        "--returning-ratio",
+        type=float,
+        default=0.5,
+        help="Share of callbacks by already signed-up users (default: 0.5)",
+    )
+    parser.add_argument("--create-schema", action="store_true", help="Create missing tables before the run")
+    args = parser.parse_args()
+
+    load_env_files()
+    asyncio.run(
+        run_load(
+            requests=args.requests,
+            concurrency=args.concurrency,
+            latency=args.latency,
+            jitter=args.jitter,
+            returning_ratio=args.returning_ratio,
+            create_schema=args.create_schema,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
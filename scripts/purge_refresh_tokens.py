@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Script to purge expired and revoked refresh tokens.
+
+Tokens are deleted in bounded batches, each in its own short transaction, so the
+job can run against a live database (e.g. from cron) without holding long locks.
+
+Usage:
+    python scripts/purge_refresh_tokens.py
+    python scripts/purge_refresh_tokens.py --batch-size 5000 --pause 0.1
+    python scripts/purge_refresh_tokens.py --max-batches 10
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add project root to path BEFORE importing app modules
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.config import load_env_files  # noqa: E402
+from app.db.session import get_session  # noqa: E402
+from app.repositories import RefreshTokenRepository  # noqa: E402
+
+
+async def purge_refresh_tokens(batch_size: int, max_batches: int | None = None, pause: float = 0.0) -> int:
+    """
+    Delete expired and revoked refresh tokens in batches.
+
+    Args:
+        batch_size: Maximum number of tokens deleted per transaction
+        max_batches: Stop after this many batches (None: until nothing is left)
+        pause: Seconds to sleep between batches to limit load on the database
+
+    Returns:
+        Total number of deleted tokens
+    """
+    # A fixed cutoff keeps the job finite even while new tokens keep expiring
+    now = datetime.now(UTC)
+    total = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        async with get_session() as session:
+            deleted = await RefreshTokenRepository(session).delete_expired_or_revoked(now, batch_size)
+
+        total += deleted
+        batches += 1
+        print(f"✓ Batch {batches}: deleted {deleted} token(s)")
+
+        if deleted < batch_size:
+            break
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    return total
+
+
+def main() -> None:
+    """Main entry point for the script."""
+    # Load environment variables first (for database connection, etc.)
+    load_env_files()
+
+    parser = argparse.ArgumentParser(
+        description="Purge expired and revoked refresh tokens",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/purge_refresh_tokens.py
+  python scripts/purge_refresh_tokens.py --batch-size 5000 --pause 0.1
+        """,
+    )
+
+    parser.add_argument("--batch-size", type=int, default=1000, help="Tokens deleted per transaction (default: 1000)")
+    parser.add_argument(
+        "--max-batches", type=int, default=None, help="Stop after this many batches (default: no limit)"
+    )
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches (default: 0)")
+
+    args = parser.parse_args()
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be positive")
+
+    try:
+        total = asyncio.run(
+            purge_refresh_tokens(batch_size=args.batch_size, max_batches=args.max_batches, pause=args.pause)
+        )
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    print(f"\n✓ Purged {total} refresh token(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,14 +19,20 @@ Sample Data:
         - "December 2023" (closed, Apartment Roommates)
         - "Summer Trip 2024" (open, Weekend Trip Group)
 
+Synthetic Data:
+    With --synthetic, a generated dataset of any size is bulk-inserted instead
+    (see scripts/synthetic_data.py). Every generated user has password "password123".
+
 Usage:
     python scripts/seed_sample_data.py
     python scripts/seed_sample_data.py --clear  # Clear existing data first
+    python scripts/seed_sample_data.py --synthetic --users 100000 --groups 20000 --transactions-per-period 200
 """
 
 import argparse
 import asyncio
 import sys
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -40,6 +46,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from app.config import load_env_files  # noqa: E402
 from app.core.security.password import hash_password  # noqa: E402
+from app.db import get_engine  # noqa: E402
 from app.db.session import get_session  # noqa: E402
 from app.models import (  # noqa: E402
     Category,
@@ -56,6 +63,13 @@ from app.models import (  # noqa: E402
     TransactionStatus,
     User,
 )
+from scripts.synthetic_data import (  # noqa: E402
+    DEFAULT_SPLIT_MIX,
+    SYNTHETIC_PASSWORD,
+    SyntheticDataSpec,
+    generate_synthetic_data,
+    parse_split_mix,
+)
 
 
 async def clear_existing_data(session: AsyncSession) -> None:
@@ -516,6 +530,44 @@ async def seed_sample_data(clear_first: bool = False) -> None:
         print("  Email: diana@example.com, Password: password123")
 
 
+async def seed_synthetic_data(spec: SyntheticDataSpec, batch_rows: int, clear_first: bool = False) -> None:
+    """Seed the database with a generated dataset of the given shape."""
+    if clear_first:
+        async with get_session() as session:
+            await clear_existing_data(session)
+
+    print("=" * 60)
+    print("Seeding synthetic data")
+    print("=" * 60)
+    expected_transactions = spec.groups * spec.periods_per_group * spec.transactions_per_period
+    print(f"  Users: {spec.users}, groups: {spec.groups} x {spec.members_per_group} members")
+    print(f"  Periods: {spec.groups * spec.periods_per_group}, transactions: {expected_transactions}")
+
+    start = time.perf_counter()
+    batches = 0
+
+    def _report_progress() -> None:
+        nonlocal batches
+        batches += 1
+        if batches % 100 == 0:
+            print(f"  ... {batches} batches in {time.perf_counter() - start:.1f} s")
+
+    async with get_engine().connect() as conn:
+        summary = await generate_synthetic_data(conn, spec, batch_rows=batch_rows, on_flush=_report_progress)
+    elapsed = time.perf_counter() - start
+
+    total_rows = sum(summary.rows.values())
+    print("\n" + "=" * 60)
+    print(f"Synthetic data seeding completed in {elapsed:.1f} s ({total_rows / elapsed:,.0f} rows/s)")
+    print("=" * 60)
+    print("\nSummary:")
+    for table, rows in summary.rows.items():
+        print(f"  {table}: {rows}")
+    print("\nTest user credentials:")
+    print(f"  Email: synthetic-{summary.user_ids.start}@example.com, Password: {SYNTHETIC_PASSWORD}")
+    print(f"  (any id from {summary.user_ids.start} to {summary.user_ids.stop - 1})")
+
+
 def main() -> None:
     """Main entry point for the script."""
     # Load environment variables first (for database connection, etc.)
@@ -529,6 +581,8 @@ def main() -> None:
 Examples:
   python scripts/seed_sample_data.py
   python scripts/seed_sample_data.py --clear  # Clear existing data first
+  python scripts/seed_sample_data.py --synthetic --users 1000 --groups 200 --seed 42
+  python scripts/seed_sample_data.py --synthetic --split-mix equal=0.7,amount=0.3
         """,
     )
 
@@ -538,11 +592,42 @@ Examples:
         help="Clear all existing data before seeding (except categories)",
     )
 
+    synthetic = parser.add_argument_group("synthetic data")
+    synthetic.add_argument("--synthetic", action="store_true", help="Generate a dataset of the shape below instead")
+    synthetic.add_argument("--users", type=int, default=100, help="Number of users (default: 100)")
+    synthetic.add_argument("--groups", type=int, default=10, help="Number of groups (default: 10)")
+    synthetic.add_argument("--members-per-group", type=int, default=5, help="Members of each group (default: 5)")
+    synthetic.add_argument("--periods-per-group", type=int, default=3, help="Periods of each group (default: 3)")
+    synthetic.add_argument(
+        "--transactions-per-period", type=int, default=50, help="Transactions in each period (default: 50)"
+    )
+    synthetic.add_argument(
+        "--split-mix",
+        type=parse_split_mix,
+        default=dict(DEFAULT_SPLIT_MIX),
+        help="Relative weight of each split kind among expenses "
+        "(default: equal=0.4,amount=0.2,percentage=0.2,personal=0.2)",
+    )
+    synthetic.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    synthetic.add_argument("--batch-size", type=int, default=5000, help="Rows per insert batch (default: 5000)")
+
     args = parser.parse_args()
 
     # Run async function
     try:
-        asyncio.run(seed_sample_data(clear_first=args.clear))
+        if args.synthetic:
+            spec = SyntheticDataSpec(
+                users=args.users,
+                groups=args.groups,
+                members_per_group=args.members_per_group,
+                periods_per_group=args.periods_per_group,
+                transactions_per_period=args.transactions_per_period,
+                split_mix=args.split_mix,
+                seed=args.seed,
+            )
+            asyncio.run(seed_synthetic_data(spec, batch_rows=args.batch_size, clear_first=args.clear))
+        else:
+            asyncio.run(seed_sample_data(clear_first=args.clear))
     except Exception as e:
         print(f"Error: {e}")
         import traceback
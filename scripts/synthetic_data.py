@@ -0,0 +1,365 @@
+"""
+Scalable synthetic data generator.
+
+Generates users, groups with members, periods and transactions with their expense
+shares, deterministically for a given seed. Rows are written in batches with one
+Core `insert()` executed over many parameter sets, committed batch by batch, so
+tens of millions of rows can be produced in minutes without holding them in
+memory. (A multi-row `insert().values(rows)` is recompiled for every batch, which
+costs far more than the insert itself; the executemany form is compiled once and
+the driver batches it.) Used by `scripts/seed_sample_data.py --synthetic` and the benchmarks.
+
+Primary keys are allocated up front from the current maximum id of each table,
+so the generator must be the only writer while it runs. On PostgreSQL the id
+sequences are moved past the generated ids afterwards.
+
+Every period but the latest of each group is closed; the latest one is open
+unless `SyntheticDataSpec.leave_last_period_open` is false. Transactions in closed
+periods are approved; the open period also holds draft and pending ones.
+"""
+
+import random
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.security.password import hash_password
+from app.models import (
+    Base,
+    Category,
+    ExpenseShare,
+    Group,
+    GroupRole,
+    GroupRoleBinding,
+    Period,
+    PeriodStatus,
+    SplitKind,
+    Transaction,
+    TransactionKind,
+    TransactionStatus,
+    User,
+)
+
+DEFAULT_SPLIT_MIX: Mapping[SplitKind, float] = {
+    SplitKind.EQUAL: 0.4,
+    SplitKind.AMOUNT: 0.2,
+    SplitKind.PERCENTAGE: 0.2,
+    SplitKind.PERSONAL: 0.2,
+}
+
+# Password of every generated user, so load tests can log in as any of them
+SYNTHETIC_PASSWORD = "password123"
+
+# Share of transactions that are deposits and refunds rather than expenses
+DEPOSIT_RATIO = 0.03
+REFUND_RATIO = 0.02
+
+# Status mix of transactions in open periods
+OPEN_PERIOD_STATUSES: Mapping[TransactionStatus, float] = {
+    TransactionStatus.APPROVED: 0.8,
+    TransactionStatus.PENDING: 0.1,
+    TransactionStatus.DRAFT: 0.1,
+}
+
+PERIOD_LENGTH = timedelta(days=30)
+
+
+@dataclass(frozen=True)
+class SyntheticDataSpec:
+    """Shape of the generated dataset."""
+
+    users: int = 100
+    groups: int = 10
+    members_per_group: int = 5
+    periods_per_group: int = 3
+    transactions_per_period: int = 50
+    split_mix: Mapping[SplitKind, float] = field(default_factory=lambda: dict(DEFAULT_SPLIT_MIX))
+    max_participants: int = 8
+    leave_last_period_open: bool = True
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.members_per_group < 2:
+            raise ValueError("members_per_group must be at least 2")
+        if self.members_per_group > self.users:
+            raise ValueError("members_per_group cannot exceed users")
+        if self.groups < 1 or self.periods_per_group < 1:
+            raise ValueError("groups and periods_per_group must be at least 1")
+        if not any(weight > 0 for weight in self.split_mix.values()):
+            raise ValueError("split_mix needs at least one positive weight")
+
+
+@dataclass
+class SyntheticDataSummary:
+    """Identifiers and row counts of a generated dataset."""
+
+    user_ids: range
+    group_ids: range
+    period_ids: range
+    rows: dict[str, int] = field(default_factory=dict[str, int])
+
+
+def parse_split_mix(value: str) -> dict[SplitKind, float]:
+    """Parse "equal=0.5,amount=0.3,percentage=0.2" into split kind weights."""
+    mix: dict[SplitKind, float] = {}
+    for item in value.split(","):
+        kind, _, weight = item.partition("=")
+        mix[SplitKind(kind.strip())] = float(weight)
+    return mix
+
+
+def _partition(total: int, parts: int, rng: random.Random) -> list[int]:
+    """Split `total` into `parts` non-negative integers summing to `total`."""
+    cuts = sorted(rng.randint(0, total) for _ in range(parts - 1))
+    return [b - a for a, b in zip([0, *cuts], [*cuts, total], strict=True)]
+
+
+class _BatchWriter:
+    """
+    Buffers rows per table and writes them in batches.
+
+    Tables are flushed in the order they were registered, which must be parent
+    before child, so a batch never references rows that are still buffered.
+    """
+
+    def __init__(
+        self, conn: AsyncConnection, tables: Sequence[Table], batch_rows: int, on_flush: Callable[[], None] | None
+    ):
+        self._conn = conn
+        self._tables = list(tables)
+        self._buffers: dict[str, list[dict[str, Any]]] = {table.name: [] for table in tables}
+        self._batch_rows = batch_rows
+        self._on_flush = on_flush
+        self.rows: dict[str, int] = dict.fromkeys(self._buffers, 0)
+
+    async def add(self, table: Table, row: dict[str, Any]) -> None:
+        buffer = self._buffers[table.name]
+        buffer.append(row)
+        if len(buffer) >= self._batch_rows:
+            await self.flush(upto=table)
+
+    async def flush(self, upto: Table | None = None) -> None:
+        """Write buffered rows of every table up to and including `upto` (default: all), then commit."""
+        for table in self._tables:
+            buffer = self._buffers[table.name]
+            if buffer:
+                await self._conn.execute(insert(table), buffer)
+                self.rows[table.name] += len(buffer)
+                buffer.clear()
+            if table is upto:
+                break
+        await self._conn.commit()
+        if self._on_flush is not None:
+            self._on_flush()
+
+
+async def _next_id(conn: AsyncConnection, table: Table) -> int:
+    return ((await conn.scalar(select(func.max(table.c.id)))) or 0) + 1
+
+
+async def _sync_postgres_sequences(conn: AsyncConnection, tables: Sequence[Table]) -> None:
+    for table in tables:
+        await conn.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+            )
+        )
+    await conn.commit()
+
+
+def _shares(
+    split_kind: SplitKind,
+    amount: int,
+    participants: Sequence[int],
+    transaction_id: int,
+    created_at: datetime,
+    rng: random.Random,
+) -> list[dict[str, Any]]:
+    """ExpenseShare rows of one expense (every row carries every column, as one batch shares one statement)."""
+    amounts: list[int | None] = [None] * len(participants)
+    percentages: list[float | None] = [None] * len(participants)
+    if split_kind == SplitKind.AMOUNT:
+        amounts = list(_partition(amount, len(participants), rng))
+    elif split_kind == SplitKind.PERCENTAGE:
+        percentages = [basis_points / 100 for basis_points in _partition(10_000, len(participants), rng)]
+    return [
+        {
+            "transaction_id": transaction_id,
+            "user_id": user_id,
+            "share_amount": share,
+            "share_percentage": percentage,
+            "created_by": None,
+            "updated_by": None,
+            "created_at": created_at,
+            "updated_at": None,
+        }
+        for user_id, share, percentage in zip(participants, amounts, percentages, strict=True)
+    ]
+
+
+async def generate_synthetic_data(
+    conn: AsyncConnection,
+    spec: SyntheticDataSpec,
+    *,
+    batch_rows: int = 5_000,
+    on_flush: Callable[[], None] | None = None,
+) -> SyntheticDataSummary:
+    """
+    Generate a synthetic dataset.
+
+    Args:
+        conn: Connection to write with; the generator commits after every batch
+        spec: Shape of the dataset
+        batch_rows: Rows per batch
+        on_flush: Called after every committed batch (e.g. to report progress)
+
+    Returns:
+        Identifiers and per-table row counts of the generated data
+    """
+    rng = random.Random(spec.seed)
+    now = datetime.now(UTC)
+    users, groups, bindings, periods, transactions, shares = (
+        Base.metadata.tables[model.__tablename__]
+        for model in (User, Group, GroupRoleBinding, Period, Transaction, ExpenseShare)
+    )
+
+    category_ids = list((await conn.execute(select(Category.id))).scalars())
+    if not category_ids:
+        await conn.execute(insert(Category).values(name="Other", is_default=True))
+        category_ids = list((await conn.execute(select(Category.id))).scalars())
+
+    first_user_id = await _next_id(conn, users)
+    first_group_id = await _next_id(conn, groups)
+    first_period_id = await _next_id(conn, periods)
+    next_transaction_id = await _next_id(conn, transactions)
+    user_ids = range(first_user_id, first_user_id + spec.users)
+    group_ids = range(first_group_id, first_group_id + spec.groups)
+    period_ids = range(first_period_id, first_period_id + spec.groups * spec.periods_per_group)
+
+    writer = _BatchWriter(conn, [users, groups, bindings, periods, transactions, shares], batch_rows, on_flush)
+    password = hash_password(SYNTHETIC_PASSWORD)
+
+    for user_id in user_ids:
+        await writer.add(
+            users,
+            {
+                "id": user_id,
+                "name": f"Synthetic User {user_id}",
+                "email": f"synthetic-{user_id}@example.com",
+                "avatar": None,
+                "password": password,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": None,
+            },
+        )
+
+    split_kinds = [kind for kind, weight in spec.split_mix.items() if weight > 0]
+    split_weights = [spec.split_mix[kind] for kind in split_kinds]
+    open_statuses = list(OPEN_PERIOD_STATUSES)
+    open_weights = list(OPEN_PERIOD_STATUSES.values())
+    max_participants = min(spec.members_per_group, spec.max_participants)
+    period_ids_iter = iter(period_ids)
+
+    for group_id in group_ids:
+        members = rng.sample(user_ids, spec.members_per_group)
+        owner_id = members[0]
+        await writer.add(
+            groups,
+            {
+                "id": group_id,
+                "name": f"Synthetic Group {group_id}",
+                "created_by": owner_id,
+                "updated_by": None,
+                "created_at": now,
+                "updated_at": None,
+            },
+        )
+        for i, user_id in enumerate(members):
+            await writer.add(
+                bindings,
+                {
+                    "user_id": user_id,
+                    "group_id": group_id,
+                    "role": (GroupRole.OWNER if i == 0 else GroupRole.MEMBER).value,
+                    "created_by": owner_id,
+                    "updated_by": None,
+                    "created_at": now,
+                    "updated_at": None,
+                },
+            )
+
+        for p in range(spec.periods_per_group):
+            period_id = next(period_ids_iter)
+            is_open = spec.leave_last_period_open and p == spec.periods_per_group - 1
+            start = now - PERIOD_LENGTH * (spec.periods_per_group - p)
+            end = None if is_open else start + PERIOD_LENGTH
+            await writer.add(
+                periods,
+                {
+                    "id": period_id,
+                    "group_id": group_id,
+                    "name": f"Period {p + 1}",
+                    "status": (PeriodStatus.OPEN if is_open else PeriodStatus.CLOSED).value,
+                    "start_date": start,
+                    "end_date": end,
+                    "closed_at": end,
+                    "created_by": owner_id,
+                    "updated_by": None,
+                    "created_at": start,
+                    "updated_at": None,
+                },
+            )
+
+            step = PERIOD_LENGTH / max(spec.transactions_per_period, 1)
+            for t in range(spec.transactions_per_period):
+                transaction_id = next_transaction_id
+                next_transaction_id += 1
+                payer_id = rng.choice(members)
+                amount = rng.randint(100, 50_000)
+                roll = rng.random()
+                if roll < DEPOSIT_RATIO:
+                    kind, split_kind, participants = TransactionKind.DEPOSIT, SplitKind.PERSONAL, []
+                elif roll < DEPOSIT_RATIO + REFUND_RATIO:
+                    kind, split_kind, participants = TransactionKind.REFUND, SplitKind.PERSONAL, []
+                else:
+                    kind = TransactionKind.EXPENSE
+                    split_kind = rng.choices(split_kinds, split_weights)[0]
+                    if split_kind == SplitKind.PERSONAL:
+                        participants = [payer_id]
+                    else:
+                        participants = rng.sample(members, rng.randint(2, max_participants))
+                status = rng.choices(open_statuses, open_weights)[0] if is_open else TransactionStatus.APPROVED
+                incurred = start + step * t
+                await writer.add(
+                    transactions,
+                    {
+                        "id": transaction_id,
+                        "transaction_kind": kind.value,
+                        "split_kind": split_kind.value,
+                        "status": status.value,
+                        "description": f"Synthetic {kind.value} {t + 1}",
+                        "amount": amount,
+                        "date_incurred": incurred,
+                        "payer_id": payer_id,
+                        "category_id": rng.choice(category_ids),
+                        "period_id": period_id,
+                        "created_by": payer_id,
+                        "updated_by": None,
+                        "created_at": incurred,
+                        "updated_at": None,
+                    },
+                )
+                for share in _shares(split_kind, amount, participants, transaction_id, incurred, rng):
+                    await writer.add(shares, share)
+
+    await writer.flush()
+    if conn.dialect.name == "postgresql":
+        await _sync_postgres_sequences(conn, [users, groups, periods, transactions])
+
+    return SyntheticDataSummary(user_ids=user_ids, group_ids=group_ids, period_ids=period_ids, rows=writer.rows)
@@ -9,7 +9,7 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
-from app.models import Group, GroupRole, User
+from app.models import Group, GroupRole, Period, User
 from app.schemas.group import GroupRequest, GroupResponse
 from app.schemas.period import PeriodRequest, PeriodResponse
 from app.services import AuthorizationService
@@ -90,6 +90,33 @@ class TestGroupsAPI:
             assert group2.id in group_ids
             assert group3.id not in group_ids
 
+    async def test_get_groups_with_fields(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        group_with_role_factory: Callable[..., Awaitable[Group]],
+    ):
+        """Test the fields parameter restricts each group to the requested fields."""
+        group = await group_with_role_factory(user_id=owner_user.id, role=GroupRole.OWNER, name="Group 1")
+
+        async for client in async_client_factory(owner_user):
+            response = await client.get("/api/v1/groups/?fields=id", follow_redirects=True)
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == [{"id": group.id}]
+
+    async def test_get_groups_with_unknown_field(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+    ):
+        """Test unknown fields are rejected."""
+        async for client in async_client_factory(owner_user):
+            response = await client.get("/api/v1/groups/?fields=id,owner", follow_redirects=True)
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert "owner" in response.json()["detail"]
+
     async def test_get_groups_returns_empty_list(
         self,
         async_client: AsyncClient,
@@ -446,6 +473,25 @@ class TestGroupsAPI:
             assert isinstance(periods, list)
             assert all(isinstance(p, PeriodResponse) for p in periods)
 
+    async def test_get_periods_with_fields(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        group_with_owner: Group,
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test the fields parameter restricts each period to the requested fields."""
+        period = await period_factory(group_id=group_with_owner.id, name="Period 1")
+
+        async for client in async_client_factory(owner_user):
+            response = await client.get(
+                f"/api/v1/groups/{group_with_owner.id}/periods?fields=id,status",
+                follow_redirects=True,
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == [{"id": period.id, "status": period.status.value}]
+
     # ============================================================================
     # PUT /groups/{group_id}/users/{user_id} - Transfer ownership
     # ============================================================================
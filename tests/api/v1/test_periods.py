@@ -2,22 +2,30 @@
 API tests for Period endpoints.
 """
 
+import asyncio
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from app.models import Group, GroupRole, Period, SplitKind, TransactionKind, User
+from app.core.events import DEFAULT_MAX_PENDING_EVENTS, event_hub, period_channel
+from app.db import track_queries
+from app.models import Category, Group, GroupRole, Period, PeriodStatus, SplitKind, Transaction, TransactionKind, User
+from app.schemas.event import PeriodEventKind, TransactionEvent
 from app.schemas.period import PeriodRequest, PeriodResponse
 from app.schemas.transaction import (
     BalanceResponse,
+    ColumnarTransactionListResponse,
+    CompactTransactionListResponse,
     ExpenseShareRequest,
     SettlementResponse,
     TransactionRequest,
     TransactionResponse,
 )
+from tests.utils.sse import open_event_stream
 
 
 @pytest.mark.api
@@ -240,6 +248,238 @@ class TestPeriodsAPI:
             assert isinstance(transactions, list)
             assert all(isinstance(t, TransactionResponse) for t in transactions)
 
+    @pytest.fixture
+    async def period_transactions(
+        self,
+        owner_user: User,
+        period_in_group: Period,
+        category_factory: Callable[..., Awaitable[Category]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ) -> list[Transaction]:
+        """Create a few transactions in the test period."""
+        category = await category_factory(name="Groceries")
+        return [
+            await transaction_factory(
+                payer_id=owner_user.id,
+                category_id=category.id,
+                period_id=period_in_group.id,
+                transaction_kind=TransactionKind.DEPOSIT,
+                split_kind=SplitKind.PERSONAL,
+                amount=amount,
+            )
+            for amount in (100, 200, 300)
+        ]
+
+    async def test_get_transactions_compact_format(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        period_transactions: list[Transaction],
+    ):
+        """Test the compact format names each referenced entity once and is smaller than the full list."""
+        async for client in async_client_factory(owner_user):
+            full = await client.get(f"/api/v1/periods/{period_in_group.id}/transactions")
+            response = await client.get(f"/api/v1/periods/{period_in_group.id}/transactions?format=compact")
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"] == "application/vnd.divvy.transactions.compact+json"
+            compact = CompactTransactionListResponse.model_validate(response.json())
+            assert compact.period_name == "Test Period"
+            assert compact.users == {owner_user.id: "Owner"}
+            assert list(compact.categories.values()) == ["Groceries"]
+            assert [t.id for t in compact.transactions] == [t.id for t in period_transactions]
+            assert len(response.content) < len(full.content)
+
+    async def test_get_transactions_columns_format_from_accept_header(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        period_transactions: list[Transaction],
+    ):
+        """Test the Accept header selects the columnar format."""
+        async for client in async_client_factory(owner_user):
+            response = await client.get(
+                f"/api/v1/periods/{period_in_group.id}/transactions",
+                headers={"Accept": "application/vnd.divvy.transactions.columns+json, application/json;q=0.5"},
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"] == "application/vnd.divvy.transactions.columns+json"
+            assert response.headers["vary"] == "Accept"
+            columnar = ColumnarTransactionListResponse.model_validate(response.json())
+            assert columnar.columns.amount == [100, 200, 300]
+            assert columnar.columns.payer_id == [owner_user.id] * 3
+
+    async def test_get_transactions_format_parameter_overrides_accept_header(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        period_transactions: list[Transaction],
+    ):
+        """Test the format query parameter wins over the Accept header, and refused media types are skipped."""
+        async for client in async_client_factory(owner_user):
+            overridden = await client.get(
+                f"/api/v1/periods/{period_in_group.id}/transactions?format=full",
+                headers={"Accept": "application/vnd.divvy.transactions.compact+json"},
+            )
+            refused = await client.get(
+                f"/api/v1/periods/{period_in_group.id}/transactions",
+                headers={"Accept": "application/vnd.divvy.transactions.compact+json;q=0, */*"},
+            )
+
+            for response in (overridden, refused):
+                assert response.status_code == status.HTTP_200_OK
+                assert response.headers["content-type"] == "application/json"
+                assert [TransactionResponse.model_validate(item).payer_name for item in response.json()] == [
+                    "Owner"
+                ] * 3
+
+    async def test_get_transactions_with_fields(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        period_transactions: list[Transaction],
+    ):
+        """Test the fields parameter restricts each transaction to the requested fields."""
+        async for client in async_client_factory(owner_user):
+            response = await client.get(
+                f"/api/v1/periods/{period_in_group.id}/transactions?fields=id,amount,payer_name"
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == [
+                {"id": t.id, "amount": t.amount, "payer_name": "Owner"} for t in period_transactions
+            ]
+
+    async def test_get_transactions_fields_require_full_format(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+    ):
+        """Test fields cannot be combined with a normalized format."""
+        async for client in async_client_factory(owner_user):
+            response = await client.get(f"/api/v1/periods/{period_in_group.id}/transactions?format=compact&fields=id")
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_get_transactions_invalid_format(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+    ):
+        """Test an unknown format is rejected."""
+        async for client in async_client_factory(owner_user):
+            response = await client.get(f"/api/v1/periods/{period_in_group.id}/transactions?format=xml")
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    async def test_get_transactions_sends_cache_validators(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        period_transactions: list[Transaction],
+    ):
+        """Test the list carries a weak ETag, Last-Modified and a revalidate-every-time policy."""
+        async for client in async_client_factory(owner_user):
+            response = await client.get(f"/api/v1/periods/{period_in_group.id}/transactions")
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["etag"].startswith(f'W/"{period_in_group.id}.')
+            assert response.headers["last-modified"].endswith("GMT")
+            assert response.headers["cache-control"] == "private, no-cache"
+
+    async def test_get_transactions_not_modified(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        period_transactions: list[Transaction],
+    ):
+        """Test a matching If-None-Match gets an empty 304 without loading the transactions."""
+        async for client in async_client_factory(owner_user):
+            first = await client.get(f"/api/v1/periods/{period_in_group.id}/transactions")
+            etag = first.headers["etag"]
+
+            with track_queries(repeat_action="off") as stats:
+                response = await client.get(
+                    f"/api/v1/periods/{period_in_group.id}/transactions", headers={"If-None-Match": etag}
+                )
+
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+            # Only the membership check and the period itself
+            assert stats.count <= 2
+
+    async def test_get_transactions_etag_depends_on_format(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+    ):
+        """Test a representation negotiated from Accept has its own ETag."""
+        async for client in async_client_factory(owner_user):
+            full = await client.get(f"/api/v1/periods/{period_in_group.id}/transactions")
+            compact = await client.get(
+                f"/api/v1/periods/{period_in_group.id}/transactions",
+                headers={"Accept": "application/vnd.divvy.transactions.compact+json", "If-None-Match": 'W/"x"'},
+            )
+
+            assert compact.status_code == status.HTTP_200_OK
+            assert compact.headers["etag"] != full.headers["etag"]
+
+    async def test_get_transactions_etag_changes_with_new_transaction(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        category_factory: Callable[..., Awaitable[Category]],
+    ):
+        """Test creating a transaction invalidates the list's ETag."""
+        category = await category_factory(name="Test Category")
+        request = TransactionRequest(
+            description="Test Transaction",
+            amount=500,
+            payer_id=owner_user.id,
+            category_id=category.id,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+            expense_shares=[],
+        )
+
+        async for client in async_client_factory(owner_user):
+            path = f"/api/v1/periods/{period_in_group.id}/transactions"
+            etag = (await client.get(path)).headers["etag"]
+            created = await client.post(path, json=request.model_dump())
+            assert created.status_code == status.HTTP_201_CREATED
+
+            response = await client.get(path, headers={"If-None-Match": etag})
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["etag"] != etag
+            assert len(response.json()) == 1
+
+    async def test_get_transactions_not_modified_requires_membership(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        member_user: User,
+        period_in_group: Period,
+    ):
+        """Test conditional requests are authorized before they are answered."""
+        async for client in async_client_factory(member_user):
+            response = await client.get(
+                f"/api/v1/periods/{period_in_group.id}/transactions", headers={"If-None-Match": "*"}
+            )
+
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
     # ============================================================================
     # POST /periods/{period_id}/transactions - Create transaction
     # ============================================================================
@@ -361,6 +601,91 @@ class TestPeriodsAPI:
             assert isinstance(balances, list)
             assert all(isinstance(b, BalanceResponse) for b in balances)
 
+    # ============================================================================
+    # GET /periods/{period_id}/events - Stream live updates
+    # ============================================================================
+
+    async def test_stream_events_requires_membership(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        member_user: User,
+        period_in_group: Period,
+    ):
+        """Test subscribing requires membership - non-members get 404 instead of a stream."""
+        async for client in async_client_factory(member_user):
+            response = await client.get(f"/api/v1/periods/{period_in_group.id}/events")
+
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_stream_events(
+        self,
+        app: FastAPI,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        category_factory: Callable[..., Awaitable[Category]],
+    ):
+        """Test the stream starts with the balances, then pushes each committed transaction with its deltas."""
+        category = await category_factory(name="Test Category")
+        request = TransactionRequest(
+            description="Test Transaction",
+            amount=500,
+            payer_id=owner_user.id,
+            category_id=category.id,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+            expense_shares=[],
+        )
+
+        async for client in async_client_factory(owner_user):
+            async with open_event_stream(app, f"/api/v1/periods/{period_in_group.id}/events") as stream:
+                assert stream.status_code == status.HTTP_200_OK
+                snapshot = await stream.next_event()
+                assert snapshot is not None
+                assert snapshot.event == "balances"
+                assert snapshot.data == {"period_id": period_in_group.id, "version": 1, "balances": []}
+                assert snapshot.id == "1"
+
+                created = await client.post(
+                    f"/api/v1/periods/{period_in_group.id}/transactions", json=request.model_dump()
+                )
+                assert created.status_code == status.HTTP_201_CREATED
+
+                event = await stream.next_event()
+                assert event is not None
+                assert event.event == "transaction.created"
+                assert event.id == "2"
+                assert event.data["transaction_id"] == created.json()["id"]
+                assert event.data["transaction"]["amount"] == 500
+                assert event.data["balance_deltas"] == {str(owner_user.id): 500}
+
+    async def test_stream_events_lagging_client_resyncs(
+        self,
+        app: FastAPI,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+    ):
+        """Test a client too far behind is told to resync and its stream ends."""
+        async for _ in async_client_factory(owner_user):
+            async with open_event_stream(app, f"/api/v1/periods/{period_in_group.id}/events") as stream:
+                assert await stream.next_event() is not None
+                for version in range(2, DEFAULT_MAX_PENDING_EVENTS + 3):
+                    event_hub.publish(
+                        period_channel(period_in_group.id),
+                        TransactionEvent(
+                            kind=PeriodEventKind.TRANSACTION_UPDATED,
+                            period_id=period_in_group.id,
+                            version=version,
+                            transaction_id=1,
+                        ),
+                    )
+
+                resync = await stream.next_event()
+                assert resync is not None
+                assert resync.event == "resync"
+                assert await stream.next_event() is None
+
     # ============================================================================
     # GET /periods/{period_id}/get-settlement-plan - Get settlement plan
     # ============================================================================
@@ -448,3 +773,35 @@ class TestPeriodsAPI:
 
             # May return 204 or 400 if period not closed/ready
             assert response.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_400_BAD_REQUEST]
+
+    async def test_apply_settlement_plan_concurrently_on_small_pool(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        group_with_owner: Group,
+        period_factory: Callable[..., Awaitable[Period]],
+        test_database_url: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test concurrent settlements share a one-connection pool: none holds a connection while waiting for another."""
+        periods = [
+            await period_factory(group_id=group_with_owner.id, name=f"Period {i}", status=PeriodStatus.CLOSED)
+            for i in range(3)
+        ]
+        engine = create_async_engine(test_database_url, pool_size=1, max_overflow=0, pool_timeout=2)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        serializable_factory = async_sessionmaker(
+            bind=engine.execution_options(isolation_level="SERIALIZABLE"), expire_on_commit=False
+        )
+        monkeypatch.setattr("app.db.session._get_session_factory", lambda: session_factory)
+        monkeypatch.setattr("app.db.session._get_serializable_session_factory", lambda: serializable_factory)
+
+        try:
+            async for client in async_client_factory(owner_user):
+                responses = await asyncio.gather(
+                    *(client.post(f"/api/v1/periods/{period.id}/apply-settlement-plan") for period in periods)
+                )
+
+                assert [response.status_code for response in responses] == [status.HTTP_204_NO_CONTENT] * 3
+        finally:
+            await engine.dispose()
@@ -0,0 +1,255 @@
+"""
+Query-count regression tests for the API endpoints.
+
+Every endpoint is called against a small and a large seeded dataset. The number of
+SQL statements it issues must be the same for both (it must not grow with the
+number of members, periods or transactions) and stay within the endpoint's budget.
+A failing test prints the statements the endpoint ran.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import QueryStats, track_queries
+from app.models import (
+    Category,
+    ExpenseShare,
+    GroupRole,
+    GroupRoleBinding,
+    PeriodStatus,
+    SplitKind,
+    TransactionStatus,
+    User,
+)
+from app.services import CategoryService
+from tests.fixtures.factories import (
+    create_test_group,
+    create_test_period,
+    create_test_transaction,
+    create_test_user,
+)
+
+SMALL_DATASET = 2
+LARGE_DATASET = 12
+
+
+@dataclass
+class SeededDataset:
+    """One owner's data: `size` groups, members, closed periods and twice as many transactions."""
+
+    owner: User
+    member_id: int
+    category_id: int
+    group_id: int
+    period_id: int
+    closed_period_id: int
+    transaction_id: int
+
+    def path(self, template: str) -> str:
+        return template.format(
+            group_id=self.group_id,
+            member_id=self.member_id,
+            period_id=self.period_id,
+            closed_period_id=self.closed_period_id,
+            transaction_id=self.transaction_id,
+        )
+
+
+async def _seed_dataset(db_session: AsyncSession, category: Category, size: int) -> SeededDataset:
+    """Seed a group whose members, periods and transactions all grow with `size`."""
+    owner = create_test_user(email=f"owner{size}@example.com", name=f"Owner {size}")
+    members = [create_test_user(email=f"member{size}-{i}@example.com", name=f"Member {i}") for i in range(size)]
+    groups = [create_test_group(name=f"Group {size}-{i}") for i in range(size)]
+    db_session.add_all([owner, *members, *groups])
+    await db_session.flush()
+
+    group = groups[0]
+    db_session.add_all(GroupRoleBinding(user_id=owner.id, group_id=g.id, role=GroupRole.OWNER) for g in groups)
+    db_session.add_all(GroupRoleBinding(user_id=m.id, group_id=group.id, role=GroupRole.MEMBER) for m in members)
+
+    start = datetime.now(UTC) - timedelta(days=30 * (size + 1))
+    closed_periods = [
+        create_test_period(
+            group_id=group.id,
+            name=f"Closed {i}",
+            start_date=start + timedelta(days=30 * i),
+            end_date=start + timedelta(days=30 * (i + 1)),
+            status=PeriodStatus.CLOSED,
+        )
+        for i in range(size)
+    ]
+    period = create_test_period(group_id=group.id, name="Open", created_by=owner.id)
+    db_session.add_all([*closed_periods, period])
+    await db_session.flush()
+
+    # The open period and the latest closed period hold the same expenses
+    participants = [owner, *members]
+    transactions = [
+        create_test_transaction(
+            split_kind=SplitKind.EQUAL,
+            amount=1000 * len(participants),
+            payer_id=participants[i % len(participants)].id,
+            category_id=category.id,
+            period_id=period_id,
+            status=TransactionStatus.APPROVED,
+            description=f"Expense {i}",
+        )
+        for period_id in (period.id, closed_periods[-1].id)
+        for i in range(2 * size)
+    ]
+    db_session.add_all(transactions)
+    await db_session.flush()
+    db_session.add_all(
+        ExpenseShare(transaction_id=transaction.id, user_id=user.id)
+        for transaction in transactions
+        for user in participants
+    )
+    await db_session.commit()
+
+    return SeededDataset(
+        owner=owner,
+        member_id=members[0].id,
+        category_id=category.id,
+        group_id=group.id,
+        period_id=period.id,
+        closed_period_id=closed_periods[-1].id,
+        transaction_id=transactions[0].id,
+    )
+
+
+def _format_statements(stats: QueryStats) -> str:
+    return "\n".join(f"  {count}x {statement}" for statement, count in stats.shapes.most_common())
+
+
+@dataclass
+class EndpointCase:
+    method: str
+    path: str
+    budget: int
+    json: Callable[[SeededDataset], dict[str, Any]] | None = None
+
+
+def _transaction_request(dataset: SeededDataset) -> dict[str, Any]:
+    return {
+        "description": "Lunch",
+        "amount": 2000,
+        "transaction_kind": "expense",
+        "split_kind": "equal",
+        "category_id": dataset.category_id,
+        "payer_id": dataset.owner.id,
+        "expense_shares": [
+            {"user_id": dataset.owner.id, "transaction_id": 0},
+            {"user_id": dataset.member_id, "transaction_id": 0},
+        ],
+    }
+
+
+# Endpoints that still run statements per settlement
+KNOWN_N_PLUS_ONE = pytest.mark.xfail(strict=True, reason="inserts and reloads settlements one row at a time")
+
+ENDPOINTS = [
+    pytest.param(EndpointCase("GET", "/api/v1/user/me", budget=0), id="get-me"),
+    pytest.param(EndpointCase("GET", "/api/v1/categories/", budget=0), id="list-categories"),
+    pytest.param(EndpointCase("GET", "/api/v1/groups/", budget=1), id="list-groups"),
+    pytest.param(EndpointCase("GET", "/api/v1/groups/?fields=id", budget=1), id="list-groups-sparse"),
+    pytest.param(EndpointCase("GET", "/api/v1/groups/{group_id}", budget=2), id="get-group"),
+    pytest.param(EndpointCase("GET", "/api/v1/groups/{group_id}/periods", budget=2), id="list-periods"),
+    pytest.param(
+        EndpointCase("GET", "/api/v1/groups/{group_id}/periods?fields=id,status", budget=2), id="list-periods-sparse"
+    ),
+    pytest.param(EndpointCase("GET", "/api/v1/groups/{group_id}/periods/current", budget=2), id="current-period"),
+    pytest.param(EndpointCase("GET", "/api/v1/periods/{period_id}", budget=2), id="get-period"),
+    pytest.param(EndpointCase("GET", "/api/v1/periods/{period_id}/transactions", budget=5), id="list-transactions"),
+    pytest.param(
+        EndpointCase("GET", "/api/v1/periods/{period_id}/transactions?fields=id,amount,status", budget=3),
+        id="list-transactions-sparse",
+    ),
+    pytest.param(EndpointCase("GET", "/api/v1/periods/{period_id}/balances", budget=5), id="balances"),
+    pytest.param(
+        EndpointCase("GET", "/api/v1/periods/{closed_period_id}/get-settlement-plan", budget=5),
+        id="settlement-plan",
+    ),
+    pytest.param(
+        EndpointCase(
+            "GET", "/api/v1/periods/{closed_period_id}/get-settlement-plan?fields=payer_id,payee_id,amount", budget=5
+        ),
+        id="settlement-plan-sparse",
+    ),
+    pytest.param(EndpointCase("GET", "/api/v1/transactions/{transaction_id}", budget=3), id="get-transaction"),
+    pytest.param(EndpointCase("GET", "/api/v1/sync/", budget=7), id="sync-snapshot"),
+    pytest.param(EndpointCase("GET", "/api/v1/sync/?cursor=0", budget=2), id="sync-changes"),
+    pytest.param(
+        EndpointCase("PUT", "/api/v1/groups/{group_id}", budget=4, json=lambda _: {"name": "Renamed"}),
+        id="rename-group",
+    ),
+    pytest.param(EndpointCase("PUT", "/api/v1/periods/{period_id}/close", budget=5), id="close-period"),
+    pytest.param(
+        EndpointCase("POST", "/api/v1/periods/{period_id}/transactions", budget=7, json=_transaction_request),
+        id="create-transaction",
+    ),
+    pytest.param(
+        EndpointCase("POST", "/api/v1/periods/{closed_period_id}/apply-settlement-plan", budget=12),
+        id="apply-settlement-plan",
+        marks=KNOWN_N_PLUS_ONE,
+    ),
+]
+
+
+@pytest.mark.api
+class TestQueryCounts:
+    """Test suite asserting per-endpoint SQL statement budgets that don't grow with data size."""
+
+    @pytest.fixture
+    async def datasets(
+        self, db_session: AsyncSession, category_factory: Callable[..., Any]
+    ) -> tuple[SeededDataset, SeededDataset]:
+        category = await category_factory(name="Food")
+        small = await _seed_dataset(db_session, category, SMALL_DATASET)
+        large = await _seed_dataset(db_session, category, LARGE_DATASET)
+        # Measure with the category catalog warm, as after application startup
+        await CategoryService(db_session).load_catalog()
+        return small, large
+
+    @staticmethod
+    async def _measure(
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        dataset: SeededDataset,
+        case: EndpointCase,
+    ) -> tuple[Response, QueryStats]:
+        json = case.json(dataset) if case.json else None
+        measured: tuple[Response, QueryStats] | None = None
+        async for client in async_client_factory(dataset.owner):
+            with track_queries(repeat_action="off") as stats:
+                response = await client.request(case.method, dataset.path(case.path), json=json, follow_redirects=True)
+            measured = response, stats
+        assert measured is not None
+        return measured
+
+    @pytest.mark.parametrize("case", ENDPOINTS)
+    async def test_query_count_does_not_grow(
+        self,
+        case: EndpointCase,
+        datasets: tuple[SeededDataset, SeededDataset],
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+    ):
+        """Test the endpoint issues the same, budgeted number of statements for small and large datasets."""
+        small, large = datasets
+        small_response, small_stats = await self._measure(async_client_factory, small, case)
+        large_response, large_stats = await self._measure(async_client_factory, large, case)
+
+        assert small_response.is_success, small_response.text
+        assert large_response.is_success, large_response.text
+        assert large_stats.count == small_stats.count, (
+            f"{case.method} {case.path} ran {small_stats.count} statements for {SMALL_DATASET} "
+            f"and {large_stats.count} for {LARGE_DATASET}:\n{_format_statements(large_stats)}"
+        )
+        assert large_stats.count <= case.budget, (
+            f"{case.method} {case.path} ran {large_stats.count} statements, budget is {case.budget}:\n"
+            f"{_format_statements(large_stats)}"
+        )
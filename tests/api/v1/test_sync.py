@@ -0,0 +1,347 @@
+"""
+API tests for the sync endpoint.
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Category,
+    ChangeEntity,
+    Group,
+    GroupRole,
+    Period,
+    PeriodStatus,
+    SplitKind,
+    Transaction,
+    TransactionKind,
+    User,
+)
+from app.schemas import SyncResponse
+from app.services import AuthorizationService
+
+
+@pytest.mark.api
+class TestSyncAPI:
+    """Test suite for the sync endpoint."""
+
+    # ============================================================================
+    # Helper Fixtures
+    # ============================================================================
+
+    @pytest.fixture
+    async def owner_user(self, user_factory: Callable[..., Awaitable[User]]) -> User:
+        """Create a user who owns the test group."""
+        return await user_factory(email="owner@example.com", name="Owner")
+
+    @pytest.fixture
+    async def member_user(self, user_factory: Callable[..., Awaitable[User]]) -> User:
+        """Create a user who is not a member of the test group yet."""
+        return await user_factory(email="member@example.com", name="Member")
+
+    @pytest.fixture
+    async def group_with_owner(
+        self, owner_user: User, group_with_role_factory: Callable[..., Awaitable[Group]]
+    ) -> Group:
+        """Create a group with an owner."""
+        return await group_with_role_factory(user_id=owner_user.id, role=GroupRole.OWNER, name="Test Group")
+
+    @pytest.fixture
+    async def period_in_group(
+        self, group_with_owner: Group, period_factory: Callable[..., Awaitable[Period]]
+    ) -> Period:
+        """Create an open period in the test group."""
+        return await period_factory(group_id=group_with_owner.id, name="Test Period")
+
+    @pytest.fixture
+    async def category(self, category_factory: Callable[..., Awaitable[Category]]) -> Category:
+        """Create a category for the test transactions."""
+        return await category_factory(name="Groceries")
+
+    @pytest.fixture
+    async def transaction_in_period(
+        self,
+        owner_user: User,
+        period_in_group: Period,
+        category: Category,
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ) -> Transaction:
+        """Create a deposit in the test period."""
+        return await transaction_factory(
+            payer_id=owner_user.id,
+            category_id=category.id,
+            period_id=period_in_group.id,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+            amount=1000,
+            created_by=owner_user.id,
+        )
+
+    def _deposit(self, user: User, category: Category, amount: int) -> dict[str, Any]:
+        return {
+            "description": "Deposit",
+            "amount": amount,
+            "payer_id": user.id,
+            "category_id": category.id,
+            "transaction_kind": "deposit",
+            "split_kind": "personal",
+            "expense_shares": [],
+        }
+
+    @staticmethod
+    async def _sync(client: AsyncClient, cursor: int | None = None, **params: int) -> SyncResponse:
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/sync/", params=params)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        return SyncResponse.model_validate(response.json())
+
+    # ============================================================================
+    # GET /sync - Snapshot
+    # ============================================================================
+
+    async def test_sync_requires_authentication(self, unauthenticated_async_client: AsyncClient):
+        """Test endpoint requires authentication."""
+        response = await unauthenticated_async_client.get("/api/v1/sync/")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_first_sync_returns_snapshot(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        group_with_owner: Group,
+        period_in_group: Period,
+        transaction_in_period: Transaction,
+        group_factory: Callable[..., Awaitable[Group]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test a sync without a cursor returns everything in the user's groups, and nothing else."""
+        other_group = await group_factory(name="Other Group")
+        await period_factory(group_id=other_group.id, name="Other Period")
+
+        async for client in async_client_factory(owner_user):
+            snapshot = await self._sync(client)
+
+            assert [g.id for g in snapshot.groups] == [group_with_owner.id]
+            assert [p.id for p in snapshot.periods] == [period_in_group.id]
+            assert [t.id for t in snapshot.transactions] == [transaction_in_period.id]
+            assert snapshot.transactions[0].period_id == period_in_group.id
+            assert snapshot.users == {owner_user.id: "Owner"}
+            assert "Groceries" in [c.name for c in snapshot.categories]
+            assert snapshot.cursor > 0
+            assert snapshot.has_more is False
+            assert snapshot.deleted == []
+
+    async def test_sync_without_changes_is_empty(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        transaction_in_period: Transaction,
+    ):
+        """Test syncing from the latest cursor returns no entities and keeps the cursor."""
+        async for client in async_client_factory(owner_user):
+            cursor = (await self._sync(client)).cursor
+
+            delta = await self._sync(client, cursor)
+
+            assert delta.cursor == cursor
+            assert delta.groups == delta.periods == delta.transactions == []
+            assert delta.deleted == []
+
+    # ============================================================================
+    # GET /sync?cursor= - Changes
+    # ============================================================================
+
+    async def test_sync_returns_only_changes(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        category: Category,
+        transaction_in_period: Transaction,
+    ):
+        """Test a delta carries each changed transaction once, in its current state, and nothing unchanged."""
+        async for client in async_client_factory(owner_user):
+            cursor = (await self._sync(client)).cursor
+            path = f"/api/v1/transactions/{transaction_in_period.id}"
+            for amount in (500, 700):
+                response = await client.put(path, json=self._deposit(owner_user, category, amount))
+                assert response.status_code == status.HTTP_200_OK
+
+            delta = await self._sync(client, cursor)
+
+            assert delta.cursor > cursor
+            assert delta.groups == delta.periods == []
+            assert [(t.id, t.amount) for t in delta.transactions] == [(transaction_in_period.id, 700)]
+            assert delta.users == {owner_user.id: "Owner"}
+
+    async def test_sync_returns_tombstones(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        transaction_in_period: Transaction,
+    ):
+        """Test a deleted transaction is reported as a tombstone."""
+        async for client in async_client_factory(owner_user):
+            cursor = (await self._sync(client)).cursor
+            await client.delete(f"/api/v1/transactions/{transaction_in_period.id}")
+
+            delta = await self._sync(client, cursor)
+
+            assert delta.transactions == []
+            assert [(d.entity, d.id) for d in delta.deleted] == [(ChangeEntity.TRANSACTION, transaction_in_period.id)]
+
+    async def test_sync_settled_period_includes_settlements(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        member_user: User,
+        group_with_owner: Group,
+        period_in_group: Period,
+        category: Category,
+        group_with_role_factory: Callable[..., Awaitable[Group]],
+    ):
+        """Test settling a period syncs the period with its settlement transfers."""
+        await group_with_role_factory(user_id=member_user.id, role=GroupRole.MEMBER, group_id=group_with_owner.id)
+        expense = {
+            **self._deposit(owner_user, category, 1000),
+            "transaction_kind": "expense",
+            "split_kind": "equal",
+            "expense_shares": [
+                {"user_id": owner_user.id, "transaction_id": 0},
+                {"user_id": member_user.id, "transaction_id": 0},
+            ],
+        }
+
+        async for client in async_client_factory(owner_user):
+            created = (await client.post(f"/api/v1/periods/{period_in_group.id}/transactions", json=expense)).json()
+            await client.put(f"/api/v1/transactions/{created['id']}/approve")
+            cursor = (await self._sync(client)).cursor
+            await client.put(f"/api/v1/periods/{period_in_group.id}/close")
+            response = await client.post(f"/api/v1/periods/{period_in_group.id}/apply-settlement-plan")
+            assert response.is_success, response.text
+
+            delta = await self._sync(client, cursor)
+
+            assert [(p.id, p.status) for p in delta.periods] == [(period_in_group.id, PeriodStatus.SETTLED)]
+            assert [(s.payer_id, s.payee_id, s.amount) for s in delta.settlements] == [
+                (member_user.id, owner_user.id, 500)
+            ]
+            assert delta.users == {owner_user.id: "Owner", member_user.id: "Member"}
+
+    async def test_sync_pages_with_limit(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        period_in_group: Period,
+        category: Category,
+    ):
+        """Test `limit` caps the changes per response and `has_more` asks for the rest."""
+        async for client in async_client_factory(owner_user):
+            cursor = (await self._sync(client)).cursor
+            path = f"/api/v1/periods/{period_in_group.id}/transactions"
+            for amount in (100, 200, 300):
+                await client.post(path, json=self._deposit(owner_user, category, amount))
+
+            first = await self._sync(client, cursor, limit=2)
+            second = await self._sync(client, first.cursor, limit=2)
+
+            assert first.has_more is True
+            assert second.has_more is False
+            assert [t.amount for t in first.transactions + second.transactions] == [100, 200, 300]
+
+    async def test_sync_user_rename(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        member_user: User,
+        group_with_owner: Group,
+        group_with_role_factory: Callable[..., Awaitable[Group]],
+    ):
+        """Test a member's new name reaches the other members of their groups."""
+        await group_with_role_factory(user_id=member_user.id, role=GroupRole.MEMBER, group_id=group_with_owner.id)
+        cursor = 0
+        async for client in async_client_factory(owner_user):
+            cursor = (await self._sync(client)).cursor
+        async for client in async_client_factory(member_user):
+            await client.put("/api/v1/user/me", json={"name": "Renamed"})
+
+        async for client in async_client_factory(owner_user):
+            delta = await self._sync(client, cursor)
+
+            assert delta.users == {member_user.id: "Renamed"}
+
+    # ============================================================================
+    # GET /sync?cursor= - Membership changes
+    # ============================================================================
+
+    async def test_sync_joined_group_returns_snapshot(
+        self,
+        db_session: AsyncSession,
+        authorization_service: AuthorizationService,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        member_user: User,
+        group_with_owner: Group,
+        period_in_group: Period,
+        transaction_in_period: Transaction,
+    ):
+        """Test joining a group syncs the group's existing periods and transactions."""
+        async for client in async_client_factory(member_user):
+            cursor = (await self._sync(client)).cursor
+            await authorization_service.assign_group_role(member_user.id, group_with_owner.id, GroupRole.MEMBER)
+            await db_session.commit()
+
+            delta = await self._sync(client, cursor)
+
+            assert [g.id for g in delta.groups] == [group_with_owner.id]
+            assert [p.id for p in delta.periods] == [period_in_group.id]
+            assert [t.id for t in delta.transactions] == [transaction_in_period.id]
+
+    async def test_sync_left_group_returns_group_tombstone(
+        self,
+        db_session: AsyncSession,
+        authorization_service: AuthorizationService,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        member_user: User,
+        group_with_owner: Group,
+        group_with_role_factory: Callable[..., Awaitable[Group]],
+    ):
+        """Test a removed member is told to drop the group, though its changes are no longer visible."""
+        await group_with_role_factory(user_id=member_user.id, role=GroupRole.MEMBER, group_id=group_with_owner.id)
+        async for client in async_client_factory(member_user):
+            cursor = (await self._sync(client)).cursor
+            await authorization_service.assign_group_role(member_user.id, group_with_owner.id, None)
+            await db_session.commit()
+
+            delta = await self._sync(client, cursor)
+
+            assert delta.groups == []
+            assert [(d.entity, d.id) for d in delta.deleted] == [(ChangeEntity.GROUP, group_with_owner.id)]
+
+    async def test_sync_hides_changes_of_other_groups(
+        self,
+        async_client_factory: Callable[[User], AsyncIterator[AsyncClient]],
+        owner_user: User,
+        member_user: User,
+        period_in_group: Period,
+        category: Category,
+    ):
+        """Test changes in a group the user is not a member of are not synced."""
+        cursor = 0
+        async for client in async_client_factory(member_user):
+            cursor = (await self._sync(client)).cursor
+        async for client in async_client_factory(owner_user):
+            path = f"/api/v1/periods/{period_in_group.id}/transactions"
+            await client.post(path, json=self._deposit(owner_user, category, 100))
+
+        async for client in async_client_factory(member_user):
+            delta = await self._sync(client, cursor)
+
+            assert delta.transactions == []
+            assert delta.cursor == cursor
@@ -7,6 +7,7 @@ Key features:
 - Automatic schema setup/teardown
 - Test data factories
 - Test-specific environment variables (no external .env files)
+- `--sqlite-profile` to run the suite under the SQLite performance profile
 """
 
 import pytest
@@ -17,9 +18,19 @@ pytest_plugins = [
     "tests.fixtures.services",
     "tests.fixtures.database",
     "tests.fixtures.api",
+    "tests.fixtures.identity_providers",
 ]
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options."""
+    parser.addoption(
+        "--sqlite-profile",
+        action="store_true",
+        help="Serve the application's sessions through the SQLite performance profile (WAL, single writer)",
+    )
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Pytest hook called at test session start."""
     # Register custom markers
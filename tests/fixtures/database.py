@@ -2,13 +2,14 @@
 Database fixtures for testing.
 """
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.category_catalog import category_catalog
 from app.db import reset_engine, reset_serializable_engine
 from app.models import Base
 
@@ -19,13 +20,23 @@ def test_database_url(tmp_path: Path) -> str:
     Provide the database URL for the test database.
 
     This fixture centralizes the database URL construction to ensure consistency
-    across all test database engines. Both test_db_engine and test_serializable_db_engine
-    use the same database file for schema consistency.
+    across all test database engines.
     """
     db_path = tmp_path / "test.db"
     return f"sqlite+aiosqlite:///{db_path}"
 
 
+@pytest.fixture
+def sqlite_profile(request: pytest.FixtureRequest) -> bool:
+    """
+    Whether the application's sessions use the SQLite performance profile (pytest --sqlite-profile).
+
+    The application then builds its own engines for the test database, a single writer
+    and query-only readers, instead of sharing test_db_engine.
+    """
+    return bool(request.config.getoption("--sqlite-profile"))
+
+
 @pytest.fixture
 async def test_db_engine(test_database_url: str) -> AsyncIterator[AsyncEngine]:
     """
@@ -55,40 +66,39 @@ async def test_db_engine(test_database_url: str) -> AsyncIterator[AsyncEngine]:
 
 
 @pytest.fixture
-async def test_serializable_db_engine(test_database_url: str) -> AsyncIterator[AsyncEngine]:
+def test_serializable_db_engine(test_db_engine: AsyncEngine) -> AsyncEngine:
     """
-    Create a temporary file-based SQLite async database engine with SERIALIZABLE isolation level.
+    Provide the test database engine with SERIALIZABLE isolation level.
 
-    Uses the same database file as test_db_engine to ensure schema consistency.
+    Like the application's serializable engine, this is an execution-options view of
+    test_db_engine sharing its connection pool, so it needs no separate cleanup.
     This engine is used for testing critical financial operations that require highest isolation.
     """
-    # Create async SQLite engine with SERIALIZABLE isolation level
-    engine = create_async_engine(
-        test_database_url,
-        connect_args={"check_same_thread": False},
-        echo=False,  # Set to True for SQL debugging
-    ).execution_options(isolation_level="SERIALIZABLE")
-
-    # Note: Tables are already created by test_db_engine fixture
-    # Both engines share the same database file
-
-    yield engine
-
-    # Cleanup
-    await engine.dispose()
+    return test_db_engine.execution_options(isolation_level="SERIALIZABLE")
 
 
 @pytest.fixture(autouse=True)
-async def mock_database_engine(test_db_engine: AsyncEngine) -> AsyncIterator[None]:
+async def mock_database_engine(
+    test_db_engine: AsyncEngine, test_database_url: str, sqlite_profile: bool, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[None]:
     """
     Mock the regular database engine to use the test database.
 
     This fixture runs automatically for all tests and ensures regular operations
-    use test_db_engine instead of the production database.
+    use test_db_engine instead of the production database. With --sqlite-profile
+    the application's own engines and session factories are pointed at the test database.
     """
     # Reset any existing engine (async)
     await reset_engine()
 
+    if sqlite_profile:
+        monkeypatch.setenv("DIVVY_DATABASE_URL", test_database_url)
+        monkeypatch.setenv("DIVVY_SQLITE_PROFILE", "true")
+        monkeypatch.setattr("app.db.session._session_local", None)
+        yield
+        await reset_engine()
+        return
+
     # Create new async session factory with test engine
     test_session_local = async_sessionmaker(
         bind=test_db_engine,
@@ -113,19 +123,34 @@ async def mock_database_engine(test_db_engine: AsyncEngine) -> AsyncIterator[Non
     await reset_engine()
 
 
+@pytest.fixture(autouse=True)
+def reset_category_catalog() -> Iterator[None]:
+    """Empty the process-wide category catalog, each test starts from a fresh database."""
+    category_catalog.clear()
+    yield
+    category_catalog.clear()
+
+
 @pytest.fixture(autouse=True)
 async def mock_serializable_database_engine(
-    test_serializable_db_engine: AsyncEngine,
+    test_serializable_db_engine: AsyncEngine, sqlite_profile: bool, monkeypatch: pytest.MonkeyPatch
 ) -> AsyncIterator[None]:
     """
     Mock the serializable database engine to use the test database.
 
     This fixture runs automatically for all tests and ensures serializable operations
     use test_serializable_db_engine (with SERIALIZABLE isolation) instead of the production database.
+    With --sqlite-profile the application's SERIALIZABLE view of its writer is used instead.
     """
     # Reset any existing serializable engine (async)
     await reset_serializable_engine()
 
+    if sqlite_profile:
+        monkeypatch.setattr("app.db.session._serializable_session_local", None)
+        yield
+        await reset_serializable_engine()
+        return
+
     # Create serializable session factory with serializable engine
     test_serializable_session_local = async_sessionmaker(
         bind=test_serializable_db_engine,
@@ -225,6 +225,7 @@ def create_test_refresh_token(
     user_id: int = 1,
     device_info: str | None = "Test Device",
     is_revoked: bool = False,
+    expires_at: datetime | None = None,
     **kwargs: Any
 ) -> RefreshToken:
     """
@@ -235,12 +236,17 @@ def create_test_refresh_token(
         user_id: ID of the user this token belongs to
         device_info: Device information (optional)
         is_revoked: Whether the token is revoked
+        expires_at: Expiration time (defaults to 7 days from now)
         **kwargs: Additional RefreshToken model fields
 
     Returns:
         RefreshToken instance (not persisted to database)
     """
-    return RefreshToken(id=id, user_id=user_id, device_info=device_info, is_revoked=is_revoked, **kwargs)
+    if expires_at is None:
+        expires_at = datetime.now(UTC) + timedelta(days=7)
+    return RefreshToken(
+        id=id, user_id=user_id, device_info=device_info, is_revoked=is_revoked, expires_at=expires_at, **kwargs
+    )
 
 
 def create_test_settlement(
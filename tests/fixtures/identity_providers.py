@@ -0,0 +1,157 @@
+"""
+Stand-in OpenID Connect identity provider for testing provider HTTP integrations.
+
+The stand-in serves discovery, JWKS, token and userinfo endpoints from an in-process
+FastAPI app reached through `httpx.ASGITransport`, so provider code runs its real HTTP,
+caching and ID token verification paths without network access.
+"""
+
+import hashlib
+import secrets
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, Form, Header, HTTPException
+from jose import jwk, jwt
+from jose.utils import calculate_at_hash
+
+from app.core.identity_providers import IdentityProviderRegistry
+
+STAND_IN_CLIENT_ID = "stand-in-client-id"
+STAND_IN_BASE_URL = "https://idp.test"
+
+
+class StandInIdentityProvider:
+    """Minimal OIDC provider: issues RS256 ID tokens for pre-registered authorization codes."""
+
+    def __init__(self, issuer: str = STAND_IN_BASE_URL, token_issuer: str | None = None, audience: str | None = None):
+        """
+        Initialize the stand-in.
+
+        Args:
+            issuer: Issuer advertised in the discovery document
+            token_issuer: 'iss' placed in ID tokens (defaults to issuer)
+            audience: 'aud' placed in ID tokens (defaults to the stand-in client ID)
+        """
+        self.issuer = issuer
+        self.token_issuer = token_issuer or issuer
+        self.audience = audience or STAND_IN_CLIENT_ID
+        self.hits: Counter[str] = Counter()
+        self._codes: dict[str, dict[str, Any]] = {}
+        self._userinfo: dict[str, dict[str, Any]] = {}
+        self._access_tokens: dict[str, str] = {}
+        self.rotate_key()
+        self.app = self._build_app()
+
+    def rotate_key(self) -> None:
+        """Replace the signing key (and key ID), as a provider does during key rotation."""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.kid = secrets.token_hex(8)
+        self._private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+        public_pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self._public_jwk = {**jwk.construct(public_pem, "RS256").to_dict(), "kid": self.kid, "use": "sig"}
+
+    def add_user(self, code: str, userinfo: dict[str, Any] | None = None, **claims: Any) -> None:
+        """
+        Register an authorization code that will be exchanged for tokens carrying the given claims.
+
+        Args:
+            code: Authorization code
+            userinfo: Userinfo response for the code's access token (defaults to one built from the claims)
+            **claims: Claims placed in the ID token
+        """
+        self._codes[code] = claims
+        self._userinfo[code] = userinfo or {
+            "id": claims.get("sub") or claims.get("oid"),
+            "email": claims.get("email"),
+            "name": claims.get("name"),
+        }
+
+    @property
+    def transport(self) -> httpx.ASGITransport:
+        """Transport routing provider HTTP calls to the in-process app."""
+        return httpx.ASGITransport(app=self.app)
+
+    @property
+    def endpoints(self) -> dict[str, str]:
+        """Endpoint overrides to pass to an OIDC provider."""
+        return {
+            "discovery_endpoint": f"{STAND_IN_BASE_URL}/.well-known/openid-configuration",
+            "token_endpoint": f"{STAND_IN_BASE_URL}/token",
+            "userinfo_endpoint": f"{STAND_IN_BASE_URL}/userinfo",
+        }
+
+    def _issue_id_token(self, claims: dict[str, Any], access_token: str) -> str:
+        payload = {
+            "iss": self.token_issuer,
+            "aud": self.audience,
+            "iat": 1_700_000_000,
+            "exp": 4_000_000_000,
+            "at_hash": calculate_at_hash(access_token, hashlib.sha256),
+            **claims,
+        }
+        return jwt.encode(payload, self._private_pem, algorithm="RS256", headers={"kid": self.kid})
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/.well-known/openid-configuration")
+        async def discovery() -> dict[str, Any]:
+            self.hits["discovery"] += 1
+            return {
+                "issuer": self.issuer,
+                "token_endpoint": f"{STAND_IN_BASE_URL}/token",
+                "userinfo_endpoint": f"{STAND_IN_BASE_URL}/userinfo",
+                "jwks_uri": f"{STAND_IN_BASE_URL}/jwks",
+                "id_token_signing_alg_values_supported": ["RS256"],
+            }
+
+        @app.get("/jwks")
+        async def jwks() -> dict[str, Any]:
+            self.hits["jwks"] += 1
+            return {"keys": [self._public_jwk]}
+
+        @app.post("/token")
+        async def token(code: str = Form(...)) -> dict[str, Any]:
+            self.hits["token"] += 1
+            claims = self._codes.get(code)
+            if claims is None:
+                raise HTTPException(status_code=400, detail="invalid_grant")
+            access_token = secrets.token_urlsafe(24)
+            self._access_tokens[access_token] = code
+            return {
+                "access_token": access_token,
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "id_token": self._issue_id_token(claims, access_token),
+            }
+
+        @app.get("/userinfo")
+        async def userinfo(authorization: str = Header(...)) -> dict[str, Any]:
+            self.hits["userinfo"] += 1
+            code = self._access_tokens.get(authorization.removeprefix("Bearer "))
+            if code is None:
+                raise HTTPException(status_code=401, detail="invalid_token")
+            return self._userinfo[code]
+
+        return app
+
+
+@pytest.fixture
+def stand_in_idp(monkeypatch: pytest.MonkeyPatch) -> Iterator[StandInIdentityProvider]:
+    """Stand-in identity provider, with provider client credentials configured to match it."""
+    for prefix in ("GOOGLE", "MICROSOFT"):
+        monkeypatch.setenv(f"{prefix}_CLIENT_ID", STAND_IN_CLIENT_ID)
+        monkeypatch.setenv(f"{prefix}_CLIENT_SECRET", "stand-in-client-secret")
+    IdentityProviderRegistry.clear()
+    yield StandInIdentityProvider()
+    IdentityProviderRegistry.clear()
@@ -99,7 +99,6 @@ def settlement_service(
     db_session: AsyncSession,
     transaction_service: TransactionService,
     period_service: PeriodService,
-    user_service: UserService,
 ) -> SettlementService:
     """Create a SettlementService instance for testing."""
     from app.repositories import SettlementRepository
@@ -108,6 +107,5 @@ def settlement_service(
     return SettlementService(
         period_service=period_service,
         transaction_service=transaction_service,
-        user_service=user_service,
         settlement_repository=settlement_repository,
     )
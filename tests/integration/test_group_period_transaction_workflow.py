@@ -28,7 +28,6 @@ from app.services import (
     PeriodService,
     SettlementService,
     TransactionService,
-    UserService,
 )
 
 
@@ -51,11 +50,10 @@ class TestGroupPeriodTransactionWorkflow:
         authorization_service = AuthorizationService(db_session)
         period_service = PeriodService(db_session)
         transaction_service = TransactionService(db_session)
-        user_service = UserService(db_session)
         from app.repositories import SettlementRepository
 
         settlement_repository = SettlementRepository(db_session)
-        settlement_service = SettlementService(period_service, transaction_service, user_service, settlement_repository)
+        settlement_service = SettlementService(period_service, transaction_service, settlement_repository)
         group_service = GroupService(db_session, authorization_service, period_service)
 
         # Step 1: Create users
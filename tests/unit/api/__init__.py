@@ -0,0 +1,3 @@
+"""
+API layer unit tests.
+"""
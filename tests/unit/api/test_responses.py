@@ -0,0 +1,65 @@
+"""
+Unit tests for the fast JSON response classes.
+"""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from app.api.responses import ModelResponse, ORJSONResponse, dump_models
+
+
+class _Item(BaseModel):
+    id: int
+    name: str | None
+    created_at: datetime
+
+
+ITEMS = [
+    _Item(id=1, name="Rent", created_at=datetime(2026, 1, 1, tzinfo=UTC)),
+    _Item(id=2, name=None, created_at=datetime(2026, 1, 2, 12, 30, tzinfo=UTC)),
+]
+
+
+@pytest.mark.unit
+class TestModelResponse:
+    """Test suite for ModelResponse and dump_models."""
+
+    def test_matches_response_model_serialization(self):
+        """Test the body is byte-identical to FastAPI's response_model serialization."""
+        adapter = TypeAdapter(list[_Item])
+
+        assert ModelResponse(ITEMS).body == adapter.dump_json(adapter.validate_python(ITEMS))
+
+    def test_single_model_and_empty_list(self):
+        """Test a single model renders as an object and an empty sequence as an empty array."""
+        assert json.loads(dump_models(ITEMS[0])) == {"id": 1, "name": "Rent", "created_at": "2026-01-01T00:00:00Z"}
+        assert dump_models([]) == b"[]"
+
+    def test_include_restricts_fields(self):
+        """Test include keeps only the given fields of every model."""
+        assert json.loads(bytes(ModelResponse(ITEMS, include={"id", "name"}).body)) == [
+            {"id": 1, "name": "Rent"},
+            {"id": 2, "name": None},
+        ]
+        assert json.loads(dump_models(ITEMS[0], include={"id"})) == {"id": 1}
+
+    def test_status_and_media_type(self):
+        """Test the response keeps its status code and is served as JSON."""
+        response = ModelResponse(ITEMS[0], status_code=201)
+
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+
+
+@pytest.mark.unit
+class TestORJSONResponse:
+    """Test suite for ORJSONResponse."""
+
+    def test_renders_plain_content(self):
+        """Test plain Python content renders to the same JSON as the standard encoder."""
+        content = {"status": "healthy", "pools": {"primary": {"size": 5}}, "ratio": 0.5, "names": ["a", "é"]}
+
+        assert json.loads(bytes(ORJSONResponse(content).body)) == content
@@ -0,0 +1,3 @@
+"""
+Core (security, configuration) unit tests.
+"""
@@ -0,0 +1,95 @@
+"""
+Unit tests for the process-wide category catalog.
+"""
+
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.category_catalog import CATALOG_LANGUAGES, CategoryCatalog, has_pending_updates, update_on_commit
+from app.core.i18n import translate_category
+
+
+@dataclass
+class _Category:
+    id: int
+    name: str
+    is_default: bool = False
+
+
+@pytest.mark.unit
+class TestCategoryCatalog:
+    """Test suite for CategoryCatalog."""
+
+    @pytest.fixture
+    def catalog(self) -> CategoryCatalog:
+        catalog = CategoryCatalog()
+        catalog.load([_Category(2, "Rent", is_default=True), _Category(1, "Groceries", is_default=True)])
+        return catalog
+
+    def test_load(self, catalog: CategoryCatalog):
+        """Test a loaded catalog serves categories by ID and name, ordered by ID."""
+        assert catalog.loaded
+        assert [c.id for c in catalog.all()] == [1, 2]
+        assert catalog.get_name(2) == "Rent"
+        assert catalog.get_by_name("Groceries") == catalog.get(1)
+        assert catalog.get(3) is None
+
+    def test_translated_names(self, catalog: CategoryCatalog):
+        """Test every entry carries its name in each supported language."""
+        category = catalog.get(1)
+
+        assert category is not None
+        assert set(category.translated_names) == set(CATALOG_LANGUAGES)
+        assert category.translated_name("zh_CN") == translate_category("Groceries", "zh_CN")
+        assert category.translated_name("xx_XX") == "Groceries"
+
+    def test_put_and_remove(self, catalog: CategoryCatalog):
+        """Test single categories can be added, replaced and removed."""
+        catalog.put(_Category(3, "Other"))
+        catalog.put(_Category(2, "Housing"))
+        catalog.remove(1)
+
+        assert [(c.id, c.name) for c in catalog.all()] == [(2, "Housing"), (3, "Other")]
+
+    def test_clear(self, catalog: CategoryCatalog):
+        """Test clearing empties the catalog and marks it as not loaded."""
+        catalog.clear()
+
+        assert not catalog.loaded
+        assert catalog.all() == []
+
+
+@pytest.mark.unit
+class TestUpdateOnCommit:
+    """Test suite for catalog updates tied to a session's commit."""
+
+    @pytest.fixture
+    def catalog(self) -> CategoryCatalog:
+        return CategoryCatalog()
+
+    async def test_applied_on_commit(self, db_session: AsyncSession, catalog: CategoryCatalog):
+        """Test a pending update is applied once the session commits."""
+        await db_session.connection()
+        update_on_commit(db_session, lambda _: catalog.put(_Category(1, "Groceries")))
+
+        assert has_pending_updates(db_session)
+        assert catalog.get(1) is None
+
+        await db_session.commit()
+
+        assert not has_pending_updates(db_session)
+        assert catalog.get_name(1) == "Groceries"
+
+    async def test_dropped_on_rollback(self, db_session: AsyncSession, catalog: CategoryCatalog):
+        """Test a pending update is discarded when the session rolls back."""
+        await db_session.connection()
+        update_on_commit(db_session, lambda _: catalog.put(_Category(1, "Groceries")))
+
+        await db_session.rollback()
+        await db_session.connection()
+        await db_session.commit()
+
+        assert not has_pending_updates(db_session)
+        assert catalog.get(1) is None
@@ -0,0 +1,122 @@
+"""
+Unit tests for the batching DataLoader and the request-scoped entity loaders.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dataloader import DataLoader
+from app.db import track_queries
+from app.models import User
+from app.services import RequestLoaders
+
+
+class _Source:
+    """Batch function recording the batches it was called with."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[list[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys: Collection[int]) -> dict[int, str]:
+        self.batches.append(sorted(keys))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("source unavailable")
+        return {key: f"value-{key}" for key in keys if key < 100}
+
+
+@pytest.mark.unit
+class TestDataLoader:
+    """Test suite for DataLoader."""
+
+    async def test_batches_keys_loaded_in_one_tick(self):
+        """Test keys requested concurrently are resolved by one batch call."""
+        source = _Source()
+        loader = DataLoader(source)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+        assert results == ["value-1", "value-2", "value-1"]
+        assert source.batches == [[1, 2]]
+
+    async def test_memoizes_results(self):
+        """Test a loaded key, found or not, is not requested again."""
+        source = _Source()
+        loader = DataLoader(source)
+
+        assert await loader.load_many([1, 100]) == ["value-1", None]
+        assert await loader.load_many([100, 2, 1]) == [None, "value-2", "value-1"]
+
+        assert source.batches == [[1, 100], [2]]
+
+    async def test_prime_and_clear(self):
+        """Test primed values are served without a batch and cleared keys are loaded again."""
+        source = _Source()
+        loader = DataLoader(source)
+        loader.prime(1, "primed")
+
+        assert await loader.load(1) == "primed"
+        assert source.batches == []
+
+        loader.clear(1)
+        assert await loader.load(1) == "value-1"
+        assert source.batches == [[1]]
+
+    async def test_failed_batch_is_not_memoized(self):
+        """Test every waiter sees the batch error and a later load retries."""
+        source = _Source(fail=True)
+        loader = DataLoader(source)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        source.fail = False
+        assert await loader.load(1) == "value-1"
+        assert source.batches == [[1, 2], [1]]
+
+    async def test_shared_lock_serializes_batches(self):
+        """Test batches of loaders sharing a lock never run at the same time."""
+        running = 0
+        overlapped = False
+
+        def batch(prefix: str) -> Callable[[Collection[int]], Awaitable[dict[int, str]]]:
+            async def load(keys: Collection[int]) -> dict[int, str]:
+                nonlocal running, overlapped
+                running += 1
+                overlapped = overlapped or running > 1
+                await asyncio.sleep(0.01)
+                running -= 1
+                return {key: f"{prefix}-{key}" for key in keys}
+
+            return load
+
+        lock = asyncio.Lock()
+        users, periods = DataLoader(batch("user"), lock), DataLoader(batch("period"), lock)
+
+        results = await asyncio.gather(users.load(1), periods.load(1))
+
+        assert results == ["user-1", "period-1"]
+        assert not overlapped
+
+
+@pytest.mark.unit
+class TestRequestLoaders:
+    """Test suite for RequestLoaders."""
+
+    async def test_users_loaded_with_one_query(
+        self, db_session: AsyncSession, user_factory: Callable[..., Awaitable[User]]
+    ):
+        """Test users requested together are fetched with a single IN query."""
+        users = [await user_factory(email=f"user{i}@example.com", name=f"User {i}") for i in range(3)]
+        loaders = RequestLoaders(db_session)
+
+        with track_queries(repeat_action="off") as stats:
+            loaded = await loaders.users.load_many([*(user.id for user in users), 99999])
+            await loaders.users.load(users[0].id)
+
+        assert [user.name if user else None for user in loaded] == ["User 0", "User 1", "User 2", None]
+        assert stats.count == 1
@@ -0,0 +1,81 @@
+"""
+Unit tests for the process-wide event hub.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.events import EventHub, event_hub, publish_on_commit
+
+
+async def _drain[EventT](subscription: AsyncIterator[EventT], count: int) -> list[EventT]:
+    return [await anext(subscription) for _ in range(count)]
+
+
+@pytest.mark.unit
+class TestEventHub:
+    """Test suite for EventHub."""
+
+    async def test_publish_reaches_channel_subscribers(self):
+        """Test each subscriber of a channel gets its events, in order, and no other channel's."""
+        hub = EventHub[str]()
+        with hub.subscribe("a") as first, hub.subscribe("a") as second, hub.subscribe("b") as other:
+            hub.publish("a", "one")
+            hub.publish("a", "two")
+            hub.publish("b", "three")
+
+            assert await _drain(first, 2) == ["one", "two"]
+            assert await _drain(second, 2) == ["one", "two"]
+            assert await _drain(other, 1) == ["three"]
+
+    async def test_subscription_ends_with_block(self):
+        """Test leaving the block unsubscribes, and publishing without subscribers is a no-op."""
+        hub = EventHub[str]()
+        with hub.subscribe("a"):
+            assert hub.subscriber_count("a") == 1
+
+        assert hub.subscriber_count("a") == 0
+        hub.publish("a", "lost")
+
+    async def test_lagging_subscriber_is_dropped(self):
+        """Test a subscriber with a full queue is dropped and stops without the queued events."""
+        hub = EventHub[int](max_pending=2)
+        with hub.subscribe("a") as slow, hub.subscribe("a") as fast:
+            hub.publish("a", 1)
+            assert await _drain(fast, 1) == [1]
+            hub.publish("a", 2)
+            hub.publish("a", 3)
+
+            assert slow.lagged
+            assert not fast.lagged
+            assert hub.subscriber_count("a") == 1
+            assert [event async for event in slow] == []
+            assert await _drain(fast, 2) == [2, 3]
+
+
+@pytest.mark.unit
+class TestPublishOnCommit:
+    """Test suite for publishing events when a session commits."""
+
+    async def test_published_on_commit(self, db_session: AsyncSession):
+        """Test events wait for the commit."""
+        with event_hub.subscribe("test") as subscription:
+            publish_on_commit(db_session, "test", "committed")
+            event_hub.publish("test", "published")
+            await db_session.commit()
+
+            assert await _drain(subscription, 2) == ["published", "committed"]
+
+    async def test_dropped_on_rollback(self, db_session: AsyncSession):
+        """Test events of a rolled back session are never published."""
+        with event_hub.subscribe("test") as subscription:
+            await db_session.execute(select(1))
+            publish_on_commit(db_session, "test", "rolled back")
+            await db_session.rollback()
+            publish_on_commit(db_session, "test", "committed")
+            await db_session.commit()
+
+            assert await _drain(subscription, 1) == ["committed"]
@@ -0,0 +1,86 @@
+"""
+Unit tests for the fake identity provider used to load test the OAuth callback path.
+"""
+
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.identity_providers import FakeIdentityProvider, IdentityProviderRegistry, IdTokenIdentityProvider
+from app.exceptions import UnauthorizedError
+from app.models import IdentityProviderName
+from app.repositories import UserIdentityRepository
+from app.schemas import TokenResponse
+from app.services import IdentityProviderService
+
+
+@pytest.mark.unit
+class TestFakeIdentityProvider:
+    """Test suite for FakeIdentityProvider."""
+
+    @pytest.fixture
+    async def fake_provider(self) -> AsyncIterator[FakeIdentityProvider]:
+        IdentityProviderRegistry.clear()
+        provider = FakeIdentityProvider(name=IdentityProviderName.MICROSOFT)
+        yield provider
+        await provider.aclose()
+        IdentityProviderRegistry.clear()
+
+    def test_impersonates_provider(self, fake_provider: FakeIdentityProvider):
+        """Test the fake provider impersonates the configured name and goes through the userinfo path."""
+        assert not isinstance(fake_provider, IdTokenIdentityProvider)
+        assert fake_provider.name == IdentityProviderName.MICROSOFT.value
+        assert "state=abc" in fake_provider.get_authorization_url(state="abc")
+
+    async def test_code_maps_to_stable_user(self, fake_provider: FakeIdentityProvider):
+        """Test the same code always resolves to the same external user."""
+        first = await fake_provider.exchange_code_for_tokens("alice")
+        second = await fake_provider.exchange_code_for_tokens("alice")
+
+        first_info = await fake_provider.get_user_info(first.access_token)
+        second_info = await fake_provider.get_user_info(second.access_token)
+
+        assert first.id_token is None
+        assert first_info.external_id == second_info.external_id == "fake-alice"
+        assert first_info.email == "alice@example.com"
+
+    async def test_invalid_access_token_rejected(self, fake_provider: FakeIdentityProvider):
+        """Test the fake userinfo endpoint rejects tokens it did not issue."""
+        with pytest.raises(UnauthorizedError):
+            await fake_provider.get_user_info("not-a-fake-token")
+
+    async def test_latency_applied(self):
+        """Test each fake endpoint waits for the configured latency."""
+        provider = FakeIdentityProvider(latency=0.05)
+        start = time.perf_counter()
+        tokens = await provider.exchange_code_for_tokens("slow")
+        await provider.get_user_info(tokens.access_token)
+        elapsed = time.perf_counter() - start
+        await provider.aclose()
+
+        assert elapsed >= 0.1
+
+    async def test_oauth_callback_signs_up_then_logs_in(
+        self,
+        fake_provider: FakeIdentityProvider,
+        identity_provider_service: IdentityProviderService,
+        db_session: AsyncSession,
+    ):
+        """Test the full OAuth callback creates a user and identity, then logs the same user in again."""
+        IdentityProviderRegistry.register(fake_provider)
+
+        first = await identity_provider_service.handle_oauth_callback(
+            provider_name=IdentityProviderName.MICROSOFT, code="bob"
+        )
+        second = await identity_provider_service.handle_oauth_callback(
+            provider_name=IdentityProviderName.MICROSOFT, code="bob"
+        )
+
+        assert isinstance(first, TokenResponse)
+        assert isinstance(second, TokenResponse)
+        identity = await UserIdentityRepository(db_session).get_identity_by_provider_and_external_id(
+            IdentityProviderName.MICROSOFT.value, "fake-bob"
+        )
+        assert identity is not None
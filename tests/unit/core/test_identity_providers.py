@@ -0,0 +1,176 @@
+"""
+Unit tests for the OIDC identity providers against a stand-in identity provider.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.identity_providers import GoogleProvider, IdentityProviderRegistry, MicrosoftProvider
+from app.exceptions import UnauthorizedError
+from app.models import IdentityProviderName
+from app.repositories import UserIdentityRepository
+from app.schemas import TokenResponse
+from app.services import IdentityProviderService
+from tests.fixtures.identity_providers import StandInIdentityProvider
+
+
+@pytest.mark.unit
+class TestOIDCProviders:
+    """Test suite for pooled HTTP, discovery/JWKS caching and local ID token verification."""
+
+    @pytest.fixture
+    async def google_provider(self, stand_in_idp: StandInIdentityProvider) -> AsyncIterator[GoogleProvider]:
+        provider = GoogleProvider(transport=stand_in_idp.transport, **stand_in_idp.endpoints)
+        yield provider
+        await provider.aclose()
+
+    async def test_id_token_replaces_userinfo_call(
+        self, google_provider: GoogleProvider, stand_in_idp: StandInIdentityProvider
+    ):
+        """Test user info is read from the verified ID token without calling the userinfo endpoint."""
+        stand_in_idp.add_user("code-1", sub="google-123", email="user@example.com", name="Test User")
+
+        tokens = await google_provider.exchange_code_for_tokens("code-1")
+        assert tokens.id_token is not None
+        user_info = await google_provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+
+        assert user_info.external_id == "google-123"
+        assert user_info.email == "user@example.com"
+        assert user_info.name == "Test User"
+        assert stand_in_idp.hits["userinfo"] == 0
+
+    async def test_discovery_and_jwks_are_cached(
+        self, google_provider: GoogleProvider, stand_in_idp: StandInIdentityProvider
+    ):
+        """Test discovery and JWKS are fetched once and the HTTP client is reused across logins."""
+        client = google_provider.http_client
+        for i in range(3):
+            stand_in_idp.add_user(f"code-{i}", sub=f"sub-{i}", email=f"user{i}@example.com")
+            tokens = await google_provider.exchange_code_for_tokens(f"code-{i}")
+            assert tokens.id_token is not None
+            await google_provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+
+        assert stand_in_idp.hits["discovery"] == 1
+        assert stand_in_idp.hits["jwks"] == 1
+        assert stand_in_idp.hits["token"] == 3
+        assert google_provider.http_client is client
+
+    async def test_key_rotation_refreshes_jwks(
+        self, google_provider: GoogleProvider, stand_in_idp: StandInIdentityProvider
+    ):
+        """Test an ID token signed with an unknown key ID triggers a JWKS refresh."""
+        stand_in_idp.add_user("code-1", sub="sub-1", email="user@example.com")
+        tokens = await google_provider.exchange_code_for_tokens("code-1")
+        assert tokens.id_token is not None
+        await google_provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+
+        stand_in_idp.rotate_key()
+        tokens = await google_provider.exchange_code_for_tokens("code-1")
+        assert tokens.id_token is not None
+        user_info = await google_provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+
+        assert user_info.external_id == "sub-1"
+        assert stand_in_idp.hits["jwks"] == 2
+
+    async def test_wrong_audience_rejected(self, stand_in_idp: StandInIdentityProvider):
+        """Test an ID token issued for another client is rejected."""
+        other_client_idp = StandInIdentityProvider(audience="another-client")
+        provider = GoogleProvider(transport=other_client_idp.transport, **other_client_idp.endpoints)
+        other_client_idp.add_user("code-1", sub="sub-1", email="user@example.com")
+
+        tokens = await provider.exchange_code_for_tokens("code-1")
+        assert tokens.id_token is not None
+        with pytest.raises(UnauthorizedError):
+            await provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+        await provider.aclose()
+
+    async def test_mismatched_access_token_rejected(
+        self, google_provider: GoogleProvider, stand_in_idp: StandInIdentityProvider
+    ):
+        """Test the ID token's at_hash must match the access token issued with it."""
+        stand_in_idp.add_user("code-1", sub="sub-1", email="user@example.com")
+        tokens = await google_provider.exchange_code_for_tokens("code-1")
+        assert tokens.id_token is not None
+
+        with pytest.raises(UnauthorizedError):
+            await google_provider.get_user_info_from_id_token(tokens.id_token, "some-other-access-token")
+
+    async def test_invalid_code_raises_unauthorized(self, google_provider: GoogleProvider):
+        """Test a failed token exchange is reported as UnauthorizedError."""
+        with pytest.raises(UnauthorizedError, match="Failed to exchange authorization code with Google"):
+            await google_provider.exchange_code_for_tokens("unknown-code")
+
+    async def test_microsoft_multi_tenant_issuer(self, stand_in_idp: StandInIdentityProvider):
+        """Test the {tenantid} issuer placeholder of multi-tenant metadata is resolved from the 'tid' claim."""
+        tenant_idp = StandInIdentityProvider(
+            issuer="https://idp.test/{tenantid}/v2.0", token_issuer="https://idp.test/tenant-1/v2.0"
+        )
+        provider = MicrosoftProvider(transport=tenant_idp.transport, **tenant_idp.endpoints)
+        tenant_idp.add_user("code-1", oid="ms-oid-1", tid="tenant-1", preferred_username="user@contoso.com")
+
+        tokens = await provider.exchange_code_for_tokens("code-1")
+        assert tokens.id_token is not None
+        user_info = await provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+
+        assert user_info.external_id == "ms-oid-1"
+        assert user_info.email == "user@contoso.com"
+        assert tenant_idp.hits["userinfo"] == 0
+        await provider.aclose()
+
+    async def test_microsoft_personal_account_uses_graph_id(self, stand_in_idp: StandInIdentityProvider):
+        """Test a personal account keeps its Microsoft Graph ID as external ID, which differs from 'oid'."""
+        consumer_issuer = f"https://idp.test/{MicrosoftProvider.CONSUMER_TENANT_ID}/v2.0"
+        consumer_idp = StandInIdentityProvider(issuer="https://idp.test/{tenantid}/v2.0", token_issuer=consumer_issuer)
+        provider = MicrosoftProvider(transport=consumer_idp.transport, **consumer_idp.endpoints)
+        consumer_idp.add_user(
+            "code-1",
+            userinfo={"id": "a1b2c3d4e5f60718", "mail": "user@outlook.com", "displayName": "Test User"},
+            oid="00000000-0000-0000-a1b2-c3d4e5f60718",
+            tid=MicrosoftProvider.CONSUMER_TENANT_ID,
+            preferred_username="user@outlook.com",
+        )
+
+        tokens = await provider.exchange_code_for_tokens("code-1")
+        assert tokens.id_token is not None
+        user_info = await provider.get_user_info_from_id_token(tokens.id_token, tokens.access_token)
+
+        assert user_info.external_id == "a1b2c3d4e5f60718"
+        assert user_info.email == "user@outlook.com"
+        assert consumer_idp.hits["userinfo"] == 1
+        await provider.aclose()
+
+    async def test_registry_aclose_closes_clients(
+        self, google_provider: GoogleProvider, stand_in_idp: StandInIdentityProvider
+    ):
+        """Test closing the registry closes pooled clients, which reopen lazily on next use."""
+        IdentityProviderRegistry.register(google_provider)
+        client = google_provider.http_client
+
+        await IdentityProviderRegistry.aclose()
+
+        assert client.is_closed
+        assert google_provider.http_client is not client
+
+    async def test_oauth_callback_skips_userinfo(
+        self,
+        google_provider: GoogleProvider,
+        stand_in_idp: StandInIdentityProvider,
+        identity_provider_service: IdentityProviderService,
+        db_session: AsyncSession,
+    ):
+        """Test the full OAuth callback signs up a new user from the ID token alone."""
+        IdentityProviderRegistry.register(google_provider)
+        stand_in_idp.add_user("code-1", sub="google-new", email="new@example.com", name="New User")
+
+        result = await identity_provider_service.handle_oauth_callback(
+            provider_name=IdentityProviderName.GOOGLE, code="code-1"
+        )
+
+        assert isinstance(result, TokenResponse)
+        assert stand_in_idp.hits["userinfo"] == 0
+        identity = await UserIdentityRepository(db_session).get_identity_by_provider_and_external_id(
+            IdentityProviderName.GOOGLE.value, "google-new"
+        )
+        assert identity is not None
@@ -0,0 +1,100 @@
+"""
+Unit tests for access token validation and the verified claims cache.
+"""
+
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+
+import pytest
+
+from app.core.security import (
+    clear_token_caches,
+    create_access_token,
+    get_cached_access_token_claims,
+    validate_access_token,
+)
+from app.core.security.claims_cache import ClaimsCache
+from app.exceptions import InvalidAccessTokenError
+
+
+@pytest.mark.unit
+class TestAccessTokenClaimsCache:
+    """Test suite for cached access token validation."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self) -> Iterator[None]:
+        clear_token_caches()
+        yield
+        clear_token_caches()
+
+    def test_validated_token_is_cached(self):
+        """Test a successfully validated token is served from the cache afterwards."""
+        token, _ = create_access_token(data={"sub": "1", "email": "user@example.com"})
+        assert get_cached_access_token_claims(token) is None
+
+        claims = validate_access_token(token)
+
+        assert get_cached_access_token_claims(token) == claims
+        assert validate_access_token(token) == claims
+
+    def test_cached_claims_are_copies(self):
+        """Test callers mutating returned claims do not corrupt the cache."""
+        token, _ = create_access_token(data={"sub": "1"})
+        validate_access_token(token)
+
+        cached = get_cached_access_token_claims(token)
+        assert cached is not None
+        cached["sub"] = "2"
+
+        assert validate_access_token(token)["sub"] == "1"
+
+    def test_custom_options_bypass_cache(self):
+        """Test validation with non-default options neither reads nor fills the cache."""
+        token, _ = create_access_token(data={"sub": "1"})
+
+        validate_access_token(token, options={"leeway": 10})
+
+        assert get_cached_access_token_claims(token) is None
+
+    def test_invalid_token_is_not_cached(self):
+        """Test a token failing verification is not cached."""
+        token, _ = create_access_token(data={"sub": "1"}, secret_key="x" * 32)
+
+        with pytest.raises(InvalidAccessTokenError):
+            validate_access_token(token)
+
+        assert get_cached_access_token_claims(token) is None
+
+    def test_expired_token_is_not_served(self):
+        """Test an entry is dropped once the token's exp has passed."""
+        token, _ = create_access_token(data={"sub": "1"}, expires_delta=timedelta(seconds=-1))
+        cache = ClaimsCache(max_size=10)
+
+        cache.put(token, {"sub": "1", "exp": time.time() - 1})
+
+        assert cache.get(token) is None
+        assert len(cache) == 0
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache stays within its size bound, evicting the least recently used entry."""
+        cache = ClaimsCache(max_size=2)
+        exp = time.time() + 60
+
+        cache.put("a", {"exp": exp})
+        cache.put("b", {"exp": exp})
+        assert cache.get("a") is not None  # "a" becomes most recently used
+        cache.put("c", {"exp": exp})
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_zero_size_disables_cache(self):
+        """Test a cache of size 0 stores nothing."""
+        cache = ClaimsCache(max_size=0)
+
+        cache.put("a", {"exp": time.time() + 60})
+
+        assert cache.get("a") is None
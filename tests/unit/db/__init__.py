@@ -0,0 +1,3 @@
+"""
+Database engine and connection pool unit tests.
+"""
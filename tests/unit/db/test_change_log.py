@@ -0,0 +1,90 @@
+"""
+Unit tests for the change log writer lock.
+"""
+
+from collections.abc import Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import QueryStats, track_queries
+from app.models import ChangeEntity, ChangeLogWriterLock, Group, Period, User
+from app.repositories import ChangeLogRepository, PeriodRepository
+from tests.fixtures.factories import create_test_refresh_token
+
+
+def _lock_statements(stats: QueryStats) -> int:
+    return sum(count for statement, count in stats.shapes.items() if "change_log_writer_lock" in statement)
+
+
+@pytest.mark.unit
+class TestChangeLogWriterLock:
+    """Test suite for the lock serializing change log writers."""
+
+    @pytest.fixture(autouse=True)
+    async def postgresql_dialect(self, monkeypatch: pytest.MonkeyPatch, db_session: AsyncSession) -> None:
+        db_session.add(ChangeLogWriterLock(id=1))
+        await db_session.commit()
+        # SQLite skips the lock, it already admits a single writer; behave like PostgreSQL
+        monkeypatch.setattr((await db_session.connection()).dialect, "name", "postgresql")
+
+    @pytest.fixture
+    def change_log_repository(self, db_session: AsyncSession) -> ChangeLogRepository:
+        return ChangeLogRepository(db_session)
+
+    async def test_locked_before_first_logged_write(
+        self,
+        db_session: AsyncSession,
+        change_log_repository: ChangeLogRepository,
+        group_factory: Callable[..., Awaitable[Group]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test the lock is taken before the rows a writer changes, not at its first entry."""
+        group = await group_factory(name="Group")
+        period = await period_factory(group_id=group.id, name="Period")
+        await db_session.commit()
+
+        with track_queries(repeat_action="off") as stats:
+            await PeriodRepository(db_session).bump_version(period.id)
+            await change_log_repository.record(ChangeEntity.PERIOD, period.id, group.id)
+        statements = list(stats.shapes)
+
+        assert _lock_statements(stats) == 1
+        assert "change_log_writer_lock" in statements[0]
+        assert statements[1].startswith("UPDATE periods")
+
+    async def test_unlogged_writes_do_not_lock(
+        self, db_session: AsyncSession, user_factory: Callable[..., Awaitable[User]]
+    ):
+        """Test writes to tables the change log does not describe leave writers unserialized."""
+        user = await user_factory(email="user@example.com", name="User")
+        await db_session.commit()
+
+        with track_queries(repeat_action="off") as stats:
+            db_session.add(create_test_refresh_token(user_id=user.id))
+            await db_session.flush()
+
+        assert _lock_statements(stats) == 0
+
+    async def test_locked_once_per_transaction(
+        self, db_session: AsyncSession, change_log_repository: ChangeLogRepository
+    ):
+        """Test writers lock the writer row once per transaction, and again after a savepoint rollback."""
+        with track_queries(repeat_action="off") as stats:
+            await change_log_repository.record(ChangeEntity.CATEGORY, 1, None)
+            await change_log_repository.record(ChangeEntity.CATEGORY, 2, None)
+            savepoint = await db_session.begin_nested()
+            await change_log_repository.record(ChangeEntity.CATEGORY, 3, None)
+            await savepoint.commit()
+        assert _lock_statements(stats) == 1
+
+        await db_session.commit()
+        with track_queries(repeat_action="off") as stats:
+            savepoint = await db_session.begin_nested()
+            await change_log_repository.record(ChangeEntity.CATEGORY, 4, None)
+            await savepoint.rollback()
+            await change_log_repository.record(ChangeEntity.CATEGORY, 5, None)
+            await db_session.commit()
+            await change_log_repository.record(ChangeEntity.CATEGORY, 6, None)
+        # In the savepoint, again once it rolled back, and in the next transaction
+        assert _lock_statements(stats) == 3
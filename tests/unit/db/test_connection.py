@@ -0,0 +1,129 @@
+"""
+Unit tests for engine creation, pool configuration and pool metrics.
+"""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db import connection
+from app.db.connection import create_engine_from_url
+from app.db.pool import InstrumentedAsyncQueuePool, get_pool_metrics
+
+
+@pytest.mark.unit
+class TestEnginePool:
+    """Test suite for the configurable, instrumented connection pool."""
+
+    @pytest.fixture
+    async def pooled_engine(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[AsyncEngine]:
+        monkeypatch.setenv("DIVVY_SQLITE_PROFILE", "false")
+        monkeypatch.setenv("DIVVY_DB_POOL_SIZE", "1")
+        monkeypatch.setenv("DIVVY_DB_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("DIVVY_DB_POOL_TIMEOUT_SECONDS", "0.1")
+        monkeypatch.setenv("DIVVY_DB_POOL_RECYCLE_SECONDS", "600")
+        monkeypatch.setenv("DIVVY_DB_POOL_LIVENESS", "recycle")
+        engine = create_engine_from_url(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+        yield engine
+        await engine.dispose()
+
+    def test_pool_configured_from_environment(self, pooled_engine: AsyncEngine):
+        """Test pool size, overflow, timeout, recycle and liveness come from app.config."""
+        metrics = get_pool_metrics(pooled_engine)
+
+        assert metrics["pool"] == "InstrumentedAsyncQueuePool"
+        assert metrics["size"] == 1
+        assert metrics["max_overflow"] == 0
+        assert metrics["timeout_seconds"] == 0.1
+        assert metrics["recycle_seconds"] == 600
+        assert metrics["pre_ping"] is False
+
+    async def test_metrics_track_checkouts(self, pooled_engine: AsyncEngine):
+        """Test live and cumulative checkout metrics."""
+        async with pooled_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            metrics = get_pool_metrics(pooled_engine)
+            assert metrics["checked_out"] == 1
+
+        metrics = get_pool_metrics(pooled_engine)
+        assert metrics["pool"] == "InstrumentedAsyncQueuePool"
+        assert metrics["checked_out"] == 0
+        assert metrics["checked_in"] == 1
+        assert metrics["checkouts"] == 1
+        assert metrics["timeouts"] == 0
+
+    async def test_exhausted_pool_counts_timeouts(self, pooled_engine: AsyncEngine):
+        """Test a checkout that times out on an exhausted pool is counted."""
+        async with pooled_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with pooled_engine.connect():
+                    pass
+
+        metrics = get_pool_metrics(pooled_engine)
+        assert metrics["timeouts"] == 1
+        assert metrics["max_wait_ms"] < 100
+
+    async def test_in_memory_sqlite_is_not_sized(self, monkeypatch: pytest.MonkeyPatch):
+        """Test in-memory SQLite keeps SQLAlchemy's single-connection pool and pre-ping by default."""
+        monkeypatch.delenv("DIVVY_DB_POOL_LIVENESS", raising=False)
+        engine = create_engine_from_url("sqlite+aiosqlite:///:memory:")
+        pings: list[object] = []
+
+        def _ping(dbapi_connection: object) -> bool:
+            pings.append(dbapi_connection)
+            return True
+
+        monkeypatch.setattr(engine.dialect, "do_ping", _ping)
+
+        async with engine.connect():
+            pass
+        async with engine.connect():
+            pass
+
+        assert not isinstance(engine.pool, InstrumentedAsyncQueuePool)
+        assert set(get_pool_metrics(engine)) == {"pool"}
+        assert len(pings) == 1  # the reused connection is pinged on checkout
+        await engine.dispose()
+
+    def test_unknown_liveness_rejected(self, monkeypatch: pytest.MonkeyPatch):
+        """Test an unknown liveness strategy fails fast."""
+        monkeypatch.setenv("DIVVY_DB_POOL_LIVENESS", "sometimes")
+
+        with pytest.raises(ValueError, match="DIVVY_DB_POOL_LIVENESS"):
+            create_engine_from_url("sqlite+aiosqlite:///:memory:")
+
+
+@pytest.mark.unit
+class TestSerializableEngine:
+    """Test suite for the SERIALIZABLE engine sharing the default pool."""
+
+    async def test_serializable_engine_shares_pool(self):
+        """Test the SERIALIZABLE engine borrows from the default pool instead of opening its own."""
+        await connection.reset_serializable_engine()
+        serializable_engine = connection.get_serializable_engine()
+
+        assert serializable_engine.pool is connection.get_engine().pool
+        async with serializable_engine.connect() as conn:
+            assert await conn.get_isolation_level() == "SERIALIZABLE"
+        await connection.reset_serializable_engine()
+
+    async def test_isolation_restored_on_checkin(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test an isolation level applied on checkout is reset before the pooled connection is reused."""
+        monkeypatch.setenv("DIVVY_SQLITE_PROFILE", "false")
+        monkeypatch.setenv("DIVVY_DB_POOL_SIZE", "1")
+        monkeypatch.setenv("DIVVY_DB_MAX_OVERFLOW", "0")
+        engine = create_engine_from_url(f"sqlite+aiosqlite:///{tmp_path / 'isolation.db'}")
+
+        # SQLite's default is SERIALIZABLE, so check the reset with another level
+        async with engine.execution_options(isolation_level="READ UNCOMMITTED").connect() as conn:
+            assert await conn.get_isolation_level() == "READ UNCOMMITTED"
+        async with engine.connect() as conn:
+            assert await conn.get_isolation_level() == "SERIALIZABLE"
+
+        metrics = get_pool_metrics(engine)
+        assert metrics["checkouts"] == 2
+        assert metrics["checked_in"] == 1
+        await engine.dispose()
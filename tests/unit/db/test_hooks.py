@@ -0,0 +1,65 @@
+"""
+Unit tests for post-commit callbacks.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.hooks import has_pending_callbacks, run_on_commit
+
+
+@pytest.mark.unit
+class TestRunOnCommit:
+    """Test suite for run_on_commit."""
+
+    async def test_runs_after_commit_in_order(self, db_session: AsyncSession):
+        """Test callbacks wait for the commit, then run once in registration order."""
+        ran: list[str] = []
+        run_on_commit(db_session, "test", lambda: ran.append("first"))
+        run_on_commit(db_session, "other", lambda: ran.append("second"))
+
+        assert ran == []
+        assert has_pending_callbacks(db_session, "test")
+        await db_session.commit()
+        await db_session.commit()
+
+        assert ran == ["first", "second"]
+        assert not has_pending_callbacks(db_session, "test")
+
+    async def test_dropped_on_rollback(self, db_session: AsyncSession):
+        """Test callbacks of a rolled back transaction never run."""
+        ran: list[str] = []
+        await db_session.execute(select(1))
+        run_on_commit(db_session, "test", lambda: ran.append("rolled back"))
+        await db_session.rollback()
+        run_on_commit(db_session, "test", lambda: ran.append("committed"))
+        await db_session.commit()
+
+        assert ran == ["committed"]
+
+    async def test_savepoint_rollback_drops_only_its_callbacks(self, db_session: AsyncSession):
+        """Test rolling back a savepoint drops the callbacks registered in it, not the outer ones."""
+        ran: list[str] = []
+        await db_session.execute(select(1))
+        run_on_commit(db_session, "test", lambda: ran.append("outer"))
+        savepoint = await db_session.begin_nested()
+        run_on_commit(db_session, "test", lambda: ran.append("savepoint"))
+        await savepoint.rollback()
+        await db_session.commit()
+
+        assert ran == ["outer"]
+
+    async def test_released_savepoint_follows_outer_transaction(self, db_session: AsyncSession):
+        """Test callbacks of a released savepoint wait for the outer commit and drop with its rollback."""
+        ran: list[str] = []
+        await db_session.execute(select(1))
+        savepoint = await db_session.begin_nested()
+        run_on_commit(db_session, "test", lambda: ran.append("savepoint"))
+        await savepoint.commit()
+
+        assert ran == []
+        await db_session.rollback()
+        await db_session.commit()
+
+        assert ran == []
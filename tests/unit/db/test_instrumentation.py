@@ -0,0 +1,127 @@
+"""
+Unit tests for per-request SQL instrumentation and repeated statement detection.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.api.middleware import SQLInstrumentationMiddleware
+from app.api.middleware import sql as sql_middleware
+from app.db import route_query_metrics, track_queries
+from app.exceptions import RepeatedStatementError
+from app.models import User
+
+
+def _create_app(engine: AsyncEngine, server_timing: bool) -> FastAPI:
+    """A minimal app whose endpoint runs one statement per requested lookup."""
+    app = FastAPI()
+    app.add_middleware(SQLInstrumentationMiddleware, server_timing=server_timing)
+
+    @app.get("/users/{lookups}")
+    async def lookup_users(lookups: int):
+        async with engine.connect() as conn:
+            for i in range(lookups):
+                await conn.execute(select(User.id).where(User.id == i))
+        return {"lookups": lookups}
+
+    return app
+
+
+@pytest.mark.unit
+class TestTrackQueries:
+    """Test suite for track_queries."""
+
+    async def test_counts_statements_and_shapes(self, test_db_engine: AsyncEngine):
+        """Test statements are counted, timed and grouped by their SQL text."""
+        async with test_db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))  # outside the tracked scope
+            with track_queries(repeat_threshold=10, repeat_action="off") as stats:
+                for i in range(3):
+                    await conn.execute(select(User.id).where(User.id == i))
+                await conn.execute(text("SELECT 2"))
+
+        assert stats.count == 4
+        assert stats.total_time > 0
+        most_repeated = stats.most_repeated()
+        assert most_repeated is not None
+        statement, count = most_repeated
+        assert count == 3
+        assert "FROM users" in statement
+
+    async def test_raise_mode_fails_past_threshold(self, test_db_engine: AsyncEngine):
+        """Test the statement exceeding the threshold raises RepeatedStatementError instead of executing."""
+        async with test_db_engine.connect() as conn:
+            with track_queries(repeat_threshold=2, repeat_action="raise") as stats:
+                for i in range(2):
+                    await conn.execute(select(User.id).where(User.id == i))
+                with pytest.raises(RepeatedStatementError) as exc_info:
+                    await conn.execute(select(User.id).where(User.id == 2))
+
+        assert exc_info.value.count == 3
+        assert stats.count == 2
+
+
+@pytest.mark.unit
+class TestSQLInstrumentationMiddleware:
+    """Test suite for SQLInstrumentationMiddleware."""
+
+    @pytest.fixture
+    async def client(
+        self, test_db_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+    ) -> AsyncIterator[AsyncClient]:
+        monkeypatch.setenv("DIVVY_SQL_REPEATED_STATEMENT_THRESHOLD", "3")
+        monkeypatch.setenv("DIVVY_SQL_REPEATED_STATEMENT_ACTION", getattr(request, "param", "off"))
+        route_query_metrics.clear()
+        app = _create_app(test_db_engine, server_timing=True)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+        route_query_metrics.clear()
+
+    async def test_server_timing_header(self, client: AsyncClient):
+        """Test responses report the request's statement count and SQL time."""
+        response = await client.get("/users/2")
+
+        assert response.status_code == 200
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert response.headers["Server-Timing"].endswith('desc="2 queries"')
+
+    async def test_metrics_keyed_by_route_template(self, client: AsyncClient):
+        """Test requests to one route are aggregated regardless of path parameters."""
+        await client.get("/users/1")
+        await client.get("/users/3")
+        await client.get("/missing")
+
+        metrics = route_query_metrics.snapshot()
+
+        assert metrics["GET /users/{lookups}"]["requests"] == 2
+        assert metrics["GET /users/{lookups}"]["statements"] == 4
+        assert metrics["GET /users/{lookups}"]["max_statements"] == 3
+        assert metrics[sql_middleware.UNMATCHED_ROUTE]["statements"] == 0
+
+    @pytest.mark.parametrize("client", ["warn"], indirect=True)
+    async def test_warn_mode_logs_repeated_statement(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch):
+        """Test warn mode logs the repeated statement and still serves the request."""
+        warnings: list[str] = []
+        monkeypatch.setattr(sql_middleware.logger, "warning", warnings.append)
+
+        response = await client.get("/users/4")
+
+        assert response.status_code == 200
+        assert len(warnings) == 1
+        assert "executed a statement 4 times" in warnings[0]
+        assert route_query_metrics.snapshot()["GET /users/{lookups}"]["repeated_statement_requests"] == 1
+
+    @pytest.mark.parametrize("client", ["raise"], indirect=True)
+    async def test_raise_mode_fails_request(self, client: AsyncClient):
+        """Test raise mode turns a repeated statement into a server error."""
+        response = await client.get("/users/4")
+        ok_response = await client.get("/users/3")
+
+        assert response.status_code == 500
+        assert "likely N+1" in response.json()["detail"]
+        assert ok_response.status_code == 200
@@ -0,0 +1,117 @@
+"""
+Query-plan tests: the hot queries must be served by their composite indexes.
+
+SQLite always runs. PostgreSQL runs when DIVVY_TEST_POSTGRES_URL points at a scratch
+database (the schema is created and dropped by the test); sequential scans are disabled
+there so the plan of an empty table still shows which index the planner can use.
+"""
+
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from app.models import (
+    AccountLinkRequest,
+    AccountLinkRequestStatus,
+    Base,
+    GroupRole,
+    GroupRoleBinding,
+    Period,
+    PeriodStatus,
+    Transaction,
+    TransactionStatus,
+)
+
+POSTGRES_URL = os.getenv("DIVVY_TEST_POSTGRES_URL")
+
+
+@dataclass
+class HotQuery:
+    statement: Select[Any]
+    index: str
+
+
+HOT_QUERIES = [
+    pytest.param(
+        HotQuery(
+            select(Period).where(Period.group_id == 1, Period.status == PeriodStatus.OPEN), "ix_period_group_status"
+        ),
+        id="active-period",
+    ),
+    pytest.param(
+        HotQuery(
+            select(GroupRoleBinding.user_id).where(
+                GroupRoleBinding.group_id == 1, GroupRoleBinding.role == GroupRole.OWNER.value
+            ),
+            "ix_group_role_binding_group_role",
+        ),
+        id="group-owner",
+    ),
+    pytest.param(
+        HotQuery(
+            select(AccountLinkRequest).where(
+                AccountLinkRequest.expires_at < datetime(2026, 1, 1, tzinfo=UTC),
+                AccountLinkRequest.status == AccountLinkRequestStatus.PENDING.value,
+            ),
+            "ix_link_request_status_expires",
+        ),
+        id="expired-link-requests",
+    ),
+    pytest.param(
+        HotQuery(
+            select(Transaction).where(Transaction.period_id == 1, Transaction.status == TransactionStatus.APPROVED),
+            "ix_transaction_period_status",
+        ),
+        id="approved-transactions",
+    ),
+]
+
+
+async def _explain(conn: AsyncConnection, statement: Select[Any]) -> str:
+    """Return the dialect's query plan for `statement` as one string."""
+    sql = statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    if conn.dialect.name == "sqlite":
+        rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+        return "\n".join(row.detail for row in rows)
+    await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    rows = await conn.exec_driver_sql(f"EXPLAIN {sql}")
+    return "\n".join(row[0] for row in rows)
+
+
+@pytest.mark.unit
+class TestHotQueryPlans:
+    """Test suite asserting the hot queries use their intended indexes."""
+
+    @pytest.fixture
+    async def postgres_engine(self) -> AsyncIterator[AsyncEngine]:
+        if not POSTGRES_URL:
+            pytest.skip("DIVVY_TEST_POSTGRES_URL is not set")
+        engine = create_async_engine(POSTGRES_URL)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield engine
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+    @pytest.mark.parametrize("query", HOT_QUERIES)
+    async def test_sqlite_plan_uses_index(self, query: HotQuery, test_db_engine: AsyncEngine):
+        """Test SQLite searches the hot query's composite index."""
+        async with test_db_engine.connect() as conn:
+            plan = await _explain(conn, query.statement)
+
+        assert query.index in plan, plan
+
+    @pytest.mark.parametrize("query", HOT_QUERIES)
+    async def test_postgres_plan_uses_index(self, query: HotQuery, postgres_engine: AsyncEngine):
+        """Test PostgreSQL scans the hot query's composite index."""
+        async with postgres_engine.begin() as conn:
+            plan = await _explain(conn, query.statement)
+
+        assert query.index in plan, plan
@@ -0,0 +1,192 @@
+"""
+Unit tests for read replica selection, read-your-writes pinning and request routing.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import Request, status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.dependencies.db import get_serializable_db
+from app.core.category_catalog import category_catalog
+from app.core.security import create_access_token
+from app.db import connection, get_read_your_writes_tracker
+from app.db.replicas import ReadYourWritesTracker, ReplicaSelector
+from app.models import Base, Group, GroupRole, GroupRoleBinding, PeriodStatus, User
+from tests.fixtures.factories import create_test_category, create_test_group, create_test_period, create_test_user
+
+
+@pytest.mark.unit
+class TestReplicaSelection:
+    """Test suite for ReplicaSelector and ReadYourWritesTracker."""
+
+    async def test_round_robin(self):
+        """Test replicas are used in turn."""
+        engines = [create_async_engine("sqlite+aiosqlite:///:memory:") for _ in range(2)]
+        selector = ReplicaSelector(engines, "round_robin")
+
+        assert [selector.choose() for _ in range(4)] == [engines[0], engines[1], engines[0], engines[1]]
+        for engine in engines:
+            await engine.dispose()
+
+    async def test_least_connections(self, tmp_path: Path):
+        """Test the replica with the fewest checked-out connections is chosen."""
+        engines = [create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'replica{i}.db'}") for i in range(2)]
+        selector = ReplicaSelector(engines, "least_connections")
+
+        async with engines[0].connect():
+            assert selector.choose() is engines[1]
+        async with engines[1].connect():
+            assert selector.choose() is engines[0]
+        for engine in engines:
+            await engine.dispose()
+
+    async def test_pin_expires_after_window(self):
+        """Test a user is pinned to the primary only for the read-your-writes window."""
+        tracker = ReadYourWritesTracker(timedelta(seconds=0.05))
+        tracker.pin("1")
+
+        assert tracker.is_pinned("1")
+        assert not tracker.is_pinned("2")
+        await asyncio.sleep(0.06)
+        assert not tracker.is_pinned("1")
+
+
+@pytest.mark.api
+class TestReadReplicaRouting:
+    """Test suite for routing read-only dependencies to a replica."""
+
+    @pytest.fixture
+    async def replica_url(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+        """A second SQLite database standing in for a replica, holding a 'Replica' category."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(create_test_category(name="Replica"))
+            await session.commit()
+        await engine.dispose()
+
+        monkeypatch.setenv("DIVVY_DATABASE_REPLICA_URLS", url)
+        monkeypatch.setattr(connection, "_read_your_writes", None)
+        return url
+
+    @pytest.fixture
+    async def primary_category(self, db_session: AsyncSession) -> None:
+        db_session.add(create_test_category(name="Primary"))
+        await db_session.commit()
+
+    async def test_read_dependency_reads_from_replica(
+        self, replica_url: str, primary_category: None, async_client: AsyncClient
+    ):
+        """Test dependencies opting into get_read_db are served from the replica."""
+        response = await async_client.get("/api/v1/categories/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [category["name"] for category in response.json()] == ["Replica"]
+        assert "replica-0" in connection.get_pool_status()
+
+    @pytest.fixture
+    async def replica_period(self, replica_url: str, authenticated_user: User) -> tuple[int, int]:
+        """A group and closed period named 'Replica' that only the replica holds, with the authenticated user as member."""
+        engine = create_async_engine(replica_url)
+        async with AsyncSession(engine) as session:
+            group = create_test_group(name="Replica")
+            session.add_all([create_test_user(id=authenticated_user.id, email=authenticated_user.email), group])
+            await session.flush()
+            period = create_test_period(group_id=group.id, name="Replica", status=PeriodStatus.CLOSED)
+            session.add_all(
+                [
+                    GroupRoleBinding(user_id=authenticated_user.id, group_id=group.id, role=GroupRole.MEMBER.value),
+                    period,
+                ]
+            )
+            await session.flush()
+            ids = (group.id, period.id)
+            await session.commit()
+        await engine.dispose()
+        return ids
+
+    async def test_period_reads_use_replica(self, replica_period: tuple[int, int], async_client: AsyncClient):
+        """Test read-only group and period routes check roles, validate caches and read from the replica."""
+        group_id, period_id = replica_period
+
+        response = await async_client.get("/api/v1/groups/")
+        assert [group["name"] for group in response.json()] == ["Replica"]
+        response = await async_client.get(f"/api/v1/groups/{group_id}/periods")
+        assert [period["name"] for period in response.json()] == ["Replica"]
+        response = await async_client.get(f"/api/v1/periods/{period_id}")
+        assert response.json()["name"] == "Replica"
+        for path in ("transactions", "balances", "get-settlement-plan"):
+            response = await async_client.get(f"/api/v1/periods/{period_id}/{path}")
+            assert response.status_code == status.HTTP_200_OK, path
+            assert response.headers["ETag"].startswith(f'W/"{period_id}.')
+
+    async def test_get_db_reads_from_primary(
+        self,
+        replica_url: str,
+        async_client: AsyncClient,
+        authenticated_user: User,
+        group_with_role_factory: Callable[..., Awaitable[Group]],
+    ):
+        """Test GET requests that do not opt into get_read_db read from the primary."""
+        group = await group_with_role_factory(user_id=authenticated_user.id, role=GroupRole.OWNER, name="Primary")
+
+        response = await async_client.get(f"/api/v1/groups/{group.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "Primary"
+
+    async def test_recent_writer_reads_from_primary(
+        self, replica_url: str, primary_category: None, async_client: AsyncClient, authenticated_user: User
+    ):
+        """Test a user who just wrote reads from the primary, while other users keep reading from the replica."""
+        token, _ = create_access_token(data={"sub": str(authenticated_user.id), "email": authenticated_user.email})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.post("/api/v1/groups/", json={"name": "New Group"}, headers=headers)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # Empty the category catalog so each listing reads the database it is routed to
+        category_catalog.clear()
+        response = await async_client.get("/api/v1/categories/", headers=headers)
+        assert [category["name"] for category in response.json()] == ["Primary"]
+
+        category_catalog.clear()
+        response = await async_client.get("/api/v1/categories/")
+        assert [category["name"] for category in response.json()] == ["Replica"]
+
+    async def test_unverified_token_does_not_pin(
+        self, replica_url: str, async_client: AsyncClient, authenticated_user: User
+    ):
+        """Test a write only pins the subject of a token that passes verification."""
+        forged, _ = create_access_token(
+            data={"sub": str(authenticated_user.id)}, secret_key="not-the-signing-key-not-the-signing-key"
+        )
+
+        response = await async_client.post(
+            "/api/v1/groups/", json={"name": "New Group"}, headers={"Authorization": f"Bearer {forged}"}
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert not get_read_your_writes_tracker().is_pinned(str(authenticated_user.id))
+
+    async def test_serializable_write_pins_user(
+        self, replica_url: str, authenticated_user: User, db_session: AsyncSession
+    ):
+        """Test a write through a SERIALIZABLE session pins its user to the primary, like other writes."""
+        token, _ = create_access_token(data={"sub": str(authenticated_user.id), "email": authenticated_user.email})
+        request = Request(
+            {"type": "http", "method": "POST", "headers": [(b"authorization", f"Bearer {token}".encode())]}
+        )
+
+        async for session in get_serializable_db(request, db_session):
+            session.add(create_test_category(name="Serializable"))
+
+        assert get_read_your_writes_tracker().is_pinned(str(authenticated_user.id))
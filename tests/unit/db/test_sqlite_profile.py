@@ -0,0 +1,106 @@
+"""
+Unit tests for the SQLite performance profile.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc, func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.db import create_engine_from_url
+from app.db.pool import get_pool_metrics
+from app.models import Base, User
+from tests.fixtures.factories import create_test_user
+
+
+@dataclass
+class ProfileEngines:
+    writer: AsyncEngine
+    reader: AsyncEngine
+
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(bind=self.writer, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.unit
+class TestSQLiteProfile:
+    """Test suite for WAL pragmas, the single writer connection and query-only readers."""
+
+    @pytest.fixture
+    async def engines(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[ProfileEngines]:
+        monkeypatch.setenv("DIVVY_SQLITE_PROFILE", "true")
+        monkeypatch.setenv("DIVVY_SQLITE_BUSY_TIMEOUT_MS", "2000")
+        url = f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}"
+        writer = create_engine_from_url(url)
+        reader = create_engine_from_url(url, read_only=True)
+        async with writer.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield ProfileEngines(writer=writer, reader=reader)
+        await reader.dispose()
+        await writer.dispose()
+
+    async def test_profile_is_opt_in(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test file-based SQLite gets a regular pool unless the profile is enabled."""
+        monkeypatch.delenv("DIVVY_SQLITE_PROFILE", raising=False)
+        monkeypatch.setenv("DIVVY_DB_POOL_SIZE", "3")
+        engine = create_engine_from_url(f"sqlite+aiosqlite:///{tmp_path / 'default.db'}")
+
+        async with engine.connect() as conn:
+            assert await conn.scalar(text("PRAGMA journal_mode")) == "delete"
+        assert get_pool_metrics(engine)["size"] == 3
+        await engine.dispose()
+
+    async def test_pragmas_applied(self, engines: ProfileEngines):
+        """Test every connection runs in WAL mode with the profile pragmas."""
+        async with engines.reader.connect() as conn:
+            assert await conn.scalar(text("PRAGMA journal_mode")) == "wal"
+            assert await conn.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+            assert await conn.scalar(text("PRAGMA busy_timeout")) == 2000
+            assert await conn.scalar(text("PRAGMA temp_store")) == 2  # MEMORY
+            assert await conn.scalar(text("PRAGMA query_only")) == 1
+
+        async with engines.writer.connect() as conn:
+            assert await conn.scalar(text("PRAGMA query_only")) == 0
+
+    async def test_writer_is_single_connection(self, engines: ProfileEngines):
+        """Test the writer pool holds exactly one connection."""
+        metrics = get_pool_metrics(engines.writer)
+
+        assert metrics["size"] == 1
+        assert metrics["max_overflow"] == 0
+
+    async def test_reader_rejects_writes(self, engines: ProfileEngines):
+        """Test a write reaching a reader connection fails instead of taking the write lock."""
+        async with engines.reader.connect() as conn:
+            with pytest.raises(exc.OperationalError, match="readonly"):
+                await conn.execute(text("DELETE FROM users"))
+
+    async def test_session_uses_writer_from_first_statement(self, engines: ProfileEngines):
+        """Test a session's reads before its first write run on the writer connection."""
+        async with engines.session_factory()() as session:
+            await session.execute(select(User))
+
+            assert get_pool_metrics(engines.writer)["checked_out"] == 1
+            assert get_pool_metrics(engines.reader)["checked_out"] == 0
+
+    async def test_read_then_write_sessions_are_serialized(self, engines: ProfileEngines):
+        """Test concurrent read-then-write sessions each read the state their write commits onto."""
+        factory = engines.session_factory()
+
+        async def _sign_up() -> None:
+            async with factory() as session:
+                # A stale count would repeat an email and violate its unique constraint
+                count = await session.scalar(select(func.count()).select_from(User))
+                await asyncio.sleep(0)
+                session.add(create_test_user(email=f"user{count}@example.com"))
+                await session.commit()
+
+        await asyncio.gather(*(_sign_up() for _ in range(20)))
+
+        async with engines.reader.connect() as conn:
+            assert await conn.scalar(select(func.count()).select_from(User)) == 20
+        assert get_pool_metrics(engines.writer)["timeouts"] == 0
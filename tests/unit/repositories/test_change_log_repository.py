@@ -0,0 +1,129 @@
+"""
+Unit tests for ChangeLogRepository.
+"""
+
+from collections.abc import Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChangeEntity, Group, GroupRole, Period, User
+from app.repositories import ChangeLogRepository
+
+
+@pytest.mark.unit
+class TestChangeLogRepository:
+    """Test suite for ChangeLogRepository."""
+
+    @pytest.fixture
+    def change_log_repository(self, db_session: AsyncSession) -> ChangeLogRepository:
+        return ChangeLogRepository(db_session)
+
+    @pytest.fixture
+    async def member(self, user_factory: Callable[..., Awaitable[User]]) -> User:
+        return await user_factory(email="member@example.com", name="Member")
+
+    @pytest.fixture
+    async def group(self, member: User, group_with_role_factory: Callable[..., Awaitable[Group]]) -> Group:
+        return await group_with_role_factory(user_id=member.id, role=GroupRole.MEMBER, name="Group")
+
+    async def test_get_head_empty(self, change_log_repository: ChangeLogRepository):
+        """Test the head of an empty log is 0."""
+        assert await change_log_repository.get_head() == 0
+
+    async def test_record_in_period_resolves_group(
+        self,
+        change_log_repository: ChangeLogRepository,
+        member: User,
+        group: Group,
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test entries of a period are filed under the period's group."""
+        period = await period_factory(group_id=group.id, name="Period")
+        head = await change_log_repository.get_head()
+
+        await change_log_repository.record_in_period(ChangeEntity.TRANSACTION, 42, period.id, deleted=True)
+
+        (entry,) = await change_log_repository.get_entries(head, [group.id], member.id, limit=10)
+        assert (entry.group_id, entry.entity, entry.entity_id, entry.deleted) == (
+            group.id,
+            ChangeEntity.TRANSACTION,
+            42,
+            True,
+        )
+        assert await change_log_repository.get_head() == entry.id
+
+    async def test_record_in_user_groups(
+        self,
+        change_log_repository: ChangeLogRepository,
+        member: User,
+        group: Group,
+        group_with_role_factory: Callable[..., Awaitable[Group]],
+    ):
+        """Test a user change is recorded once per group of the user."""
+        other_group = await group_with_role_factory(user_id=member.id, role=GroupRole.OWNER, name="Other")
+        head = await change_log_repository.get_head()
+
+        await change_log_repository.record_in_user_groups(ChangeEntity.USER, member.id, member.id)
+
+        entries = await change_log_repository.get_entries(head, [group.id, other_group.id], member.id, limit=10)
+        assert len(entries) == 2
+        assert {entry.group_id for entry in entries} == {group.id, other_group.id}
+        assert {entry.entity for entry in entries} == {ChangeEntity.USER}
+
+    async def test_get_entries_visibility(
+        self,
+        change_log_repository: ChangeLogRepository,
+        member: User,
+        group: Group,
+        group_factory: Callable[..., Awaitable[Group]],
+    ):
+        """Test a user sees their groups' entries, global entries and their own membership changes only."""
+        other_group = await group_factory(name="Other")
+        head = await change_log_repository.get_head()
+        await change_log_repository.record(ChangeEntity.GROUP, group.id, group.id)
+        await change_log_repository.record(ChangeEntity.GROUP, other_group.id, other_group.id)
+        await change_log_repository.record(ChangeEntity.CATEGORY, 1, None)
+        await change_log_repository.record(ChangeEntity.MEMBERSHIP, member.id, other_group.id, deleted=True)
+        await change_log_repository.record(ChangeEntity.MEMBERSHIP, member.id + 1, other_group.id, deleted=True)
+
+        entries = await change_log_repository.get_entries(head, [group.id], member.id, limit=10)
+
+        assert [(entry.entity, entry.group_id) for entry in entries] == [
+            (ChangeEntity.GROUP, group.id),
+            (ChangeEntity.CATEGORY, None),
+            (ChangeEntity.MEMBERSHIP, other_group.id),
+        ]
+
+    async def test_get_entries_after_cursor_with_limit(
+        self, change_log_repository: ChangeLogRepository, member: User, group: Group
+    ):
+        """Test entries are returned oldest first, after the cursor and up to the limit."""
+        for period_id in (1, 2, 3):
+            await change_log_repository.record(ChangeEntity.PERIOD, period_id, group.id)
+        head = await change_log_repository.get_head()
+
+        first = await change_log_repository.get_entries(head - 3, [group.id], member.id, limit=2)
+        rest = await change_log_repository.get_entries(first[-1].id, [group.id], member.id, limit=2)
+
+        assert [entry.entity_id for entry in first] == [1, 2]
+        assert [entry.entity_id for entry in rest] == [3]
+
+    async def test_record_group_deleted(
+        self,
+        change_log_repository: ChangeLogRepository,
+        member: User,
+        group: Group,
+    ):
+        """Test deleting a group records every member as having left it."""
+        head = await change_log_repository.get_head()
+
+        await change_log_repository.record_group_deleted(group.id)
+
+        (entry,) = await change_log_repository.get_entries(head, [], member.id, limit=10)
+        assert (entry.entity, entry.entity_id, entry.group_id, entry.deleted) == (
+            ChangeEntity.MEMBERSHIP,
+            member.id,
+            group.id,
+            True,
+        )
@@ -62,6 +62,15 @@ class TestGroupRepository:
 
         assert result is None
 
+    async def test_group_exists(
+        self, group_repository: GroupRepository, group_factory: Callable[..., Awaitable[Group]]
+    ):
+        """Test checking whether a group exists without loading it."""
+        group = await group_factory(name="Test Group")
+
+        assert await group_repository.group_exists(group.id) is True
+        assert await group_repository.group_exists(99999) is False
+
     async def test_get_groups_by_user_id_empty(
         self, group_repository: GroupRepository, user_factory: Callable[..., Awaitable[User]]
     ):
@@ -6,9 +6,10 @@ from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Group, Period
+from app.models import Group, GroupRole, Period, PeriodStatus, Transaction, User
 from app.repositories import PeriodRepository
 from tests.fixtures.factories import create_test_period
 
@@ -161,3 +162,92 @@ class TestPeriodRepository:
         current = await period_repository.get_active_period_by_group_id(group2.id)
 
         assert current is None
+
+    async def test_active_period_has_transactions(
+        self,
+        period_repository: PeriodRepository,
+        group_factory: Callable[..., Awaitable[Group]],
+        period_factory: Callable[..., Awaitable[Period]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test only transactions in the group's open period count."""
+        busy_group = await group_factory(name="Busy")
+        empty_group = await group_factory(name="Empty")
+        closed_group = await group_factory(name="Closed")
+
+        busy_period = await period_factory(group_id=busy_group.id, name="Open")
+        await period_factory(group_id=empty_group.id, name="Open")
+        closed_period = await period_factory(group_id=closed_group.id, name="Closed", status=PeriodStatus.CLOSED)
+        await transaction_factory(period_id=busy_period.id)
+        await transaction_factory(period_id=closed_period.id)
+
+        assert await period_repository.active_period_has_transactions(busy_group.id) is True
+        assert await period_repository.active_period_has_transactions(empty_group.id) is False
+        assert await period_repository.active_period_has_transactions(closed_group.id) is False
+        assert await period_repository.active_period_has_transactions(99999) is False
+
+    async def _versions(self, db_session: AsyncSession, *periods: Period) -> list[int]:
+        rows = await db_session.execute(
+            select(Period.id, Period.version).where(Period.id.in_([period.id for period in periods]))
+        )
+        versions: dict[int, int] = dict(rows.all())
+        return [versions[period.id] for period in periods]
+
+    @pytest.mark.parametrize("update_returning", [True, False], ids=["returning", "no-returning"])
+    async def test_bump_version(
+        self,
+        update_returning: bool,
+        db_session: AsyncSession,
+        period_repository: PeriodRepository,
+        period_factory: Callable[..., Awaitable[Period]],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test bumping a period's version returns it and leaves the other periods alone, with or without RETURNING."""
+        monkeypatch.setattr(db_session.get_bind().dialect, "update_returning", update_returning)
+        period = await period_factory(group_id=1, name="Changed")
+        other = await period_factory(group_id=1, name="Unchanged")
+        assert await self._versions(db_session, period, other) == [1, 1]
+
+        assert await period_repository.bump_version(period.id) == 2
+        assert await period_repository.bump_version(period.id) == 3
+
+        assert await self._versions(db_session, period, other) == [3, 1]
+        assert await period_repository.bump_version(99999) is None
+
+    async def test_bump_versions_for_category(
+        self,
+        db_session: AsyncSession,
+        period_repository: PeriodRepository,
+        period_factory: Callable[..., Awaitable[Period]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test only periods with transactions in the category are bumped."""
+        with_category = await period_factory(group_id=1, name="Groceries")
+        without_category = await period_factory(group_id=1, name="Rent")
+        await transaction_factory(period_id=with_category.id, category_id=1)
+        await transaction_factory(period_id=without_category.id, category_id=2)
+
+        await period_repository.bump_versions_for_category(1)
+
+        assert await self._versions(db_session, with_category, without_category) == [2, 1]
+
+    async def test_bump_versions_for_user(
+        self,
+        db_session: AsyncSession,
+        period_repository: PeriodRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        group_factory: Callable[..., Awaitable[Group]],
+        group_with_role_factory: Callable[..., Awaitable[Group]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test every period of the user's groups is bumped, and no other."""
+        user = await user_factory(email="member@example.com", name="Member")
+        group = await group_with_role_factory(user_id=user.id, role=GroupRole.MEMBER, name="Mine")
+        other_group = await group_factory(name="Theirs")
+        closed = await period_factory(group_id=group.id, name="Closed", status=PeriodStatus.CLOSED)
+        current = await period_factory(group_id=group.id, name="Open")
+        elsewhere = await period_factory(group_id=other_group.id, name="Open")
+
+        await period_repository.bump_versions_for_user(user.id)
+
+        assert await self._versions(db_session, closed, current, elsewhere) == [2, 2, 1]
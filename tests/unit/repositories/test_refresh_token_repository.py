@@ -3,10 +3,12 @@ Unit tests for RefreshTokenRepository.
 """
 
 from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db import track_queries
 from app.models import RefreshToken, User
 from app.repositories import RefreshTokenRepository
 
@@ -29,12 +31,16 @@ class TestRefreshTokenRepository:
         # Create a refresh token
         token_id = "test_token_123"
         device_info = "Test Device"
-        created = await refresh_token_repository.create(id=token_id, user_id=user.id, device_info=device_info)
+        expires_at = datetime.now(UTC) + timedelta(days=7)
+        created = await refresh_token_repository.create(
+            id=token_id, user_id=user.id, expires_at=expires_at, device_info=device_info
+        )
 
         assert created.id == token_id
         assert created.user_id == user.id
         assert created.device_info == device_info
         assert created.is_revoked is False
+        assert created.expires_at == expires_at
 
         # Verify it's in the database
         retrieved = await refresh_token_repository.get_by_id(token_id)
@@ -52,7 +58,9 @@ class TestRefreshTokenRepository:
 
         # Create a refresh token without device info
         token_id = "test_token_456"
-        created = await refresh_token_repository.create(id=token_id, user_id=user.id, device_info=None)
+        created = await refresh_token_repository.create(
+            id=token_id, user_id=user.id, expires_at=datetime.now(UTC) + timedelta(days=7), device_info=None
+        )
 
         assert created.id == token_id
         assert created.user_id == user.id
@@ -86,13 +94,18 @@ class TestRefreshTokenRepository:
 
         assert result is None
 
+    @pytest.mark.parametrize("update_returning", [True, False], ids=["returning", "no-returning"])
     async def test_revoke_by_id_exists(
         self,
+        update_returning: bool,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
         refresh_token_repository: RefreshTokenRepository,
         user_factory: Callable[..., Awaitable[User]],
         refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
     ):
-        """Test revoking a refresh token by ID when it exists."""
+        """Test revoking a refresh token by ID when it exists, with or without RETURNING."""
+        monkeypatch.setattr(db_session.get_bind().dialect, "update_returning", update_returning)
         # Create a user first
         user = await user_factory(email="test@example.com", name="Test User")
 
@@ -259,3 +272,138 @@ class TestRefreshTokenRepository:
 
         # Should not raise an exception
         await refresh_token_repository.revoke_all(user.id)
+
+    @pytest.mark.parametrize("update_returning", [True, False], ids=["returning", "no-returning"])
+    async def test_revoke_for_rotation_active_token(
+        self,
+        update_returning: bool,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test rotating an active token revokes it and returns its device info and the user's email, with or without RETURNING."""
+        monkeypatch.setattr(db_session.get_bind().dialect, "update_returning", update_returning)
+        user = await user_factory(email="test@example.com", name="Test User")
+        token = await refresh_token_factory(id="rotate_me", user_id=user.id, device_info="Phone")
+
+        result = await refresh_token_repository.revoke_for_rotation(token.id, user.id)
+
+        assert result == ("Phone", "test@example.com")
+        retrieved = await refresh_token_repository.get_by_id(token.id)
+        assert retrieved is not None
+        assert retrieved.is_revoked is True
+
+    @pytest.mark.parametrize("update_returning", [True, False], ids=["returning", "no-returning"])
+    async def test_revoke_for_rotation_only_once(
+        self,
+        update_returning: bool,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test a token can only be revoked for rotation once, with or without RETURNING."""
+        monkeypatch.setattr(db_session.get_bind().dialect, "update_returning", update_returning)
+        user = await user_factory(email="test@example.com", name="Test User")
+        token = await refresh_token_factory(id="rotate_once", user_id=user.id)
+
+        assert await refresh_token_repository.revoke_for_rotation(token.id, user.id) is not None
+        assert await refresh_token_repository.revoke_for_rotation(token.id, user.id) is None
+
+    async def test_revoke_for_rotation_rejects_other_user(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test a token is not revoked when the claimed user does not own it."""
+        owner = await user_factory(email="owner@example.com", name="Owner")
+        other = await user_factory(email="other@example.com", name="Other")
+        token = await refresh_token_factory(id="owned_token", user_id=owner.id)
+
+        assert await refresh_token_repository.revoke_for_rotation(token.id, other.id) is None
+        retrieved = await refresh_token_repository.get_by_id(token.id)
+        assert retrieved is not None
+        assert retrieved.is_revoked is False
+
+    async def test_revoke_for_rotation_rejects_inactive_user(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test a token is not revoked when its user is inactive."""
+        user = await user_factory(email="test@example.com", name="Test User", is_active=False)
+        token = await refresh_token_factory(id="inactive_token", user_id=user.id)
+
+        assert await refresh_token_repository.revoke_for_rotation(token.id, user.id) is None
+
+    async def test_revoke_all_returns_revoked_count(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test revoke_all reports only the tokens it revoked."""
+        user = await user_factory(email="test@example.com", name="Test User")
+        await refresh_token_factory(id="active_1", user_id=user.id)
+        await refresh_token_factory(id="active_2", user_id=user.id)
+        await refresh_token_factory(id="revoked_1", user_id=user.id, is_revoked=True)
+
+        assert await refresh_token_repository.revoke_all(user.id) == 2
+
+    async def test_delete_expired_or_revoked(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test purging deletes revoked and expired tokens and keeps active ones."""
+        user = await user_factory(email="test@example.com", name="Test User")
+        now = datetime.now(UTC)
+        await refresh_token_factory(id="active", user_id=user.id)
+        await refresh_token_factory(id="revoked", user_id=user.id, is_revoked=True)
+        await refresh_token_factory(id="expired", user_id=user.id, expires_at=now - timedelta(seconds=1))
+
+        deleted = await refresh_token_repository.delete_expired_or_revoked(now, limit=100)
+
+        assert deleted == 2
+        assert await refresh_token_repository.get_by_id("active") is not None
+        assert await refresh_token_repository.get_by_id("revoked") is None
+        assert await refresh_token_repository.get_by_id("expired") is None
+
+    async def test_delete_expired_or_revoked_respects_limit(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test purging deletes at most one batch per call."""
+        user = await user_factory(email="test@example.com", name="Test User")
+        for i in range(5):
+            await refresh_token_factory(id=f"revoked_{i}", user_id=user.id, is_revoked=True)
+
+        now = datetime.now(UTC)
+        assert await refresh_token_repository.delete_expired_or_revoked(now, limit=2) == 2
+        assert await refresh_token_repository.delete_expired_or_revoked(now, limit=2) == 2
+        assert await refresh_token_repository.delete_expired_or_revoked(now, limit=2) == 1
+        assert await refresh_token_repository.delete_expired_or_revoked(now, limit=2) == 0
+
+    async def test_delete_expired_or_revoked_deletes_by_id(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        user_factory: Callable[..., Awaitable[User]],
+        refresh_token_factory: Callable[..., Awaitable[RefreshToken]],
+    ):
+        """Test the batch is deleted by its IDs, without the LIMIT subquery MySQL rejects."""
+        user = await user_factory(email="test@example.com", name="Test User")
+        await refresh_token_factory(id="revoked", user_id=user.id, is_revoked=True)
+
+        with track_queries(repeat_action="off") as stats:
+            assert await refresh_token_repository.delete_expired_or_revoked(datetime.now(UTC), limit=2) == 1
+
+        (delete_statement,) = [statement for statement in stats.shapes if statement.startswith("DELETE")]
+        assert "LIMIT" not in delete_statement
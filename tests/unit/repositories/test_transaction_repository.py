@@ -5,9 +5,12 @@ Unit tests for TransactionRepository.
 from collections.abc import Awaitable, Callable
 
 import pytest
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import SplitKind, Transaction, TransactionKind
+from app.db import track_queries
+from app.models import ExpenseShare, Period, SplitKind, Transaction, TransactionKind, TransactionStatus
 from app.repositories import TransactionRepository
 from tests.fixtures.factories import create_test_transaction
 
@@ -41,6 +44,18 @@ class TestTransactionRepository:
 
         assert result is None
 
+    async def test_get_transaction_status_and_creator(
+        self, transaction_repository: TransactionRepository, transaction_factory: Callable[..., Awaitable[Transaction]]
+    ):
+        """Test retrieving only the status and creator of a transaction."""
+        transaction = await transaction_factory(status=TransactionStatus.PENDING, created_by=7)
+
+        assert await transaction_repository.get_transaction_status_and_creator(transaction.id) == (
+            TransactionStatus.PENDING,
+            7,
+        )
+        assert await transaction_repository.get_transaction_status_and_creator(99999) is None
+
     async def test_get_transactions_by_period_id(
         self, transaction_repository: TransactionRepository, transaction_factory: Callable[..., Awaitable[Transaction]]
     ):
@@ -60,6 +75,61 @@ class TestTransactionRepository:
         assert tx2.description in descriptions
         assert tx3.description not in descriptions
 
+    async def test_get_transactions_by_period_id_with_fields(
+        self,
+        db_session: AsyncSession,
+        transaction_repository: TransactionRepository,
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test only the requested columns are loaded, and expense shares only when requested."""
+        await transaction_factory(period_id=1, amount=1234)
+        db_session.expunge_all()
+
+        (transaction,) = await transaction_repository.get_transactions_by_period_id(1, fields={"amount", "status"})
+
+        assert transaction.amount == 1234
+        assert {"description", "payer_id", "expense_shares"} <= inspect(transaction).unloaded
+        with pytest.raises(InvalidRequestError):
+            _ = transaction.description
+
+        db_session.expunge_all()
+        (transaction,) = await transaction_repository.get_transactions_by_period_id(1, fields={"expense_shares"})
+
+        assert "expense_shares" not in inspect(transaction).unloaded
+        assert "amount" in inspect(transaction).unloaded
+
+    async def test_get_period_version_and_transactions(
+        self,
+        db_session: AsyncSession,
+        transaction_repository: TransactionRepository,
+        period_factory: Callable[..., Awaitable[Period]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test the version comes with every transaction of the period and their shares, in one statement."""
+        period = await period_factory(group_id=1, name="Dinner")
+        empty = await period_factory(group_id=1, name="Empty")
+        other = await period_factory(group_id=1, name="Other")
+        first = await transaction_factory(period_id=period.id, payer_id=1)
+        second = await transaction_factory(period_id=period.id, payer_id=1)
+        await transaction_factory(period_id=other.id, payer_id=1)
+        db_session.add_all([ExpenseShare(transaction_id=first.id, user_id=user_id) for user_id in (1, 2)])
+        await db_session.commit()
+        db_session.expunge_all()
+
+        with track_queries(repeat_action="off") as stats:
+            snapshot = await transaction_repository.get_period_version_and_transactions(period.id)
+
+        assert stats.count == 1
+        assert snapshot is not None
+        version, transactions = snapshot
+        assert version == period.version
+        assert sorted(t.id for t in transactions) == [first.id, second.id]
+        shares = {t.id: sorted(s.user_id for s in t.expense_shares) for t in transactions}
+        assert shares == {first.id: [1, 2], second.id: []}
+
+        assert await transaction_repository.get_period_version_and_transactions(empty.id) == (empty.version, [])
+        assert await transaction_repository.get_period_version_and_transactions(99999) is None
+
     async def test_create_transaction(self, transaction_repository: TransactionRepository):
         """Test creating a new transaction."""
         transaction = create_test_transaction(
@@ -109,15 +179,24 @@ class TestTransactionRepository:
         assert retrieved.description == "Updated Description"
         assert retrieved.amount == 20000
 
+    @pytest.mark.parametrize("delete_returning", [True, False], ids=["returning", "no-returning"])
     async def test_delete_transaction_exists(
-        self, transaction_repository: TransactionRepository, transaction_factory: Callable[..., Awaitable[Transaction]]
+        self,
+        delete_returning: bool,
+        db_session: AsyncSession,
+        transaction_repository: TransactionRepository,
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+        monkeypatch: pytest.MonkeyPatch,
     ):
-        """Test deleting a transaction that exists."""
+        """Test deleting a transaction that exists returns its period, with or without RETURNING."""
+        monkeypatch.setattr(db_session.get_bind().dialect, "delete_returning", delete_returning)
         # Create a transaction
         transaction = await transaction_factory(description="To Delete", payer_id=1, category_id=1, period_id=1)
 
         # Delete it
-        await transaction_repository.delete_transaction(transaction.id)
+        period_id = await transaction_repository.delete_transaction(transaction.id)
+
+        assert period_id == 1
 
         # Verify it's gone
         retrieved = await transaction_repository.get_transaction_by_id(transaction.id)
@@ -127,4 +206,4 @@ class TestTransactionRepository:
     async def test_delete_transaction_not_exists(self, transaction_repository: TransactionRepository):
         """Test deleting a transaction that doesn't exist (should not raise error)."""
         # Should not raise an exception
-        await transaction_repository.delete_transaction(99999)
+        assert await transaction_repository.delete_transaction(99999) is None
@@ -9,7 +9,7 @@ import pytest
 from app.core.security import hash_password
 from app.exceptions import ConflictError, NotFoundError, UnauthorizedError
 from app.models import User
-from app.schemas.user import PasswordResetRequest
+from app.schemas.user import PasswordResetRequest, ProfileRequest
 from app.services import AuthenticationService, UserService
 
 
@@ -260,3 +260,19 @@ class TestAuthenticationService:
         """Test rotating an invalid refresh token raises UnauthorizedError."""
         with pytest.raises(UnauthorizedError):
             await authentication_service.rotate_token("invalid_token")
+
+    async def test_rotate_refresh_token_inactive_user(
+        self,
+        authentication_service: AuthenticationService,
+        user_service: UserService,
+        user_factory: Callable[..., Awaitable[User]],
+    ) -> None:
+        """Test rotating a refresh token of a deactivated user raises UnauthorizedError."""
+        password = "password"
+        user = await user_factory(email="user@example.com", name="Test User", password=hash_password(password))
+        old_token = (await authentication_service.authenticate(email=user.email, password=password)).refresh_token
+
+        await user_service.update_profile(user.id, ProfileRequest(is_active=False))
+
+        with pytest.raises(UnauthorizedError):
+            await authentication_service.rotate_token(old_token)
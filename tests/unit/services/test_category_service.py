@@ -5,9 +5,11 @@ Unit tests for CategoryService.
 from collections.abc import Awaitable, Callable
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from app.models import Category
+from app.core.category_catalog import category_catalog
+from app.models import Category, ChangeEntity, Period, Transaction
+from app.repositories import CategoryRepository, ChangeLogRepository
 from app.schemas.category import CategoryRequest
 from app.services import CategoryService
 
@@ -95,6 +97,24 @@ class TestCategoryService:
         assert retrieved is not None
         assert retrieved.name == "Updated Name"
 
+    async def test_update_category_bumps_period_versions(
+        self,
+        db_session: AsyncSession,
+        category_service: CategoryService,
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test renaming a category changes the version of the periods that show its name."""
+        category = await category_factory(name="Original Name")
+        period = await period_factory(group_id=1, name="Test Period")
+        await transaction_factory(period_id=period.id, category_id=category.id)
+
+        await category_service.update_category(category.id, CategoryRequest(name="Updated Name"))
+
+        await db_session.refresh(period)
+        assert period.version == 2
+
     async def test_delete_category(
         self, category_service: CategoryService, category_factory: Callable[..., Awaitable[Category]]
     ):
@@ -114,3 +134,74 @@ class TestCategoryService:
     async def test_delete_category_not_exists(self, category_service: CategoryService):
         """Test deleting a category that doesn't exist."""
         await category_service.delete_category(99999)
+
+    async def test_writes_reach_catalog_on_commit(self, category_service: CategoryService, db_session: AsyncSession):
+        """Test created, updated and deleted categories reach the catalog once the session commits."""
+        await category_service.load_catalog()
+
+        created = await category_service.create_category(CategoryRequest(name="New Category"))
+        assert category_catalog.get(created.id) is None
+        await db_session.commit()
+        assert category_catalog.get_name(created.id) == "New Category"
+
+        await category_service.update_category(created.id, CategoryRequest(name="Renamed Category"))
+        await db_session.commit()
+        assert category_catalog.get_name(created.id) == "Renamed Category"
+
+        await category_service.delete_category(created.id)
+        await db_session.commit()
+        assert category_catalog.get(created.id) is None
+
+    async def test_rolled_back_write_does_not_reach_catalog(
+        self, category_service: CategoryService, db_session: AsyncSession
+    ):
+        """Test a category write that is rolled back leaves the catalog unchanged."""
+        await category_service.load_catalog()
+
+        created = await category_service.create_category(CategoryRequest(name="New Category"))
+        await db_session.rollback()
+
+        assert category_catalog.get(created.id) is None
+        assert await category_service.get_category_by_id(created.id) is None
+
+    async def test_catalog_miss_reloads(
+        self, category_service: CategoryService, category_factory: Callable[..., Awaitable[Category]]
+    ):
+        """Test a category written outside this process is picked up the first time it is missed."""
+        await category_service.load_catalog()
+        category = await category_factory(name="Added Elsewhere")
+        assert category_catalog.get(category.id) is None
+
+        retrieved = await category_service.get_category_by_id(category.id)
+
+        assert retrieved is not None
+        assert retrieved.name == "Added Elsewhere"
+        assert category_catalog.get_name(category.id) == "Added Elsewhere"
+
+    async def test_catalog_picks_up_renames_of_other_processes(
+        self,
+        category_service: CategoryService,
+        category_factory: Callable[..., Awaitable[Category]],
+        test_db_engine: AsyncEngine,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test a category renamed through another session, as by another worker, is picked up once the catalog expires."""
+        category = await category_factory(name="Groceries")
+        await category_service.load_catalog()
+
+        # Another worker's catalog hook does not run in this process, only its change log entry is seen
+        async with AsyncSession(test_db_engine) as other_session:
+            stored = await CategoryRepository(other_session).get_category_by_id(category.id)
+            assert stored is not None
+            stored.name = "Food"
+            await ChangeLogRepository(other_session).record(ChangeEntity.CATEGORY, category.id, None)
+            await other_session.commit()
+        assert category_catalog.get_name(category.id) == "Groceries"
+
+        monkeypatch.setenv("DIVVY_CATEGORY_CATALOG_TTL_SECONDS", "0")
+        async with AsyncSession(test_db_engine) as later_session:
+            retrieved = await CategoryService(later_session).get_category_by_id(category.id)
+
+        assert retrieved is not None
+        assert retrieved.name == "Food"
+        assert category_catalog.get_name(category.id) == "Food"
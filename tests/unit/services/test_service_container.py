@@ -0,0 +1,66 @@
+"""
+Unit tests for ServiceContainer.
+"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.services import get_group_service, get_period_service, get_services
+from app.services import GroupService, PeriodService, ServiceContainer
+
+
+@pytest.mark.unit
+class TestServiceContainer:
+    """Test suite for ServiceContainer."""
+
+    def test_builds_services_on_first_use(self, db_session: AsyncSession):
+        """Test a service is built only when accessed, then reused."""
+        services = ServiceContainer(db_session)
+
+        assert "group_service" not in vars(services)
+        group_service = services.group_service
+
+        assert services.group_service is group_service
+        assert "identity_provider_service" not in vars(services)
+
+    def test_shares_dependencies(self, db_session: AsyncSession):
+        """Test each service is one instance per container, also after a dependent service built it."""
+        services = ServiceContainer(db_session)
+        group_service = services.group_service
+        settlement_service = services.settlement_service
+        sync_service = services.sync_service
+        period_service = services.period_service
+        transaction_service = services.transaction_service
+        loaders = services.loaders
+
+        assert services.group_service is group_service
+        assert services.settlement_service is settlement_service
+        assert services.sync_service is sync_service
+        assert services.period_service is period_service
+        assert services.transaction_service is transaction_service
+        assert services.loaders is loaders
+        assert ServiceContainer(db_session).period_service is not period_service
+
+    async def test_one_container_per_request(self):
+        """Test the service dependencies of a request resolve from one container."""
+        app = FastAPI()
+        seen: list[tuple[ServiceContainer, PeriodService, GroupService]] = []
+
+        @app.get("/probe")
+        async def probe(
+            services: ServiceContainer = Depends(get_services),
+            period_service: PeriodService = Depends(get_period_service),
+            group_service: GroupService = Depends(get_group_service),
+        ) -> None:
+            seen.append((services, period_service, group_service))
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/probe")
+            await client.get("/probe")
+
+        (first, period_service, group_service), (second, *_) = seen
+        assert period_service is first.period_service
+        assert group_service is first.group_service
+        assert second is not first
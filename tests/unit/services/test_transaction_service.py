@@ -5,10 +5,14 @@ Unit tests for TransactionService.
 from collections.abc import Awaitable, Callable
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.util import await_only
 
+from app.core.events import event_hub, period_channel
 from app.exceptions import NotFoundError, ValidationError
 from app.models import Category, Group, Period, SplitKind, Transaction, TransactionKind, TransactionStatus, User
-from app.schemas import ExpenseShareRequest, TransactionRequest
+from app.schemas import ExpenseShareRequest, PeriodEventKind, TransactionRequest
 from app.services import TransactionService
 
 
@@ -73,6 +77,79 @@ class TestTransactionService:
         assert tx2.id in transaction_ids
         assert tx3.id not in transaction_ids
 
+    async def test_get_compact_transactions_by_period_id(
+        self,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test compact transactions reference entities by ID and name each one once."""
+        payer = await user_factory(email="payer@example.com", name="Payer")
+        sharer = await user_factory(email="sharer@example.com", name="Sharer")
+        category = await category_factory(name="Groceries")
+        period = await period_factory(group_id=1, name="Trip")
+        other_period = await period_factory(group_id=1, name="Other")
+        deposit = await transaction_factory(
+            payer_id=payer.id,
+            category_id=category.id,
+            period_id=period.id,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+        )
+        await transaction_factory(payer_id=payer.id, category_id=category.id, period_id=other_period.id)
+        expense = await transaction_service.create_transaction(
+            period.id,
+            TransactionRequest(
+                amount=1000,
+                payer_id=payer.id,
+                category_id=category.id,
+                transaction_kind=TransactionKind.EXPENSE,
+                split_kind=SplitKind.AMOUNT,
+                expense_shares=[
+                    ExpenseShareRequest(user_id=payer.id, transaction_id=0, share_amount=400),
+                    ExpenseShareRequest(user_id=sharer.id, transaction_id=0, share_amount=600),
+                ],
+            ),
+        )
+
+        compact = await transaction_service.get_compact_transactions_by_period_id(period.id)
+
+        assert compact.period_id == period.id
+        assert compact.period_name == "Trip"
+        assert compact.users == {payer.id: "Payer", sharer.id: "Sharer"}
+        assert compact.categories == {category.id: "Groceries"}
+        rows = {row.id: row for row in compact.transactions}
+        assert rows.keys() == {deposit.id, expense.id}
+        assert rows[expense.id].payer_id == payer.id
+        assert rows[expense.id].expense_shares == [(payer.id, 400, None), (sharer.id, 600, None)]
+
+    async def test_get_transaction_columns_by_period_id(
+        self,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test transaction columns hold one entry per transaction, in the order of the compact rows."""
+        payer = await user_factory(email="payer@example.com", name="Payer")
+        category = await category_factory(name="Groceries")
+        period = await period_factory(group_id=1, name="Trip")
+        for amount in (100, 200, 300):
+            await transaction_factory(payer_id=payer.id, category_id=category.id, period_id=period.id, amount=amount)
+
+        compact = await transaction_service.get_compact_transactions_by_period_id(period.id)
+        columnar = await transaction_service.get_transaction_columns_by_period_id(period.id)
+
+        assert columnar.users == compact.users
+        assert columnar.categories == compact.categories
+        assert columnar.columns.id == [row.id for row in compact.transactions]
+        assert columnar.columns.amount == [row.amount for row in compact.transactions]
+        assert columnar.columns.expense_shares == [row.expense_shares for row in compact.transactions]
+        assert all(len(column) == 3 for column in columnar.columns.model_dump().values())
+
     async def test_create_transaction_expense_equal_split(
         self,
         transaction_service: TransactionService,
@@ -139,6 +216,55 @@ class TestTransactionService:
         assert created.amount == 50000
         assert created.transaction_kind == TransactionKind.DEPOSIT
 
+    async def test_create_transaction_resolves_category_name(
+        self,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test the created transaction carries its category name from the category catalog."""
+        user = await user_factory(email="user@example.com", name="User")
+        category = await category_factory(name="Rent")
+        period = await period_factory(group_id=1, name="Test Period")
+
+        request = TransactionRequest(
+            description="March rent",
+            amount=50000,
+            payer_id=user.id,
+            category_id=category.id,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+            expense_shares=[],
+        )
+
+        created = await transaction_service.create_transaction(period.id, request)
+
+        assert created.category_name == "Rent"
+
+    async def test_create_transaction_unknown_category_raises_error(
+        self,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test that creating a transaction with a category that does not exist raises ValidationError."""
+        user = await user_factory(email="user@example.com", name="User")
+        period = await period_factory(group_id=1, name="Test Period")
+
+        request = TransactionRequest(
+            description="Monthly deposit",
+            amount=50000,
+            payer_id=user.id,
+            category_id=99999,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+            expense_shares=[],
+        )
+
+        with pytest.raises(ValidationError, match="Category 99999 not found"):
+            await transaction_service.create_transaction(period.id, request)
+
     async def test_create_transaction_expense_no_shares_raises_error(
         self,
         transaction_service: TransactionService,
@@ -283,8 +409,196 @@ class TestTransactionService:
 
         assert retrieved is None
 
+    async def test_calculate_shares_for_transaction(
+        self,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test calculating what each participant owes for a transaction."""
+        user1 = await user_factory(email="user1@example.com", name="User 1")
+        user2 = await user_factory(email="user2@example.com", name="User 2")
+        category = await category_factory(name="Groceries")
+        period = await period_factory(group_id=1, name="Test Period")
+        created = await transaction_service.create_transaction(
+            period.id,
+            TransactionRequest(
+                description="Dinner",
+                amount=10001,
+                payer_id=user1.id,
+                category_id=category.id,
+                transaction_kind=TransactionKind.EXPENSE,
+                split_kind=SplitKind.EQUAL,
+                expense_shares=[
+                    ExpenseShareRequest(user_id=user1.id, transaction_id=0),
+                    ExpenseShareRequest(user_id=user2.id, transaction_id=0),
+                ],
+            ),
+        )
+
+        shares = await transaction_service.calculate_shares_for_transaction(created.id)
+
+        assert sum(shares.values()) == 10001
+        assert set(shares) == {user1.id, user2.id}
+
+        with pytest.raises(NotFoundError):
+            await transaction_service.calculate_shares_for_transaction(99999)
+
+    async def test_writes_bump_period_version(
+        self,
+        db_session: AsyncSession,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test creating, updating and deleting a transaction each bump its period's version."""
+        user = await user_factory(email="user@example.com", name="User")
+        category = await category_factory(name="Groceries")
+        period = await period_factory(group_id=1, name="Test Period")
+        request = TransactionRequest(
+            description="Deposit",
+            amount=1000,
+            payer_id=user.id,
+            category_id=category.id,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+            expense_shares=[],
+        )
+
+        created = await transaction_service.create_transaction(period.id, request)
+        await transaction_service.update_transaction(created.id, request.model_copy(update={"amount": 2000}))
+        await transaction_service.delete_transaction(created.id)
+
+        await db_session.refresh(period)
+        assert period.version == 4
+
+    async def test_writes_publish_events_on_commit(
+        self,
+        db_session: AsyncSession,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test each write publishes its version and balance deltas to the period's channel once committed."""
+        payer = await user_factory(email="payer@example.com", name="Payer")
+        guest = await user_factory(email="guest@example.com", name="Guest")
+        category = await category_factory(name="Restaurants")
+        period = await period_factory(group_id=1, name="Test Period")
+        request = TransactionRequest(
+            description="Dinner",
+            amount=1000,
+            payer_id=payer.id,
+            category_id=category.id,
+            transaction_kind=TransactionKind.EXPENSE,
+            split_kind=SplitKind.EQUAL,
+            expense_shares=[
+                ExpenseShareRequest(user_id=payer.id, transaction_id=0),
+                ExpenseShareRequest(user_id=guest.id, transaction_id=0),
+            ],
+        )
+
+        with event_hub.subscribe(period_channel(period.id)) as subscription:
+            created = await transaction_service.create_transaction(period.id, request)
+            await transaction_service.update_transaction(created.id, request.model_copy(update={"amount": 3000}))
+            await transaction_service.update_transaction_status(created.id, TransactionStatus.PENDING)
+            await transaction_service.delete_transaction(created.id)
+            await db_session.commit()
+
+            events = [await anext(subscription) for _ in range(4)]
+
+        assert [(e.kind, e.version, e.transaction_id) for e in events] == [
+            (PeriodEventKind.TRANSACTION_CREATED, 2, created.id),
+            (PeriodEventKind.TRANSACTION_UPDATED, 3, created.id),
+            (PeriodEventKind.TRANSACTION_UPDATED, 4, created.id),
+            (PeriodEventKind.TRANSACTION_DELETED, 5, created.id),
+        ]
+        assert [e.balance_deltas for e in events] == [
+            {payer.id: 500, guest.id: -500},
+            {payer.id: 1000, guest.id: -1000},
+            {},
+            {payer.id: -1500, guest.id: 1500},
+        ]
+        assert events[2].transaction is not None
+        assert events[2].transaction.status == TransactionStatus.PENDING
+        assert events[3].transaction is None
+
+    async def test_balances_event_consistent_with_write_committed_meanwhile(
+        self,
+        db_session: AsyncSession,
+        test_db_engine: AsyncEngine,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        category_factory: Callable[..., Awaitable[Category]],
+        period_factory: Callable[..., Awaitable[Period]],
+    ):
+        """Test a write committed while the balances are read is either in them or in a newer event, never both."""
+        user = await user_factory(email="user@example.com", name="User")
+        category = await category_factory(name="Groceries")
+        period = await period_factory(group_id=1, name="Test Period")
+        request = TransactionRequest(
+            amount=700,
+            payer_id=user.id,
+            category_id=category.id,
+            transaction_kind=TransactionKind.DEPOSIT,
+            split_kind=SplitKind.PERSONAL,
+            expense_shares=[],
+        )
+        interleaved = False
+
+        async def write() -> None:
+            await transaction_service.create_transaction(period.id, request)
+            await db_session.commit()
+
+        def commit_write_after_first_read(*args: object) -> None:
+            nonlocal interleaved
+            if not interleaved:
+                interleaved = True
+                await_only(write())
+
+        with event_hub.subscribe(period_channel(period.id)) as subscription:
+            async with AsyncSession(test_db_engine) as reader_session:
+                event.listen(test_db_engine.sync_engine, "after_cursor_execute", commit_write_after_first_read)
+                try:
+                    snapshot = await TransactionService(reader_session).get_balances_event(period.id)
+                finally:
+                    event.remove(test_db_engine.sync_engine, "after_cursor_execute", commit_write_after_first_read)
+            published = await anext(subscription)
+
+        assert interleaved
+        balances = {b.user_id: b.balance for b in snapshot.balances}
+        if published.version > snapshot.version:
+            for user_id, delta in published.balance_deltas.items():
+                balances[user_id] = balances.get(user_id, 0) + delta
+        assert balances == {b.user_id: b.balance for b in await transaction_service.get_all_balances(period.id)}
+
+    async def test_get_balances_event(
+        self,
+        transaction_service: TransactionService,
+        user_factory: Callable[..., Awaitable[User]],
+        period_factory: Callable[..., Awaitable[Period]],
+        transaction_factory: Callable[..., Awaitable[Transaction]],
+    ):
+        """Test the balances event carries the balances and the version they were computed at."""
+        user = await user_factory(email="user@example.com", name="User")
+        period = await period_factory(group_id=1, name="Test Period")
+        await transaction_factory(
+            payer_id=user.id, period_id=period.id, amount=700, transaction_kind=TransactionKind.DEPOSIT
+        )
+
+        event = await transaction_service.get_balances_event(period.id)
+
+        assert event.period_id == period.id
+        assert event.version == period.version
+        assert [(b.user_id, b.balance) for b in event.balances] == [(user.id, 700)]
+
+        with pytest.raises(NotFoundError):
+            await transaction_service.get_balances_event(99999)
+
     # ============================================================================
-    # get_all_balances tests (indirectly tests _calculate_shares_for_transaction)
+    # get_all_balances tests (indirectly tests _calculate_shares)
     # ============================================================================
 
     async def test_get_all_balances_empty_period(
@@ -0,0 +1,89 @@
+"""
+Utilities for reading Server-Sent Event streams in tests.
+
+httpx's `ASGITransport` returns a response once its body is complete, which a live
+stream never is; `open_event_stream` drives the ASGI app directly instead.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.types import ASGIApp, Message
+
+
+@dataclass
+class ReceivedEvent:
+    """One event read from a stream."""
+
+    event: str | None
+    id: str | None
+    data: Any
+
+
+class EventStream:
+    """Response of a streaming request, read one event at a time."""
+
+    def __init__(self, messages: asyncio.Queue[Message], status_code: int):
+        self._messages = messages
+        self.status_code = status_code
+
+    async def next_event(self, timeout: float = 5) -> ReceivedEvent | None:
+        """Read the next event, skipping keepalive comments; None once the stream ended."""
+        while True:
+            message = await asyncio.wait_for(self._messages.get(), timeout)
+            body = message.get("body", b"").decode()
+            fields: dict[str, str] = {}
+            for line in body.splitlines():
+                name, _, value = line.partition(":")
+                if name:
+                    fields[name] = value.removeprefix(" ")
+            if "data" in fields:
+                return ReceivedEvent(event=fields.get("event"), id=fields.get("id"), data=json.loads(fields["data"]))
+            if not message.get("more_body", False):
+                return None
+
+
+@asynccontextmanager
+async def open_event_stream(app: ASGIApp, path: str) -> AsyncGenerator[EventStream]:
+    """Send a GET request for `path` to `app` and disconnect when the block exits."""
+    messages: asyncio.Queue[Message] = asyncio.Queue()
+    disconnected = asyncio.Event()
+    requested = False
+
+    async def receive() -> Message:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("test", 80),
+    }
+
+    async def run_app() -> None:
+        await app(scope, receive, messages.put)
+
+    task: asyncio.Task[None] = asyncio.create_task(run_app())
+    try:
+        start = await asyncio.wait_for(messages.get(), 5)
+        yield EventStream(messages, start["status"])
+    finally:
+        disconnected.set()
+        await asyncio.wait_for(task, 5)